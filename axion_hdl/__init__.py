@@ -43,6 +43,7 @@ from .doc_generators import DocGenerator, CHeaderGenerator, XMLGenerator
 from .axion import AxionHDL
 from .bit_field_manager import BitFieldManager, BitOverlapError, BitField
 from .register_model import RegisterSpaceModel, RegisterModel, FieldModel, ReadOnlyError, AddressError
+from .ir import ModuleIR, RegisterIR, FieldIR
 
 # Package metadata
 __version__ = "1.5.1"
@@ -75,6 +76,9 @@ __all__ = [
     'FieldModel',               # Python bit field model
     'ReadOnlyError',            # Write-to-RO exception
     'AddressError',             # Unknown address exception
+    'ModuleIR',                 # Parsed module (typed IR)
+    'RegisterIR',               # Parsed register (typed IR)
+    'FieldIR',                  # Parsed bit field (typed IR)
     '__version__',
     '__author__',
     '__email__',
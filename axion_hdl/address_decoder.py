@@ -0,0 +1,141 @@
+"""
+Address Decoder Planning for Axion HDL
+
+By default a generated register bank compares the full 32-bit bus address
+with BASE_ADDR + offset for every register, and repeats that comparison for
+the address valid flags, the write enables, the read mux and the strobes.
+A module can opt into a case-based decoder instead:
+
+    -- @axion_def DECODE=case        (VHDL)
+    // @axion_def DECODE=case        (SystemVerilog)
+    axion-hdl ... --decode case      (all modules)
+
+compare  One full-width comparator per register and use (default).
+case     The base address is subtracted once per channel, the offset bits
+         above the register window are checked against zero and only the
+         low window bits enter a single case statement. The case sets one
+         bit of a one-hot select vector, which is captured together with the
+         address and then drives the valid flag, write enables, read mux and
+         strobes of that channel.
+
+Readable (RO/RW) and writable (RW/WO) register chunks each get their own
+select vector, numbered in address order.
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from axion_hdl.signal_types import resolve_signal_type
+
+DECODE_MODES = ('compare', 'case')
+
+# to_integer() in VHDL yields a natural: the decoded window stays below 2**31
+MAX_DECODE_BITS = 31
+
+
+class DecodeSlot(NamedTuple):
+    """One 32-bit register chunk in a select vector."""
+    offset: int     # Byte offset from the base address
+    name: str       # Register (signal or packed register) name
+    chunk: int      # Chunk index of a wide register (0 otherwise)
+
+
+class DecodeMap:
+    """
+    Select vectors of a module for the case-based decoder.
+
+    Attributes:
+        write: Writable slots, in select-bit order
+        read: Readable slots, in select-bit order
+        bits: Number of low offset bits decoded by the case statement
+    """
+
+    def __init__(self, write: List[DecodeSlot], read: List[DecodeSlot]):
+        self.write = sorted(write)
+        self.read = sorted(read)
+        self._write_index = {(s.name, s.chunk): i for i, s in enumerate(self.write)}
+        self._read_index = {(s.name, s.chunk): i for i, s in enumerate(self.read)}
+        top = max([s.offset for s in self.write + self.read], default=0)
+        # At least the two byte-lane bits, so unaligned addresses never decode
+        self.bits = max(2, top.bit_length())
+        if self.bits > MAX_DECODE_BITS:
+            raise ValueError(
+                f"DECODE=case needs register offsets below 0x{1 << MAX_DECODE_BITS:X}; "
+                f"highest offset is 0x{top:X}"
+            )
+
+    def write_index(self, name: str, chunk: int = 0) -> Optional[int]:
+        """Select bit of a writable chunk, or None if it is not writable."""
+        return self._write_index.get((name, chunk))
+
+    def read_index(self, name: str, chunk: int = 0) -> Optional[int]:
+        """Select bit of a readable chunk, or None if it is not readable."""
+        return self._read_index.get((name, chunk))
+
+    @staticmethod
+    def choices(slots: List[DecodeSlot]) -> List[Tuple[int, List[int]]]:
+        """
+        Group the select bits of a vector by offset.
+
+        Returns:
+            (offset, [select bits]) pairs in address order; an offset claimed
+            by more than one register (an overlap the rule checker reports)
+            sets all of their bits, as the comparators would
+        """
+        grouped: Dict[int, List[int]] = {}
+        for index, slot in enumerate(slots):
+            grouped.setdefault(slot.offset, []).append(index)
+        return list(grouped.items())
+
+
+def parse_decode_mode(value) -> Optional[str]:
+    """
+    Normalize a DECODE attribute value.
+
+    Args:
+        value: Attribute value (any case), or None
+
+    Returns:
+        'compare', 'case', or None if value is None
+
+    Raises:
+        ValueError: If value is not a known decode mode
+    """
+    if value is None:
+        return None
+    mode = str(value).strip().lower()
+    if mode not in DECODE_MODES:
+        raise ValueError(
+            f"Unknown DECODE '{value}'; expected one of: {', '.join(DECODE_MODES)}"
+        )
+    return mode
+
+
+def build_decode_map(registers: Iterable[Dict], base_address: int = 0) -> DecodeMap:
+    """
+    Number the register chunks a generator decodes.
+
+    Args:
+        registers: Registers as the generator emits them (standalone
+            registers and packed registers; packed registers are one chunk)
+        base_address: Module base address, for registers without a
+            relative address
+
+    Returns:
+        DecodeMap with the writable and readable slots
+    """
+    write, read = [], []
+    for reg in registers:
+        name = reg.get('signal_name') or reg['reg_name']
+        offset = reg.get('relative_address_int', reg['address_int'] - base_address)
+        if reg.get('is_packed') or 'signal_type' not in reg:
+            chunks = 1
+        else:
+            chunks = (resolve_signal_type(reg['signal_type']).width + 31) // 32
+        access = reg['access_mode']
+        for chunk in range(chunks):
+            slot = DecodeSlot(offset + chunk * 4, name, chunk)
+            if access in ('RW', 'WO'):
+                write.append(slot)
+            if access in ('RO', 'RW'):
+                read.append(slot)
+    return DecodeMap(write, read)
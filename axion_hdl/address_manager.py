@@ -5,7 +5,9 @@ Provides automatic address assignment and management for register spaces.
 Handles address alignment, conflict detection, and address map generation.
 """
 
-from typing import Dict, List, Optional, Set, Tuple
+import heapq
+from bisect import bisect_right
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 
 class AddressConflictError(Exception):
@@ -66,6 +68,12 @@ class AddressManager:
     - Manual address specification and conflict detection
     - Address range validation
     - Address map generation
+    
+    Allocated registers are kept as sorted, non-overlapping [start, end)
+    intervals, one per register regardless of its width. Conflict checks
+    and first-fit auto placement are binary searches over the interval
+    starts, so neither cost nor memory grows with the number of 4-byte
+    slots a wide register covers.
     """
     
     def __init__(self, start_addr: int = 0x00, alignment: int = 4, module_name: str = ""):
@@ -81,15 +89,31 @@ class AddressManager:
         self.alignment = alignment
         self.module_name = module_name
         self.auto_counter = start_addr
-        self.assigned_addresses: Set[int] = set()
-        # Track which signal is at which address
-        self.address_to_signal: Dict[int, str] = {}
+        # Allocated intervals: parallel lists sorted by start address
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._owners: List[str] = []
         
     def reset(self):
         """Reset the address counter and assigned addresses."""
         self.auto_counter = self.start_addr
-        self.assigned_addresses.clear()
-        self.address_to_signal.clear()
+        self._starts.clear()
+        self._ends.clear()
+        self._owners.clear()
+    
+    @property
+    def assigned_addresses(self) -> Set[int]:
+        """Set of all assigned 4-byte slot addresses (built on demand)."""
+        return set(self.get_address_map())
+    
+    @property
+    def address_to_signal(self) -> Dict[int, str]:
+        """Mapping of every assigned slot address to its signal (built on demand)."""
+        return {
+            addr: owner
+            for start, end, owner in zip(self._starts, self._ends, self._owners)
+            for addr in range(start, end, self.alignment)
+        }
         
     def allocate_address(self, manual_addr: Optional[int] = None, signal_width: int = 32, signal_name: str = "") -> int:
         """
@@ -120,36 +144,92 @@ class AddressManager:
             # Manual address assignment
             addr = self._validate_address(manual_addr)
             # Check for conflicts across all addresses this signal will occupy
-            for offset in range(0, size_bytes, self.alignment):
-                check_addr = addr + offset
-                if check_addr in self.assigned_addresses:
-                    existing_signal = self.address_to_signal.get(check_addr, "unknown")
-                    raise AddressConflictError(
-                        address=check_addr,
-                        existing_signal=existing_signal,
-                        new_signal=signal_name or "unknown",
-                        module_name=self.module_name
-                    )
-            # Mark all addresses as assigned
-            for offset in range(0, size_bytes, self.alignment):
-                self.assigned_addresses.add(addr + offset)
-                self.address_to_signal[addr + offset] = signal_name
+            conflict = self._find_overlap(addr, addr + size_bytes)
+            if conflict is not None:
+                check_addr, index = conflict
+                raise AddressConflictError(
+                    address=check_addr,
+                    existing_signal=self._owners[index] or "unknown",
+                    new_signal=signal_name or "unknown",
+                    module_name=self.module_name
+                )
+            self._insert(addr, addr + size_bytes, signal_name)
             # Update auto counter if needed
             self.auto_counter = max(self.auto_counter, addr + size_bytes)
             return addr
         else:
-            # Auto address assignment
+            # Auto address assignment: first free block at or after the counter
             addr = self._align_address(self.auto_counter)
-            # Find next available contiguous block
-            while any((addr + offset) in self.assigned_addresses for offset in range(0, size_bytes, self.alignment)):
-                addr += self.alignment
-            # Mark all addresses as assigned
-            for offset in range(0, size_bytes, self.alignment):
-                self.assigned_addresses.add(addr + offset)
-                self.address_to_signal[addr + offset] = signal_name
+            # Skip past every interval the candidate block runs into
+            conflict = self._find_overlap(addr, addr + size_bytes)
+            while conflict is not None:
+                addr = self._align_address(self._ends[conflict[1]])
+                conflict = self._find_overlap(addr, addr + size_bytes)
+            self._insert(addr, addr + size_bytes, signal_name)
             self.auto_counter = addr + size_bytes
             return addr
     
+    def get_owner(self, addr: int) -> Optional[str]:
+        """
+        Get the signal occupying an address.
+        
+        Args:
+            addr: Address as integer
+            
+        Returns:
+            Name of the signal whose address range contains addr, or None
+        """
+        index = bisect_right(self._starts, addr) - 1
+        if index >= 0 and addr < self._ends[index]:
+            return self._owners[index]
+        return None
+    
+    def find_free(self, start: int, size_bytes: int, align: Optional[int] = None) -> int:
+        """
+        Find the first free block at or after an address, without allocating it.
+
+        Args:
+            start: Lowest candidate address
+            size_bytes: Size of the block in bytes
+            align: Alignment of the block in bytes (default: configured alignment)
+
+        Returns:
+            Start address of the first free, aligned block
+        """
+        align = align or self.alignment
+        addr = -(-start // align) * align
+        conflict = self._find_overlap(addr, addr + size_bytes)
+        while conflict is not None:
+            addr = -(-self._ends[conflict[1]] // align) * align
+            conflict = self._find_overlap(addr, addr + size_bytes)
+        return addr
+
+    def _find_overlap(self, start: int, end: int) -> Optional[Tuple[int, int]]:
+        """
+        Find the lowest allocated address in [start, end).
+        
+        Returns:
+            (address, interval index) of the first conflict, or None
+        """
+        if end <= start:
+            return None
+        index = bisect_right(self._starts, start) - 1
+        if index >= 0 and start < self._ends[index]:
+            return start, index
+        index += 1
+        if index < len(self._starts) and self._starts[index] < end:
+            return self._starts[index], index
+        return None
+    
+    def _insert(self, start: int, end: int, signal_name: str):
+        """Record the free interval [start, end) as owned by signal_name."""
+        if end <= start:
+            return
+        index = bisect_right(self._starts, start)
+        self._starts.insert(index, start)
+        self._ends.insert(index, end)
+        self._owners.insert(index, signal_name)
+    
     def _align_address(self, addr: int) -> int:
         """Align address to configured alignment."""
         if addr % self.alignment != 0:
@@ -202,7 +282,11 @@ class AddressManager:
         Returns:
             Sorted list of addresses
         """
-        return sorted(list(self.assigned_addresses))
+        return [
+            addr
+            for start, end in zip(self._starts, self._ends)
+            for addr in range(start, end, self.alignment)
+        ]
     
     def get_next_available_address(self) -> int:
         """Get next available auto-assigned address."""
@@ -222,3 +306,33 @@ class AddressManager:
         counts = Counter(addresses)
         conflicts = [(addr, count) for addr, count in counts.items() if count > 1]
         return conflicts
+
+
+def overlapping_pairs(ranges: Sequence[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Find all pairs of overlapping address ranges with a sweep line.
+
+    Ranges are visited in order of their start address while a heap keeps
+    the ranges still open; every open range overlaps the one being visited.
+    This takes O(n log n + k) time for n ranges and k overlapping pairs,
+    instead of comparing all n² pairs.
+
+    Args:
+        ranges: (start, end) pairs, end exclusive; empty ranges never overlap
+
+    Returns:
+        Sorted list of (i, j) index pairs with i < j, in the order a nested
+        loop over all pairs would find them
+    """
+    order = sorted((i for i, (start, end) in enumerate(ranges) if end > start),
+                   key=lambda i: ranges[i][0])
+    open_ranges: List[Tuple[int, int]] = []  # Heap of (end, index)
+    pairs = []
+    for j in order:
+        start, end = ranges[j]
+        while open_ranges and open_ranges[0][0] <= start:
+            heapq.heappop(open_ranges)
+        pairs.extend((i, j) if i < j else (j, i) for _, i in open_ranges)
+        heapq.heappush(open_ranges, (end, j))
+    pairs.sort()
+    return pairs
@@ -6,7 +6,164 @@ Provides a flexible annotation parsing framework for HDL tools.
 """
 
 import re
-from typing import Dict, List, Optional, Tuple, Any
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple, Any
+
+
+# Bound of the shared parse_attributes() cache (distinct attribute strings)
+ATTRIBUTE_CACHE_SIZE = 4096
+
+# Quoted key=value pairs; otherwise runs of other non-space characters, or
+# whitespace. A quoted pair may follow other characters without a space
+# (only at the start of a word), so token runs stop where one begins.
+_QUOTED = r'(\w+)=["\']([^"\']*)["\']'
+_TOKEN_PATTERN = re.compile(rf'{_QUOTED}|((?:[^\s\w]+|(?!{_QUOTED})\w+)+)|\s+')
+
+_KEY_REPLACEMENTS = {
+    'addr': 'address',
+    'base_addr': 'base_address',
+    'cdc_stage': 'cdc_stages',
+    'r_strobe': 'read_strobe',
+    'w_strobe': 'write_strobe',
+    'desc': 'description',
+    'reg_name': 'reg_name',
+    'bit_offset': 'bit_offset',
+    'default': 'default_value',
+    'cdc_en': 'cdc_enabled',
+    'enum': 'enum_values'
+}
+
+_ACCESS_MODES = frozenset(('RO', 'RW', 'WO'))
+
+# Flags with a fixed attribute (case-insensitive)
+_FLAGS = {
+    'R_STROBE': 'read_strobe',
+    'W_STROBE': 'write_strobe',
+    'CDC_EN': 'cdc_enabled',
+}
+
+
+class FrozenDict(dict):
+    """Read-only dictionary: parse results shared through the attribute cache."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"'{type(self).__name__}' object is read-only; copy it with dict()")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict.__repr__(self)})"
+
+
+class AttributeCacheInfo(NamedTuple):
+    """Counters of the shared parse_attributes() cache."""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    hit_rate: float
+
+
+def _normalize_key(key: str) -> str:
+    key = key.lower()
+    return _KEY_REPLACEMENTS.get(key, key)
+
+
+def _convert_value(value: str) -> Any:
+    value = value.strip()
+    
+    # Try hexadecimal integer (with 0x or 0X prefix)
+    if value.startswith('0x') or value.startswith('0X'):
+        try:
+            return int(value, 16)
+        except ValueError:
+            pass
+    
+    # Try decimal integer (including negative)
+    try:
+        return int(value, 10)
+    except ValueError:
+        pass
+    
+    # Try boolean
+    if value.lower() in ['true', 'yes', '1']:
+        return True
+    if value.lower() in ['false', 'no', '0']:
+        return False
+    
+    # Return as string
+    return value
+
+
+def _parse_enum_values(raw: str) -> Optional[Dict[int, str]]:
+    result = {}
+    for item in raw.split(','):
+        item = item.strip()
+        if ':' not in item:
+            continue
+        val_str, name = item.split(':', 1)
+        try:
+            result[int(val_str.strip(), 0)] = name.strip()
+        except ValueError:
+            pass
+    return result if result else None
+
+
+@lru_cache(maxsize=ATTRIBUTE_CACHE_SIZE)
+def _parse_attributes_cached(attrs_str: str) -> FrozenDict:
+    """Parse an attribute string into a FrozenDict (see AnnotationParser.parse_attributes)."""
+    attrs = {}
+    tokens = []
+    current = ''
+    
+    # One scan splits quoted pairs from the other tokens. Text around a
+    # quoted pair joins into one token, as if the pair had been removed.
+    for match in _TOKEN_PATTERN.finditer(attrs_str):
+        if match.group(1) is not None:
+            attrs[_normalize_key(match.group(1))] = match.group(2)
+        elif match.group(3) is not None:
+            current += match.group(3)
+        elif current:
+            tokens.append(current)
+            current = ''
+    if current:
+        tokens.append(current)
+    
+    for token in tokens:
+        if '=' in token:
+            # Key-value pair (non-quoted)
+            key, value = token.split('=', 1)
+            key = _normalize_key(key.strip())
+            
+            # Skip if already processed as quoted string
+            if key in attrs:
+                continue
+            
+            # Convert to appropriate type
+            attrs[key] = _convert_value(value.strip())
+        else:
+            # Boolean flag or mode
+            token_upper = token.upper()
+            if token_upper in _ACCESS_MODES:
+                attrs['access_mode'] = token_upper
+            elif token_upper in _FLAGS:
+                attrs[_FLAGS[token_upper]] = True
+            # Generic boolean flag
+            else:
+                attrs[_normalize_key(token)] = True
+    
+    # Post-process: convert raw enum_values string to Dict[int, str]
+    if 'enum_values' in attrs and isinstance(attrs['enum_values'], str):
+        enum_values = _parse_enum_values(attrs['enum_values'])
+        attrs['enum_values'] = FrozenDict(enum_values) if enum_values else enum_values
+
+    return FrozenDict(attrs)
 
 
 class AnnotationParser:
@@ -45,7 +202,7 @@ class AnnotationParser:
             comment: Comment line containing annotation
             
         Returns:
-            Dictionary of parsed attributes or None
+            Read-only dictionary of parsed attributes (see parse_attributes()) or None
             
         Example:
             "-- @axion RW ADDR=0x10 W_STROBE" -> 
@@ -66,7 +223,7 @@ class AnnotationParser:
             content: Source file content
             
         Returns:
-            Dictionary of parsed module attributes or None
+            Read-only dictionary of parsed module attributes or None
             
         Example:
             "-- @axion_def CDC_EN CDC_STAGE=3" ->
@@ -83,11 +240,17 @@ class AnnotationParser:
         """
         Parse attribute string into dictionary.
         
+        Results are memoized in a bounded LRU cache shared by all parsers,
+        so a repeated attribute string costs a cache lookup. The returned
+        dictionary is a read-only FrozenDict (enum values included) because
+        it is shared between callers; copy it with dict() to modify it. See
+        cache_info().
+        
         Args:
             attrs_str: Space-separated attributes
             
         Returns:
-            Dictionary of parsed attributes
+            Read-only dictionary of parsed attributes
             
         Supports:
             - Boolean flags: "CDC_EN" -> {'cdc_enabled': True}
@@ -96,62 +259,40 @@ class AnnotationParser:
             - Access modes: "RW", "RO", "WO"
             - Strobes: "R_STROBE", "W_STROBE"
         """
-        attrs = {}
-        
-        # First, extract quoted strings (DESC="..." or similar)
-        # This handles spaces within quoted values
-        quoted_pattern = re.compile(r'(\w+)=["\']([^"\']*)["\']')
-        for match in quoted_pattern.finditer(attrs_str):
-            key = match.group(1)
-            value = match.group(2)
-            attrs[self._normalize_key(key)] = value
-        
-        # Remove quoted strings from attrs_str for further processing
-        remaining = quoted_pattern.sub('', attrs_str)
-        
-        # Now process remaining tokens (non-quoted)
-        tokens = remaining.split()
-        
-        for token in tokens:
-            if '=' in token:
-                # Key-value pair (non-quoted)
-                key, value = token.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                # Skip if already processed as quoted string
-                if self._normalize_key(key) in attrs:
-                    continue
-                
-                # Convert to appropriate type
-                attrs[self._normalize_key(key)] = self._convert_value(value)
-            else:
-                # Boolean flag or mode
-                token = token.strip()
-                if not token:
-                    continue
-                
-                # Check for access modes (case-insensitive)
-                token_upper = token.upper()
-                if token_upper in ['RO', 'RW', 'WO']:
-                    attrs['access_mode'] = token_upper
-                # Check for strobe flags (case-insensitive)
-                elif token_upper == 'R_STROBE':
-                    attrs['read_strobe'] = True
-                elif token_upper == 'W_STROBE':
-                    attrs['write_strobe'] = True
-                # Check for CDC enable (case-insensitive)
-                elif token_upper == 'CDC_EN':
-                    attrs['cdc_enabled'] = True
-                # Generic boolean flag
-                else:
-                    attrs[self._normalize_key(token)] = True
+        return _parse_attributes_cached(attrs_str)
+
+    @staticmethod
+    def cache_info() -> AttributeCacheInfo:
+        """
+        Get the counters of the shared attribute cache.
         
-        # Post-process: convert raw enum_values string to Dict[int, str]
-        if 'enum_values' in attrs and isinstance(attrs['enum_values'], str):
-            attrs['enum_values'] = self.parse_enum_values(attrs['enum_values'])
+        Returns:
+            AttributeCacheInfo(hits, misses, maxsize, currsize, hit_rate)
+        """
+        info = _parse_attributes_cached.cache_info()
+        lookups = info.hits + info.misses
+        return AttributeCacheInfo(info.hits, info.misses, info.maxsize, info.currsize,
+                                  info.hits / lookups if lookups else 0.0)
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Empty the shared attribute cache and reset its counters."""
+        _parse_attributes_cached.cache_clear()
 
-        return attrs
+    @staticmethod
+    def enum_values(attrs: Dict[str, Any]) -> Any:
+        """
+        Get the enum values of parsed attributes as a new dictionary.
+        
+        Args:
+            attrs: Result of parse_attributes()
+            
+        Returns:
+            Dict[int, str] copy of the enum values, or the raw value if the
+            attribute is missing or not an enum list
+        """
+        values = attrs.get('enum_values')
+        return dict(values) if isinstance(values, dict) else values
 
     def parse_enum_values(self, raw: str) -> Optional[Dict[int, str]]:
         """
@@ -163,17 +304,7 @@ class AnnotationParser:
         Returns:
             Dictionary mapping int values to names, or None if empty/invalid
         """
-        result = {}
-        for item in raw.split(','):
-            item = item.strip()
-            if ':' not in item:
-                continue
-            val_str, name = item.split(':', 1)
-            try:
-                result[int(val_str.strip(), 0)] = name.strip()
-            except ValueError:
-                pass
-        return result if result else None
+        return _parse_enum_values(raw)
 
     def _normalize_key(self, key: str) -> str:
         """
@@ -185,24 +316,7 @@ class AnnotationParser:
         Returns:
             Normalized key (e.g., "cdc_stages")
         """
-        key = key.lower()
-        
-        # Handle common transformations
-        replacements = {
-            'addr': 'address',
-            'base_addr': 'base_address',
-            'cdc_stage': 'cdc_stages',
-            'r_strobe': 'read_strobe',
-            'w_strobe': 'write_strobe',
-            'desc': 'description',
-            'reg_name': 'reg_name',
-            'bit_offset': 'bit_offset',
-            'default': 'default_value',
-            'cdc_en': 'cdc_enabled',
-            'enum': 'enum_values'
-        }
-        
-        return replacements.get(key, key)
+        return _normalize_key(key)
     
     def _convert_value(self, value: str) -> Any:
         """
@@ -215,29 +329,7 @@ class AnnotationParser:
         Returns:
             Converted value (int, bool, str)
         """
-        value = value.strip()
-        
-        # Try hexadecimal integer (with 0x or 0X prefix)
-        if value.startswith('0x') or value.startswith('0X'):
-            try:
-                return int(value, 16)
-            except ValueError:
-                pass
-        
-        # Try decimal integer (including negative)
-        try:
-            return int(value, 10)
-        except ValueError:
-            pass
-        
-        # Try boolean
-        if value.lower() in ['true', 'yes', '1']:
-            return True
-        if value.lower() in ['false', 'no', '0']:
-            return False
-        
-        # Return as string
-        return value
+        return _convert_value(value)
     
     def validate_access_mode(self, mode: str) -> bool:
         """
@@ -0,0 +1,83 @@
+"""
+AXI4-Lite State Machine Selection for Axion HDL
+
+By default a generated register bank serves the bus with one state machine
+for both channels: a read waits until a write in flight has been answered,
+and the other way round. A module can opt into independent channels:
+
+    -- @axion_def FSM=split          (VHDL)
+    // @axion_def FSM=split          (SystemVerilog)
+    axion-hdl ... --fsm split        (all modules)
+
+shared  One state machine; writes and reads are fully serialized (default).
+split   Separate write and read state machines that advance in the same
+        cycle, so a read is answered while a write is in flight.
+fast    No state machine: each channel takes a new transaction in the cycle
+        the previous response is accepted, so back-to-back traffic runs at
+        one write and one read per cycle.
+
+With FSM=split a read and a write of the same register are ordered by the
+register bank: a write is not committed while a read of that register is
+between its address handshake and its response handshake (the read is
+ordered first and RDATA stays stable), and a read is not accepted while a
+write of that register is being committed (the write is ordered first and
+the read returns the written value). A read and a write that arrive in the
+same cycle are therefore ordered read first. Transactions to different
+registers never wait for each other.
+
+With FSM=fast AWREADY, WREADY and ARREADY are registered and stay high while
+the channel can take a transaction. An address or data beat that cannot be
+served in the cycle it is accepted (its partner beat has not arrived, or the
+response channel is stalled) waits in a holding register, which drops the
+READY of that channel until it drains. A write commits, and a read samples
+its data into the RDATA register, in the cycle both of its beats are
+available and the response slot is free; read strobes pulse in that cycle.
+A read and a write of one register in the same cycle are ordered read
+first, and RDATA never changes while RVALID is high. The read mux stays
+combinational, so RD_PIPE does not apply; generating a module that asks
+for both prints a warning (see ignored_read_pipeline()).
+"""
+
+from typing import Dict, Optional
+
+FSM_MODES = ('shared', 'split', 'fast')
+
+
+def parse_fsm_mode(value) -> Optional[str]:
+    """
+    Normalize an FSM attribute value.
+
+    Args:
+        value: Attribute value (any case), or None
+
+    Returns:
+        'shared', 'split', 'fast', or None if value is None
+
+    Raises:
+        ValueError: If value is not a known state machine mode
+    """
+    if value is None:
+        return None
+    mode = str(value).strip().lower()
+    if mode not in FSM_MODES:
+        raise ValueError(
+            f"Unknown FSM '{value}'; expected one of: {', '.join(FSM_MODES)}"
+        )
+    return mode
+
+
+def ignored_read_pipeline(module: Dict) -> Optional[str]:
+    """
+    Describe a read pipeline that FSM=fast leaves out of a module.
+
+    Args:
+        module: Module dictionary with the 'fsm' and 'read_pipeline' options
+
+    Returns:
+        Warning message, or None if the module's read pipeline is generated
+    """
+    pipeline = module.get('read_pipeline') or 0
+    if module.get('fsm') != 'fast' or not pipeline:
+        return None
+    return (f"Module '{module.get('name')}': RD_PIPE={pipeline} (--read-pipeline) has no "
+            f"effect with FSM=fast (--fsm fast); the read data mux stays combinational")
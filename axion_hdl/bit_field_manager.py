@@ -3,11 +3,62 @@ Bit Field Manager Module
 
 Manages bit field allocation within registers for subregister support.
 Handles bit overlap detection and auto-packing of signals.
+
+Each packed register keeps an integer occupancy bitmask (bit n set when a
+field covers bit n), so overlap checks and free-space searches are a few
+integer operations instead of comparisons against every existing field.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
 
+REGISTER_BITS = 32
+
+
+def bit_mask(bit_low: int, bit_high: int) -> int:
+    """Mask with bits bit_low..bit_high (inclusive) set."""
+    return ((1 << (bit_high - bit_low + 1)) - 1) << bit_low
+
+
+def occupancy_masks(masks: Iterable[int]) -> Tuple[int, int]:
+    """
+    Combine field masks.
+
+    Args:
+        masks: Bit mask of each field
+
+    Returns:
+        Tuple of (occupied, overlapped): bits covered by any field, and bits
+        covered by more than one field
+    """
+    occupied = overlapped = 0
+    for mask in masks:
+        overlapped |= occupied & mask
+        occupied |= mask
+    return occupied, overlapped
+
+
+def first_fit(occupied: int, width: int, start: int = 0, align: int = 1) -> Optional[int]:
+    """
+    Find the lowest free, aligned bit offset for a field.
+
+    Args:
+        occupied: Occupancy bitmask of the register
+        width: Field width in bits
+        start: Lowest offset to consider
+        align: Offset alignment in bits
+
+    Returns:
+        Bit offset, or None if the field does not fit
+    """
+    field = (1 << width) - 1
+    offset = -(-start // align) * align
+    while offset + width <= REGISTER_BITS:
+        if not (field << offset) & occupied:
+            return offset
+        offset += align
+    return None
+
 
 class BitOverlapError(Exception):
     """
@@ -103,6 +154,7 @@ class PackedRegister:
     access_mode: str
     cdc_enabled: bool = False
     cdc_stages: int = 2
+    occupancy: int = 0    # Bits covered by the fields
     
     @property
     def width(self) -> int:
@@ -159,7 +211,8 @@ class BitFieldManager:
         write_strobe: bool = False,
         default_value: int = 0,
         allow_overlap: bool = False,
-        enum_values: Optional[Dict[int, str]] = None
+        enum_values: Optional[Dict[int, str]] = None,
+        align: int = 1
     ) -> BitField:
         """
         Add a bit field to a register.
@@ -177,10 +230,19 @@ class BitFieldManager:
             source_line: Source line for error messages
             read_strobe: Has read strobe
             write_strobe: Has write strobe
+            default_value: Field default value
+            allow_overlap: Accept fields overlapping existing ones
+            enum_values: Mapping of values to names
+            align: Alignment in bits of an auto-packed field's offset
             
         Returns:
             Created BitField object
             
+        Note:
+            A field without bit_offset is placed after the highest field so
+            far (aligned to align). If it does not fit there, it takes the
+            first free, aligned gap below.
+            
         Raises:
             BitOverlapError: If field overlaps with existing field (unless allow_overlap=True)
             ValueError: If access modes don't match
@@ -213,11 +275,22 @@ class BitFieldManager:
         
         # Determine bit offset
         if bit_offset is None:
-            bit_offset = self._next_offset[reg_name]
+            align = max(1, int(align or 1))
+            bit_offset = first_fit(reg.occupancy, width, self._next_offset[reg_name], align)
+            if bit_offset is None:
+                bit_offset = first_fit(reg.occupancy, width, 0, align)
+            if bit_offset is None:
+                # No room left: reported as exceeding the boundary below
+                bit_offset = -(-self._next_offset[reg_name] // align) * align
         
         bit_low = bit_offset
         bit_high = bit_offset + width - 1
         
+        if bit_low < 0:
+            raise ValueError(
+                f"Field '{field_name}' has a negative bit offset ({bit_low})"
+            )
+        
         # Check for 32-bit limit
         if bit_high > 31:
             raise ValueError(
@@ -257,20 +330,19 @@ class BitFieldManager:
         )
         
         # Check for overlaps with existing fields
-        for existing in reg.fields:
-            overlap = field.overlaps_with(existing)
-            if overlap:
-                if not allow_overlap:
-                    raise BitOverlapError(
-                        register_name=reg_name,
-                        address=address,
-                        field1=existing,
-                        field2=field,
-                        overlap_bits=overlap
-                    )
+        if field.mask & reg.occupancy and not allow_overlap:
+            existing = next(f for f in reg.fields if f.mask & field.mask)
+            raise BitOverlapError(
+                register_name=reg_name,
+                address=address,
+                field1=existing,
+                field2=field,
+                overlap_bits=field.overlaps_with(existing)
+            )
         
         # Add field
         reg.fields.append(field)
+        reg.occupancy |= field.mask
         
         # Update next auto-pack offset
         self._next_offset[reg_name] = max(
@@ -309,22 +381,19 @@ class BitFieldManager:
         warnings = []
         
         for reg in self._registers.values():
-            # Check for overlaps
-            for i, f1 in enumerate(reg.fields):
-                for f2 in reg.fields[i+1:]:
-                    overlap = f1.overlaps_with(f2)
-                    if overlap:
-                        warnings.append(
-                            f"Overlapping fields in register '{reg.name}': "
-                            f"{f1.name} [{f1.bit_high}:{f1.bit_low}] and "
-                            f"{f2.name} [{f2.bit_high}:{f2.bit_low}]"
-                        )
-
-            # Check for gaps in bit allocation
-            used_bits = set()
-            for field in reg.fields:
-                for bit in range(field.bit_low, field.bit_high + 1):
-                    used_bits.add(bit)
+            # Check for overlaps; only fields on doubly used bits can clash
+            _, overlapped = occupancy_masks(f.mask for f in reg.fields)
+            if overlapped:
+                clashing = [f for f in reg.fields if f.mask & overlapped]
+                for i, f1 in enumerate(clashing):
+                    for f2 in clashing[i+1:]:
+                        overlap = f1.overlaps_with(f2)
+                        if overlap:
+                            warnings.append(
+                                f"Overlapping fields in register '{reg.name}': "
+                                f"{f1.name} [{f1.bit_high}:{f1.bit_low}] and "
+                                f"{f2.name} [{f2.bit_high}:{f2.bit_low}]"
+                            )
             
             # Check for access mode consistency
             access_modes = set(f.access_mode for f in reg.fields)
@@ -0,0 +1,56 @@
+"""
+Clock Domain Crossing Mode Selection for Axion HDL
+
+With CDC_EN a generated register bank crosses every register between
+axi_aclk and module_clk. By default each 32-bit chunk of each register goes
+through its own CDC_STAGE-deep flop chain. A module can opt into a bundled
+handshake instead:
+
+    -- @axion_def CDC_EN CDC_MODE=handshake    (VHDL)
+    // @axion_def CDC_EN CDC_MODE=handshake    (SystemVerilog)
+    axion-hdl ... --cdc-mode handshake         (all modules)
+
+sync       A CDC_STAGE-deep flop chain per register bit (default).
+handshake  One toggle req/ack handshake per direction for the whole bank.
+
+With CDC_MODE=handshake the source domain copies one register into a
+holding register, toggles req and keeps the copy stable until the
+synchronized ack comes back; the destination domain loads the register in
+one cycle when it sees req toggle and echoes it as ack. Only req and ack
+pass through CDC_STAGE-deep synchronizers, so each register arrives as one
+coherent value and the bank needs one destination register per register
+instead of CDC_STAGE copies.
+
+Registers take turns on the handshake. RW/WO registers are sent in the
+order they are written: a write marks its register pending, and a pointer
+that advances every idle axi_aclk cycle sends the pending ones. RO
+registers are sent round robin, so the AXI side sees each module value at
+most one pass over the RO registers late.
+"""
+
+from typing import Optional
+
+CDC_MODES = ('sync', 'handshake')
+
+
+def parse_cdc_mode(value) -> Optional[str]:
+    """
+    Normalize a CDC_MODE attribute value.
+
+    Args:
+        value: Attribute value (any case), or None
+
+    Returns:
+        'sync', 'handshake', or None if value is None
+
+    Raises:
+        ValueError: If value is not a known CDC mode
+    """
+    if value is None:
+        return None
+    mode = str(value).strip().lower()
+    if mode not in CDC_MODES:
+        raise ValueError(
+            f"Unknown CDC_MODE '{value}'; expected one of: {', '.join(CDC_MODES)}"
+        )
+    return mode
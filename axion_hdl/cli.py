@@ -29,6 +29,10 @@ import os
 import json
 
 from axion_hdl import AxionHDL, __version__
+from axion_hdl.address_decoder import DECODE_MODES
+from axion_hdl.read_pipeline import MAX_READ_PIPELINE
+from axion_hdl.axi_fsm import FSM_MODES
+from axion_hdl.cdc_mode import CDC_MODES
 
 
 def main():
@@ -122,6 +126,30 @@ For more information, visit: https://axion-hdl.readthedocs.io
         metavar='FILE',
         help='Load configuration (sources, excludes) from JSON file'
     )
+
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Parse source files and run module-local rule checks with N worker processes '
+             '(0 = one per CPU). Results are identical to a serial run. Default: serial'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        dest='no_cache',
+        help='Do not use the parse cache (.axion_cache next to the output directory); '
+             'parse every source file again'
+    )
+
+    parser.add_argument(
+        '--clear-cache',
+        action='store_true',
+        dest='clear_cache',
+        help='Delete all parse cache entries before analysis'
+    )
     
     # Generation options
     gen_group = parser.add_argument_group('Generation Options')
@@ -198,6 +226,46 @@ For more information, visit: https://axion-hdl.readthedocs.io
              'instead of flat individual signals. Overrides per-module use_axion_types config.'
     )
 
+    gen_group.add_argument(
+        '--decode',
+        choices=DECODE_MODES,
+        default=None,
+        help='Address decoder of the generated VHDL/SystemVerilog register banks: "compare" '
+             '(one full-width comparator per register, default) or "case" (base subtracted once, '
+             'low offset bits decoded in one case statement). Overrides per-module DECODE attributes.'
+    )
+
+    gen_group.add_argument(
+        '--read-pipeline',
+        type=int,
+        choices=range(0, MAX_READ_PIPELINE + 1),
+        default=None,
+        metavar='N',
+        help=f'Register the read data mux of the generated VHDL/SystemVerilog register banks as '
+             f'a tree of N stages (0-{MAX_READ_PIPELINE}; 0 = combinational). Adds read latency. '
+             'Overrides per-module RD_PIPE attributes.'
+    )
+
+    gen_group.add_argument(
+        '--fsm',
+        choices=FSM_MODES,
+        default=None,
+        help='AXI4-Lite state machine of the generated VHDL/SystemVerilog register banks: "shared" '
+             '(one state machine, reads and writes serialized, default), "split" (independent '
+             'write and read state machines) or "fast" (no state machine, one write and one read '
+             'per cycle under back-to-back traffic). Overrides per-module FSM attributes.'
+    )
+
+    gen_group.add_argument(
+        '--cdc-mode',
+        choices=CDC_MODES,
+        default=None,
+        help='Clock domain crossing of CDC-enabled VHDL/SystemVerilog register banks: "sync" '
+             '(a CDC_STAGE-deep flop chain per register bit, default) or "handshake" (one req/ack '
+             'handshake per direction, registers cross as coherent values). '
+             'Overrides per-module CDC_MODE attributes.'
+    )
+
     gen_group.add_argument(
         '--gui',
         action='store_true',
@@ -223,6 +291,24 @@ For more information, visit: https://axion-hdl.readthedocs.io
         help='Run validation rules. Optional: specify output report file (default: rule_check_report.json)'
     )
 
+    gen_group.add_argument(
+        '--rules',
+        action='append',
+        default=None,
+        metavar='RULE[,RULE]',
+        help='With --rule-check, run only these rules. Can be specified multiple times. '
+             'Example: --rules naming-conventions,duplicate-names'
+    )
+
+    gen_group.add_argument(
+        '--skip-rules',
+        action='append',
+        default=None,
+        dest='skip_rules',
+        metavar='RULE[,RULE]',
+        help='With --rule-check, do not run these rules. Can be specified multiple times'
+    )
+
     gen_group.add_argument(
         '--port',
         type=int,
@@ -330,12 +416,18 @@ For more information, visit: https://axion-hdl.readthedocs.io
     # Add exclusion patterns
     if args.excludes:
         axion.exclude(*args.excludes)
+
+    # Parse cache: unchanged source files are loaded instead of re-parsed
+    if args.clear_cache:
+        axion.clear_cache()
+    if not args.no_cache and effective_output_dir:
+        axion.enable_cache()
     
     # Analyze files
     # For GUI mode, tolerate analysis errors - GUI will display them gracefully
     analysis_error = None
     try:
-        if not axion.analyze():
+        if not axion.analyze(jobs=args.jobs):
             if not args.gui:
                 print("Error: Analysis failed. No modules found.", 
                       file=sys.stderr)
@@ -354,6 +446,26 @@ For more information, visit: https://axion-hdl.readthedocs.io
         for module in axion.analyzed_modules:
             module['use_axion_types'] = True
 
+    # Apply global --decode override to all modules
+    if getattr(args, 'decode', None):
+        for module in axion.analyzed_modules:
+            module['decode'] = args.decode
+
+    # Apply global --read-pipeline override to all modules
+    if getattr(args, 'read_pipeline', None) is not None:
+        for module in axion.analyzed_modules:
+            module['read_pipeline'] = args.read_pipeline
+
+    # Apply global --fsm override to all modules
+    if getattr(args, 'fsm', None):
+        for module in axion.analyzed_modules:
+            module['fsm'] = args.fsm
+
+    # Apply global --cdc-mode override to all modules
+    if getattr(args, 'cdc_mode', None):
+        for module in axion.analyzed_modules:
+            module['cdc_mode'] = args.cdc_mode
+
     # Apply hierarchy if provided (must happen after analyze, before generation)
     if args.hier_file:
         if not os.path.exists(args.hier_file):
@@ -391,7 +503,8 @@ For more information, visit: https://axion-hdl.readthedocs.io
     # Run rule checking if requested
     if args.rule_check is not None:
         print("Running Rule Checks...")
-        passed = axion.run_rules(report_file=args.rule_check)
+        passed = axion.run_rules(report_file=args.rule_check, rules=args.rules,
+                                 skip_rules=args.skip_rules, jobs=args.jobs)
         if not passed:
             print("Rule Check failed with errors.", file=sys.stderr)
             sys.exit(1)
@@ -13,6 +13,7 @@ from typing import Dict, List
 
 # Import from axion_hdl (unified package)
 from axion_hdl.code_formatter import CodeFormatter
+from axion_hdl.signal_types import resolve_signal_type
 
 
 class DocGenerator:
@@ -1696,16 +1697,7 @@ class CHeaderGenerator:
             'std_logic_vector(31 downto 0)'   (YAML-input path)
             'std_logic'                       (YAML-input, 1-bit)
         """
-        import re
-        match = re.match(r'\[(\d+):(\d+)\]', signal_type)
-        if match:
-            return int(match.group(1)) - int(match.group(2)) + 1
-        match = re.match(r'std_logic_vector\((\d+)\s+downto\s+(\d+)\)', signal_type)
-        if match:
-            return int(match.group(1)) - int(match.group(2)) + 1
-        if signal_type.strip() == 'std_logic':
-            return 1
-        return 32
+        return resolve_signal_type(signal_type).width
     
     def _get_num_regs(self, signal_width: int) -> int:
         """Calculate number of 32-bit registers needed for a signal."""
@@ -0,0 +1,150 @@
+"""
+Exclusion Matcher Module for Axion HDL
+
+Shared engine for exclusion patterns (see AxionHDL.exclude()). All patterns
+are compiled once into combined regular expressions, and results for
+directories are memoized, so checking a file costs a few regex calls
+regardless of the number of patterns, and a directory is tested only once.
+
+A path is excluded when any pattern:
+- occurs literally in the path or in its absolute form ("deprecated", "tb/")
+- matches a file or directory name of the absolute path ("*_tb.vhd", "error_cases")
+- contains a wildcard and matches the whole path ("*/generated/*")
+
+directory_pattern() builds a pattern for exactly one directory, used to
+exclude the output directory without a substring match on its name.
+"""
+
+import os
+import re
+import glob
+import fnmatch
+from functools import lru_cache
+from typing import Iterable, Optional
+
+
+class ExcludeMatcher:
+    """
+    Compiled set of exclusion patterns.
+
+    Attributes:
+        patterns (frozenset): Patterns this matcher was compiled from
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = frozenset(patterns)
+        ordered = sorted(self.patterns)
+        wildcards = [p for p in ordered if '*' in p or '?' in p]
+
+        self._substring_re = self._compile(re.escape(p) for p in ordered)
+        self._name_re = self._compile(fnmatch.translate(os.path.normcase(p)) for p in ordered)
+        self._path_re = self._compile(fnmatch.translate(os.path.normcase(p)) for p in wildcards)
+
+        # Absolute directory path -> True if any of its names matches a pattern
+        self._dir_names = {}
+        # Directory path -> full is_excluded() result (used for pruning)
+        self._dirs = {}
+
+    @staticmethod
+    def _compile(parts) -> Optional[re.Pattern]:
+        parts = list(parts)
+        return re.compile('|'.join(f'(?:{p})' for p in parts)) if parts else None
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    def _dir_has_name_match(self, directory: str) -> bool:
+        """True if any name along an absolute directory path matches a pattern."""
+        cached = self._dir_names.get(directory)
+        if cached is None:
+            parent, name = os.path.split(directory)
+            if parent == directory:
+                cached = False
+            else:
+                cached = (bool(self._name_re.match(os.path.normcase(name)))
+                          or self._dir_has_name_match(parent))
+            self._dir_names[directory] = cached
+        return cached
+
+    def is_excluded(self, path: str) -> bool:
+        """
+        Check if a file or directory path is excluded.
+
+        Args:
+            path: Path to check (relative or absolute)
+
+        Returns:
+            True if the path matches any exclusion pattern
+        """
+        if not self.patterns:
+            return False
+
+        abs_path = os.path.abspath(path)
+        if self._substring_re.search(path) or self._substring_re.search(abs_path):
+            return True
+
+        directory, name = os.path.split(abs_path)
+        if self._name_re.match(os.path.normcase(name)) or self._dir_has_name_match(directory):
+            return True
+
+        if self._path_re is not None:
+            if (self._path_re.match(os.path.normcase(path))
+                    or self._path_re.match(os.path.normcase(abs_path))):
+                return True
+        return False
+
+    def is_dir_excluded(self, directory: str) -> bool:
+        """
+        Memoized is_excluded() for directories, for pruning directory walks.
+
+        Args:
+            directory: Directory path
+
+        Returns:
+            True if the directory is excluded
+        """
+        if not os.path.isabs(directory):
+            # Relative results depend on the working directory
+            return self.is_excluded(directory)
+        cached = self._dirs.get(directory)
+        if cached is None:
+            cached = self._dirs[directory] = self.is_excluded(directory)
+        return cached
+
+
+def directory_pattern(directory: str) -> str:
+    """
+    Build a pattern that excludes everything below one directory.
+
+    The pattern is the escaped absolute path followed by a wildcard, so it
+    only matches as a full-path glob: paths that merely contain the
+    directory name ("layout.json" for "out") are not excluded.
+
+    Args:
+        directory: Directory path (relative or absolute)
+
+    Returns:
+        Exclusion pattern
+    """
+    return os.path.join(glob.escape(os.path.abspath(directory)), '*')
+
+
+@lru_cache(maxsize=32)
+def _compiled(patterns: frozenset) -> ExcludeMatcher:
+    return ExcludeMatcher(patterns)
+
+
+def get_exclude_matcher(patterns: Iterable[str]) -> ExcludeMatcher:
+    """
+    Get the shared compiled matcher for a set of exclusion patterns.
+
+    Matchers are cached by pattern set, so parsers configured with the same
+    patterns share one matcher and its directory memo.
+
+    Args:
+        patterns: Exclusion patterns
+
+    Returns:
+        ExcludeMatcher instance
+    """
+    return _compiled(frozenset(patterns))
@@ -17,7 +17,10 @@ import sys
 from typing import Dict, List, Optional
 
 # Import from axion_hdl (unified package)
+from axion_hdl.address_decoder import DecodeMap, build_decode_map
 from axion_hdl.code_formatter import CodeFormatter
+from axion_hdl.read_pipeline import plan_read_tree
+from axion_hdl.signal_types import RANGE, resolve_signal_type
 
 
 class VHDLGenerator:
@@ -40,18 +43,15 @@ class VHDLGenerator:
         Returns:
             VHDL type string like "std_logic_vector(31 downto 0)" or "std_logic"
         """
-        import re
         # Already a valid VHDL type — return as-is
         if signal_type.startswith('std_logic_vector(') or signal_type.strip() == 'std_logic':
             return signal_type
         # Bracket format [high:low] → convert
-        match = re.match(r'\[(\d+):(\d+)\]', signal_type)
-        if match:
-            high = int(match.group(1))
-            low = int(match.group(2))
-            if high == 0 and low == 0:
+        sig = resolve_signal_type(signal_type)
+        if sig.notation == RANGE:
+            if sig.high == 0 and sig.low == 0:
                 return "std_logic"
-            return f"std_logic_vector({high} downto {low})"
+            return f"std_logic_vector({sig.high} downto {sig.low})"
         return "std_logic_vector(31 downto 0)"
     
     @staticmethod
@@ -67,16 +67,7 @@ class VHDLGenerator:
         Returns:
             Width in bits
         """
-        import re
-        match = re.match(r'\[(\d+):(\d+)\]', signal_type)
-        if match:
-            return int(match.group(1)) - int(match.group(2)) + 1
-        match = re.match(r'std_logic_vector\((\d+)\s+downto\s+(\d+)\)', signal_type)
-        if match:
-            return int(match.group(1)) - int(match.group(2)) + 1
-        if signal_type.strip() == 'std_logic':
-            return 1
-        return 32
+        return resolve_signal_type(signal_type).width
     
     @staticmethod
     def _expand_to_32bit(signal_name: str, signal_type: str) -> str:
@@ -96,12 +87,9 @@ class VHDLGenerator:
             For 32-bit:          'signal_name'
             For >32-bit:         'signal_name(31 downto 0)' (first 32 bits only)
         """
-        import re
-        match = re.match(r'\[(\d+):(\d+)\]', signal_type)
-        if match:
-            high = int(match.group(1))
-            low = int(match.group(2))
-            width = high - low + 1
+        sig = resolve_signal_type(signal_type)
+        if sig.notation == RANGE:
+            width = sig.width
             
             if width > 32:
                 # For signals wider than 32 bits, take only the first 32 bits
@@ -132,12 +120,9 @@ class VHDLGenerator:
             For 32-bit:          'signal_name'
             For >32-bit:         'signal_name' (only 32 bits available)
         """
-        import re
-        match = re.match(r'\[(\d+):(\d+)\]', signal_type)
-        if match:
-            high = int(match.group(1))
-            low = int(match.group(2))
-            width = high - low + 1
+        sig = resolve_signal_type(signal_type)
+        if sig.notation == RANGE:
+            width = sig.width
             
             if width > 32:
                 # For signals wider than 32 bits, only first 32 bits are in the register
@@ -148,7 +133,7 @@ class VHDLGenerator:
             elif width == 1:  # std_logic
                 return f"{signal_name}(0)"
             else:
-                return f"{signal_name}({high} downto {low})"
+                return f"{signal_name}({sig.high} downto {sig.low})"
         return signal_name
     
     @staticmethod
@@ -162,13 +147,9 @@ class VHDLGenerator:
         Returns:
             Number of 32-bit registers needed
         """
-        import re
-        match = re.match(r'\[(\d+):(\d+)\]', signal_type)
-        if match:
-            high = int(match.group(1))
-            low = int(match.group(2))
-            width = high - low + 1
-            return (width + 31) // 32
+        sig = resolve_signal_type(signal_type)
+        if sig.notation == RANGE:
+            return sig.num_chunks
         return 1
         
     @staticmethod
@@ -549,13 +530,29 @@ class VHDLGenerator:
     def _generate_architecture(self, module_data: Dict) -> List[str]:
         """Generate architecture body with full AXI4-Lite protocol compliance."""
         use_axion_types = module_data.get('use_axion_types', False)
+        decode = self._decode_map(module_data)
+        # DECODE=case: the decoded select vector is captured with the address
+        wr_sel_capture = ["                            wr_sel <= aw_sel;"] if decode else []
+        rd_sel_capture = ["                            rd_sel <= ar_sel;"] if decode else []
+        read_sources = self._read_sources(module_data)
+        # FSM=split: separate write and read state machines
+        # FSM=fast: no state machine; RDATA is registered instead of RD_PIPE
+        fsm = module_data.get('fsm')
+        split = fsm == 'split'
+        fast = fsm == 'fast'
+        pipeline = 0 if fast else module_data.get('read_pipeline') or 0
+        # RD_PIPE > 1: RD_ADDR waits for the extra mux stages
+        rd_pipe_reset = ["                rd_pipe_cnt <= 0;"] if pipeline > 1 else []
+        if fast:
+            wr_commit, rd_fire = "do_reg_write = '1'", "rd_load = '1'"
+        elif split:
+            wr_commit, rd_fire = "wr_state = WR_DO_WRITE and wr_hold = '0'", "rd_state = RD_DATA and axi_rready = '1'"
+        else:
+            wr_commit, rd_fire = "axi_state = WR_DO_WRITE", "axi_state = RD_DATA and axi_rready = '1'"
         lines = [
             f"architecture rtl of {module_data['name']}_axion_reg is",
             "    ",
-            "    -- AXI4-Lite Compliant State Machine",
-            "    -- Supports independent address and data channels per AXI-LITE-005",
-            "    type axi_state_type is (IDLE, WR_WAIT_ADDR, WR_WAIT_DATA, WR_DO_WRITE, WR_RESP, RD_ADDR, RD_DATA);",
-            "    signal axi_state : axi_state_type;",
+            *self._generate_fsm_declarations(fsm, decode),
             "    ",
             "    -- Internal signals for write transaction",
             "    signal wr_addr_reg : std_logic_vector(31 downto 0);",
@@ -575,6 +572,8 @@ class VHDLGenerator:
             "    -- Write trigger signal",
             "    signal do_reg_write : std_logic;",
             "    ",
+            *self._generate_decode_declarations(decode),
+            *self._generate_read_pipeline_declarations(pipeline, len(read_sources)),
             "    -- Register storage",
         ]
         
@@ -599,7 +598,10 @@ class VHDLGenerator:
                 lines.append(f"    signal {pr['reg_name']}_val : std_logic_vector(31 downto 0) := (others => '0'); -- Combined read value")
         
         lines.append("    ")
-        if module_data['cdc_enabled']:
+        if module_data['cdc_enabled'] and module_data.get('cdc_mode') == 'handshake':
+            lines.append("    ")
+            lines.extend(self._generate_cdc_handshake_declarations(module_data))
+        elif module_data['cdc_enabled']:
             lines.append("    ")
             lines.append(f"    -- CDC synchronizer ({module_data['cdc_stages']} stages)")
             for reg in module_data['registers']:
@@ -713,242 +715,258 @@ class VHDLGenerator:
             lines.append("    ")
 
             
-        lines.extend([
-            "    ",
-            "    ---------------------------------------------------------------------------",
-            "    -- AXI4-Lite Interface State Machine",
-            "    -- Full protocol compliance per ARM AMBA AXI4-Lite specification:",
-            "    --   - AXI-LITE-001: Safe reset state for all outputs",
-            "    --   - AXI-LITE-004: VALID stability until READY",
-            "    --   - AXI-LITE-005: Independent write address and data channels",
-            "    --   - AXI-LITE-007/008: Correct response timing",
-            "    --   - AXI-LITE-016/017: Delayed and early READY handling",
-            "    ---------------------------------------------------------------------------",
-            "    process(axi_aclk)",
-            "    begin",
-            "        if rising_edge(axi_aclk) then",
-            "            if axi_aresetn = '0' then",
-            "                -- AXI-LITE-001: Reset State Requirements",
-            "                axi_state <= IDLE;",
-            "                axi_awready <= '0';",
-            "                axi_wready <= '0';",
-            "                axi_bvalid <= '0';",
-            "                axi_bresp <= \"00\";",
-            "                axi_arready <= '0';",
-            "                axi_rvalid <= '0';",
-            "                axi_rresp <= \"00\";",
-            "                wr_access_error <= '0';",
-            "                rd_access_error <= '0';",
-            "                do_reg_write <= '0';",
-            "            else",
-            "                -- Default: clear one-shot signals",
-            "                do_reg_write <= '0';",
-            "                ",
-            "                case axi_state is",
-            "                    ------------------------------------",
-            "                    -- IDLE: Wait for transaction start",
-            "                    ------------------------------------",
-            "                    when IDLE =>",
-            "                        -- Check for write transaction (address or data can come first)",
-            "                        -- AXI-LITE-005: Write Address and Data Independence",
-            "                        if axi_awvalid = '1' and axi_wvalid = '1' then",
-            "                            -- Both address and data arrived simultaneously",
-            "                            axi_awready <= '1';",
-            "                            axi_wready <= '1';",
-            "                            wr_addr_reg <= axi_awaddr;",
-            "                            wr_data_reg <= axi_wdata;",
-            "                            wr_strb_reg <= axi_wstrb;",
-            "                            wr_access_error <= wr_addr_valid_n;",
-            "                            axi_state <= WR_DO_WRITE;",
-            "                        elsif axi_awvalid = '1' then",
-            "                            -- Address first - wait for data",
-            "                            axi_awready <= '1';",
-            "                            wr_addr_reg <= axi_awaddr;",
-            "                            wr_access_error <= wr_addr_valid_n;",
-            "                            axi_state <= WR_WAIT_DATA;",
-            "                        elsif axi_wvalid = '1' then",
-            "                            -- Data first - wait for address",
-            "                            axi_wready <= '1';",
-            "                            wr_data_reg <= axi_wdata;",
-            "                            wr_strb_reg <= axi_wstrb;",
-            "                            axi_state <= WR_WAIT_ADDR;",
-            "                        elsif axi_arvalid = '1' then",
-            "                            -- Read transaction",
-            "                            axi_arready <= '1';",
-            "                            rd_addr_reg <= axi_araddr;",
-            "                            rd_access_error <= rd_addr_valid_n;",
-            "                            axi_state <= RD_ADDR;",
-            "                        end if;",
-            "                    ",
-            "                    ------------------------------------",
-            "                    -- WR_WAIT_ADDR: Data received, waiting for address",
-            "                    -- AXI-LITE-005: Data-first ordering support",
-            "                    ------------------------------------",
-            "                    when WR_WAIT_ADDR =>",
-            "                        axi_wready <= '0';",
-            "                        if axi_awvalid = '1' then",
-            "                            axi_awready <= '1';",
-            "                            wr_addr_reg <= axi_awaddr;",
-            "                            wr_access_error <= wr_addr_valid_n;",
-            "                            axi_state <= WR_DO_WRITE;",
-            "                        end if;",
-            "                    ",
-            "                    ------------------------------------",
-            "                    -- WR_WAIT_DATA: Address received, waiting for data",
-            "                    -- AXI-LITE-005: Address-first ordering support",
-            "                    ------------------------------------",
-            "                    when WR_WAIT_DATA =>",
-            "                        axi_awready <= '0';",
-            "                        if axi_wvalid = '1' then",
-            "                            axi_wready <= '1';",
-            "                            wr_data_reg <= axi_wdata;",
-            "                            wr_strb_reg <= axi_wstrb;",
-            "                            axi_state <= WR_DO_WRITE;",
-            "                        end if;",
-            "                    ",
-            "                    ------------------------------------",
-            "                    -- WR_DO_WRITE: Perform register write",
-            "                    ------------------------------------",
-            "                    when WR_DO_WRITE =>",
-            "                        axi_awready <= '0';",
-            "                        axi_wready <= '0';",
-            "                        do_reg_write <= '1';  -- Trigger register write",
-            "                        axi_state <= WR_RESP;",
-            "                        axi_bvalid <= '1';",
-            "                        -- AXI-LITE-014: Response Code Compliance",
-            "                        if wr_access_error = '1' then",
-            "                            axi_bresp <= \"10\"; -- SLVERR",
-            "                        else",
-            "                            axi_bresp <= \"00\"; -- OKAY",
-            "                        end if;",
-            "                    ",
-            "                    ------------------------------------",
-            "                    -- WR_RESP: Wait for response acknowledgment",
-            "                    -- AXI-LITE-007: Write Response Timing",
-            "                    ------------------------------------",
-            "                    when WR_RESP =>",
-            "                        -- AXI-LITE-016/017: READY handling (immediate or delayed)",
-            "                        if axi_bready = '1' then",
-            "                            axi_bvalid <= '0';",
-            "                            axi_bresp <= \"00\";",
-            "                            axi_state <= IDLE;",
-            "                        end if;",
-            "                    ",
-            "                    ------------------------------------",
-            "                    -- RD_ADDR: Read address received",
-            "                    ------------------------------------",
-            "                    when RD_ADDR =>",
-            "                        axi_arready <= '0';",
-            "                        axi_state <= RD_DATA;",
-            "                        axi_rvalid <= '1';",
-            "                        -- AXI-LITE-014: Response Code Compliance",
-            "                        if rd_access_error = '1' then",
-            "                            axi_rresp <= \"10\"; -- SLVERR",
-            "                        else",
-            "                            axi_rresp <= \"00\"; -- OKAY",
-            "                        end if;",
-            "                    ",
-            "                    ------------------------------------",
-            "                    -- RD_DATA: Output read data",
-            "                    -- AXI-LITE-008: Read Response Timing",
-            "                    -- AXI-LITE-016/017: READY handling",
-            "                    ------------------------------------",
-            "                    when RD_DATA =>",
-            "                        if axi_rready = '1' then",
-            "                            axi_rvalid <= '0';",
-            "                            axi_rresp <= \"00\";",
-            "                            axi_state <= IDLE;",
-            "                        end if;",
-            "                end case;",
-            "            end if;",
-            "        end if;",
-            "    end process;",
-            "    ",
-        ])
+        if split:
+            lines.extend(self._generate_split_state_machines(wr_sel_capture, rd_sel_capture,
+                                                             rd_pipe_reset, pipeline))
+        elif fast:
+            lines.extend(self._generate_fast_channels(decode))
+        else:
+            lines.extend([
+                "    ",
+                "    ---------------------------------------------------------------------------",
+                "    -- AXI4-Lite Interface State Machine",
+                "    -- Full protocol compliance per ARM AMBA AXI4-Lite specification:",
+                "    --   - AXI-LITE-001: Safe reset state for all outputs",
+                "    --   - AXI-LITE-004: VALID stability until READY",
+                "    --   - AXI-LITE-005: Independent write address and data channels",
+                "    --   - AXI-LITE-007/008: Correct response timing",
+                "    --   - AXI-LITE-016/017: Delayed and early READY handling",
+                "    ---------------------------------------------------------------------------",
+                "    process(axi_aclk)",
+                "    begin",
+                "        if rising_edge(axi_aclk) then",
+                "            if axi_aresetn = '0' then",
+                "                -- AXI-LITE-001: Reset State Requirements",
+                "                axi_state <= IDLE;",
+                "                axi_awready <= '0';",
+                "                axi_wready <= '0';",
+                "                axi_bvalid <= '0';",
+                "                axi_bresp <= \"00\";",
+                "                axi_arready <= '0';",
+                "                axi_rvalid <= '0';",
+                "                axi_rresp <= \"00\";",
+                "                wr_access_error <= '0';",
+                "                rd_access_error <= '0';",
+                "                do_reg_write <= '0';",
+                *rd_pipe_reset,
+                "            else",
+                "                -- Default: clear one-shot signals",
+                "                do_reg_write <= '0';",
+                "                ",
+                "                case axi_state is",
+                "                    ------------------------------------",
+                "                    -- IDLE: Wait for transaction start",
+                "                    ------------------------------------",
+                "                    when IDLE =>",
+                "                        -- Check for write transaction (address or data can come first)",
+                "                        -- AXI-LITE-005: Write Address and Data Independence",
+                "                        if axi_awvalid = '1' and axi_wvalid = '1' then",
+                "                            -- Both address and data arrived simultaneously",
+                "                            axi_awready <= '1';",
+                "                            axi_wready <= '1';",
+                "                            wr_addr_reg <= axi_awaddr;",
+                *wr_sel_capture,
+                "                            wr_data_reg <= axi_wdata;",
+                "                            wr_strb_reg <= axi_wstrb;",
+                "                            wr_access_error <= wr_addr_valid_n;",
+                "                            axi_state <= WR_DO_WRITE;",
+                "                        elsif axi_awvalid = '1' then",
+                "                            -- Address first - wait for data",
+                "                            axi_awready <= '1';",
+                "                            wr_addr_reg <= axi_awaddr;",
+                *wr_sel_capture,
+                "                            wr_access_error <= wr_addr_valid_n;",
+                "                            axi_state <= WR_WAIT_DATA;",
+                "                        elsif axi_wvalid = '1' then",
+                "                            -- Data first - wait for address",
+                "                            axi_wready <= '1';",
+                "                            wr_data_reg <= axi_wdata;",
+                "                            wr_strb_reg <= axi_wstrb;",
+                "                            axi_state <= WR_WAIT_ADDR;",
+                "                        elsif axi_arvalid = '1' then",
+                "                            -- Read transaction",
+                "                            axi_arready <= '1';",
+                "                            rd_addr_reg <= axi_araddr;",
+                *rd_sel_capture,
+                "                            rd_access_error <= rd_addr_valid_n;",
+                "                            axi_state <= RD_ADDR;",
+                "                        end if;",
+                "                    ",
+                "                    ------------------------------------",
+                "                    -- WR_WAIT_ADDR: Data received, waiting for address",
+                "                    -- AXI-LITE-005: Data-first ordering support",
+                "                    ------------------------------------",
+                "                    when WR_WAIT_ADDR =>",
+                "                        axi_wready <= '0';",
+                "                        if axi_awvalid = '1' then",
+                "                            axi_awready <= '1';",
+                "                            wr_addr_reg <= axi_awaddr;",
+                *wr_sel_capture,
+                "                            wr_access_error <= wr_addr_valid_n;",
+                "                            axi_state <= WR_DO_WRITE;",
+                "                        end if;",
+                "                    ",
+                "                    ------------------------------------",
+                "                    -- WR_WAIT_DATA: Address received, waiting for data",
+                "                    -- AXI-LITE-005: Address-first ordering support",
+                "                    ------------------------------------",
+                "                    when WR_WAIT_DATA =>",
+                "                        axi_awready <= '0';",
+                "                        if axi_wvalid = '1' then",
+                "                            axi_wready <= '1';",
+                "                            wr_data_reg <= axi_wdata;",
+                "                            wr_strb_reg <= axi_wstrb;",
+                "                            axi_state <= WR_DO_WRITE;",
+                "                        end if;",
+                "                    ",
+                "                    ------------------------------------",
+                "                    -- WR_DO_WRITE: Perform register write",
+                "                    ------------------------------------",
+                "                    when WR_DO_WRITE =>",
+                "                        axi_awready <= '0';",
+                "                        axi_wready <= '0';",
+                "                        do_reg_write <= '1';  -- Trigger register write",
+                "                        axi_state <= WR_RESP;",
+                "                        axi_bvalid <= '1';",
+                "                        -- AXI-LITE-014: Response Code Compliance",
+                "                        if wr_access_error = '1' then",
+                "                            axi_bresp <= \"10\"; -- SLVERR",
+                "                        else",
+                "                            axi_bresp <= \"00\"; -- OKAY",
+                "                        end if;",
+                "                    ",
+                "                    ------------------------------------",
+                "                    -- WR_RESP: Wait for response acknowledgment",
+                "                    -- AXI-LITE-007: Write Response Timing",
+                "                    ------------------------------------",
+                "                    when WR_RESP =>",
+                "                        -- AXI-LITE-016/017: READY handling (immediate or delayed)",
+                "                        if axi_bready = '1' then",
+                "                            axi_bvalid <= '0';",
+                "                            axi_bresp <= \"00\";",
+                "                            axi_state <= IDLE;",
+                "                        end if;",
+                "                    ",
+                "                    ------------------------------------",
+                "                    -- RD_ADDR: Read address received",
+                "                    ------------------------------------",
+                "                    when RD_ADDR =>",
+                "                        axi_arready <= '0';",
+                *self._generate_rd_addr_state(pipeline),
+                "                    ",
+                "                    ------------------------------------",
+                "                    -- RD_DATA: Output read data",
+                "                    -- AXI-LITE-008: Read Response Timing",
+                "                    -- AXI-LITE-016/017: READY handling",
+                "                    ------------------------------------",
+                "                    when RD_DATA =>",
+                "                        if axi_rready = '1' then",
+                "                            axi_rvalid <= '0';",
+                "                            axi_rresp <= \"00\";",
+                "                            axi_state <= IDLE;",
+                "                        end if;",
+                "                end case;",
+                "            end if;",
+                "        end if;",
+                "    end process;",
+                "    ",
+            ])
         
         # Generate CDC synchronizer process if CDC is enabled
-        if module_data['cdc_enabled']:
+        if module_data['cdc_enabled'] and module_data.get('cdc_mode') == 'handshake':
+            lines.extend(self._generate_cdc_handshake(module_data, decode))
+        elif module_data['cdc_enabled']:
             lines.extend(self._generate_cdc_process(module_data))
         
-        # Generate write address valid detection (combinational, uses axi_awaddr)
-        lines.extend([
-            "    -- Write Address Valid Detection (combinational)",
-            "    process(axi_awaddr)",
-            "    begin",
-            "        wr_addr_valid_n <= '1';  -- Default: invalid",
-        ])
+        if decode:
+            # One case statement per channel drives the select vector and valid flag
+            lines.extend(self._generate_decode_process('axi_awaddr', 'aw_sel', decode.write, 'Write'))
+            lines.append("    wr_addr_valid_n <= '1' when aw_sel = WR_SEL_NONE else '0';")
+            lines.append("    ")
+            lines.extend(self._generate_decode_process('axi_araddr', 'ar_sel', decode.read, 'Read'))
+            lines.append("    rd_addr_valid_n <= '1' when ar_sel = RD_SEL_NONE else '0';")
+            lines.append("    ")
+        else:
+            # Generate write address valid detection (combinational, uses axi_awaddr)
+            lines.extend([
+                "    -- Write Address Valid Detection (combinational)",
+                "    process(axi_awaddr)",
+                "    begin",
+                "        wr_addr_valid_n <= '1';  -- Default: invalid",
+            ])
         
-        for reg in module_data['registers']:
-            if reg.get('is_packed'):
-                continue
-            if reg['access_mode'] in ['WO', 'RW']:
-                num_regs = self._get_num_regs(reg['signal_type'])
-                if num_regs == 1:
-                    offset = reg.get("relative_address_int", reg["address_int"] - module_data.get('base_address', 0))
-                    lines.append(f"        if unsigned(axi_awaddr) = unsigned(BASE_ADDR) + {offset} then")
-                    lines.append("            wr_addr_valid_n <= '0';  -- Valid write address")
-                    lines.append("        end if;")
-                else:
-                    # Multi-register signal - add all chunk addresses
-                    base_relative = reg.get("relative_address_int", reg["address_int"] - module_data.get('base_address', 0))
-                    for i in range(num_regs):
-                        offset = base_relative + (i * 4)
+            for reg in module_data['registers']:
+                if reg.get('is_packed'):
+                    continue
+                if reg['access_mode'] in ['WO', 'RW']:
+                    num_regs = self._get_num_regs(reg['signal_type'])
+                    if num_regs == 1:
+                        offset = reg.get("relative_address_int", reg["address_int"] - module_data.get('base_address', 0))
                         lines.append(f"        if unsigned(axi_awaddr) = unsigned(BASE_ADDR) + {offset} then")
-                        lines.append(f"            wr_addr_valid_n <= '0';  -- Valid write address ({reg['signal_name']} reg{i})")
+                        lines.append("            wr_addr_valid_n <= '0';  -- Valid write address")
                         lines.append("        end if;")
+                    else:
+                        # Multi-register signal - add all chunk addresses
+                        base_relative = reg.get("relative_address_int", reg["address_int"] - module_data.get('base_address', 0))
+                        for i in range(num_regs):
+                            offset = base_relative + (i * 4)
+                            lines.append(f"        if unsigned(axi_awaddr) = unsigned(BASE_ADDR) + {offset} then")
+                            lines.append(f"            wr_addr_valid_n <= '0';  -- Valid write address ({reg['signal_name']} reg{i})")
+                            lines.append("        end if;")
         
-        # Add packed register write address validation
-        for packed_reg in module_data.get('packed_registers', []):
-            if packed_reg['access_mode'] in ['WO', 'RW']:
-                offset = packed_reg.get("relative_address_int", packed_reg["address_int"] - module_data.get('base_address', 0))
-                lines.append(f"        if unsigned(axi_awaddr) = unsigned(BASE_ADDR) + {offset} then")
-                lines.append(f"            wr_addr_valid_n <= '0';  -- Valid write address ({packed_reg['reg_name']} packed)")
-                lines.append("        end if;")
+            # Add packed register write address validation
+            for packed_reg in module_data.get('packed_registers', []):
+                if packed_reg['access_mode'] in ['WO', 'RW']:
+                    offset = packed_reg.get("relative_address_int", packed_reg["address_int"] - module_data.get('base_address', 0))
+                    lines.append(f"        if unsigned(axi_awaddr) = unsigned(BASE_ADDR) + {offset} then")
+                    lines.append(f"            wr_addr_valid_n <= '0';  -- Valid write address ({packed_reg['reg_name']} packed)")
+                    lines.append("        end if;")
         
-        lines.extend([
-            "    end process;",
-            "    ",
-        ])
+            lines.extend([
+                "    end process;",
+                "    ",
+            ])
         
-        # Generate read address valid detection (combinational, uses axi_araddr)
-        lines.extend([
-            "    -- Read Address Valid Detection (combinational)",
-            "    process(axi_araddr)",
-            "    begin",
-            "        rd_addr_valid_n <= '1';  -- Default: invalid",
-        ])
+            # Generate read address valid detection (combinational, uses axi_araddr)
+            lines.extend([
+                "    -- Read Address Valid Detection (combinational)",
+                "    process(axi_araddr)",
+                "    begin",
+                "        rd_addr_valid_n <= '1';  -- Default: invalid",
+            ])
         
-        for reg in module_data['registers']:
-            if reg.get('is_packed'):
-                continue
-            if reg['access_mode'] in ['RO', 'RW']:
-                num_regs = self._get_num_regs(reg['signal_type'])
-                if num_regs == 1:
-                    offset = reg.get("relative_address_int", reg["address_int"] - module_data.get('base_address', 0))
-                    lines.append(f"        if unsigned(axi_araddr) = unsigned(BASE_ADDR) + {offset} then")
-                    lines.append("            rd_addr_valid_n <= '0';  -- Valid read address")
-                    lines.append("        end if;")
-                else:
-                    # Multi-register signal - add all chunk addresses
-                    base_relative = reg.get("relative_address_int", reg["address_int"] - module_data.get('base_address', 0))
-                    for i in range(num_regs):
-                        offset = base_relative + (i * 4)
+            for reg in module_data['registers']:
+                if reg.get('is_packed'):
+                    continue
+                if reg['access_mode'] in ['RO', 'RW']:
+                    num_regs = self._get_num_regs(reg['signal_type'])
+                    if num_regs == 1:
+                        offset = reg.get("relative_address_int", reg["address_int"] - module_data.get('base_address', 0))
                         lines.append(f"        if unsigned(axi_araddr) = unsigned(BASE_ADDR) + {offset} then")
-                        lines.append(f"            rd_addr_valid_n <= '0';  -- Valid read address ({reg['signal_name']} reg{i})")
+                        lines.append("            rd_addr_valid_n <= '0';  -- Valid read address")
                         lines.append("        end if;")
+                    else:
+                        # Multi-register signal - add all chunk addresses
+                        base_relative = reg.get("relative_address_int", reg["address_int"] - module_data.get('base_address', 0))
+                        for i in range(num_regs):
+                            offset = base_relative + (i * 4)
+                            lines.append(f"        if unsigned(axi_araddr) = unsigned(BASE_ADDR) + {offset} then")
+                            lines.append(f"            rd_addr_valid_n <= '0';  -- Valid read address ({reg['signal_name']} reg{i})")
+                            lines.append("        end if;")
         
-        # Add packed register read address validation
-        for packed_reg in module_data.get('packed_registers', []):
-            if packed_reg['access_mode'] in ['RO', 'RW']:
-                offset = packed_reg.get("relative_address_int", packed_reg["address_int"] - module_data.get('base_address', 0))
-                lines.append(f"        if unsigned(axi_araddr) = unsigned(BASE_ADDR) + {offset} then")
-                lines.append(f"            rd_addr_valid_n <= '0';  -- Valid read address ({packed_reg['reg_name']} packed)")
-                lines.append("        end if;")
+            # Add packed register read address validation
+            for packed_reg in module_data.get('packed_registers', []):
+                if packed_reg['access_mode'] in ['RO', 'RW']:
+                    offset = packed_reg.get("relative_address_int", packed_reg["address_int"] - module_data.get('base_address', 0))
+                    lines.append(f"        if unsigned(axi_araddr) = unsigned(BASE_ADDR) + {offset} then")
+                    lines.append(f"            rd_addr_valid_n <= '0';  -- Valid read address ({packed_reg['reg_name']} packed)")
+                    lines.append("        end if;")
+        
+            lines.extend([
+                "    end process;",
+                "    ",
+            ])
         
-        lines.extend([
-            "    end process;",
-            "    ",
-        ])
         
         # Register Write Logic - triggered by do_reg_write signal
         lines.extend([
@@ -1011,7 +1029,8 @@ class VHDLGenerator:
                     offset = base_relative + (chunk * 4)
                     reg_suffix = f"_reg{chunk}" if num_regs > 1 else "_reg"
                     
-                    lines.append(f"                    if unsigned(wr_addr_reg) = unsigned(BASE_ADDR) + {offset} then")
+                    cond = self._addr_match(decode, 'wr', reg['signal_name'], chunk, offset)
+                    lines.append(f"                    if {cond} then")
                     lines.append("                        -- Byte-level write strobe")
                     lines.append("                        if wr_strb_reg(0) = '1' then")
                     lines.append(f"                            {reg['signal_name']}{reg_suffix}(7 downto 0) <= wr_data_reg(7 downto 0);")
@@ -1032,7 +1051,8 @@ class VHDLGenerator:
             if packed_reg['access_mode'] in ['WO', 'RW']:
                 offset = packed_reg.get("relative_address_int", packed_reg["address_int"] - module_data.get('base_address', 0))
                 
-                lines.append(f"                    if unsigned(wr_addr_reg) = unsigned(BASE_ADDR) + {offset} then")
+                cond = self._addr_match(decode, 'wr', packed_reg['reg_name'], 0, offset)
+                lines.append(f"                    if {cond} then")
                 lines.append("                        -- Byte-level write strobe")
                 lines.append("                        if wr_strb_reg(0) = '1' then")
                 lines.append(f"                            {packed_reg['reg_name']}_reg(7 downto 0) <= wr_data_reg(7 downto 0);")
@@ -1057,69 +1077,69 @@ class VHDLGenerator:
         ])
         
         # Register Read Logic
-        lines.extend([
-            "    -- Register Read Logic",
-            "    process(rd_addr_reg, rd_access_error",
-        ])
-        
-        # Add read sensitivity list
-        for reg in module_data['registers']:
-            if reg.get('is_packed'):
-                continue
-            if reg['access_mode'] in ['RO', 'RW']:
-                num_regs = self._get_num_regs(reg['signal_type'])
-                if num_regs == 1:
-                    lines.append(f"        , {reg['signal_name']}_reg")
-                else:
-                    for i in range(num_regs):
-                        lines.append(f"        , {reg['signal_name']}_reg{i}")
-        
-        # Add packed register to sensitivity list
-        for packed_reg in module_data.get('packed_registers', []):
-            if packed_reg['access_mode'] in ['RO', 'RW']:
-                lines.append(f"        , {packed_reg['reg_name']}_val")
+        if pipeline:
+            lines.extend(self._generate_read_pipeline(decode, read_sources, pipeline))
+        else:
+            lines.extend([
+                "    -- Register Read Logic",
+                "    process(rd_sel, rd_access_error" if decode else "    process(rd_addr_reg, rd_access_error",
+            ])
         
-        lines.extend([
-            "    )",
-            "    begin",
-            "        rd_data_reg <= (others => '0');",
-            "        if rd_access_error = '0' then",
-        ])
+            # Add read sensitivity list
+            for _, _, _, source in read_sources:
+                lines.append(f"        , {source}")
         
-        # Read address decoder
-        for reg in module_data['registers']:
-            if reg.get('is_packed'):
-                continue
-            if reg['access_mode'] in ['RO', 'RW']:
-                num_regs = self._get_num_regs(reg['signal_type'])
-                base_relative = reg.get("relative_address_int", reg["address_int"] - module_data.get('base_address', 0))
-                
-                for chunk in range(num_regs):
-                    offset = base_relative + (chunk * 4)
-                    reg_suffix = f"_reg{chunk}" if num_regs > 1 else "_reg"
-                    
+            if decode:
+                # One-hot select: AND-OR mux instead of a priority chain
+                lines.extend([
+                    "    )",
+                    "        variable rd_mux : std_logic_vector(31 downto 0);",
+                    "    begin",
+                    "        rd_mux := (others => '0');",
+                    "        if rd_access_error = '0' then",
+                ])
+                for name, chunk, _, source in read_sources:
+                    lines.append(f"            if rd_sel({decode.read_index(name, chunk)}) = '1' then")
+                    lines.append(f"                rd_mux := rd_mux or {source};")
+                    lines.append("            end if;")
+                lines.extend([
+                    "        end if;",
+                    "        rd_data_reg <= rd_mux;",
+                    "    end process;",
+                    "    ",
+                ])
+            else:
+                lines.extend([
+                    "    )",
+                    "    begin",
+                    "        rd_data_reg <= (others => '0');",
+                    "        if rd_access_error = '0' then",
+                ])
+            
+                # Read address decoder
+                for _, _, offset, source in read_sources:
                     lines.append(f"            if unsigned(rd_addr_reg) = unsigned(BASE_ADDR) + {offset} then")
-                    lines.append(f"                rd_data_reg <= {reg['signal_name']}{reg_suffix};")
+                    lines.append(f"                rd_data_reg <= {source};")
                     lines.append("            end if;")
-        
-        # Packed register read address decoder
-        for packed_reg in module_data.get('packed_registers', []):
-            if packed_reg['access_mode'] in ['RO', 'RW']:
-                offset = packed_reg.get("relative_address_int", packed_reg["address_int"] - module_data.get('base_address', 0))
-                lines.append(f"            if unsigned(rd_addr_reg) = unsigned(BASE_ADDR) + {offset} then")
-                lines.append(f"                rd_data_reg <= {packed_reg['reg_name']}_val;")
-                lines.append("            end if;")
-        
-        lines.extend([
-            "        end if;",
-            "    end process;",
-            "    ",
-            "    axi_rdata <= rd_data_reg;",
-            "    ",
-        ])
+            
+                lines.extend([
+                    "        end if;",
+                    "    end process;",
+                    "    ",
+                ])
+            if not fast:
+                # FSM=fast loads axi_rdata from rd_data_reg in the read channel
+                lines.extend([
+                    "    axi_rdata <= rd_data_reg;",
+                    "    ",
+                ])
         
         cdc_enabled = module_data['cdc_enabled']
-        cdc_last_stage = module_data['cdc_stages'] - 1 if cdc_enabled else 0
+        # Crossed value: last synchronizer stage, or the CDC_MODE=handshake destination register
+        if module_data.get('cdc_mode') == 'handshake':
+            cdc_out = "_cdc"
+        else:
+            cdc_out = f"_sync{module_data['cdc_stages'] - 1 if cdc_enabled else 0}"
         
         # Generate signal assignments based on port direction
         for reg in module_data['registers']:
@@ -1137,17 +1157,17 @@ class VHDLGenerator:
                     addr_checks = []
                     for i in range(num_regs):
                         chunk_offset = offset + (i * 4)
-                        addr_checks.append(f"unsigned(rd_addr_reg) = unsigned(BASE_ADDR) + {chunk_offset}")
+                        addr_checks.append(self._addr_match(decode, 'rd', reg['signal_name'], i, chunk_offset))
                     addr_cond = " or ".join(addr_checks)
                     if num_regs > 1:
-                        lines.append(f"    {reg['signal_name']}_rd_strobe <= '1' when (axi_state = RD_DATA and axi_rready = '1' and ({addr_cond})) else '0';")
+                        lines.append(f"    {reg['signal_name']}_rd_strobe <= '1' when ({rd_fire} and ({addr_cond})) else '0';")
                     else:
-                        lines.append(f"    {reg['signal_name']}_rd_strobe <= '1' when (axi_state = RD_DATA and axi_rready = '1' and {addr_cond}) else '0';")
+                        lines.append(f"    {reg['signal_name']}_rd_strobe <= '1' when ({rd_fire} and {addr_cond}) else '0';")
                 
                 # RO is 'in' port - assign chunks from input to internal registers
                 if num_regs == 1:
                     if cdc_enabled:
-                        lines.append(f"    {reg['signal_name']}_reg <= {reg['signal_name']}_sync{cdc_last_stage};")
+                        lines.append(f"    {reg['signal_name']}_reg <= {reg['signal_name']}{cdc_out};")
                     else:
                         expanded_input = self._expand_to_32bit(reg['signal_name'], signal_type)
                         lines.append(f"    {reg['signal_name']}_reg <= {expanded_input};")
@@ -1157,7 +1177,7 @@ class VHDLGenerator:
                         start_bit = i * 32
                         end_bit = min((i + 1) * 32 - 1, signal_width - 1)
                         if cdc_enabled:
-                            lines.append(f"    {reg['signal_name']}_reg{i} <= {reg['signal_name']}{i}_sync{cdc_last_stage};")
+                            lines.append(f"    {reg['signal_name']}_reg{i} <= {reg['signal_name']}{i}{cdc_out};")
                         else:
                             if end_bit - start_bit + 1 == 32:
                                 lines.append(f"    {reg['signal_name']}_reg{i} <= {reg['signal_name']}({end_bit} downto {start_bit});")
@@ -1174,25 +1194,25 @@ class VHDLGenerator:
                     addr_checks = []
                     for i in range(num_regs):
                         chunk_offset = offset + (i * 4)
-                        addr_checks.append(f"unsigned(wr_addr_reg) = unsigned(BASE_ADDR) + {chunk_offset}")
+                        addr_checks.append(self._addr_match(decode, 'wr', reg['signal_name'], i, chunk_offset))
                     addr_cond = " or ".join(addr_checks)
                     if num_regs > 1:
-                        lines.append(f"    {reg['signal_name']}_wr_strobe <= '1' when (axi_state = WR_DO_WRITE and ({addr_cond})) else '0';")
+                        lines.append(f"    {reg['signal_name']}_wr_strobe <= '1' when ({wr_commit} and ({addr_cond})) else '0';")
                     else:
-                        lines.append(f"    {reg['signal_name']}_wr_strobe <= '1' when (axi_state = WR_DO_WRITE and {addr_cond}) else '0';")
+                        lines.append(f"    {reg['signal_name']}_wr_strobe <= '1' when ({wr_commit} and {addr_cond}) else '0';")
                 
                 # WO is 'out' port - concatenate chunks to output
                 if num_regs == 1:
                     sliced_reg = self._slice_from_32bit(f"{reg['signal_name']}_reg", signal_type)
                     if cdc_enabled:
-                        sliced_sync = self._slice_from_32bit(f"{reg['signal_name']}_sync{cdc_last_stage}", signal_type)
+                        sliced_sync = self._slice_from_32bit(f"{reg['signal_name']}{cdc_out}", signal_type)
                         lines.append(f"    {reg['signal_name']} <= {sliced_sync};")
                     else:
                         lines.append(f"    {reg['signal_name']} <= {sliced_reg};")
                 else:
                     # Wide signal - concatenate all chunks
                     if cdc_enabled:
-                        chunks = [f"{reg['signal_name']}{i}_sync{cdc_last_stage}" for i in range(num_regs-1, -1, -1)]
+                        chunks = [f"{reg['signal_name']}{i}{cdc_out}" for i in range(num_regs-1, -1, -1)]
                     else:
                         chunks = [f"{reg['signal_name']}_reg{i}" for i in range(num_regs-1, -1, -1)]
                     
@@ -1211,37 +1231,37 @@ class VHDLGenerator:
                     addr_checks_rd = []
                     for i in range(num_regs):
                         chunk_offset = offset + (i * 4)
-                        addr_checks_rd.append(f"unsigned(rd_addr_reg) = unsigned(BASE_ADDR) + {chunk_offset}")
+                        addr_checks_rd.append(self._addr_match(decode, 'rd', reg['signal_name'], i, chunk_offset))
                     addr_cond_rd = " or ".join(addr_checks_rd)
                     if num_regs > 1:
-                        lines.append(f"    {reg['signal_name']}_rd_strobe <= '1' when (axi_state = RD_DATA and axi_rready = '1' and ({addr_cond_rd})) else '0';")
+                        lines.append(f"    {reg['signal_name']}_rd_strobe <= '1' when ({rd_fire} and ({addr_cond_rd})) else '0';")
                     else:
-                        lines.append(f"    {reg['signal_name']}_rd_strobe <= '1' when (axi_state = RD_DATA and axi_rready = '1' and {addr_cond_rd}) else '0';")
+                        lines.append(f"    {reg['signal_name']}_rd_strobe <= '1' when ({rd_fire} and {addr_cond_rd}) else '0';")
 
                 if reg['write_strobe']:
                     # Check all address chunks for wide signals
                     addr_checks_wr = []
                     for i in range(num_regs):
                         chunk_offset = offset + (i * 4)
-                        addr_checks_wr.append(f"unsigned(wr_addr_reg) = unsigned(BASE_ADDR) + {chunk_offset}")
+                        addr_checks_wr.append(self._addr_match(decode, 'wr', reg['signal_name'], i, chunk_offset))
                     addr_cond_wr = " or ".join(addr_checks_wr)
                     if num_regs > 1:
-                        lines.append(f"    {reg['signal_name']}_wr_strobe <= '1' when (axi_state = WR_DO_WRITE and ({addr_cond_wr})) else '0';")
+                        lines.append(f"    {reg['signal_name']}_wr_strobe <= '1' when ({wr_commit} and ({addr_cond_wr})) else '0';")
                     else:
-                        lines.append(f"    {reg['signal_name']}_wr_strobe <= '1' when (axi_state = WR_DO_WRITE and {addr_cond_wr}) else '0';")
+                        lines.append(f"    {reg['signal_name']}_wr_strobe <= '1' when ({wr_commit} and {addr_cond_wr}) else '0';")
                 
                 # RW is 'out' port - concatenate chunks to output
                 if num_regs == 1:
                     sliced_reg = self._slice_from_32bit(f"{reg['signal_name']}_reg", signal_type)
                     if cdc_enabled:
-                        sliced_sync = self._slice_from_32bit(f"{reg['signal_name']}_sync{cdc_last_stage}", signal_type)
+                        sliced_sync = self._slice_from_32bit(f"{reg['signal_name']}{cdc_out}", signal_type)
                         lines.append(f"    {reg['signal_name']} <= {sliced_sync};")
                     else:
                         lines.append(f"    {reg['signal_name']} <= {sliced_reg};")
                 else:
                     # Wide signal - concatenate all chunks
                     if cdc_enabled:
-                        chunks = [f"{reg['signal_name']}{i}_sync{cdc_last_stage}" for i in range(num_regs-1, -1, -1)]
+                        chunks = [f"{reg['signal_name']}{i}{cdc_out}" for i in range(num_regs-1, -1, -1)]
                     else:
                         chunks = [f"{reg['signal_name']}_reg{i}" for i in range(num_regs-1, -1, -1)]
                     
@@ -1258,9 +1278,11 @@ class VHDLGenerator:
             
             # Strobe logic (Parent level)
             if packed_reg.get('read_strobe'):
-                lines.append(f"    {packed_reg['reg_name']}_rd_strobe <= '1' when (axi_state = RD_DATA and axi_rready = '1' and unsigned(rd_addr_reg) = unsigned(BASE_ADDR) + {offset}) else '0';")
+                rd_cond = self._addr_match(decode, 'rd', packed_reg['reg_name'], 0, offset)
+                lines.append(f"    {packed_reg['reg_name']}_rd_strobe <= '1' when ({rd_fire} and {rd_cond}) else '0';")
             if packed_reg.get('write_strobe'):
-                lines.append(f"    {packed_reg['reg_name']}_wr_strobe <= '1' when (axi_state = WR_DO_WRITE and unsigned(wr_addr_reg) = unsigned(BASE_ADDR) + {offset}) else '0';")
+                wr_cond = self._addr_match(decode, 'wr', packed_reg['reg_name'], 0, offset)
+                lines.append(f"    {packed_reg['reg_name']}_wr_strobe <= '1' when ({wr_commit} and {wr_cond}) else '0';")
             
             lines.append("    ")
         
@@ -1273,21 +1295,580 @@ class VHDLGenerator:
         
         return lines
     
-    def _generate_cdc_process(self, module_data: Dict) -> List[str]:
-        """Generate CDC synchronization process for cross-domain signals."""
-        lines = []
-        cdc_stages = module_data['cdc_stages']
-        
-        lines.extend([
-            "    ---------------------------------------------------------------------------",
-            f"    -- CDC Synchronizer Process ({cdc_stages}-stage synchronization)",
-            "    -- Synchronizes signals between module_clk and axi_aclk domains",
-            "    -- RO registers: module_clk -> axi_aclk (input to AXI)",
-            "    -- WO/RW registers: axi_aclk -> module_clk (output from AXI)",
-            "    ---------------------------------------------------------------------------",
-        ])
+    def _read_sources(self, module_data: Dict) -> List[tuple]:
+        """Readable register chunks as (register name, chunk, offset, source signal)."""
+        read_sources = []
+        for reg in module_data['registers']:
+            if reg.get('is_packed'):
+                continue
+            if reg['access_mode'] in ['RO', 'RW']:
+                num_regs = self._get_num_regs(reg['signal_type'])
+                base_relative = reg.get("relative_address_int", reg["address_int"] - module_data.get('base_address', 0))
+                
+                for chunk in range(num_regs):
+                    offset = base_relative + (chunk * 4)
+                    reg_suffix = f"_reg{chunk}" if num_regs > 1 else "_reg"
+                    read_sources.append((reg['signal_name'], chunk, offset, f"{reg['signal_name']}{reg_suffix}"))
         
-        # Process for RO registers (module_clk -> axi_aclk)
+        for packed_reg in module_data.get('packed_registers', []):
+            if packed_reg['access_mode'] in ['RO', 'RW']:
+                offset = packed_reg.get("relative_address_int", packed_reg["address_int"] - module_data.get('base_address', 0))
+                read_sources.append((packed_reg['reg_name'], 0, offset, f"{packed_reg['reg_name']}_val"))
+        return read_sources
+
+    @staticmethod
+    def _generate_read_pipeline_declarations(pipeline: int, sources: int) -> List[str]:
+        """Declare the stage registers of the RD_PIPE read mux tree."""
+        if not pipeline:
+            return []
+        lines = [
+            f"    -- Registered read mux (RD_PIPE={pipeline}): stage registers of the mux tree",
+            "    type rd_pipe_array is array (natural range <>) of std_logic_vector(31 downto 0);",
+        ]
+        stages = plan_read_tree(sources, pipeline)
+        for stage, groups in enumerate(stages[:-1], start=1):
+            lines.append(f"    signal rd_pipe{stage} : rd_pipe_array(0 to {len(groups) - 1}) := (others => (others => '0'));")
+        if pipeline > 1:
+            lines.append(f"    signal rd_pipe_cnt : natural range 0 to {pipeline - 1} := 0;")
+        lines.append("    ")
+        return lines
+
+    @staticmethod
+    def _generate_rd_addr_state(pipeline: int, state: str = 'axi_state') -> List[str]:
+        """
+        Generate the RD_ADDR state body after ARREADY is cleared.
+
+        rd_addr_reg is captured on entry to RD_ADDR, so one registered mux
+        stage is loaded by the time RD_DATA starts; each further stage
+        keeps the state machine in RD_ADDR for one more cycle.
+        """
+        respond = [
+            f"{state} <= RD_DATA;",
+            "axi_rvalid <= '1';",
+            "-- AXI-LITE-014: Response Code Compliance",
+            "if rd_access_error = '1' then",
+            "    axi_rresp <= \"10\"; -- SLVERR",
+            "else",
+            "    axi_rresp <= \"00\"; -- OKAY",
+            "end if;",
+        ]
+        if pipeline <= 1:
+            return [f"                        {stmt}" for stmt in respond]
+        return [
+            f"                        -- RD_PIPE={pipeline}: wait until the last mux stage holds the data",
+            f"                        if rd_pipe_cnt = {pipeline - 1} then",
+            "                            rd_pipe_cnt <= 0;",
+            *[f"                            {stmt}" for stmt in respond],
+            "                        else",
+            "                            rd_pipe_cnt <= rd_pipe_cnt + 1;",
+            "                        end if;",
+        ]
+
+    @staticmethod
+    def _generate_fsm_declarations(fsm: Optional[str], decode: Optional[DecodeMap]) -> List[str]:
+        """Declare the AXI4-Lite state machine(s), or the FSM=fast channel registers."""
+        if fsm == 'fast':
+            lines = [
+                "    -- AXI4-Lite Channels (FSM=fast): no state machine, one transaction",
+                "    -- per channel and cycle; READY and VALID outputs are registered",
+                "    signal aw_ready : std_logic;",
+                "    signal w_ready  : std_logic;",
+                "    signal b_valid  : std_logic;",
+                "    signal ar_ready : std_logic;",
+                "    signal r_valid  : std_logic;",
+                "    signal rd_load  : std_logic;  -- Read served: load RDATA from the read mux",
+                "    ",
+                "    -- Holding registers for a beat accepted before it can be served",
+                "    signal aw_held       : std_logic;",
+                "    signal aw_hold_addr  : std_logic_vector(31 downto 0);",
+                "    signal aw_hold_error : std_logic;",
+                "    signal w_held        : std_logic;",
+                "    signal w_hold_data   : std_logic_vector(31 downto 0);",
+                "    signal w_hold_strb   : std_logic_vector(3 downto 0);",
+                "    signal ar_held       : std_logic;",
+                "    signal ar_hold_addr  : std_logic_vector(31 downto 0);",
+                "    signal ar_hold_error : std_logic;",
+            ]
+            if decode:
+                lines.extend([
+                    f"    signal aw_hold_sel   : std_logic_vector({max(len(decode.write), 1) - 1} downto 0);",
+                    f"    signal ar_hold_sel   : std_logic_vector({max(len(decode.read), 1) - 1} downto 0);",
+                ])
+            return lines
+        if fsm != 'split':
+            return [
+                "    -- AXI4-Lite Compliant State Machine",
+                "    -- Supports independent address and data channels per AXI-LITE-005",
+                "    type axi_state_type is (IDLE, WR_WAIT_ADDR, WR_WAIT_DATA, WR_DO_WRITE, WR_RESP, RD_ADDR, RD_DATA);",
+                "    signal axi_state : axi_state_type;",
+            ]
+        return [
+            "    -- AXI4-Lite Compliant State Machines (FSM=split)",
+            "    -- Independent write and read channels; each supports AXI-LITE-005",
+            "    type wr_state_type is (WR_IDLE, WR_WAIT_ADDR, WR_WAIT_DATA, WR_DO_WRITE, WR_RESP);",
+            "    type rd_state_type is (RD_IDLE, RD_ADDR, RD_DATA);",
+            "    signal wr_state : wr_state_type;",
+            "    signal rd_state : rd_state_type;",
+            "    ",
+            "    -- Same-address read/write ordering",
+            "    signal wr_hold : std_logic;  -- Read of the write address in flight: delay the write",
+            "    signal rd_hold : std_logic;  -- Write of the read address committing: delay the read",
+        ]
+
+    def _generate_split_state_machines(self, wr_sel_capture: List[str], rd_sel_capture: List[str],
+                                       rd_pipe_reset: List[str], pipeline: int) -> List[str]:
+        """
+        Generate the FSM=split write and read state machines.
+
+        The write state machine is the write half of the shared one; it
+        holds in WR_DO_WRITE while a read of the same address is in flight.
+        The read state machine does not accept a read of an address whose
+        write is in WR_DO_WRITE, so a register never changes between the
+        read address and read response handshakes of a bus read.
+        """
+        return [
+            "    ",
+            "    ---------------------------------------------------------------------------",
+            "    -- AXI4-Lite Interface State Machines (FSM=split)",
+            "    -- Write and read channels advance independently in the same cycle.",
+            "    -- Full protocol compliance per ARM AMBA AXI4-Lite specification:",
+            "    --   - AXI-LITE-001: Safe reset state for all outputs",
+            "    --   - AXI-LITE-004: VALID stability until READY",
+            "    --   - AXI-LITE-005: Independent write address and data channels",
+            "    --   - AXI-LITE-007/008: Correct response timing",
+            "    --   - AXI-LITE-016/017: Delayed and early READY handling",
+            "    ---------------------------------------------------------------------------",
+            "    ",
+            "    -- Same-address ordering: an in-flight read goes first, a committing write",
+            "    -- goes before a new read; different addresses never wait for each other",
+            "    wr_hold <= '1' when rd_state /= RD_IDLE and rd_addr_reg = wr_addr_reg else '0';",
+            "    rd_hold <= '1' when wr_state = WR_DO_WRITE and axi_araddr = wr_addr_reg else '0';",
+            "    ",
+            "    -- Write channel",
+            "    process(axi_aclk)",
+            "    begin",
+            "        if rising_edge(axi_aclk) then",
+            "            if axi_aresetn = '0' then",
+            "                -- AXI-LITE-001: Reset State Requirements",
+            "                wr_state <= WR_IDLE;",
+            "                axi_awready <= '0';",
+            "                axi_wready <= '0';",
+            "                axi_bvalid <= '0';",
+            "                axi_bresp <= \"00\";",
+            "                wr_access_error <= '0';",
+            "                do_reg_write <= '0';",
+            "            else",
+            "                -- Default: clear one-shot signals",
+            "                do_reg_write <= '0';",
+            "                ",
+            "                case wr_state is",
+            "                    when WR_IDLE =>",
+            "                        -- AXI-LITE-005: Write Address and Data Independence",
+            "                        if axi_awvalid = '1' and axi_wvalid = '1' then",
+            "                            axi_awready <= '1';",
+            "                            axi_wready <= '1';",
+            "                            wr_addr_reg <= axi_awaddr;",
+            *wr_sel_capture,
+            "                            wr_data_reg <= axi_wdata;",
+            "                            wr_strb_reg <= axi_wstrb;",
+            "                            wr_access_error <= wr_addr_valid_n;",
+            "                            wr_state <= WR_DO_WRITE;",
+            "                        elsif axi_awvalid = '1' then",
+            "                            axi_awready <= '1';",
+            "                            wr_addr_reg <= axi_awaddr;",
+            *wr_sel_capture,
+            "                            wr_access_error <= wr_addr_valid_n;",
+            "                            wr_state <= WR_WAIT_DATA;",
+            "                        elsif axi_wvalid = '1' then",
+            "                            axi_wready <= '1';",
+            "                            wr_data_reg <= axi_wdata;",
+            "                            wr_strb_reg <= axi_wstrb;",
+            "                            wr_state <= WR_WAIT_ADDR;",
+            "                        end if;",
+            "                    ",
+            "                    when WR_WAIT_ADDR =>",
+            "                        axi_wready <= '0';",
+            "                        if axi_awvalid = '1' then",
+            "                            axi_awready <= '1';",
+            "                            wr_addr_reg <= axi_awaddr;",
+            *wr_sel_capture,
+            "                            wr_access_error <= wr_addr_valid_n;",
+            "                            wr_state <= WR_DO_WRITE;",
+            "                        end if;",
+            "                    ",
+            "                    when WR_WAIT_DATA =>",
+            "                        axi_awready <= '0';",
+            "                        if axi_wvalid = '1' then",
+            "                            axi_wready <= '1';",
+            "                            wr_data_reg <= axi_wdata;",
+            "                            wr_strb_reg <= axi_wstrb;",
+            "                            wr_state <= WR_DO_WRITE;",
+            "                        end if;",
+            "                    ",
+            "                    when WR_DO_WRITE =>",
+            "                        axi_awready <= '0';",
+            "                        axi_wready <= '0';",
+            "                        if wr_hold = '0' then",
+            "                            do_reg_write <= '1';  -- Trigger register write",
+            "                            wr_state <= WR_RESP;",
+            "                            axi_bvalid <= '1';",
+            "                            -- AXI-LITE-014: Response Code Compliance",
+            "                            if wr_access_error = '1' then",
+            "                                axi_bresp <= \"10\"; -- SLVERR",
+            "                            else",
+            "                                axi_bresp <= \"00\"; -- OKAY",
+            "                            end if;",
+            "                        end if;",
+            "                    ",
+            "                    when WR_RESP =>",
+            "                        -- AXI-LITE-016/017: READY handling (immediate or delayed)",
+            "                        if axi_bready = '1' then",
+            "                            axi_bvalid <= '0';",
+            "                            axi_bresp <= \"00\";",
+            "                            wr_state <= WR_IDLE;",
+            "                        end if;",
+            "                end case;",
+            "            end if;",
+            "        end if;",
+            "    end process;",
+            "    ",
+            "    -- Read channel",
+            "    process(axi_aclk)",
+            "    begin",
+            "        if rising_edge(axi_aclk) then",
+            "            if axi_aresetn = '0' then",
+            "                -- AXI-LITE-001: Reset State Requirements",
+            "                rd_state <= RD_IDLE;",
+            "                axi_arready <= '0';",
+            "                axi_rvalid <= '0';",
+            "                axi_rresp <= \"00\";",
+            "                rd_access_error <= '0';",
+            *rd_pipe_reset,
+            "            else",
+            "                case rd_state is",
+            "                    when RD_IDLE =>",
+            "                        if axi_arvalid = '1' and rd_hold = '0' then",
+            "                            axi_arready <= '1';",
+            "                            rd_addr_reg <= axi_araddr;",
+            *rd_sel_capture,
+            "                            rd_access_error <= rd_addr_valid_n;",
+            "                            rd_state <= RD_ADDR;",
+            "                        end if;",
+            "                    ",
+            "                    when RD_ADDR =>",
+            "                        axi_arready <= '0';",
+            *self._generate_rd_addr_state(pipeline, 'rd_state'),
+            "                    ",
+            "                    when RD_DATA =>",
+            "                        -- AXI-LITE-016/017: READY handling (immediate or delayed)",
+            "                        if axi_rready = '1' then",
+            "                            axi_rvalid <= '0';",
+            "                            axi_rresp <= \"00\";",
+            "                            rd_state <= RD_IDLE;",
+            "                        end if;",
+            "                end case;",
+            "            end if;",
+            "        end if;",
+            "    end process;",
+            "    ",
+        ]
+
+    @staticmethod
+    def _generate_fast_channels(decode: Optional[DecodeMap]) -> List[str]:
+        """
+        Generate the FSM=fast write and read channels.
+
+        AWREADY, WREADY and ARREADY stay high while the channel is empty, so
+        a new address is accepted in the cycle the previous response is. A
+        write commits (do_reg_write) and a read loads RDATA (rd_load) as soon
+        as both beats are available and the response register is free or
+        being emptied; a beat that has to wait is parked in its holding
+        register and drops READY of its channel until it is served. The
+        write address, data and read address seen by the register logic are
+        the held beat if there is one, else the beat on the bus.
+        """
+        wr_sel = ["    wr_sel <= aw_hold_sel when aw_held = '1' else aw_sel;"] if decode else []
+        rd_sel = ["    rd_sel <= ar_hold_sel when ar_held = '1' else ar_sel;"] if decode else []
+        aw_hold_sel = ["                    aw_hold_sel <= aw_sel;"] if decode else []
+        ar_hold_sel = ["                    ar_hold_sel <= ar_sel;"] if decode else []
+        return [
+            "    ",
+            "    ---------------------------------------------------------------------------",
+            "    -- AXI4-Lite Interface Channels (FSM=fast)",
+            "    -- No state machine: each channel takes one transaction per cycle.",
+            "    --   - AXI-LITE-001: Safe reset state for all outputs",
+            "    --   - AXI-LITE-004: VALID stability until READY",
+            "    --   - AXI-LITE-005: Independent write address and data channels",
+            "    --   - AXI-LITE-016/017: Delayed and early READY handling",
+            "    ---------------------------------------------------------------------------",
+            "    axi_awready <= aw_ready;",
+            "    axi_wready  <= w_ready;",
+            "    axi_bvalid  <= b_valid;",
+            "    axi_arready <= ar_ready;",
+            "    axi_rvalid  <= r_valid;",
+            "    ",
+            "    -- Write: commit when address and data are available and B is free",
+            "    do_reg_write <= (aw_held or (axi_awvalid and aw_ready)) and",
+            "                    (w_held or (axi_wvalid and w_ready)) and",
+            "                    (not b_valid or axi_bready);",
+            "    wr_addr_reg <= aw_hold_addr when aw_held = '1' else axi_awaddr;",
+            *wr_sel,
+            "    wr_access_error <= aw_hold_error when aw_held = '1' else wr_addr_valid_n;",
+            "    wr_data_reg <= w_hold_data when w_held = '1' else axi_wdata;",
+            "    wr_strb_reg <= w_hold_strb when w_held = '1' else axi_wstrb;",
+            "    ",
+            "    -- Read: load RDATA when an address is available and R is free",
+            "    rd_load <= (ar_held or (axi_arvalid and ar_ready)) and (not r_valid or axi_rready);",
+            "    rd_addr_reg <= ar_hold_addr when ar_held = '1' else axi_araddr;",
+            *rd_sel,
+            "    rd_access_error <= ar_hold_error when ar_held = '1' else rd_addr_valid_n;",
+            "    ",
+            "    -- Write channel",
+            "    process(axi_aclk)",
+            "    begin",
+            "        if rising_edge(axi_aclk) then",
+            "            if axi_aresetn = '0' then",
+            "                -- AXI-LITE-001: Reset State Requirements",
+            "                aw_ready <= '0';",
+            "                w_ready <= '0';",
+            "                b_valid <= '0';",
+            "                axi_bresp <= \"00\";",
+            "                aw_held <= '0';",
+            "                w_held <= '0';",
+            "            else",
+            "                -- Address: park it while the data or B is not ready",
+            "                if do_reg_write = '1' then",
+            "                    aw_held <= '0';",
+            "                    aw_ready <= '1';",
+            "                elsif axi_awvalid = '1' and aw_ready = '1' then",
+            "                    aw_held <= '1';",
+            "                    aw_ready <= '0';",
+            "                    aw_hold_addr <= axi_awaddr;",
+            *aw_hold_sel,
+            "                    aw_hold_error <= wr_addr_valid_n;",
+            "                elsif aw_held = '0' then",
+            "                    aw_ready <= '1';",
+            "                end if;",
+            "                ",
+            "                -- Data: park it while the address or B is not ready",
+            "                if do_reg_write = '1' then",
+            "                    w_held <= '0';",
+            "                    w_ready <= '1';",
+            "                elsif axi_wvalid = '1' and w_ready = '1' then",
+            "                    w_held <= '1';",
+            "                    w_ready <= '0';",
+            "                    w_hold_data <= axi_wdata;",
+            "                    w_hold_strb <= axi_wstrb;",
+            "                elsif w_held = '0' then",
+            "                    w_ready <= '1';",
+            "                end if;",
+            "                ",
+            "                -- Response: AXI-LITE-016/017 READY handling (immediate or delayed)",
+            "                if do_reg_write = '1' then",
+            "                    b_valid <= '1';",
+            "                    -- AXI-LITE-014: Response Code Compliance",
+            "                    if wr_access_error = '1' then",
+            "                        axi_bresp <= \"10\"; -- SLVERR",
+            "                    else",
+            "                        axi_bresp <= \"00\"; -- OKAY",
+            "                    end if;",
+            "                elsif axi_bready = '1' then",
+            "                    b_valid <= '0';",
+            "                end if;",
+            "            end if;",
+            "        end if;",
+            "    end process;",
+            "    ",
+            "    -- Read channel",
+            "    process(axi_aclk)",
+            "    begin",
+            "        if rising_edge(axi_aclk) then",
+            "            if axi_aresetn = '0' then",
+            "                -- AXI-LITE-001: Reset State Requirements",
+            "                ar_ready <= '0';",
+            "                r_valid <= '0';",
+            "                axi_rresp <= \"00\";",
+            "                axi_rdata <= (others => '0');",
+            "                ar_held <= '0';",
+            "            else",
+            "                -- Address: park it while R is stalled",
+            "                if rd_load = '1' then",
+            "                    ar_held <= '0';",
+            "                    ar_ready <= '1';",
+            "                elsif axi_arvalid = '1' and ar_ready = '1' then",
+            "                    ar_held <= '1';",
+            "                    ar_ready <= '0';",
+            "                    ar_hold_addr <= axi_araddr;",
+            *ar_hold_sel,
+            "                    ar_hold_error <= rd_addr_valid_n;",
+            "                elsif ar_held = '0' then",
+            "                    ar_ready <= '1';",
+            "                end if;",
+            "                ",
+            "                -- Response: RDATA is loaded once and held until RREADY",
+            "                if rd_load = '1' then",
+            "                    r_valid <= '1';",
+            "                    axi_rdata <= rd_data_reg;",
+            "                    -- AXI-LITE-014: Response Code Compliance",
+            "                    if rd_access_error = '1' then",
+            "                        axi_rresp <= \"10\"; -- SLVERR",
+            "                    else",
+            "                        axi_rresp <= \"00\"; -- OKAY",
+            "                    end if;",
+            "                elsif axi_rready = '1' then",
+            "                    r_valid <= '0';",
+            "                end if;",
+            "            end if;",
+            "        end if;",
+            "    end process;",
+            "    ",
+        ]
+
+    def _generate_read_pipeline(self, decode: Optional[DecodeMap], read_sources: List[tuple],
+                                pipeline: int) -> List[str]:
+        """
+        Generate the RD_PIPE read mux as a tree of registered sub-muxes.
+
+        Stage 1 selects one source per sub-mux on the captured address (a
+        priority chain as in the combinational mux, or AND-OR on rd_sel
+        with DECODE=case); later stages OR the sub-mux outputs of the stage
+        before, since only the selected one is non-zero.
+        """
+        stages = plan_read_tree(len(read_sources), pipeline)
+        lines = [
+            f"    -- Register Read Logic (RD_PIPE={pipeline}: {pipeline}-stage registered mux tree)",
+            "    process(axi_aclk)",
+            "        variable rd_mux : std_logic_vector(31 downto 0);",
+            "    begin",
+            "        if rising_edge(axi_aclk) then",
+        ]
+        for stage, groups in enumerate(stages, start=1):
+            label = "final mux" if stage == len(stages) else f"{len(groups)} sub-muxes"
+            lines.append(f"            -- Stage {stage}: {label}")
+            for index, group in enumerate(groups):
+                lines.append("            rd_mux := (others => '0');")
+                if stage == 1 and len(group):
+                    lines.append("            if rd_access_error = '0' then")
+                    for name, chunk, offset, source in (read_sources[i] for i in group):
+                        lines.append(f"                if {self._addr_match(decode, 'rd', name, chunk, offset)} then")
+                        if decode:
+                            lines.append(f"                    rd_mux := rd_mux or {source};")
+                        else:
+                            lines.append(f"                    rd_mux := {source};")
+                        lines.append("                end if;")
+                    lines.append("            end if;")
+                elif stage > 1:
+                    lines.append(f"            for i in {group.start} to {group.stop - 1} loop")
+                    lines.append(f"                rd_mux := rd_mux or rd_pipe{stage - 1}(i);")
+                    lines.append("            end loop;")
+                target = "rd_data_reg" if stage == len(stages) else f"rd_pipe{stage}({index})"
+                lines.append(f"            {target} <= rd_mux;")
+        lines.extend([
+            "        end if;",
+            "    end process;",
+            "    ",
+            "    axi_rdata <= rd_data_reg;",
+            "    ",
+        ])
+        return lines
+
+    @staticmethod
+    def _decode_map(module_data: Dict) -> Optional[DecodeMap]:
+        """Select vectors for DECODE=case (see axion_hdl.address_decoder), or None."""
+        if module_data.get('decode') != 'case':
+            return None
+        registers = [reg for reg in module_data['registers'] if not reg.get('is_packed')]
+        registers.extend(module_data.get('packed_registers', []))
+        return build_decode_map(registers, module_data.get('base_address', 0))
+
+    @staticmethod
+    def _addr_match(decode: Optional[DecodeMap], channel: str, name: str, chunk: int, offset: int) -> str:
+        """
+        Condition selecting one register chunk on the captured address.
+
+        Args:
+            decode: DecodeMap for DECODE=case, or None for full comparators
+            channel: 'wr' (wr_addr_reg) or 'rd' (rd_addr_reg)
+            name: Register name
+            chunk: 32-bit chunk of the register
+            offset: Chunk offset from BASE_ADDR
+        """
+        if decode is None:
+            return f"unsigned({channel}_addr_reg) = unsigned(BASE_ADDR) + {offset}"
+        index = decode.write_index(name, chunk) if channel == 'wr' else decode.read_index(name, chunk)
+        if index is None:
+            # Not decodable on this channel (e.g. a read strobe on a write-only register)
+            return "false"
+        return f"{channel}_sel({index}) = '1'"
+
+    @staticmethod
+    def _generate_decode_declarations(decode: Optional[DecodeMap]) -> List[str]:
+        """Declare the select vectors of the case-based decoder."""
+        if decode is None:
+            return []
+        wr_range = f"{max(len(decode.write), 1) - 1} downto 0"
+        rd_range = f"{max(len(decode.read), 1) - 1} downto 0"
+        return [
+            "    -- Case-based address decode (DECODE=case): one-hot register selects",
+            f"    constant ADDR_DEC_BITS : natural := {decode.bits};",
+            f"    constant WR_SEL_NONE : std_logic_vector({wr_range}) := (others => '0');",
+            f"    constant RD_SEL_NONE : std_logic_vector({rd_range}) := (others => '0');",
+            f"    signal aw_sel : std_logic_vector({wr_range});  -- Decoded axi_awaddr",
+            f"    signal wr_sel : std_logic_vector({wr_range}) := (others => '0');  -- Captured with wr_addr_reg",
+            f"    signal ar_sel : std_logic_vector({rd_range});  -- Decoded axi_araddr",
+            f"    signal rd_sel : std_logic_vector({rd_range}) := (others => '0');  -- Captured with rd_addr_reg",
+            "    ",
+        ]
+
+    @staticmethod
+    def _generate_decode_process(addr: str, sel: str, slots: List, title: str) -> List[str]:
+        """
+        Generate the case-based decoder of one AXI address channel.
+
+        The base address is subtracted once; the offset must be zero above
+        the ADDR_DEC_BITS window, and the window bits select one case choice.
+        """
+        lines = [
+            f"    -- {title} Address Decode (DECODE=case, combinational)",
+            f"    process({addr})",
+            "        variable addr_offset : unsigned(31 downto 0);",
+            "    begin",
+            f"        addr_offset := unsigned({addr}) - unsigned(BASE_ADDR);",
+            f"        {sel} <= (others => '0');",
+            "        if addr_offset(31 downto ADDR_DEC_BITS) = 0 then",
+            "            case to_integer(addr_offset(ADDR_DEC_BITS - 1 downto 0)) is",
+        ]
+        for offset, indices in DecodeMap.choices(slots):
+            lines.append(f"                when 16#{offset:X}# =>")
+            for index in indices:
+                slot = slots[index]
+                label = f"{slot.name} reg{slot.chunk}" if slot.chunk else slot.name
+                lines.append(f"                    {sel}({index}) <= '1';  -- {label}")
+        lines.extend([
+            "                when others =>",
+            "                    null;",
+            "            end case;",
+            "        end if;",
+            "    end process;",
+            "    ",
+        ])
+        return lines
+
+    def _generate_cdc_process(self, module_data: Dict) -> List[str]:
+        """Generate CDC synchronization process for cross-domain signals."""
+        lines = []
+        cdc_stages = module_data['cdc_stages']
+        
+        lines.extend([
+            "    ---------------------------------------------------------------------------",
+            f"    -- CDC Synchronizer Process ({cdc_stages}-stage synchronization)",
+            "    -- Synchronizes signals between module_clk and axi_aclk domains",
+            "    -- RO registers: module_clk -> axi_aclk (input to AXI)",
+            "    -- WO/RW registers: axi_aclk -> module_clk (output from AXI)",
+            "    ---------------------------------------------------------------------------",
+        ])
+        
+        # Process for RO registers (module_clk -> axi_aclk)
         # These are inputs from module that AXI needs to read
         ro_regs = [reg for reg in module_data['registers'] if reg['access_mode'] == 'RO' and not reg.get('is_packed')]
         if ro_regs:
@@ -1375,3 +1956,222 @@ class VHDLGenerator:
             ])
         
         return lines
+
+    def _cdc_handshake_registers(self, module_data: Dict) -> tuple:
+        """
+        Registers on each CDC_MODE=handshake direction.
+
+        Returns:
+            (rd, wr): lists of chunk lists, one per RO register (module_clk ->
+            axi_aclk) and one per WO/RW register (axi_aclk -> module_clk). Each
+            chunk is (destination register, 32-bit source expression).
+        """
+        rd, wr = [], []
+        for reg in module_data['registers']:
+            if reg.get('is_packed'):
+                continue
+            name = reg['signal_name']
+            num_regs = self._get_num_regs(reg['signal_type'])
+            if reg['access_mode'] == 'RO':
+                if num_regs == 1:
+                    rd.append([(f"{name}_cdc", self._expand_to_32bit(name, reg['signal_type']))])
+                    continue
+                signal_width = self._get_signal_width(reg['signal_type'])
+                chunks = []
+                for i in range(num_regs):
+                    start_bit = i * 32
+                    end_bit = min((i + 1) * 32 - 1, signal_width - 1)
+                    chunk_width = end_bit - start_bit + 1
+                    source = f"{name}({end_bit} downto {start_bit})"
+                    if chunk_width < 32:
+                        source = f"(31 downto {chunk_width} => '0') & {source}"
+                    chunks.append((f"{name}{i}_cdc", source))
+                rd.append(chunks)
+            elif num_regs == 1:
+                wr.append([(f"{name}_cdc", f"{name}_reg")])
+            else:
+                wr.append([(f"{name}{i}_cdc", f"{name}_reg{i}") for i in range(num_regs)])
+        return rd, wr
+
+    def _generate_cdc_handshake_declarations(self, module_data: Dict) -> List[str]:
+        """Declare the CDC_MODE=handshake holding, destination and req/ack signals."""
+        cdc_stages = module_data['cdc_stages']
+        lines = [f"    -- CDC handshake ({cdc_stages}-stage req/ack synchronizers)"]
+        for channel, regs in zip(('rd', 'wr'), self._cdc_handshake_registers(module_data)):
+            if not regs:
+                continue
+            hold_width = 32 * max(len(chunks) for chunks in regs)
+            if channel == 'wr':
+                lines.append(f"    signal cdc_wr_pending  : std_logic_vector({len(regs) - 1} downto 0) := (others => '1');")
+            lines.extend([
+                f"    signal cdc_{channel}_ptr      : integer range 0 to {len(regs) - 1} := 0;",
+                f"    signal cdc_{channel}_data     : std_logic_vector({hold_width - 1} downto 0) := (others => '0');",
+                f"    signal cdc_{channel}_req      : std_logic := '0';",
+                f"    signal cdc_{channel}_req_sync : std_logic_vector({cdc_stages - 1} downto 0) := (others => '0');",
+                f"    signal cdc_{channel}_ack      : std_logic := '0';",
+                f"    signal cdc_{channel}_ack_sync : std_logic_vector({cdc_stages - 1} downto 0) := (others => '0');",
+            ])
+            for chunks in regs:
+                for dest, _ in chunks:
+                    lines.append(f"    signal {dest} : std_logic_vector(31 downto 0) := (others => '0');")
+        return lines
+
+    def _generate_cdc_handshake(self, module_data: Dict, decode: Optional[DecodeMap]) -> List[str]:
+        """
+        Generate the CDC_MODE=handshake processes.
+
+        Each direction moves one register per toggle handshake: the source
+        domain loads cdc_<ch>_data and cdc_<ch>_ptr, toggles cdc_<ch>_req and
+        keeps both stable until the synchronized ack equals req again; the
+        destination domain loads the register selected by cdc_<ch>_ptr when
+        the synchronized req differs from its ack, and echoes req as ack.
+
+        A write marks its register pending on the clock edge that updates
+        <reg>_reg (the register write condition, for every FSM), so the next
+        load sends the new value.
+
+        Args:
+            module_data: Parsed module data
+            decode: DecodeMap for DECODE=case, or None
+        """
+        cdc_stages = module_data['cdc_stages']
+        last = cdc_stages - 1
+        rd_regs, wr_regs = self._cdc_handshake_registers(module_data)
+
+        def sync_chain(channel, signal, indent):
+            pad = " " * indent
+            chain = [f"{pad}cdc_{channel}_{signal}_sync(0) <= cdc_{channel}_{signal};"]
+            chain.extend(f"{pad}cdc_{channel}_{signal}_sync({stage}) <= cdc_{channel}_{signal}_sync({stage - 1});"
+                         for stage in range(1, cdc_stages))
+            return chain
+
+        def load(channel, regs, indent, next_ptr=False):
+            # Source side: copy one register into the holding register
+            pad = " " * indent
+            case = [f"{pad}case cdc_{channel}_ptr is"]
+            for k in range(len(regs)):
+                sel = (k + 1) % len(regs) if next_ptr else k
+                case.append(f"{pad}    when {k} =>")
+                if next_ptr:
+                    case.append(f"{pad}        cdc_{channel}_ptr <= {sel};")
+                for i, (_, source) in enumerate(regs[sel]):
+                    case.append(f"{pad}        cdc_{channel}_data({i * 32 + 31} downto {i * 32}) <= {source};")
+            case.append(f"{pad}end case;")
+            return case
+
+        def capture(channel, regs, indent):
+            # Destination side: load the register the source is holding
+            pad = " " * indent
+            case = [
+                f"{pad}if cdc_{channel}_req_sync({last}) /= cdc_{channel}_ack then",
+                f"{pad}    cdc_{channel}_ack <= cdc_{channel}_req_sync({last});",
+                f"{pad}    case cdc_{channel}_ptr is",
+            ]
+            for k, chunks in enumerate(regs):
+                case.append(f"{pad}        when {k} =>")
+                for i, (dest, _) in enumerate(chunks):
+                    case.append(f"{pad}            {dest} <= cdc_{channel}_data({i * 32 + 31} downto {i * 32});")
+            case.extend([f"{pad}    end case;", f"{pad}end if;"])
+            return case
+
+        lines = [
+            "    ---------------------------------------------------------------------------",
+            f"    -- CDC Handshake ({cdc_stages}-stage req/ack synchronization)",
+            "    -- One register crosses per req toggle; cdc_*_ptr and cdc_*_data stay",
+            "    -- stable in the source domain until the synchronized ack matches req",
+            "    -- RO registers: module_clk -> axi_aclk, sent round robin",
+            "    -- WO/RW registers: axi_aclk -> module_clk, sent when written",
+            "    ---------------------------------------------------------------------------",
+        ]
+
+        if rd_regs:
+            lines.extend([
+                "    -- CDC: Module clock domain to AXI clock domain (for RO registers)",
+                "    process(module_clk)",
+                "    begin",
+                "        if rising_edge(module_clk) then",
+                *sync_chain('rd', 'ack', 12),
+                f"            if cdc_rd_req = cdc_rd_ack_sync({last}) then",
+                *load('rd', rd_regs, 16, next_ptr=True),
+                "                cdc_rd_req <= not cdc_rd_req;",
+                "            end if;",
+                "        end if;",
+                "    end process;",
+                "    ",
+                "    process(axi_aclk)",
+                "    begin",
+                "        if rising_edge(axi_aclk) then",
+                "            if axi_aresetn = '0' then",
+                "                cdc_rd_req_sync <= (others => '0');",
+                "                cdc_rd_ack <= '0';",
+                *[f"                {dest} <= (others => '0');" for chunks in rd_regs for dest, _ in chunks],
+                "            else",
+                *sync_chain('rd', 'req', 16),
+                *capture('rd', rd_regs, 16),
+                "            end if;",
+                "        end if;",
+                "    end process;",
+                "    ",
+            ])
+
+        if wr_regs:
+            advance = []
+            if len(wr_regs) > 1:
+                advance = [
+                    f"                    elsif cdc_wr_ptr = {len(wr_regs) - 1} then",
+                    "                        cdc_wr_ptr <= 0;",
+                    "                    else",
+                    "                        cdc_wr_ptr <= cdc_wr_ptr + 1;",
+                ]
+            lines.extend([
+                "    -- CDC: AXI clock domain to Module clock domain (for WO/RW registers)",
+                "    process(axi_aclk)",
+                "    begin",
+                "        if rising_edge(axi_aclk) then",
+                "            if axi_aresetn = '0' then",
+                "                cdc_wr_pending <= (others => '1');",
+                "                cdc_wr_ptr <= 0;",
+                "                cdc_wr_req <= '0';",
+                "                cdc_wr_ack_sync <= (others => '0');",
+                "            else",
+                *sync_chain('wr', 'ack', 16),
+                f"                if cdc_wr_req = cdc_wr_ack_sync({last}) then",
+                "                    if cdc_wr_pending(cdc_wr_ptr) = '1' then",
+                *load('wr', wr_regs, 24),
+                "                        cdc_wr_pending(cdc_wr_ptr) <= '0';",
+                "                        cdc_wr_req <= not cdc_wr_req;",
+                *advance,
+                "                    end if;",
+                "                end if;",
+                "                -- A write marks its register pending again",
+            ])
+            k = 0
+            for reg in module_data['registers']:
+                if reg.get('is_packed') or reg['access_mode'] not in ('WO', 'RW'):
+                    continue
+                offset = reg.get("relative_address_int", reg["address_int"] - module_data.get('base_address', 0))
+                addr_cond = " or ".join(
+                    self._addr_match(decode, 'wr', reg['signal_name'], i, offset + i * 4)
+                    for i in range(self._get_num_regs(reg['signal_type'])))
+                lines.extend([
+                    f"                if do_reg_write = '1' and wr_access_error = '0' and ({addr_cond}) then",
+                    f"                    cdc_wr_pending({k}) <= '1';",
+                    "                end if;",
+                ])
+                k += 1
+            lines.extend([
+                "            end if;",
+                "        end if;",
+                "    end process;",
+                "    ",
+                "    process(module_clk)",
+                "    begin",
+                "        if rising_edge(module_clk) then",
+                *sync_chain('wr', 'req', 12),
+                *capture('wr', wr_regs, 12),
+                "        end if;",
+                "    end process;",
+                "    ",
+            ])
+
+        return lines
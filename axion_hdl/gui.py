@@ -85,13 +85,11 @@ class AnalysisCache:
             axion_instance.toml_src_dirs
         )
 
+        # Files may have been added since the last analysis
+        inventory = axion_instance.get_source_inventory(refresh=True)
         for directory in all_dirs:
             if os.path.exists(directory):
-                for root, dirs, filenames in os.walk(directory):
-                    for filename in filenames:
-                        ext = os.path.splitext(filename)[1].lower()
-                        if ext in ['.vhd', '.vhdl', '.json', '.yaml', '.yml', '.xml', '.toml']:
-                            files.append(os.path.join(root, filename))
+                files.extend(inventory.files(directory, ('vhdl', 'xml', 'yaml', 'json', 'toml')))
 
         return files
 
@@ -219,7 +217,6 @@ class AxionGUI:
         # --- Routes ---
         @self.app.route('/')
         def index():
-            import os as os_module
             # Do initial analysis only on first request
             if not self.initial_analysis_done:
                 try:
@@ -228,20 +225,11 @@ class AxionGUI:
                     self.axion.analyze()
 
                     # Run initial rule checks
-                    from axion_hdl.rule_checker import RuleChecker
-                    self.checker = RuleChecker()
-                    self.checker.run_all_checks(self.axion.analyzed_modules)
+                    self.checker.run_all_checks(self.axion.analyzed_modules, incremental=True)
 
                     # Inject parsing errors
-                    for m in self.axion.analyzed_modules:
-                        if 'parsing_errors' in m:
-                            for err in m['parsing_errors']:
-                                self.checker._add_error("Parsing Error", m['name'], err.get('msg', 'Unknown parsing error'))
-
-                    if hasattr(self.axion, 'parse_errors') and self.axion.parse_errors:
-                        for err in self.axion.parse_errors:
-                            fname = os_module.path.basename(err.get('file', 'unknown_file'))
-                            self.checker._add_error("Format Error", fname, err.get('msg', 'Unknown error'))
+                    self._inject_module_parse_errors()
+                    self._inject_format_errors()
 
                     # Build module status map and attach to modules
                     module_status = {}
@@ -639,28 +627,17 @@ class AxionGUI:
                 
                 # Then run all module checks
                 print(f"Running rule checks on {len(self.axion.analyzed_modules)} analyzed modules...")
-                self.checker.run_all_checks(self.axion.analyzed_modules)
+                self.checker.run_all_checks(self.axion.analyzed_modules, incremental=True)
                 
                 print("Rule check completed.")
                 
                 # Inject parse errors from analysis phase
-                if hasattr(self.axion, 'parse_errors') and self.axion.parse_errors:
-                    import os
+                if getattr(self.axion, 'parse_errors', None):
                     print(f"Adding {len(self.axion.parse_errors)} parse errors to results.")
-                    for err in self.axion.parse_errors:
-                        # Use filename as module name for parse errors
-                        fname = os.path.basename(err.get('file', 'unknown_file'))
-                        self.checker._add_error(
-                            rule_type="Format Error",
-                            module_name=fname,
-                            message=err.get('msg', 'Unknown error')
-                        )
+                self._inject_format_errors()
 
                 # Inject parsing errors from modules (to match index() behavior)
-                for m in self.axion.analyzed_modules:
-                    if 'parsing_errors' in m:
-                        for err in m['parsing_errors']:
-                            self.checker._add_error("Parsing Error", m['name'], err.get('msg', 'Unknown parsing error'))
+                self._inject_module_parse_errors()
 
             return jsonify({
                 'errors': self.checker.errors,
@@ -902,17 +879,12 @@ class AxionGUI:
         def get_detected_files():
             """Get list of all detected source files"""
             import os
-            import fnmatch
+            from axion_hdl.exclusion import get_exclude_matcher
             
             files_list = []
             exclude_patterns = list(self.axion._exclude_patterns) if hasattr(self.axion, '_exclude_patterns') else []
-            
-            def is_excluded(filepath):
-                filename = os.path.basename(filepath)
-                for pattern in exclude_patterns:
-                    if fnmatch.fnmatch(filename, pattern): return True
-                    if pattern in filepath: return True
-                return False
+            matcher = get_exclude_matcher(exclude_patterns)
+            is_excluded = matcher.is_excluded
 
             # Add manually added files first
             manual_files = (
@@ -934,23 +906,18 @@ class AxionGUI:
             )
             
             unique_paths = {f['path'] for f in files_list}
-            
+
+            # One fresh walk shared by all source kinds
+            inventory = self.axion.get_source_inventory(refresh=True)
             for d in dirs:
                 if not os.path.exists(d): continue
-                for root, dirnames, filenames in os.walk(d):
-                    # Skip excluded directories
-                    dirnames[:] = [d for d in dirnames if not any(fnmatch.fnmatch(d, p) for p in exclude_patterns)]
-                    
-                    for filename in filenames:
-                        filepath = os.path.join(root, filename)
-                        
-                        if is_excluded(filepath): continue
-                        
-                        ext = os.path.splitext(filename)[1].lower()
-                        if ext in ['.vhd', '.vhdl', '.json', '.yaml', '.yml', '.xml']:
-                             if filepath not in unique_paths:
-                                 files_list.append({'path': filepath, 'type': 'Scanned', 'category': ext[1:].upper()})
-                                 unique_paths.add(filepath)
+                for filepath in inventory.files(d, ('vhdl', 'xml', 'yaml', 'json'), prune_dir=matcher.is_dir_excluded):
+                    if is_excluded(filepath): continue
+
+                    ext = os.path.splitext(filepath)[1].lower()
+                    if filepath not in unique_paths:
+                        files_list.append({'path': filepath, 'type': 'Scanned', 'category': ext[1:].upper()})
+                        unique_paths.add(filepath)
             
             return jsonify(sorted(files_list, key=lambda x: x['path']))
 
@@ -1258,10 +1225,21 @@ class AxionGUI:
         lines.append('</register_map>')
         return '\n'.join(lines)
 
+    def _inject_module_parse_errors(self):
+        """Report each module's own parsing errors through the rule checker."""
+        for m in self.axion.analyzed_modules:
+            for err in m.get('parsing_errors') or ():
+                self.checker._add_error("Parsing Error", m['name'], err.get('msg', 'Unknown parsing error'))
+
+    def _inject_format_errors(self):
+        """Report the analysis parse errors, by file name, through the rule checker."""
+        for err in getattr(self.axion, 'parse_errors', None) or ():
+            # Use filename as module name for parse errors
+            fname = os.path.basename(err.get('file', 'unknown_file'))
+            self.checker._add_error("Format Error", fname, err.get('msg', 'Unknown error'))
+
     def _background_analyze(self):
         """Run analysis in background thread"""
-        import os as os_module
-
         # Check if already analyzing
         if self.analysis_cache.is_analyzing:
             return
@@ -1296,21 +1274,12 @@ class AxionGUI:
                         self.axion.analyzed_modules = old_modules
                     # Continue with whatever modules we have
 
-            # Run rule checks
-            from axion_hdl.rule_checker import RuleChecker
-            self.checker = RuleChecker()
-            self.checker.run_all_checks(self.axion.analyzed_modules)
+            # Run rule checks; only modules changed since the last run are checked again
+            self.checker.run_all_checks(self.axion.analyzed_modules, incremental=True)
 
             # Inject parsing errors
-            for m in self.axion.analyzed_modules:
-                if 'parsing_errors' in m:
-                    for err in m['parsing_errors']:
-                        self.checker._add_error("Parsing Error", m['name'], err.get('msg', 'Unknown parsing error'))
-
-            if hasattr(self.axion, 'parse_errors') and self.axion.parse_errors:
-                for err in self.axion.parse_errors:
-                    fname = os_module.path.basename(err.get('file', 'unknown_file'))
-                    self.checker._add_error("Format Error", fname, err.get('msg', 'Unknown error'))
+            self._inject_module_parse_errors()
+            self._inject_format_errors()
 
             # Build module status map and attach to modules
             module_status = {}
@@ -92,14 +92,13 @@ class HierarchyParser:
     # ------------------------------------------------------------------
 
     def _load_yaml(self, path: str) -> dict:
-        try:
-            import yaml
-        except ImportError:
+        from .yaml_loader import yaml, safe_load
+        if yaml is None:
             raise ImportError(
                 "PyYAML is required for YAML hierarchy files. Install with: pip install PyYAML"
             )
         with open(path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = safe_load(f)
         if not isinstance(data, dict):
             raise ValueError(f"Hierarchy YAML must be a mapping, got {type(data).__name__}")
         return data
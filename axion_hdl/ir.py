@@ -0,0 +1,493 @@
+"""
+Typed Intermediate Representation for Axion HDL
+
+Compact objects for parsed modules, registers and fields. All parsers return
+a ModuleIR whose registers are RegisterIR and whose fields are FieldIR.
+
+Each object stores its data once, in typed __slots__ attributes: names are
+interned strings; addresses, widths, bit positions and defaults are ints.
+The redundant keys of the former dictionaries (name/signal_name/reg_name,
+r_strobe/read_strobe, address/address_int, relative_address, ...) are not
+stored but derived from these attributes on access.
+
+For backward compatibility every object is also a mutable mapping that reads
+exactly like the dictionary it was built from: same keys, same order, same
+values (including address string formats), so code written for the module
+dictionaries keeps working unchanged:
+
+    reg.address_int        # typed attribute
+    reg.signal.num_chunks  # resolved signal type
+    reg['address']         # '0x0000000C', formatted from address_int
+    dict(reg)              # shallow dictionary copy
+    reg.to_dict()          # plain dictionaries all the way down
+
+IR objects are not dict instances, so json.dumps() and yaml.safe_dump() only
+accept them after to_dict() (or to_plain() for a mixed structure).
+
+Writing through the mapping behaves like a dictionary: setting one key never
+changes the value of another key.
+"""
+
+import sys
+from collections.abc import MutableMapping
+from itertools import count
+from operator import attrgetter
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from axion_hdl.signal_types import SignalType, resolve_signal_type
+
+# Formats of derived hexadecimal address strings, tried in order
+_HEX_FORMATS: Tuple[Callable[[int], str], ...] = (
+    lambda v: f"0x{v:02X}",
+    lambda v: f"0x{v:04X}",
+    lambda v: f"0x{v:08X}",
+    lambda v: f"0x{v:X}",
+)
+
+
+class _Shape:
+    """
+    Key layout shared by all IR objects with the same keys.
+
+    Attributes:
+        spec: Tuple of (key, slot, fmt) in key order. slot is the attribute
+            holding the value (None: stored in _extra); fmt is the index of
+            the hex format of a derived string (None: the value itself)
+        getters: Key -> function returning the value from an IR object
+    """
+    __slots__ = ('spec', 'keys', 'getters', 'slots')
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.keys = tuple(key for key, _, _ in spec)
+        self.slots = {key: (slot, fmt) for key, slot, fmt in spec}
+        self.getters = {key: _getter(key, slot, fmt) for key, slot, fmt in spec}
+
+
+def _getter(key, slot, fmt):
+    if slot is None:
+        return lambda obj: obj._extra[key]
+    if fmt is None:
+        return attrgetter(slot)
+    get, fmt_fn = attrgetter(slot), _HEX_FORMATS[fmt]
+    return lambda obj: fmt_fn(get(obj))
+
+
+_SHAPES: Dict[tuple, _Shape] = {}
+
+# Version stamps: every new or changed IR object takes the next number
+_next_stamp = count(1).__next__
+
+
+def _shape(spec: tuple) -> _Shape:
+    shape = _SHAPES.get(spec)
+    if shape is None:
+        shape = _SHAPES[spec] = _Shape(spec)
+    return shape
+
+
+def _same(a, b) -> bool:
+    return a is b or (type(a) is type(b) and a == b)
+
+
+class _IRBase(MutableMapping):
+    """Shared mapping behaviour of the IR classes."""
+
+    __slots__ = ('_shape', '_extra', '_stamp')
+
+    # Key -> (attribute, derived hex string). Keys mapping to the same
+    # attribute are aliases; the first one present holds the value.
+    _KEYS: Dict[str, Tuple[str, bool]] = {}
+    # Attributes whose string values are interned
+    _INTERNED: Tuple[str, ...] = ()
+    _ATTRS: Tuple[str, ...] = ()
+
+    def __init__(self, **attrs):
+        for attr in self._ATTRS:
+            setattr(self, attr, attrs.pop(attr, None))
+        if attrs:
+            raise TypeError(f"Unknown {type(self).__name__} attributes: {', '.join(attrs)}")
+        self._shape = _shape(())
+        self._extra = None
+        self._stamp = _next_stamp()
+
+    @classmethod
+    def from_dict(cls, data: Dict, _memo: Optional[dict] = None):
+        """
+        Build an IR object that reads exactly like the given dictionary.
+
+        Args:
+            data: Module, register or field dictionary
+
+        Returns:
+            IR object (data itself if it already is one)
+        """
+        if isinstance(data, _IRBase):
+            return data
+        obj = cls.__new__(cls)
+        for attr in cls._ATTRS:
+            setattr(obj, attr, None)
+        memo = {} if _memo is None else _memo
+
+        # Pass 1: the first key of each attribute holds the value
+        owners = {}
+        for key, value in data.items():
+            entry = cls._KEYS.get(key)
+            if entry is not None and not entry[1] and entry[0] not in owners:
+                owners[entry[0]] = key
+                setattr(obj, entry[0], obj._convert(entry[0], value, memo))
+
+        # Pass 2: aliases and derived strings are kept only if they agree
+        spec = []
+        extra = None
+        for key, value in data.items():
+            entry = cls._KEYS.get(key)
+            if entry is not None:
+                attr, is_hex = entry
+                if owners.get(attr) == key:
+                    spec.append((key, attr, None))
+                    continue
+                if attr in owners:
+                    current = getattr(obj, attr)
+                    if not is_hex:
+                        if _same(current, value):
+                            spec.append((key, attr, None))
+                            continue
+                    elif isinstance(current, int) and isinstance(value, str):
+                        fmt = next((i for i, fn in enumerate(_HEX_FORMATS) if fn(current) == value), None)
+                        if fmt is not None:
+                            spec.append((key, attr, fmt))
+                            continue
+            if extra is None:
+                extra = {}
+            extra[key] = value
+            spec.append((key, None, None))
+
+        obj._shape = _shape(tuple(spec))
+        obj._extra = extra
+        obj._stamp = _next_stamp()
+        return obj
+
+    def _convert(self, attr: str, value, memo: dict):
+        """Convert a value for storage in an attribute."""
+        if attr in self._INTERNED and type(value) is str:
+            return sys.intern(value)
+        return value
+
+    # -- Mapping interface --------------------------------------------------
+
+    def __getitem__(self, key):
+        return self._shape.getters[key](self)
+
+    def get(self, key, default=None):
+        getter = self._shape.getters.get(key)
+        return default if getter is None else getter(self)
+
+    def __contains__(self, key) -> bool:
+        return key in self._shape.getters
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._shape.keys)
+
+    def __len__(self) -> int:
+        return len(self._shape.keys)
+
+    def keys(self):
+        return list(self._shape.keys)
+
+    def __setitem__(self, key, value):
+        shape = self._shape
+        entry = shape.slots.get(key)
+        if entry is None or entry[1] is not None or not _same(shape.getters[key](self), value):
+            self._stamp = _next_stamp()
+        if entry is None:
+            attr_entry = self._KEYS.get(key)
+            if (attr_entry is not None and not attr_entry[1]
+                    and all(slot != attr_entry[0] for slot, _ in shape.slots.values())):
+                setattr(self, attr_entry[0], value)
+                self._reshape(shape.spec + ((key, attr_entry[0], None),))
+            else:
+                self._set_extra(key, value, shape.spec + ((key, None, None),))
+            return
+
+        slot, fmt = entry
+        if slot is None:
+            self._extra[key] = value
+        elif fmt is not None:
+            self._set_extra(key, value, self._detach(shape.spec, lambda k, s, f: k == key))
+        elif not _same(getattr(self, slot), value):
+            # Other keys reading this attribute keep their current values
+            self._reshape(self._detach(shape.spec, lambda k, s, f: s == slot and k != key))
+            setattr(self, slot, value)
+
+    def __delitem__(self, key):
+        shape = self._shape
+        entry = shape.slots[key]
+        self._stamp = _next_stamp()
+        spec = self._detach(shape.spec, lambda k, s, f: s is not None and s == entry[0] and k != key)
+        self._reshape(tuple(e for e in spec if e[0] != key))
+        if entry[0] is None:
+            del self._extra[key]
+
+    def _detach(self, spec: tuple, matches) -> tuple:
+        """Move the current values of matching keys into _extra; return the new spec."""
+        new_spec = []
+        for key, slot, fmt in spec:
+            if slot is not None and matches(key, slot, fmt):
+                if self._extra is None:
+                    self._extra = {}
+                self._extra[key] = self._shape.getters[key](self)
+                slot = fmt = None
+            new_spec.append((key, slot, fmt))
+        return tuple(new_spec)
+
+    def _set_extra(self, key, value, spec: tuple):
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
+        self._reshape(tuple((k, s, f) if k != key else (k, None, None) for k, s, f in spec))
+
+    def _reshape(self, spec: tuple):
+        self._shape = _shape(spec)
+
+    # -- Copying, pickling, display -----------------------------------------
+
+    def copy(self):
+        """Shallow copy (like dict.copy())."""
+        new = type(self).__new__(type(self))
+        for attr in self._ATTRS:
+            setattr(new, attr, getattr(self, attr))
+        new._shape = self._shape
+        new._extra = dict(self._extra) if self._extra is not None else None
+        new._stamp = _next_stamp()
+        return new
+
+    __copy__ = copy
+
+    def to_dict(self) -> Dict:
+        """
+        Deep copy as plain dictionaries and lists.
+
+        Nested IR objects (registers, fields) become dictionaries too; a
+        register listed in both registers and packed_registers stays one
+        shared dictionary.
+
+        Returns:
+            Dictionary with the same keys and values as this object
+        """
+        return to_plain(self)
+
+    def __reduce__(self):
+        values = tuple(getattr(self, attr) for attr in self._ATTRS)
+        return (_restore, (type(self), self._shape.spec, values, self._extra))
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (dict, _IRBase)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+
+def _restore(cls, spec, values, extra):
+    obj = cls.__new__(cls)
+    for attr, value in zip(cls._ATTRS, values):
+        setattr(obj, attr, value)
+    obj._shape = _shape(spec)
+    obj._extra = extra
+    obj._stamp = _next_stamp()
+    return obj
+
+
+class FieldIR(_IRBase):
+    """A bit field of a packed register."""
+
+    _ATTRS = ('name', 'bit_low', 'bit_high', 'width', 'access_mode', 'signal_type',
+              'default_value', 'read_strobe', 'write_strobe', 'description',
+              'enum_values', 'mask')
+    __slots__ = _ATTRS
+    _INTERNED = ('name', 'access_mode', 'signal_type')
+    _KEYS = {
+        'name': ('name', False),
+        'bit_low': ('bit_low', False),
+        'bit_high': ('bit_high', False),
+        'width': ('width', False),
+        'access_mode': ('access_mode', False),
+        'signal_type': ('signal_type', False),
+        'default_value': ('default_value', False),
+        'read_strobe': ('read_strobe', False),
+        'r_strobe': ('read_strobe', False),
+        'write_strobe': ('write_strobe', False),
+        'w_strobe': ('write_strobe', False),
+        'description': ('description', False),
+        'enum_values': ('enum_values', False),
+        'mask': ('mask', False),
+    }
+
+    @property
+    def signal(self) -> SignalType:
+        """Resolved signal type (see axion_hdl.signal_types)."""
+        return resolve_signal_type(self.signal_type)
+
+
+class RegisterIR(_IRBase):
+    """A register (standalone or packed) of a module."""
+
+    _ATTRS = ('name', 'signal_type', 'address_int', 'relative_address_int', 'width',
+              'access_mode', 'read_strobe', 'write_strobe', 'description',
+              'default_value', 'enum_values', 'is_packed', 'fields', 'manual_address')
+    __slots__ = _ATTRS
+    _INTERNED = ('name', 'access_mode', 'signal_type')
+    _KEYS = {
+        'signal_name': ('name', False),
+        'name': ('name', False),
+        'reg_name': ('name', False),
+        'signal_type': ('signal_type', False),
+        'address_int': ('address_int', False),
+        'address': ('address_int', True),
+        'relative_address_int': ('relative_address_int', False),
+        'relative_address': ('relative_address_int', True),
+        'width': ('width', False),
+        'signal_width': ('width', False),
+        'access_mode': ('access_mode', False),
+        'access': ('access_mode', False),
+        'read_strobe': ('read_strobe', False),
+        'r_strobe': ('read_strobe', False),
+        'write_strobe': ('write_strobe', False),
+        'w_strobe': ('write_strobe', False),
+        'description': ('description', False),
+        'default_value': ('default_value', False),
+        'default_value_hex': ('default_value', True),
+        'enum_values': ('enum_values', False),
+        'is_packed': ('is_packed', False),
+        'fields': ('fields', False),
+        'manual_address': ('manual_address', False),
+    }
+
+    @property
+    def signal(self) -> SignalType:
+        """Resolved signal type (see axion_hdl.signal_types)."""
+        return resolve_signal_type(self.signal_type)
+
+    def _convert(self, attr, value, memo):
+        if attr == 'fields' and type(value) is list:
+            return [FieldIR.from_dict(f) if isinstance(f, dict) else f for f in value]
+        return super()._convert(attr, value, memo)
+
+
+class ModuleIR(_IRBase):
+    """A parsed module with its registers."""
+
+    _ATTRS = ('name', 'file', 'base_address', 'cdc_enabled', 'cdc_stages',
+              'use_axion_types', 'registers', 'packed_registers', 'parsing_errors')
+    __slots__ = _ATTRS
+    _INTERNED = ('name', 'file')
+    _KEYS = {
+        'entity_name': ('name', False),
+        'name': ('name', False),
+        'file': ('file', False),
+        'source_file': ('file', False),
+        'base_address': ('base_address', False),
+        'base_addr': ('base_address', False),
+        'cdc_enabled': ('cdc_enabled', False),
+        'cdc_en': ('cdc_enabled', False),
+        'cdc_stages': ('cdc_stages', False),
+        'cdc_stage': ('cdc_stages', False),
+        'use_axion_types': ('use_axion_types', False),
+        'registers': ('registers', False),
+        'packed_registers': ('packed_registers', False),
+        'parsing_errors': ('parsing_errors', False),
+    }
+
+    def _convert(self, attr, value, memo):
+        if attr in ('registers', 'packed_registers') and type(value) is list:
+            # A register may be listed in both; it becomes one object
+            converted = []
+            for reg in value:
+                if isinstance(reg, dict):
+                    ir = memo.get(id(reg))
+                    if ir is None:
+                        ir = memo[id(reg)] = RegisterIR.from_dict(reg)
+                    reg = ir
+                converted.append(reg)
+            return converted
+        return super()._convert(attr, value, memo)
+
+    def version(self) -> Optional[tuple]:
+        """
+        Cheap change signal of the module.
+
+        The version stays equal while the module, its registers and their
+        fields are unchanged: setting or deleting a key of any of them, or
+        adding, removing or reordering registers or fields, changes it.
+        In-place edits of other nested values (an enum_values dictionary, the
+        parsing_errors list) are not seen; assign a new value instead.
+
+        Returns:
+            Tuple of version stamps, or None if the module holds registers or
+            fields that are not IR objects
+        """
+        stamps = [self._stamp]
+        for registers in (self.registers, self.packed_registers):
+            if registers is None:
+                continue
+            if type(registers) is not list:
+                return None
+            stamps.append(0)
+            for reg in registers:
+                if type(reg) is not RegisterIR:
+                    return None
+                stamps.append(reg._stamp)
+                fields = reg.fields
+                if fields:
+                    if type(fields) is not list:
+                        return None
+                    for field in fields:
+                        if type(field) is not FieldIR:
+                            return None
+                        stamps.append(field._stamp)
+        return tuple(stamps)
+
+
+def to_plain(value, _memo: Optional[dict] = None):
+    """
+    Convert IR objects anywhere in a value to plain dictionaries.
+
+    Dictionaries and lists are copied; other values are returned as is.
+
+    Args:
+        value: IR object, dictionary, list or any other value
+
+    Returns:
+        Value containing only built-in containers
+    """
+    if isinstance(value, (_IRBase, dict)):
+        memo = {} if _memo is None else _memo
+        plain = memo.get(id(value))
+        if plain is None:
+            plain = memo[id(value)] = {}
+            for key, item in value.items():
+                plain[key] = to_plain(item, memo)
+        return plain
+    if type(value) in (list, tuple):
+        memo = {} if _memo is None else _memo
+        return type(value)(to_plain(item, memo) for item in value)
+    return value
+
+
+def to_ir(module: Optional[Dict]) -> Optional[ModuleIR]:
+    """
+    Convert a parser's module dictionary to a ModuleIR.
+
+    Args:
+        module: Module dictionary, ModuleIR or None
+
+    Returns:
+        ModuleIR (or None if module is None)
+    """
+    if module is None:
+        return None
+    return ModuleIR.from_dict(module)
@@ -7,12 +7,13 @@ then using YAMLInputParser for processing. This provides a unified parsing pipel
 
 import os
 import json
-import fnmatch
 from typing import Dict, List, Optional, Set
 
 # Import from axion_hdl
 from axion_hdl.address_manager import AddressManager
 from axion_hdl.yaml_input_parser import YAMLInputParser
+from axion_hdl.source_discovery import walk_source_files
+from axion_hdl.exclusion import get_exclude_matcher
 
 
 class JSONInputParser:
@@ -68,17 +69,8 @@ class JSONInputParser:
     
     def _is_excluded(self, filepath: str) -> bool:
         """Check if a file path matches any exclusion pattern."""
-        filename = os.path.basename(filepath)
-        
-        for pattern in self._exclude_patterns:
-            if fnmatch.fnmatch(filename, pattern):
-                return True
-            if fnmatch.fnmatch(filepath, f"*/{pattern}/*"):
-                return True
-            if fnmatch.fnmatch(filepath, f"*/{pattern}"):
-                return True
-        return False
-    
+        return get_exclude_matcher(self._exclude_patterns).is_excluded(filepath)
+
     def parse_file(self, filepath: str) -> Optional[Dict]:
         """
         Parse a single JSON file by converting to YAML then using YAMLInputParser.
@@ -158,11 +150,4 @@ class JSONInputParser:
     
     def _find_json_files(self, directory: str) -> List[str]:
         """Find all JSON files in directory (recursive)."""
-        json_files = []
-        
-        for root, dirs, files in os.walk(directory):
-            for filename in files:
-                if filename.lower().endswith('.json'):
-                    json_files.append(os.path.join(root, filename))
-        
-        return sorted(json_files)
+        return sorted(walk_source_files(directory)['json'])
@@ -0,0 +1,164 @@
+"""
+Address Layout Planner for Axion HDL
+
+Registers without an ADDR attribute are placed in declaration order by the
+AddressManager. A module can opt into a planned layout instead:
+
+    -- @axion_def LAYOUT=compact     (VHDL)
+    // @axion_def LAYOUT=decode      (SystemVerilog)
+
+compact  Auto-assigned registers are packed from address 0, widest first,
+         into the holes left by manually addressed registers.
+decode   As compact, but registers are grouped by access mode (RO, then RW,
+         then WO) so that readable registers (RO/RW) and writable registers
+         (RW/WO) each occupy one contiguous range.
+
+In both modes a register is aligned to its own power-of-two size, so the
+32-bit chunks of a wide register differ only in the low address bits and
+the module fits the smallest power-of-two window the planner reports.
+Manually addressed registers are never moved.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from axion_hdl.address_manager import AddressManager, AddressConflictError
+
+LAYOUT_MODES = ('compact', 'decode')
+
+# Group order of the decode layout: readable and writable ranges overlap on RW
+_ACCESS_ORDER = {'RO': 0, 'RW': 1, 'WO': 2}
+
+
+class LayoutEntry(NamedTuple):
+    """A register to be placed, as seen by the planner."""
+    name: str
+    address: int        # Relative address from the parser
+    width: int          # Width in bits
+    access_mode: str
+    manual: bool        # True if the address was given with ADDR
+
+
+class LayoutPlan(NamedTuple):
+    """Result of plan_layout(): new addresses and span report."""
+    mode: str
+    addresses: List[int]   # New relative address of each entry, in input order
+    span_before: int       # Bytes from the lowest to past the highest register
+    span_after: int
+    window: int            # Smallest power-of-two window holding the layout
+    moved: int             # Number of registers whose address changed
+
+    def report(self) -> Dict:
+        """Layout report as stored in the module dictionary."""
+        return {
+            'mode': self.mode,
+            'span_before': self.span_before,
+            'span_after': self.span_after,
+            'window': self.window,
+            'moved': self.moved,
+        }
+
+    def summary(self, module_name: str) -> str:
+        """One-line description of the layout change."""
+        return (
+            f"Layout '{self.mode}' for '{module_name}': span 0x{self.span_before:X} -> "
+            f"0x{self.span_after:X} bytes, window 0x{self.window:X}, "
+            f"{self.moved} register(s) moved"
+        )
+
+
+def _size(width: int) -> int:
+    return max(1, (width + 31) // 32) * 4
+
+
+def _natural_alignment(size: int) -> int:
+    return 1 << (size - 1).bit_length()
+
+
+def _span(entries: Sequence[LayoutEntry], addresses: Sequence[int]) -> int:
+    if not entries:
+        return 0
+    low = min(addresses)
+    high = max(addr + _size(e.width) for e, addr in zip(entries, addresses))
+    return high - low
+
+
+def parse_layout_mode(value) -> Optional[str]:
+    """
+    Normalize a LAYOUT attribute value.
+
+    Args:
+        value: Attribute value (any case), or None
+
+    Returns:
+        'compact', 'decode', or None if value is None
+
+    Raises:
+        ValueError: If value is not a known layout mode
+    """
+    if value is None:
+        return None
+    mode = str(value).strip().lower()
+    if mode not in LAYOUT_MODES:
+        raise ValueError(
+            f"Unknown LAYOUT '{value}'; expected one of: {', '.join(LAYOUT_MODES)}"
+        )
+    return mode
+
+
+def plan_layout(entries: Sequence[LayoutEntry], mode: str) -> LayoutPlan:
+    """
+    Plan new addresses for the auto-assigned registers of a module.
+
+    Args:
+        entries: Registers of the module (standalone and packed)
+        mode: 'compact' or 'decode'
+
+    Returns:
+        LayoutPlan with one address per entry; manual entries keep theirs
+    """
+    occupied = AddressManager()
+    for entry in entries:
+        if entry.manual:
+            try:
+                occupied.allocate_address(entry.address, entry.width, entry.name)
+            except (AddressConflictError, ValueError):
+                # Already reported by the parser; the register stays where it is
+                pass
+
+    movable = [i for i, entry in enumerate(entries) if not entry.manual]
+    if mode == 'decode':
+        group = lambda i: _ACCESS_ORDER.get(entries[i].access_mode, 1)
+    else:
+        group = lambda i: 0
+    # Widest first within a group; sorted() keeps declaration order on ties
+    movable.sort(key=lambda i: (group(i), -_size(entries[i].width)))
+
+    addresses = [entry.address for entry in entries]
+    current_group = None
+    group_start = group_end = 0
+    # Lowest candidate per block size: placements only ever fill space
+    cursors: Dict[int, int] = {}
+    for i in movable:
+        entry = entries[i]
+        if group(i) != current_group:
+            # Each group starts past the one before it
+            current_group = group(i)
+            group_start = group_end
+            cursors = {}
+        size = _size(entry.width)
+        addr = occupied.find_free(cursors.get(size, group_start), size, _natural_alignment(size))
+        occupied.allocate_address(addr, entry.width, entry.name)
+        cursors[size] = addr + size
+        group_end = max(group_end, addr + size)
+        addresses[i] = addr
+
+    span_after = _span(entries, addresses)
+    end = max((addr + _size(e.width) for e, addr in zip(entries, addresses)), default=0)
+    return LayoutPlan(
+        mode=mode,
+        addresses=addresses,
+        span_before=_span(entries, [e.address for e in entries]),
+        span_after=span_after,
+        window=_natural_alignment(end) if end else 0,
+        moved=sum(1 for e, addr in zip(entries, addresses) if e.address != addr),
+    )
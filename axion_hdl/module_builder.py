@@ -0,0 +1,418 @@
+"""
+Module Builder for Axion HDL
+
+Lowers register definitions from the data-file formats (YAML, JSON, XML and
+TOML) into the module (a ModuleIR, see ir.py) used by the rest of Axion-HDL. Parsers call
+add_register() once per register with the values they read from their input,
+and each call creates the final register entry directly, so no intermediate
+per-register dictionary is built on the way.
+
+Numeric values may be given as integers or as decimal/hex strings; invalid
+values are recorded in the builder's error list.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from axion_hdl.bit_field_manager import BitFieldManager
+from axion_hdl.ir import ModuleIR, RegisterIR
+
+
+class ModuleBuilder:
+    """
+    Builds the registers of one module and assembles the module dictionary.
+
+    Register addresses are relative to the module base address, which is
+    only needed by build(). A streaming parser can therefore add registers
+    before it has seen the base address.
+
+    Attributes:
+        filepath (str): Source file, used for error reporting
+        errors (list): Errors found while lowering registers
+        registers (list): Standalone register entries, in input order
+    """
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self.errors: List[Dict] = []
+        self.registers: List[Dict] = []
+        self.next_auto_addr = 0
+        self.bit_field_manager = BitFieldManager()
+
+    def parse_number(self, value, context: str = "") -> int:
+        """
+        Parse a numeric value (integer, hex string or decimal string).
+
+        Args:
+            value: Value to parse
+            context: Context for error reporting (e.g., register name)
+
+        Returns:
+            Parsed integer or 0 if parsing fails (after recording an error)
+        """
+        if isinstance(value, int):
+            return value
+
+        text = str(value).strip()
+        try:
+            if text.lower().startswith('0x'):
+                return int(text, 16)
+            return int(text)
+        except ValueError:
+            msg = f"Invalid numeric value '{value}'"
+            if context:
+                msg += f" in {context}"
+            self.errors.append({'file': self.filepath, 'msg': msg})
+            return 0
+
+    def _parse_enum_values(self, raw_enum, owner: str) -> Optional[Dict[int, str]]:
+        """Normalize enum_values keys to integers (YAML may deliver int or str keys)."""
+        if not isinstance(raw_enum, dict) or not raw_enum:
+            return None
+        parsed_enum = {}
+        for k, v in raw_enum.items():
+            try:
+                if isinstance(k, int):
+                    parsed_enum[k] = str(v)
+                else:
+                    parsed_enum[int(str(k), 0)] = str(v)
+            except (ValueError, TypeError):
+                self.errors.append({
+                    'file': self.filepath,
+                    'msg': f"Invalid enum_values key '{k}' for {owner}; expected an integer value"
+                })
+        return parsed_enum or None
+
+    def add_register_data(self, reg_data: Dict):
+        """
+        Add a register given as a YAML-structured mapping.
+
+        Args:
+            reg_data: Register mapping with the keys of the YAML format
+        """
+        self.add_register(
+            reg_data.get('name'),
+            access=reg_data.get('access', 'RW'),
+            width=reg_data.get('width', 32),
+            addr=reg_data.get('addr'),
+            description=reg_data.get('description', ''),
+            default=reg_data.get('default'),
+            r_strobe=reg_data.get('r_strobe', False),
+            w_strobe=reg_data.get('w_strobe', False),
+            reg_name=reg_data.get('reg_name'),
+            bit_offset=reg_data.get('bit_offset'),
+            bit_align=reg_data.get('bit_align', 1),
+            enum_values=reg_data.get('enum_values'),
+            fields=reg_data.get('fields'),
+        )
+
+    def add_register(self, name, access='RW', width=32, addr=None, description='',
+                     default=None, r_strobe=False, w_strobe=False, reg_name=None,
+                     bit_offset=None, enum_values=None, fields: Optional[Iterable[Dict]] = None,
+                     bit_align=1):
+        """
+        Add one register, as read from an input file.
+
+        Registers without a name are ignored. A register with fields becomes
+        a packed register; one with reg_name becomes a field of the packed
+        register of that name; any other is a standalone register.
+
+        Args:
+            name: Register name
+            access: Access mode ('RO', 'RW' or 'WO', any case)
+            width: Width in bits
+            addr: Relative address, or None for the next free address
+            description: Description text
+            default: Default (reset) value
+            r_strobe: Read strobe flag (bool or 'true'/'false')
+            w_strobe: Write strobe flag (bool or 'true'/'false')
+            reg_name: Packed register this register is a field of
+            bit_offset: Bit offset within the packed register
+            enum_values: Mapping of values to names
+            fields: Field mappings with the keys of the YAML format
+            bit_align: Bit alignment of a field placed without bit_offset
+        """
+        if not name:
+            return
+
+        access = str(access).upper()
+        if access not in ('RO', 'RW', 'WO'):
+            print(f"  Warning: Invalid access mode '{access}' for {name}, using RW")
+            access = 'RW'
+
+        if isinstance(width, str):
+            try:
+                width = int(width)
+            except ValueError:
+                self.errors.append({'file': self.filepath, 'msg': f"Invalid width value '{width}' for register '{name}', using default 32"})
+                width = 32
+
+        if fields:
+            self._add_fields(name, access, addr, fields)
+            return
+
+        if bit_offset is not None and isinstance(bit_offset, str):
+            try:
+                bit_offset = int(bit_offset)
+            except ValueError:
+                self.errors.append({'file': self.filepath, 'msg': f"Invalid bit_offset value '{bit_offset}' for register '{name}'"})
+                bit_offset = None
+
+        default_val = 0
+        if default is not None:
+            default_val = self.parse_number(default, context=f"register '{name}' default value")
+
+        if reg_name:
+            self._add_legacy_field(name, access, width, addr, description, default_val,
+                                   r_strobe, w_strobe, reg_name, bit_offset,
+                                   self._parse_align(bit_align, name))
+            return
+
+        # Standard register
+        if addr is not None:
+            addr = self.parse_number(addr, context=f"register '{name}' addr")
+        else:
+            addr = self.next_auto_addr
+
+        num_regs = (width + 31) // 32
+        self.next_auto_addr = addr + (num_regs * 4)
+
+        if isinstance(r_strobe, str):
+            r_strobe = r_strobe.lower() == 'true'
+        if isinstance(w_strobe, str):
+            w_strobe = w_strobe.lower() == 'true'
+
+        parsed_enum = self._parse_enum_values(enum_values, f"register '{name}'")
+
+        self.registers.append({
+            'signal_name': name,
+            'name': name,
+            'access_mode': access,
+            'access': access,
+            'address': None,      # Absolute address, set by build()
+            'address_int': None,
+            'relative_address': f"0x{addr:02X}",
+            'relative_address_int': addr,
+            'width': width,
+            'signal_type': f"std_logic_vector({width-1} downto 0)" if width > 1 else "std_logic",
+            'r_strobe': r_strobe,
+            'w_strobe': w_strobe,
+            'read_strobe': r_strobe,
+            'write_strobe': w_strobe,
+            'description': description,
+            'default_value': default_val,
+            'default_value_hex': f"0x{default_val:X}",
+            'enum_values': parsed_enum
+        })
+
+    def _add_fields(self, reg_name: str, access: str, addr, fields: Iterable[Dict]):
+        """Add a packed register given with a fields list."""
+        if addr is not None:
+            addr = self.parse_number(addr, context=f"register '{reg_name}' addr")
+        else:
+            addr = self.next_auto_addr
+
+        for field_data in fields:
+            field_name = field_data.get('name')
+            if not field_name:
+                continue
+
+            field_width = field_data.get('width', 1)
+            if isinstance(field_width, str):
+                try:
+                    field_width = int(field_width)
+                except ValueError:
+                    self.errors.append({'file': self.filepath, 'msg': f"Invalid width value '{field_width}' for field '{field_name}' in register '{reg_name}', using default 1"})
+                    field_width = 1
+
+            field_access = str(field_data.get('access', access)).upper()
+            if field_access not in ('RO', 'RW', 'WO'):
+                field_access = access
+
+            field_bit_offset = field_data.get('bit_offset')
+            if field_bit_offset is not None and isinstance(field_bit_offset, str):
+                try:
+                    field_bit_offset = int(field_bit_offset)
+                except ValueError:
+                    self.errors.append({'file': self.filepath, 'msg': f"Invalid bit_offset value '{field_bit_offset}' for field '{field_name}' in register '{reg_name}'"})
+                    field_bit_offset = None
+
+            field_default_val = 0
+            field_default_str = field_data.get('default')
+            if field_default_str is not None:
+                field_default_val = self.parse_number(field_default_str, context=f"field '{field_name}' default value")
+
+            sig_type = f"[{field_width-1}:0]" if field_width > 1 else "[0:0]"
+
+            parsed_enum = self._parse_enum_values(
+                field_data.get('enum_values'), f"field '{field_name}' in register '{reg_name}'")
+
+            try:
+                self.bit_field_manager.add_field(
+                    reg_name=reg_name,
+                    address=addr,
+                    field_name=field_name,
+                    width=field_width,
+                    access_mode=field_access,
+                    signal_type=sig_type,
+                    bit_offset=field_bit_offset,
+                    description=field_data.get('description', ''),
+                    source_file=self.filepath,
+                    default_value=field_default_val,
+                    read_strobe=field_data.get('r_strobe', False),
+                    write_strobe=field_data.get('w_strobe', False),
+                    allow_overlap=True,
+                    enum_values=parsed_enum,
+                    align=self._parse_align(field_data.get('bit_align', 1), field_name)
+                )
+            except Exception as e:
+                msg = f"Error processing field {field_name} in {reg_name}: {e}"
+                print(f"  {msg}")
+                self.errors.append({'file': self.filepath, 'msg': msg})
+
+        if addr >= self.next_auto_addr:
+            self.next_auto_addr = addr + 4
+
+    def _parse_align(self, value, owner: str) -> int:
+        """Parse a bit_align value (1 if invalid)."""
+        try:
+            align = int(value)
+        except (TypeError, ValueError):
+            align = 0
+        if align < 1:
+            self.errors.append({'file': self.filepath, 'msg': f"Invalid bit_align value '{value}' for '{owner}', using 1"})
+            return 1
+        return align
+
+    def _add_legacy_field(self, name, access, width, addr, description, default_val,
+                          r_strobe, w_strobe, reg_name, bit_offset, bit_align=1):
+        """Add a register declared as a field of a packed register (reg_name format)."""
+        if addr is not None:
+            addr = self.parse_number(addr, context=f"register '{name}' addr")
+        else:
+            existing_reg = self.bit_field_manager.get_register(reg_name)
+            if existing_reg:
+                addr = existing_reg.address
+            else:
+                addr = (self.next_auto_addr + 3) & ~3
+
+        sig_type = f"[{width-1}:0]" if width > 1 else "[0:0]"
+
+        try:
+            self.bit_field_manager.add_field(
+                reg_name=reg_name,
+                address=addr,
+                field_name=name,
+                width=width,
+                access_mode=access,
+                signal_type=sig_type,
+                bit_offset=bit_offset,
+                description=description,
+                source_file=self.filepath,
+                default_value=default_val,
+                read_strobe=r_strobe,
+                write_strobe=w_strobe,
+                allow_overlap=True,  # Allow overlaps, RuleChecker will validate
+                align=bit_align
+            )
+
+            if addr >= self.next_auto_addr:
+                self.next_auto_addr = addr + 4
+
+        except Exception as e:
+            msg = f"Error processing packed register {name}: {e}"
+            print(f"  {msg}")
+            self.errors.append({'file': self.filepath, 'msg': msg})
+
+    def build(self, module_name: str, base_addr: int, cdc_en: bool, cdc_stage: int,
+              use_axion_types: bool, parsing_errors: List[Dict]) -> ModuleIR:
+        """
+        Assemble the module (typed IR, see axion_hdl.ir).
+
+        Args:
+            module_name: Module name
+            base_addr: Module base address
+            cdc_en: CDC enabled
+            cdc_stage: Number of CDC synchronizer stages
+            use_axion_types: Use the axion types package in generated code
+            parsing_errors: Errors to attach to the module
+
+        Returns:
+            ModuleIR of the module
+        """
+        registers = self.registers
+        for i, register in enumerate(registers):
+            address = base_addr + register['relative_address_int']
+            register['address'] = f"0x{address:02X}"
+            register['address_int'] = address
+            # Converted in place so only one register exists twice at a time
+            registers[i] = RegisterIR.from_dict(register)
+
+        # Process packed registers
+        packed_regs_data = []
+
+        for packed in self.bit_field_manager.get_all_registers():
+            combined_default = 0
+            for field in packed.fields:
+                mask = ((1 << field.width) - 1)
+                field_val = (field.default_value & mask) << field.bit_low
+                combined_default |= field_val
+
+            packed_reg_entry = {
+                'signal_name': packed.name,
+                'name': packed.name,
+                'access_mode': packed.access_mode,
+                'access': packed.access_mode,
+                'address': f"0x{base_addr + packed.address:02X}",
+                'address_int': base_addr + packed.address,
+                'relative_address': f"0x{packed.address:02X}",
+                'reg_name': packed.name,
+                'relative_address_int': packed.address,
+                'width': 32,
+                'signal_type': "std_logic_vector(31 downto 0)",
+                'r_strobe': any(f.read_strobe for f in packed.fields),
+                'w_strobe': any(f.write_strobe for f in packed.fields),
+                'read_strobe': any(f.read_strobe for f in packed.fields),
+                'write_strobe': any(f.write_strobe for f in packed.fields),
+                'description': f"Packed register: {packed.name}",
+                'default_value': combined_default,
+                'default_value_hex': f"0x{combined_default:X}",
+                'is_packed': True,
+                'fields': [
+                    {
+                        'name': f.name,
+                        'bit_low': f.bit_low,
+                        'bit_high': f.bit_high,
+                        'width': f.width,
+                        'access_mode': f.access_mode,
+                        'signal_type': f.signal_type,
+                        'default_value': f.default_value,
+                        'read_strobe': f.read_strobe,
+                        'write_strobe': f.write_strobe,
+                        'description': f.description,
+                        'enum_values': f.enum_values
+                    } for f in packed.fields
+                ]
+            }
+            packed_reg_entry = RegisterIR.from_dict(packed_reg_entry)
+            registers.append(packed_reg_entry)
+            packed_regs_data.append(packed_reg_entry)
+
+        # Sort registers by address
+        registers.sort(key=lambda x: x['relative_address_int'])
+
+        return ModuleIR.from_dict({
+            'entity_name': module_name,
+            'name': module_name,
+            'file': self.filepath,
+            'base_address': base_addr,
+            'base_addr': base_addr,
+            'cdc_enabled': cdc_en,
+            'cdc_en': cdc_en,
+            'cdc_stages': cdc_stage,
+            'cdc_stage': cdc_stage,
+            'use_axion_types': use_axion_types,
+            'registers': registers,
+            'packed_registers': packed_regs_data,
+            'source_file': self.filepath,
+            'parsing_errors': parsing_errors
+        })
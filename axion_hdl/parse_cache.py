@@ -0,0 +1,184 @@
+"""
+Parse Cache Module for Axion HDL
+
+Persists per-file parse results on disk so that unchanged source files are
+loaded instead of re-parsed on the next run. Entries are keyed by the file
+content hash, the parser type, the exclusion set and the axion-hdl version,
+so any change to one of these simply misses the cache.
+
+The cache directory is bounded in size; the least recently used entries are
+evicted first.
+"""
+
+import os
+import pickle
+import shutil
+import hashlib
+from typing import Dict, Iterable, Optional
+
+
+# Default cache directory name (created next to the output directory)
+CACHE_DIR_NAME = '.axion_cache'
+
+# Default size bound of the cache directory
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Bump when the layout of cached results changes
+CACHE_FORMAT = 6
+
+
+def file_digest(filepath: str) -> Optional[str]:
+    """
+    SHA-256 hex digest of a file's content.
+
+    Args:
+        filepath: File to hash
+
+    Returns:
+        Hex digest, or None if the file cannot be read
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+class ParseCache:
+    """
+    Content-hashed on-disk cache of parse results.
+
+    Cached values are the result dictionaries produced by
+    parse_pool.parse_source_file() (module, errors, captured output), so a
+    cache hit replays exactly what a fresh parse would have produced.
+
+    Attributes:
+        cache_dir (str): Directory holding cache entries
+        max_bytes (int): Size bound enforced by prune()
+        hits (int): Number of lookups served from the cache
+        misses (int): Number of lookups that required parsing
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, kind: str, filepath: str, exclude_patterns: Iterable[str],
+                 content_hash: Optional[str] = None) -> Optional[str]:
+        """
+        Compute the cache key for a source file.
+
+        Args:
+            kind: Source kind (see source_discovery.SOURCE_KINDS)
+            filepath: Path of the source file, as passed to the parser
+            exclude_patterns: Active exclusion patterns
+            content_hash: file_digest() of the file, if already known
+
+        Returns:
+            Hex digest key, or None if the file cannot be read
+        """
+        from . import __version__
+
+        if content_hash is None:
+            content_hash = file_digest(filepath)
+        if content_hash is None:
+            return None
+
+        # The path is part of the key because parsers record it in the module
+        parts = [str(CACHE_FORMAT), __version__, kind, filepath, content_hash]
+        parts.extend(sorted(exclude_patterns))
+        return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + '.pkl')
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Load a cached result.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached result dictionary, or None on a miss
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as f:
+                result = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            # Corrupt or incompatible entry: drop it and parse again
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        # Refresh the access time used for LRU eviction
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: Dict) -> None:
+        """
+        Store a parse result.
+
+        Args:
+            key: Key from make_key()
+            result: Result dictionary from parse_pool.parse_source_file()
+        """
+        path = self._entry_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError:
+            # A read-only or full disk must never break analysis
+            self._remove(tmp_path)
+
+    def prune(self) -> int:
+        """
+        Evict least recently used entries until the cache fits in max_bytes.
+
+        Returns:
+            Number of evicted entries
+        """
+        entries = []
+        total = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for filename in files:
+                path = os.path.join(root, filename)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+                total += st.st_size
+
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+            evicted += 1
+        return evicted
+
+    def clear(self) -> None:
+        """Delete every cache entry."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
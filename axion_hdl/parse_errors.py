@@ -0,0 +1,63 @@
+"""
+Parse Error Index for Axion HDL
+
+Parsers record errors in a flat list of {'file': ..., 'msg': ...} entries.
+ParseErrorIndex groups such a list by file so the errors of one source can
+be looked up without scanning every error. Entries appended to the list
+after the last lookup are indexed incrementally, so building the index over
+a whole analysis is linear in the number of errors.
+"""
+
+from typing import Dict, List, Optional
+
+
+class ParseErrorIndex:
+    """Index of a parse error list by source file."""
+
+    def __init__(self):
+        self._errors: Optional[List[Dict]] = None
+        self._by_file: Dict[str, List[Dict]] = {}
+        self._count = 0
+        self._last = None
+
+    def _sync(self, errors: List[Dict]) -> None:
+        """Index the entries added to errors since the last call."""
+        count = self._count
+        if (errors is not self._errors or len(errors) < count
+                or (count and errors[count - 1] is not self._last)):
+            # A different, truncated or refilled list: index it from scratch
+            self._errors = errors
+            self._by_file = {}
+            count = 0
+        for error in errors[count:]:
+            filepath = error.get('file') if isinstance(error, dict) else None
+            self._by_file.setdefault(filepath, []).append(error)
+        self._count = len(errors)
+        self._last = errors[-1] if errors else None
+
+    def for_file(self, errors: List[Dict], filepath: str) -> List[Dict]:
+        """
+        Get the errors of one file.
+
+        Args:
+            errors: Error list to index (the same list on every call)
+            filepath: File path as recorded in the 'file' key
+
+        Returns:
+            New list of the file's errors, in recording order
+        """
+        self._sync(errors)
+        return list(self._by_file.get(filepath, ()))
+
+    def by_file(self, errors: List[Dict]) -> Dict[str, List[Dict]]:
+        """
+        Get all errors grouped by file.
+
+        Args:
+            errors: Error list to index
+
+        Returns:
+            Dictionary of file path (None for entries without one) to errors
+        """
+        self._sync(errors)
+        return {filepath: list(errs) for filepath, errs in self._by_file.items()}
@@ -0,0 +1,158 @@
+"""
+Parse Pool Module for Axion HDL
+
+Runs per-file parsing of source files across a pool of worker processes.
+Each task parses exactly one file with a fresh parser instance, and results
+are returned in task order so that callers can merge modules and errors
+deterministically, independent of which worker finished first.
+"""
+
+import io
+import os
+import sys
+from contextlib import redirect_stdout, redirect_stderr
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """
+    Normalize a requested worker count.
+
+    Args:
+        jobs: None or 1 for serial analysis, 0 (or negative) for one worker
+              per available CPU, or an explicit worker count.
+
+    Returns:
+        Effective number of workers (always >= 1)
+    """
+    if jobs is None:
+        return 1
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def create_parser(kind: str, exclude_patterns: Iterable[str] = ()):
+    """
+    Create a parser instance for a source kind with exclusion patterns applied.
+
+    Args:
+        kind: One of source_discovery.SOURCE_KINDS
+        exclude_patterns: Exclusion patterns to register on the parser
+
+    Returns:
+        Parser instance
+    """
+    if kind == 'vhdl':
+        from .parser import VHDLParser
+        parser = VHDLParser()
+        add = parser.add_exclude
+    elif kind == 'sv':
+        from .systemverilog_parser import SystemVerilogParser
+        parser = SystemVerilogParser()
+        add = parser.add_exclude_pattern
+    elif kind == 'xml':
+        from .xml_input_parser import XMLInputParser
+        parser = XMLInputParser()
+        add = parser.add_exclude
+    elif kind == 'yaml':
+        from .yaml_input_parser import YAMLInputParser
+        parser = YAMLInputParser()
+        add = parser.add_exclude
+    elif kind == 'json':
+        from .json_input_parser import JSONInputParser
+        parser = JSONInputParser()
+        add = parser.add_exclude
+    elif kind == 'toml':
+        from .toml_input_parser import TOMLInputParser
+        parser = TOMLInputParser()
+        add = parser.add_exclude
+    else:
+        raise ValueError(f"Unknown source kind: {kind}")
+
+    for pattern in exclude_patterns:
+        add(pattern)
+    return parser
+
+
+def parse_source_file(task: Tuple[str, str, Tuple[str, ...]]) -> Dict:
+    """
+    Parse a single source file (worker entry point).
+
+    Console output produced by the parser is captured and returned so the
+    caller can replay it in task order.
+
+    Args:
+        task: (kind, filepath, exclude_patterns) tuple
+
+    Returns:
+        Dictionary with keys:
+        - modules: Parsed module dictionaries (several for multi-document YAML)
+        - errors: Errors recorded by the parser while parsing this file
+        - exception: Message of an unexpected exception, or None
+        - skipped: True if the @axion prefilter rejected the file
+        - stdout / stderr: Captured console output
+    """
+    kind, filepath, exclude_patterns = task
+    out, err = io.StringIO(), io.StringIO()
+    modules = []
+    exception = None
+    parser = None
+
+    with redirect_stdout(out), redirect_stderr(err):
+        try:
+            parser = create_parser(kind, exclude_patterns)
+            if kind == 'vhdl':
+                modules.append(parser._parse_vhdl_file(filepath))
+            elif kind == 'sv':
+                modules.append(parser._parse_sv_file(filepath))
+            elif kind == 'yaml':
+                # One module per document, loaded as the file streams by
+                modules.extend(parser.iter_modules(filepath))
+            else:
+                modules.append(parser.parse_file(filepath))
+        except Exception as e:
+            exception = str(e)
+
+    return {
+        'modules': [module for module in modules if module is not None],
+        'errors': list(parser.errors) if parser is not None else [],
+        'exception': exception,
+        'skipped': bool(getattr(parser, 'skipped_files', 0)),
+        'stdout': out.getvalue(),
+        'stderr': err.getvalue(),
+    }
+
+
+def run_parse_tasks(tasks: List[Tuple[str, str, Tuple[str, ...]]], jobs: int) -> List[Dict]:
+    """
+    Parse all tasks, spreading them over a process pool.
+
+    Args:
+        tasks: List of (kind, filepath, exclude_patterns) tuples
+        jobs: Maximum number of worker processes
+
+    Returns:
+        List of result dictionaries (see parse_source_file), in task order
+    """
+    if not tasks:
+        return []
+
+    workers = min(jobs, len(tasks))
+    if workers <= 1:
+        return [parse_source_file(task) for task in tasks]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Several files per round trip keeps IPC overhead low on large trees
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse_source_file, tasks, chunksize=chunksize))
+
+
+def replay_output(result: Dict) -> None:
+    """Re-emit console output captured by a worker."""
+    if result['stdout']:
+        sys.stdout.write(result['stdout'])
+    if result['stderr']:
+        sys.stderr.write(result['stderr'])
@@ -5,9 +5,7 @@ This module parses VHDL files and extracts @axion annotations.
 Uses axion_hdl for reusable utilities.
 """
 
-import os
 import re
-import fnmatch
 from typing import Dict, List, Optional, Tuple, Any, Set
 
 # Import from axion_hdl (unified package)
@@ -15,6 +13,16 @@ from .address_manager import AddressManager, AddressConflictError # Import speci
 from .vhdl_utils import VHDLUtils
 from .annotation_parser import AnnotationParser
 from .bit_field_manager import BitFieldManager, BitOverlapError
+from .source_discovery import walk_source_files, has_axion_annotation
+from .vhdl_scanner import ScanEvent, scan_vhdl, first_entity
+from .exclusion import get_exclude_matcher
+from .ir import ModuleIR
+from .signal_types import resolve_signal_type
+from .layout_planner import LayoutEntry, parse_layout_mode, plan_layout
+from .address_decoder import parse_decode_mode
+from .read_pipeline import parse_read_pipeline
+from .axi_fsm import parse_fsm_mode
+from .cdc_mode import parse_cdc_mode
 
 
 class VHDLParser:
@@ -30,6 +38,7 @@ class VHDLParser:
         # Exclusion patterns (files, directories, or glob patterns)
         self.exclude_patterns: Set[str] = set()
         self.errors = []  # Track parsing errors
+        self.skipped_files = 0  # Files without any @axion annotation
     
     def parse_file(self, filepath: str) -> Optional[Dict]:
         """
@@ -81,21 +90,7 @@ class VHDLParser:
     
     def _extract_width(self, signal_type: str) -> int:
         """Extract bit width from signal type string."""
-        if signal_type == 'std_logic' or signal_type == '[0:0]':
-            return 1
-        # Match [high:low] format
-        match = re.search(r'\[(\d+):(\d+)\]', signal_type)
-        if match:
-            high = int(match.group(1))
-            low = int(match.group(2))
-            return high - low + 1
-        # Match (high downto low) format
-        match = re.search(r'\((\d+)\s+downto\s+(\d+)\)', signal_type)
-        if match:
-            high = int(match.group(1))
-            low = int(match.group(2))
-            return high - low + 1
-        return 32  # Default width
+        return resolve_signal_type(signal_type).width
         
     def add_exclude(self, pattern: str):
         """
@@ -134,38 +129,8 @@ class VHDLParser:
         Returns:
             True if file should be excluded, False otherwise
         """
-        if not self.exclude_patterns:
-            return False
-            
-        # Get various forms of the path for matching
-        filename = os.path.basename(filepath)
-        dirname = os.path.dirname(filepath)
-        dir_basename = os.path.basename(dirname)
-        abs_filepath = os.path.abspath(filepath)
-        
-        for pattern in self.exclude_patterns:
-            # Check filename match
-            if fnmatch.fnmatch(filename, pattern):
-                return True
-            # Check if pattern matches directory name
-            if fnmatch.fnmatch(dir_basename, pattern):
-                return True
-            # Check if pattern is in the full path (exact substring)
-            if pattern in filepath or pattern in abs_filepath:
-                return True
-            # Check if any directory component matches the pattern
-            path_parts = abs_filepath.split(os.sep)
-            for part in path_parts:
-                if fnmatch.fnmatch(part, pattern):
-                    return True
-            # For patterns with wildcards, match against full path
-            # Only wrap with * if pattern doesn't already have wildcards at edges
-            if '*' in pattern or '?' in pattern:
-                if fnmatch.fnmatch(filepath, pattern) or fnmatch.fnmatch(abs_filepath, pattern):
-                    return True
-                
-        return False
-        
+        return get_exclude_matcher(self.exclude_patterns).is_excluded(filepath)
+
     def parse_vhdl_files(self, source_dirs: List[str]) -> List[Dict]:
         """
         Parse all VHDL files in source directories.
@@ -200,18 +165,19 @@ class VHDLParser:
     
     def _find_vhdl_files(self, directory: str) -> List[str]:
         """Find all VHDL files in directory (recursive)."""
-        vhdl_files = []
-        for root, dirs, files in os.walk(directory):
-            # Filter out excluded directories to prevent descending into them
-            dirs[:] = [d for d in dirs if not self._is_excluded(os.path.join(root, d))]
-            
-            for file in files:
-                if file.endswith(('.vhd', '.vhdl')):
-                    vhdl_files.append(os.path.join(root, file))
-        return vhdl_files
+        # Excluded directories are pruned to prevent descending into them
+        matcher = get_exclude_matcher(self.exclude_patterns)
+        return walk_source_files(directory, prune_dir=matcher.is_dir_excluded)['vhdl']
     
     def _parse_vhdl_file(self, filepath: str) -> Optional[Dict]:
         """Parse a single VHDL file."""
+        errors_start = len(self.errors)
+
+        # Most HDL files carry no annotations; reject them before decoding
+        if not has_axion_annotation(filepath):
+            self.skipped_files += 1
+            return None
+
         print(f"Parsing VHDL file: {filepath}")
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
@@ -222,22 +188,29 @@ class VHDLParser:
             self.errors.append({'file': filepath, 'msg': msg})
             return None
         
-        # Extract entity name using common utilities
-        entity_name = self.vhdl_utils.extract_entity_name(content)
+        # One sweep finds the entity, @axion_def lines and annotated signals
+        events = list(scan_vhdl(content))
+        entity_name = first_entity(events)
         if not entity_name:
             return None
         
         # Parse @axion_def using annotation parser
-        cdc_enabled, cdc_stages, base_address = self._parse_axion_def(content)
+        cdc_enabled, cdc_stages, base_address, layout, options = self._parse_axion_def(content, events, filepath)
         
         # Parse signal annotations with base_address offset
         registers, packed_registers = self._parse_signal_annotations(
-            content, base_address, entity_name, filepath
+            content, base_address, entity_name, filepath, events
         )
         
         if not registers and not packed_registers:
             return None
         
+        layout_report = None
+        if layout:
+            layout_report = self._apply_layout(
+                layout, registers + packed_registers, base_address, entity_name
+            )
+        
         # Merge packed registers into main registers list (consistent with XML/YAML/JSON parsers)
         # This ensures RuleChecker can validate subregister overlaps
         all_registers = list(registers)
@@ -268,7 +241,7 @@ class VHDLParser:
         # Sort all registers by address
         all_registers.sort(key=lambda x: x.get('relative_address_int', 0))
             
-        return {
+        module = {
             'name': entity_name,
             'file': filepath,
             'cdc_enabled': cdc_enabled,
@@ -277,28 +250,70 @@ class VHDLParser:
             'registers': all_registers,
 
             'packed_registers': packed_registers,  # Keep for backward compatibility
-            'parsing_errors': self.errors  # Pass accumulated errors to module
+            'parsing_errors': self.errors[errors_start:]  # Errors of this file only
         }
+        if layout_report:
+            module['layout'] = layout_report
+        module.update(options)
+        return ModuleIR.from_dict(module)
     
-        return cdc_enabled, cdc_stages, base_address
+    def _apply_layout(self, layout: str, registers: List[Dict], base_address: int, module_name: str) -> Dict:
+        """
+        Re-place the auto-assigned registers with the layout planner.
+        
+        Args:
+            layout: Layout mode ('compact' or 'decode')
+            registers: Standalone and packed registers, updated in place
+            base_address: Module base address
+            module_name: Name of the module (for the report line)
+            
+        Returns:
+            Layout report dictionary (see layout_planner.LayoutPlan.report)
+        """
+        entries = [
+            LayoutEntry(
+                reg['signal_name'], reg['relative_address_int'], reg['signal_width'],
+                reg['access_mode'], reg.get('manual_address', False)
+            )
+            for reg in registers
+        ]
+        plan = plan_layout(entries, layout)
+        for reg, relative_addr in zip(registers, plan.addresses):
+            reg['relative_address_int'] = relative_addr
+            reg['relative_address'] = f"0x{relative_addr:02X}"
+            reg['address_int'] = base_address + relative_addr
+            reg['address'] = f"0x{base_address + relative_addr:02X}"
+        print(f"INFO: {plan.summary(module_name)}")
+        return plan.report()
     
-    def _parse_axion_def(self, content: str) -> Tuple[bool, int, int]:
-        """Parse @axion_def annotation using common library."""
-        # Find ALL matches to handle split definitions
-        matches = self.annotation_parser.def_pattern.finditer(content)
+    def _parse_axion_def(self, content: str, events: Optional[List[ScanEvent]] = None,
+                         filepath: str = "") -> Tuple[bool, int, int, Optional[str], Dict]:
+        """
+        Parse @axion_def annotation using common library.
+        
+        Returns:
+            (cdc_enabled, cdc_stages, base_address, layout, options), where
+            options holds the generator options given (e.g. {'decode': 'case',
+            'read_pipeline': 2})
+        """
+        if events is None:
+            events = list(scan_vhdl(content))
         
         attrs = {}
         found_any = False
         
-        for match in matches:
+        # Merge ALL definitions to handle split definitions
+        for event in events:
+            if event.kind != 'def':
+                continue
             found_any = True
-            attrs_str = match.group(1).strip()
+            attrs_str = event.text
             # Merge attributes from this line
             line_attrs = self.annotation_parser.parse_attributes(attrs_str)
             attrs.update(line_attrs)
         
         if not found_any:
-            return False, 2, 0x00
+            return False, 2, 0x00, None, {}
         
         cdc_enabled = attrs.get('cdc_enabled', False)
         cdc_stages = attrs.get('cdc_stages', 2)
@@ -314,15 +329,48 @@ class VHDLParser:
             except ValueError:
                 self.errors.append({'msg': f"Invalid base_address value '{base_address}'"})
                 base_address = 0x00
+        
+        try:
+            layout = parse_layout_mode(attrs.get('layout'))
+        except ValueError as e:
+            self.errors.append({'file': filepath, 'msg': str(e)})
+            layout = None
+        
+        options = {}
+        try:
+            decode = parse_decode_mode(attrs.get('decode'))
+            if decode:
+                options['decode'] = decode
+        except ValueError as e:
+            self.errors.append({'file': filepath, 'msg': str(e)})
+        try:
+            read_pipeline = parse_read_pipeline(attrs.get('rd_pipe'))
+            if read_pipeline:
+                options['read_pipeline'] = read_pipeline
+        except ValueError as e:
+            self.errors.append({'file': filepath, 'msg': str(e)})
+        try:
+            fsm = parse_fsm_mode(attrs.get('fsm'))
+            if fsm:
+                options['fsm'] = fsm
+        except ValueError as e:
+            self.errors.append({'file': filepath, 'msg': str(e)})
+        try:
+            cdc_mode = parse_cdc_mode(attrs.get('cdc_mode'))
+            if cdc_mode:
+                options['cdc_mode'] = cdc_mode
+        except ValueError as e:
+            self.errors.append({'file': filepath, 'msg': str(e)})
             
-        return cdc_enabled, cdc_stages, base_address
+        return cdc_enabled, cdc_stages, base_address, layout, options
     
     def _parse_signal_annotations(
         self, 
         content: str, 
         base_address: int = 0x00, 
         module_name: str = "",
-        filepath: str = ""
+        filepath: str = "",
+        events: Optional[List[ScanEvent]] = None
     ) -> Tuple[List[Dict], List[Dict]]:
         """
         Parse all @axion signal annotations.
@@ -334,6 +382,7 @@ class VHDLParser:
             base_address: Base address offset to add to all register addresses
             module_name: Name of the module (for error messages)
             filepath: Source file path (for error messages)
+            events: Events from scan_vhdl() (scanned from content if omitted)
             
         Returns:
             Tuple of (regular_registers, packed_registers)
@@ -345,25 +394,28 @@ class VHDLParser:
         # Track signals with REG_NAME for grouping
         grouped_signals = {}  # reg_name -> list of (signal_name, attrs, signal_type, width, line_num)
         
+        if events is None:
+            events = list(scan_vhdl(content))
+        
         # First pass: collect all signals and identify grouped ones
-        lines = content.split('\n')
-        for line_num, line in enumerate(lines, 1):
-            match = self.axion_signal_pattern.search(line)
-            if not match:
+        declarations = []
+        for event in events:
+            if event.kind != 'signal':
                 continue
-                
-            signal_name = match.group(1)
-            signal_type_str = match.group(2).strip()
-            attrs_str = (match.group(3) or '').strip()
             
             # Parse signal type using common utilities
-            type_name, high_bit, low_bit = self.vhdl_utils.parse_signal_type(signal_type_str)
+            type_name, high_bit, low_bit = self.vhdl_utils.parse_signal_type(event.signal_type)
             signal_type = self.vhdl_utils.format_signal_type(high_bit, low_bit)
             signal_width = high_bit - low_bit + 1
             
             # Parse attributes using annotation parser
-            attrs = self.annotation_parser.parse_attributes(attrs_str)
+            attrs = self.annotation_parser.parse_attributes(event.text)
             
+            # Each signal of a list declaration gets its own register
+            for signal_name in event.names:
+                declarations.append((signal_name, signal_type, signal_width, dict(attrs), event.line))
+        
+        for signal_name, signal_type, signal_width, attrs, line_num in declarations:
             # Check for REG_NAME (subregister grouping)
             reg_name = attrs.get('reg_name')
             
@@ -440,7 +492,7 @@ class VHDLParser:
                     'manual_address': True if manual_addr is not None else False,
                     'signal_width': signal_width,
                     'width': signal_width,  # Standardize on 'width' for modifiers
-                    'enum_values': attrs.get('enum_values')
+                    'enum_values': self.annotation_parser.enum_values(attrs)
                 }
                 
                 registers.append(reg_data)
@@ -527,7 +579,8 @@ class VHDLParser:
                         write_strobe=sig_info['attrs'].get('write_strobe', False),
                         default_value=field_default,
                         allow_overlap=False,
-                        enum_values=sig_info['attrs'].get('enum_values')
+                        enum_values=self.annotation_parser.enum_values(sig_info['attrs']),
+                        align=sig_info['attrs'].get('bit_align', 1)
                     )
 
                     fields.append({
@@ -651,6 +704,7 @@ class VHDLParser:
                 'is_packed': True,
                 'default_value': combined_default,
                 'signal_width': 32,
+                'manual_address': manual_addr is not None,
                 # Aggregate strobes from fields: enable if ANY field has it
                 'read_strobe': any(f.get('read_strobe') for f in fields),
                 'write_strobe': any(f.get('write_strobe') for f in fields)
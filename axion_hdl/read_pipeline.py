@@ -0,0 +1,77 @@
+"""
+Read Pipeline Planning for Axion HDL
+
+By default the read data of a generated register bank is a combinational
+mux from every readable register to the AXI read data port. A module can
+opt into a registered read path instead:
+
+    -- @axion_def RD_PIPE=2          (VHDL)
+    // @axion_def RD_PIPE=2          (SystemVerilog)
+    axion-hdl ... --read-pipeline 2  (all modules)
+
+RD_PIPE=N (1 to 3) splits the mux into a tree of N registered stages. The
+first stage selects one register per sub-mux from the captured address;
+each later stage merges the registered sub-mux outputs of the stage before
+(only a selected register contributes, so merging is an OR). The state
+machines hold RVALID back until the last stage holds the read data.
+RD_PIPE=0 is the combinational mux (default).
+"""
+
+from typing import List, Optional
+
+MAX_READ_PIPELINE = 3
+
+
+def parse_read_pipeline(value) -> Optional[int]:
+    """
+    Normalize an RD_PIPE attribute value.
+
+    Args:
+        value: Attribute value (int or string), or None
+
+    Returns:
+        Pipeline depth 0 to MAX_READ_PIPELINE, or None if value is None
+
+    Raises:
+        ValueError: If value is not a depth from 0 to MAX_READ_PIPELINE
+    """
+    if value is None:
+        return None
+    try:
+        depth = int(str(value).strip(), 0)
+    except ValueError:
+        depth = -1
+    if not 0 <= depth <= MAX_READ_PIPELINE:
+        raise ValueError(
+            f"Invalid RD_PIPE '{value}'; expected a depth from 0 to {MAX_READ_PIPELINE}"
+        )
+    return depth
+
+
+def plan_read_tree(sources: int, depth: int) -> List[List[range]]:
+    """
+    Split a read mux over `sources` inputs into `depth` registered stages.
+
+    Every stage uses the same fan-in, the smallest one that reaches a
+    single output after `depth` stages, so the logic between two stage
+    registers is about the same everywhere.
+
+    Args:
+        sources: Number of readable register chunks
+        depth: Number of registered stages (at least 1)
+
+    Returns:
+        One list per stage of the input ranges of its sub-muxes; stage 1
+        indexes the sources, each later stage the sub-muxes of the stage
+        before, and the last stage has a single sub-mux
+    """
+    fan_in = 2
+    while fan_in ** depth < sources:
+        fan_in += 1
+    stages = []
+    count = sources
+    for _ in range(depth):
+        groups = [range(start, min(start + fan_in, count)) for start in range(0, count, fan_in)]
+        stages.append(groups or [range(0)])
+        count = len(stages[-1])
+    return stages
@@ -1,7 +1,191 @@
 import re
 import json
-from typing import List, Dict, Any, Tuple
+import time
+import pickle
+import hashlib
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Optional, Tuple
 from collections import defaultdict
+from .exclusion import get_exclude_matcher
+from .bit_field_manager import bit_mask, occupancy_masks
+from .address_manager import overlapping_pairs
+from .ir import ModuleIR
+
+# Keys of the issues recorded by RuleChecker
+_ISSUE_KEYS = {'type', 'module', 'msg'}
+
+RULE_SCOPES = ('module', 'global')
+
+
+class Rule(NamedTuple):
+    """A check run by RuleChecker.run_all_checks()."""
+    name: str          # Name used to select or skip the rule
+    method: str        # RuleChecker method taking the module list
+    scope: str         # 'module': each module is checked on its own; 'global': across modules
+    description: str
+
+
+# Registered rules, in the order run_all_checks() runs them
+RULES: Tuple[Rule, ...] = (
+    Rule('parsing-errors', 'check_parsing_errors', 'module', 'Errors recorded while parsing'),
+    Rule('logical-integrity', 'check_logical_integrity', 'module', 'Modules without registers'),
+    Rule('documentation', 'check_documentation', 'module', 'Registers without descriptions'),
+    Rule('address-overlaps', 'check_address_overlaps', 'global', 'Overlapping module address ranges'),
+    Rule('intra-module-conflicts', 'check_intra_module_address_conflicts', 'module',
+         'Registers sharing an address within a module'),
+    Rule('subregister-overlaps', 'check_subregister_overlaps', 'module',
+         'Overlapping bit fields in packed registers'),
+    Rule('default-values', 'check_default_values', 'module', 'Default values wider than the register'),
+    Rule('naming-conventions', 'check_naming_conventions', 'module',
+         'Identifiers, reserved keywords and style'),
+    Rule('address-alignment', 'check_address_alignment', 'module', 'Registers not 4-byte aligned'),
+    Rule('duplicate-names', 'check_duplicate_names', 'module', 'Register names defined twice'),
+    Rule('unique-module-names', 'check_unique_module_names', 'global', 'Module names used twice'),
+    Rule('enum-overflow', 'check_enum_value_overflow', 'module', 'Enum values wider than the field'),
+    # Runs only when a hierarchy is passed to run_all_checks()
+    Rule('hierarchy', 'check_hierarchy', 'global', 'Hierarchy modules, instance names and ranges'),
+)
+
+_RULES_BY_NAME = {rule.name: rule for rule in RULES}
+
+
+def select_rules(rules: Optional[Iterable[str]] = None,
+                 skip: Optional[Iterable[str]] = None) -> List[Rule]:
+    """
+    Resolve rule names to the registered rules to run.
+
+    Args:
+        rules: Names of the rules to run (default: all rules)
+        skip: Names of rules not to run
+
+    Returns:
+        Selected rules in registry order
+
+    Raises:
+        ValueError: If a name is not a registered rule
+    """
+    def _names(values):
+        names = set()
+        for value in values or ():
+            # Accept "a,b" as well as separate names
+            names.update(n.strip() for n in value.split(',') if n.strip())
+        unknown = sorted(names - set(_RULES_BY_NAME))
+        if unknown:
+            raise ValueError(
+                f"Unknown rule(s): {', '.join(unknown)}; "
+                f"available: {', '.join(rule.name for rule in RULES)}"
+            )
+        return names
+
+    selected = _names(rules) if rules is not None else set(_RULES_BY_NAME)
+    skipped = _names(skip)
+    return [rule for rule in RULES if rule.name in selected and rule.name not in skipped]
+
+
+def module_digest(module: Dict) -> str:
+    """
+    Content hash of an analyzed module dictionary.
+
+    Args:
+        module: Module dictionary
+
+    Returns:
+        Hex digest; modules with equal content hash equal
+    """
+    try:
+        data = pickle.dumps(module, protocol=4)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        data = repr(module).encode('utf-8', 'replace')
+    return hashlib.sha1(data).hexdigest()
+
+
+def module_key(module: Dict) -> Hashable:
+    """
+    Key under which incremental checking caches a module's results.
+
+    A ModuleIR is keyed by its version stamps (see ModuleIR.version()), which
+    are much cheaper to collect than a content hash; other modules by
+    module_digest().
+
+    Args:
+        module: Module dictionary or ModuleIR
+
+    Returns:
+        Key that changes whenever the module changes
+    """
+    if isinstance(module, ModuleIR):
+        version = module.version()
+        if version is not None:
+            return version
+    return module_digest(module)
+
+
+def _to_int(v) -> int:
+    if isinstance(v, int):
+        return v
+    try:
+        return int(str(v), 0)
+    except (ValueError, TypeError):
+        return 0
+
+
+def _module_range(module: Dict) -> Optional[Tuple[str, int, int]]:
+    """(name, start, inclusive end) of a module's registers, or None without registers."""
+    base_addr = module.get('base_address', 0x00)
+    registers = module.get('registers', [])
+    if not registers:
+        return None
+    max_addr = base_addr
+    for reg in registers:
+        reg_addr = reg.get('address_int', 0)
+        width = int(reg.get('width', 32)) if reg.get('width') else 32
+        byte_width = (width + 7) // 8
+        # reg_addr is absolute address (base + offset)
+        # So end address is just start + size
+        reg_end = reg_addr + max(4, byte_width)
+        max_addr = max(max_addr, reg_end)
+    return module['name'], base_addr, max_addr - 1
+
+
+def _hierarchy_size(module: Dict) -> Optional[int]:
+    """Bytes from a module's base past its last register, or None without registers."""
+    regs = module.get('registers', [])
+    if not regs:
+        return None
+    mod_base = _to_int(module.get('base_address', 0))
+
+    def _relative_offset(r):
+        if r.get('relative_address_int') is not None:
+            return _to_int(r['relative_address_int'])
+        if r.get('address_int') is not None:
+            return _to_int(r['address_int']) - mod_base
+        return _to_int(r.get('address', 0))
+
+    def _reg_span(r):
+        width = int(r.get('width', 32)) if r.get('width') else 32
+        byte_size = max(4, (width + 7) // 8)
+        return ((byte_size + 3) // 4) * 4
+
+    return max(_relative_offset(r) + _reg_span(r) for r in regs)
+
+
+def _run_module_rules(task: Tuple[Tuple[str, ...], List[Dict]]) -> Dict[str, Tuple]:
+    """
+    Run module-local rules on a chunk of modules (worker entry point).
+
+    Args:
+        task: (rule names, modules) tuple
+
+    Returns:
+        Mapping of rule name to (errors, warnings, seconds) for the chunk
+    """
+    names, modules = task
+    results = {}
+    for name in names:
+        checker = RuleChecker()
+        start = time.perf_counter()
+        getattr(checker, _RULES_BY_NAME[name].method)(modules)
+        results[name] = (checker.errors, checker.warnings, time.perf_counter() - start)
+    return results
 
 class RuleChecker:
     """
@@ -27,6 +211,14 @@ class RuleChecker:
         # Format: [{'type': str, 'module': str, 'msg': str}]
         self.errors = []
         self.warnings = []
+        # id(list) -> [list, keys of its issues, indexed length]
+        self._seen = {}
+        # Per-rule statistics of the last run_all_checks()
+        self.timings = []
+        # Incremental checking: module key -> {'index': (name, range, size), 'results': {rule: issues}}
+        self._module_cache = {}
+        # Incremental checking: global rule name -> (index key, errors, warnings)
+        self._global_cache = {}
 
     def _add_error(self, rule_type: str, module_name: str, message: str):
         issue = {
@@ -34,8 +226,7 @@ class RuleChecker:
             'module': module_name,
             'msg': message
         }
-        if issue not in self.errors:
-            self.errors.append(issue)
+        self._append_unique(self.errors, issue)
 
     def _add_warning(self, rule_type: str, module_name: str, message: str):
         issue = {
@@ -43,8 +234,24 @@ class RuleChecker:
             'module': module_name,
             'msg': message
         }
-        if issue not in self.warnings:
-            self.warnings.append(issue)
+        self._append_unique(self.warnings, issue)
+
+    def _append_unique(self, issues: List[Dict], issue: Dict) -> None:
+        """Append issue unless an equal one is listed (constant time per issue)."""
+        key = (issue['type'], issue['module'], issue['msg'])
+        seen = self._seen.get(id(issues))
+        if (seen is None or seen[0] is not issues or seen[2] != len(issues)
+                or (issues and issues[-1] is not seen[3])):
+            # New list, or issues were changed without this method: re-index
+            keys = {(i['type'], i['module'], i['msg']) for i in issues
+                    if i.keys() == _ISSUE_KEYS}
+            seen = self._seen[id(issues)] = [issues, keys, len(issues), issues[-1] if issues else None]
+        if key in seen[1]:
+            return
+        issues.append(issue)
+        seen[1].add(key)
+        seen[2] += 1
+        seen[3] = issue
 
     def check_subregister_overlaps(self, modules: List[Dict]) -> None:
         """Check for overlapping bit fields within packed registers."""
@@ -58,6 +265,16 @@ class RuleChecker:
                 # Fields handles are dicts: {'name':..., 'bit_low':..., 'bit_high':...}
                 sorted_fields = sorted(fields, key=lambda f: f.get('bit_low', 0))
 
+                # Occupancy masks find doubly used bits in one pass; only the
+                # fields covering them need to be compared pairwise
+                bounds = [(f.get('bit_low', 0), f.get('bit_high', 0)) for f in sorted_fields]
+                if all(low >= 0 for low, _ in bounds):
+                    masks = [bit_mask(low, high) if high >= low else 0 for low, high in bounds]
+                    _, overlapped = occupancy_masks(masks)
+                    if not overlapped:
+                        continue
+                    sorted_fields = [f for f, m in zip(sorted_fields, masks) if m & overlapped]
+
                 for i, f1 in enumerate(sorted_fields):
                     for f2 in sorted_fields[i+1:]:
                         start1, end1 = f1.get('bit_low', 0), f1.get('bit_high', 0)
@@ -77,43 +294,25 @@ class RuleChecker:
 
     def check_address_overlaps(self, modules: List[Dict]) -> None:
         """Check for overlapping address ranges between modules."""
-        module_ranges = []
-        for module in modules:
-            base_addr = module.get('base_address', 0x00)
-            registers = module.get('registers', [])
-            
-            if registers:
-                max_addr = base_addr
-                for reg in registers:
-                    reg_addr = reg.get('address_int', 0) 
-                    width = int(reg.get('width', 32)) if reg.get('width') else 32
-                    byte_width = (width + 7) // 8
-                    # reg_addr is absolute address (base + offset)
-                    # So end address is just start + size
-                    reg_end = reg_addr + max(4, byte_width)
-                    max_addr = max(max_addr, reg_end)
-                
-                module_ranges.append({
-                    'name': module['name'],
-                    'start': base_addr,
-                    'end': max_addr - 1
-                })
+        self._report_address_overlaps([_module_range(module) for module in modules])
 
-        # Find overlaps
+    def _report_address_overlaps(self, ranges: List[Optional[Tuple[str, int, int]]]) -> None:
+        """Report overlaps between (name, start, inclusive end) module ranges."""
+        module_ranges = [
+            {'name': name, 'start': start, 'end': end}
+            for name, start, end in filter(None, ranges)
+        ]
+
+        # Find overlaps (ends are inclusive)
         overlaps = defaultdict(list)
-        for i, m1 in enumerate(module_ranges):
-            for m2 in module_ranges[i+1:]:
-                # Check intersection: max(start1, start2) <= min(end1, end2)
-                overlap_start = max(m1['start'], m2['start'])
-                overlap_end = min(m1['end'], m2['end'])
-                
-                if overlap_start <= overlap_end:
-                    # Found overlap
-                    msg = f"Address region 0x{m1['start']:X}-0x{m1['end']:X} overlaps with {m2['name']} (0x{m2['start']:X}-0x{m2['end']:X})"
-                    overlaps[m1['name']].append(msg)
-                    
-                    msg2 = f"Address region 0x{m2['start']:X}-0x{m2['end']:X} overlaps with {m1['name']} (0x{m1['start']:X}-0x{m1['end']:X})"
-                    overlaps[m2['name']].append(msg2)
+        pairs = overlapping_pairs([(m['start'], m['end'] + 1) for m in module_ranges])
+        for i, j in pairs:
+            m1, m2 = module_ranges[i], module_ranges[j]
+            msg = f"Address region 0x{m1['start']:X}-0x{m1['end']:X} overlaps with {m2['name']} (0x{m2['start']:X}-0x{m2['end']:X})"
+            overlaps[m1['name']].append(msg)
+            
+            msg2 = f"Address region 0x{m2['start']:X}-0x{m2['end']:X} overlaps with {m1['name']} (0x{m1['start']:X}-0x{m1['end']:X})"
+            overlaps[m2['name']].append(msg2)
         
         # Report errors per module
         for mod_name, messages in overlaps.items():
@@ -247,39 +446,38 @@ class RuleChecker:
                 
                 address_ranges.append((start_addr, end_addr, reg_name, width))
             
-            # Check for overlaps between all pairs of registers
-            for i, (start1, end1, name1, width1) in enumerate(address_ranges):
-                for start2, end2, name2, width2 in address_ranges[i+1:]:
-                    # Check if ranges overlap: [start1, end1) intersects [start2, end2)
-                    if start1 < end2 and start2 < end1:
-                        # Determine the nature of the conflict
-                        if start1 == start2:
-                            # Exact duplicate address
-                            self._add_error(
-                                "Duplicate Address",
-                                module['name'],
-                                f"Address 0x{start1:04X} is assigned to both '{name1}' and '{name2}'"
-                            )
-                        else:
-                            # Wide register overlap
-                            # Determine which register is the wide one
-                            if width1 > 32:
-                                wide_name, wide_start, wide_end = name1, start1, end1
-                                other_name, other_addr = name2, start2
-                            elif width2 > 32:
-                                wide_name, wide_start, wide_end = name2, start2, end2
-                                other_name, other_addr = name1, start1
-                            else:
-                                # Both are 32-bit or less but still overlap
-                                wide_name, wide_start, wide_end = name1, start1, end1
-                                other_name, other_addr = name2, start2
-                            
-                            self._add_error(
-                                "Address Overlap",
-                                module['name'],
-                                f"Register '{other_name}' at 0x{other_addr:04X} conflicts with "
-                                f"'{wide_name}' which occupies 0x{wide_start:04X}-0x{wide_end-1:04X}"
-                            )
+            # Check for overlaps between registers: [start1, end1) intersects [start2, end2)
+            for i, j in overlapping_pairs([(start, end) for start, end, _, _ in address_ranges]):
+                start1, end1, name1, width1 = address_ranges[i]
+                start2, end2, name2, width2 = address_ranges[j]
+                # Determine the nature of the conflict
+                if start1 == start2:
+                    # Exact duplicate address
+                    self._add_error(
+                        "Duplicate Address",
+                        module['name'],
+                        f"Address 0x{start1:04X} is assigned to both '{name1}' and '{name2}'"
+                    )
+                else:
+                    # Wide register overlap
+                    # Determine which register is the wide one
+                    if width1 > 32:
+                        wide_name, wide_start, wide_end = name1, start1, end1
+                        other_name, other_addr = name2, start2
+                    elif width2 > 32:
+                        wide_name, wide_start, wide_end = name2, start2, end2
+                        other_name, other_addr = name1, start1
+                    else:
+                        # Both are 32-bit or less but still overlap
+                        wide_name, wide_start, wide_end = name1, start1, end1
+                        other_name, other_addr = name2, start2
+                    
+                    self._add_error(
+                        "Address Overlap",
+                        module['name'],
+                        f"Register '{other_name}' at 0x{other_addr:04X} conflicts with "
+                        f"'{wide_name}' which occupies 0x{wide_start:04X}-0x{wide_end-1:04X}"
+                    )
 
     def check_unique_module_names(self, modules: List[Dict]) -> None:
         """Check for duplicate module names across the project."""
@@ -304,7 +502,16 @@ class RuleChecker:
         - Instance names within the hierarchy are unique.
         - Address ranges of different instances do not overlap.
         """
-        known_modules = {m['name'] for m in modules}
+        sizes = {}
+        for m in modules:
+            # The first module of a name determines the size
+            if m['name'] not in sizes:
+                sizes[m['name']] = _hierarchy_size(m)
+        self._report_hierarchy(hierarchy, sizes)
+
+    def _report_hierarchy(self, hierarchy: List[Dict], sizes: Dict[str, Optional[int]]) -> None:
+        """Check a hierarchy against module sizes (None for modules without registers)."""
+        known_modules = sizes
 
         # Check: every hierarchy module exists in sources
         for entry in hierarchy:
@@ -332,71 +539,38 @@ class RuleChecker:
                 seen_instances[inst] = entry
 
         # Check: overlapping address ranges between instances
-        def _to_int(v):
-            if isinstance(v, int):
-                return v
-            try:
-                return int(str(v), 0)
-            except (ValueError, TypeError):
-                return 0
-
-        def _relative_offset(r, mod_base):
-            if r.get('relative_address_int') is not None:
-                return _to_int(r['relative_address_int'])
-            if r.get('address_int') is not None:
-                return _to_int(r['address_int']) - mod_base
-            return _to_int(r.get('address', 0))
-
-        def _reg_span(r):
-            width = int(r.get('width', 32)) if r.get('width') else 32
-            byte_size = max(4, (width + 7) // 8)
-            return ((byte_size + 3) // 4) * 4
-
         ranges = []
         for entry in hierarchy:
             mod = entry['module']
             inst = entry.get('instance') or mod
             base = entry['base_addr']
-            # Find the corresponding analyzed module to determine size
-            for m in modules:
-                if m['name'] == mod:
-                    regs = m.get('registers', [])
-                    mod_base = _to_int(m.get('base_address', 0))
-                    if regs:
-                        size = max(
-                            _relative_offset(r, mod_base) + _reg_span(r)
-                            for r in regs
-                        )
-                        end = base + size - 1
-                        ranges.append((inst, base, end))
-                    break
+            size = sizes.get(mod)
+            if size is not None:
+                end = base + size - 1
+                ranges.append((inst, base, end))
 
-        for i, (inst_a, base_a, end_a) in enumerate(ranges):
-            for inst_b, base_b, end_b in ranges[i + 1:]:
-                if base_a <= end_b and base_b <= end_a:
-                    self._add_error(
-                        "Hierarchy",
-                        inst_a,
-                        f"Address ranges of instances '{inst_a}' "
-                        f"(0x{base_a:08X}–0x{end_a:08X}) and '{inst_b}' "
-                        f"(0x{base_b:08X}–0x{end_b:08X}) overlap."
-                    )
+        # Ends are inclusive
+        for i, j in overlapping_pairs([(base, end + 1) for _, base, end in ranges]):
+            inst_a, base_a, end_a = ranges[i]
+            inst_b, base_b, end_b = ranges[j]
+            self._add_error(
+                "Hierarchy",
+                inst_a,
+                f"Address ranges of instances '{inst_a}' "
+                f"(0x{base_a:08X}–0x{end_a:08X}) and '{inst_b}' "
+                f"(0x{base_b:08X}–0x{end_b:08X}) overlap."
+            )
 
     def _check_single_file(self, filepath: str, exclude_patterns: List[str] = None) -> None:
         """Check a single source file for format issues."""
         import os
-        import fnmatch
         import json
         
-        exclude_patterns = exclude_patterns or []
         filename = os.path.basename(filepath)
         
         # Check exclusion
-        for pattern in exclude_patterns:
-            if fnmatch.fnmatch(filename, pattern):
-                return
-            if pattern in filepath:
-                return
+        if get_exclude_matcher(exclude_patterns or ()).is_excluded(filepath):
+            return
 
         # Common field name mistakes and their corrections
         field_suggestions = {
@@ -476,50 +650,51 @@ class RuleChecker:
 
         elif ext in ['.yaml', '.yml']:
             try:
-                import yaml
+                from .yaml_loader import safe_load_all
                 with open(filepath, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
-                
-                if isinstance(data, dict):
-                    if 'module' not in data:
-                        if 'name' in data:
-                            self._add_warning(
-                                "Format Issue",
-                                filename,
-                                f"Missing 'module' field. Did you mean 'module' instead of 'name'?"
-                            )
-                        else:
-                            self._add_warning(
-                                "Format Issue",
-                                filename,
-                                "Missing required 'module' field"
-                            )
+                    # Multi-document files carry one module per document
+                    for data in safe_load_all(f):
+                        if not isinstance(data, dict):
+                            continue
+                        if 'module' not in data:
+                            if 'name' in data:
+                                self._add_warning(
+                                    "Format Issue",
+                                    filename,
+                                    f"Missing 'module' field. Did you mean 'module' instead of 'name'?"
+                                )
+                            else:
+                                self._add_warning(
+                                    "Format Issue",
+                                    filename,
+                                    "Missing required 'module' field"
+                                )
                     
-                    for wrong_field, suggestion in field_suggestions.items():
-                        if wrong_field in data and wrong_field != 'name':
-                            self._add_warning(
-                                "Format Issue",
-                                filename,
-                                suggestion[1]
-                            )
+                        for wrong_field, suggestion in field_suggestions.items():
+                            if wrong_field in data and wrong_field != 'name':
+                                self._add_warning(
+                                    "Format Issue",
+                                    filename,
+                                    suggestion[1]
+                                )
                     
-                    if 'config' not in data:
-                        if 'cdc_enabled' in data or 'cdc_stages' in data:
-                            self._add_warning(
-                                "Format Issue",
-                                filename,
-                                "CDC settings should be in 'config' section"
-                            )
+                        if 'config' not in data:
+                            if 'cdc_enabled' in data or 'cdc_stages' in data:
+                                self._add_warning(
+                                    "Format Issue",
+                                    filename,
+                                    "CDC settings should be in 'config' section"
+                                )
                     
-                    if 'registers' in data and isinstance(data['registers'], list):
-                        for i, reg in enumerate(data['registers']):
-                            if isinstance(reg, dict):
-                                if 'mode' in reg and 'access' not in reg:
-                                    self._add_warning(
-                                        "Format Issue",
-                                        filename,
-                                        f"Register {i+1}: Use 'access' instead of 'mode'"
-                                    )
+                        if 'registers' in data and isinstance(data['registers'], list):
+                            for i, reg in enumerate(data['registers']):
+                                if isinstance(reg, dict):
+                                    if 'mode' in reg and 'access' not in reg:
+                                        self._add_warning(
+                                            "Format Issue",
+                                            filename,
+                                            f"Register {i+1}: Use 'access' instead of 'mode'"
+                                        )
             except ImportError:
                 pass  # PyYAML not installed
             except Exception as e:
@@ -570,9 +745,9 @@ class RuleChecker:
         Scans JSON, YAML, and XML files for common mistakes.
         """
         import os
-        import fnmatch
         
         exclude_patterns = exclude_patterns or []
+        matcher = get_exclude_matcher(exclude_patterns)
         
         # Scan all source directories
         for src_dir in source_dirs:
@@ -581,7 +756,7 @@ class RuleChecker:
             
             for root, dirs, files in os.walk(src_dir):
                 # Skip excluded directories
-                dirs[:] = [d for d in dirs if not any(fnmatch.fnmatch(d, p) for p in exclude_patterns)]
+                dirs[:] = [d for d in dirs if not matcher.is_dir_excluded(os.path.join(root, d))]
                 
                 for filename in files:
                     filepath = os.path.join(root, filename)
@@ -690,28 +865,208 @@ class RuleChecker:
                         f"Standalone register '{reg_name}'"
                     )
 
-    def run_all_checks(self, modules: List[Dict]) -> Dict[str, List]:
+    def run_all_checks(self, modules: List[Dict], rules: Optional[Iterable[str]] = None,
+                       skip: Optional[Iterable[str]] = None,
+                       jobs: Optional[int] = None,
+                       hierarchy: Optional[List[Dict]] = None,
+                       incremental: bool = False) -> Dict[str, List]:
+        """
+        Run the registered rules and collect their errors and warnings.
+
+        Module-local rules check each module on its own, so with jobs > 1 the
+        modules are split into chunks that are checked in a process pool.
+        Results are merged in rule and module order, so the issues and their
+        order are identical to a serial run.
+
+        With incremental=True the results of module-local rules are kept per
+        module (see module_key()), and only new or changed modules are
+        checked again. Global rules are re-run only when the module names, address
+        ranges or hierarchy sizes they depend on have changed.
+
+        Args:
+            modules: Analyzed module dictionaries
+            rules: Names of the rules to run (default: all, see RULES)
+            skip: Names of rules not to run
+            jobs: None or 1 for a serial run, 0 for one worker per CPU,
+                  or an explicit worker count
+            hierarchy: Hierarchy entries to validate with the 'hierarchy' rule
+            incremental: Reuse results of the previous run on this checker
+
+        Returns:
+            Dictionary with 'errors' and 'warnings' lists
+
+        Raises:
+            ValueError: If a rule name is unknown
+        """
+        from .parse_pool import resolve_jobs
+
+        selected = [rule for rule in select_rules(rules, skip)
+                    if rule.name != 'hierarchy' or hierarchy is not None]
         self.errors = []
         self.warnings = []
+        self._seen = {}
+        self.timings = []
+
+        module_rules = tuple(rule.name for rule in selected if rule.scope == 'module')
+        workers = resolve_jobs(jobs)
+        # (errors, warnings) per rule for consecutive groups of modules, in module order
+        parts: List[Dict[str, Tuple]] = []
+        seconds: Dict[str, float] = defaultdict(float)
+        cached: Dict[str, int] = defaultdict(int)
+        index = None
+        if incremental:
+            parts, index = self._update_module_cache(modules, module_rules, workers, seconds, cached)
+        elif module_rules and min(workers, len(modules)) > 1:
+            # A few chunks per worker balances modules of different sizes
+            num_chunks = min(len(modules), workers * 4)
+            size = -(-len(modules) // num_chunks)
+            tasks = [(module_rules, modules[i:i + size]) for i in range(0, len(modules), size)]
+            for result in self._map_module_rules(tasks, workers):
+                part = {}
+                for name, (errors, warnings, chunk_seconds) in result.items():
+                    part[name] = (errors, warnings)
+                    seconds[name] += chunk_seconds
+                parts.append(part)
 
-        self.check_parsing_errors(modules)  # Check pre-existing parsing errors first
-        self.check_logical_integrity(modules)
-        self.check_documentation(modules)
-        self.check_address_overlaps(modules)
-        self.check_intra_module_address_conflicts(modules)  # New: check within each module
-        self.check_subregister_overlaps(modules)
-        self.check_default_values(modules)
-        self.check_naming_conventions(modules)
-        self.check_address_alignment(modules)
-        self.check_duplicate_names(modules)
-        self.check_unique_module_names(modules)
-        self.check_enum_value_overflow(modules)
+        for rule in selected:
+            errors_before, warnings_before = len(self.errors), len(self.warnings)
+            start = time.perf_counter()
+            if parts and rule.scope == 'module':
+                for result in parts:
+                    errors, warnings = result[rule.name]
+                    for issue in errors:
+                        self._append_unique(self.errors, dict(issue))
+                    for issue in warnings:
+                        self._append_unique(self.warnings, dict(issue))
+            elif index is not None and rule.scope == 'global':
+                if self._run_global_incremental(rule, modules, index, hierarchy):
+                    cached[rule.name] = len(modules)
+            elif rule.name == 'hierarchy':
+                self.check_hierarchy(hierarchy, modules)
+            else:
+                getattr(self, rule.method)(modules)
+            # Time spent in workers (if any), plus running or merging here
+            seconds[rule.name] += time.perf_counter() - start
+            self.timings.append({
+                'rule': rule.name,
+                'scope': rule.scope,
+                'seconds': seconds[rule.name],
+                'items': len(modules),
+                'cached': cached[rule.name],
+                'issues': len(self.errors) - errors_before + len(self.warnings) - warnings_before,
+            })
 
         return {
             'errors': self.errors,
             'warnings': self.warnings
         }
 
+    @staticmethod
+    def _map_module_rules(tasks: List[Tuple], workers: int) -> List[Dict[str, Tuple]]:
+        """Run _run_module_rules() over tasks, in a process pool if workers > 1."""
+        workers = min(workers, len(tasks))
+        if workers <= 1:
+            return [_run_module_rules(task) for task in tasks]
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_run_module_rules, tasks, chunksize=chunksize))
+
+    def _update_module_cache(self, modules: List[Dict], module_rules: Tuple[str, ...], workers: int,
+                             seconds: Dict[str, float], cached: Dict[str, int]) -> Tuple[List, List]:
+        """
+        Check new or changed modules and return cached results for all modules.
+
+        Returns:
+            (per-module results, per-module (name, address range, hierarchy size) index)
+        """
+        digests = [module_key(module) for module in modules]
+        live = set(digests)
+        # Forget modules that were removed or changed since the last run
+        for digest in [d for d in self._module_cache if d not in live]:
+            del self._module_cache[digest]
+
+        pending = {}
+        for digest, module in zip(digests, modules):
+            entry = self._module_cache.get(digest)
+            if entry is None:
+                entry = self._module_cache[digest] = {
+                    'index': (module.get('name'), _module_range(module), _hierarchy_size(module)),
+                    'results': {},
+                }
+            names = tuple(name for name in module_rules if name not in entry['results'])
+            if names and digest not in pending:
+                pending[digest] = (names, [module])
+
+        results = self._map_module_rules(list(pending.values()), workers)
+        for digest, result in zip(pending, results):
+            for name, (errors, warnings, rule_seconds) in result.items():
+                self._module_cache[digest]['results'][name] = (errors, warnings)
+                seconds[name] += rule_seconds
+
+        for name in module_rules:
+            cached[name] = len(digests)
+        for digest in digests:
+            if digest in pending:
+                for name in pending[digest][0]:
+                    cached[name] -= 1
+        entries = [self._module_cache[digest] for digest in digests]
+        return [entry['results'] for entry in entries], [entry['index'] for entry in entries]
+
+    def _run_global_incremental(self, rule: Rule, modules: List[Dict], index: List[Tuple],
+                                hierarchy: Optional[List[Dict]]) -> bool:
+        """
+        Run a global rule unless the part of the module index it reads is unchanged.
+
+        Returns:
+            True if the issues of the previous run were reused
+        """
+        if rule.name == 'address-overlaps':
+            key = tuple(entry[1] for entry in index)
+        elif rule.name == 'unique-module-names':
+            key = tuple(entry[0] for entry in index)
+        elif rule.name == 'hierarchy':
+            key = (module_digest(hierarchy), tuple((entry[0], entry[2]) for entry in index))
+        else:
+            key = tuple(module_key(module) for module in modules)
+
+        previous = self._global_cache.get(rule.name)
+        reused = previous is not None and previous[0] == key
+        if not reused:
+            scratch = RuleChecker()
+            if rule.name == 'address-overlaps':
+                scratch._report_address_overlaps(list(key))
+            elif rule.name == 'hierarchy':
+                sizes = {}
+                for name, _, size in index:
+                    sizes.setdefault(name, size)
+                scratch._report_hierarchy(hierarchy, sizes)
+            else:
+                getattr(scratch, rule.method)(modules)
+            previous = self._global_cache[rule.name] = (key, scratch.errors, scratch.warnings)
+
+        for issue in previous[1]:
+            self._append_unique(self.errors, dict(issue))
+        for issue in previous[2]:
+            self._append_unique(self.warnings, dict(issue))
+        return reused
+
+    def _timing_lines(self) -> List[str]:
+        """Per-rule timing table of the last run_all_checks()."""
+        if not self.timings:
+            return []
+        lines = ["⏱   RULE TIMINGS", "-" * 80]
+        lines.append(f"  {'Rule':<28} {'Scope':<8} {'Modules':>8} {'Cached':>8} {'Issues':>8} {'Time (ms)':>12}")
+        for timing in self.timings:
+            lines.append(
+                f"  {timing['rule']:<28} {timing['scope']:<8} {timing['items']:>8} "
+                f"{timing['cached']:>8} {timing['issues']:>8} {timing['seconds'] * 1000:>12.2f}"
+            )
+        lines.append("")
+        return lines
+
     def generate_report(self) -> str:
         """Generate a structured text report."""
         lines = []
@@ -721,6 +1076,9 @@ class RuleChecker:
         
         if not self.errors and not self.warnings:
             lines.append("✅  All checks passed! System is healthy.")
+            if self.timings:
+                lines.append("")
+                lines.extend(self._timing_lines())
             lines.append("="*80)
             return "\n".join(lines)
 
@@ -743,6 +1101,7 @@ class RuleChecker:
         
         print_group("ERRORS", self.errors, "❌")
         print_group("WARNINGS", self.warnings, "⚠️ ")
+        lines.extend(self._timing_lines())
             
         lines.append("="*80)
         return "\n".join(lines)
@@ -756,6 +1115,7 @@ class RuleChecker:
                 'total_errors': len(self.errors),
                 'total_warnings': len(self.warnings),
                 'passed': len(self.errors) == 0
-            }
+            },
+            'rules': self.timings
         }
         return json.dumps(report, indent=4)
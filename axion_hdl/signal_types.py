@@ -0,0 +1,69 @@
+"""
+Signal Type Resolution for Axion HDL
+
+Registers and fields carry their type as a string in one of the internal
+notations written by the parsers:
+
+    '[31:0]'                          (VHDL and SystemVerilog annotations)
+    'std_logic_vector(31 downto 0)'   (YAML, JSON, XML and TOML input)
+    'std_logic'                       (1-bit data-file registers)
+
+resolve_signal_type() parses such a string once and returns a frozen
+SignalType record; results are memoized, so the parsers and every generator
+share one resolution per distinct type string instead of re-running their
+own regular expressions per register and output format.
+"""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+# Notations of a signal type string
+RANGE = 'range'      # [high:low]
+VECTOR = 'vector'    # std_logic_vector(high downto low)
+BIT = 'bit'          # std_logic (or logic/reg/wire)
+UNKNOWN = ''         # Anything else: treated as 32 bits
+
+_RANGE_PATTERN = re.compile(r'\[(\d+):(\d+)\]')
+_VECTOR_PATTERN = re.compile(r'std_logic_vector\((\d+)\s+downto\s+(\d+)\)')
+_BIT_TYPES = frozenset(('std_logic', 'logic', 'reg', 'wire'))
+
+# Bound of the resolution cache (distinct type strings)
+SIGNAL_TYPE_CACHE_SIZE = 1024
+
+
+class SignalType(NamedTuple):
+    """Resolved signal type."""
+    width: int        # Width in bits
+    high: int         # High bit index as written
+    low: int          # Low bit index as written
+    num_chunks: int   # Number of 32-bit registers needed
+    notation: str     # RANGE, VECTOR, BIT or UNKNOWN
+
+
+def _resolved(high: int, low: int, notation: str) -> SignalType:
+    width = abs(high - low) + 1
+    return SignalType(width, high, low, (width + 31) // 32, notation)
+
+
+@lru_cache(maxsize=SIGNAL_TYPE_CACHE_SIZE)
+def resolve_signal_type(signal_type: str) -> SignalType:
+    """
+    Resolve a signal type string.
+
+    Args:
+        signal_type: Type string in an internal notation (see module docstring)
+
+    Returns:
+        SignalType(width, high, low, num_chunks, notation); unrecognized
+        strings resolve to a 32-bit type with notation UNKNOWN
+    """
+    match = _RANGE_PATTERN.match(signal_type)
+    if match:
+        return _resolved(int(match.group(1)), int(match.group(2)), RANGE)
+    match = _VECTOR_PATTERN.match(signal_type)
+    if match:
+        return _resolved(int(match.group(1)), int(match.group(2)), VECTOR)
+    if signal_type.strip() in _BIT_TYPES:
+        return _resolved(0, 0, BIT)
+    return _resolved(31, 0, UNKNOWN)
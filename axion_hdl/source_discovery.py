@@ -0,0 +1,198 @@
+"""
+Source Discovery Module for Axion HDL
+
+Walks source directories once with os.scandir and buckets every supported
+file by source kind, so that all parsers (and the GUI) share a single
+directory traversal instead of walking the same tree once per format.
+
+Also provides the byte-level @axion prefilter used by the HDL parsers to
+skip files that carry no annotations without decoding them.
+"""
+
+import os
+import re
+import mmap
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+
+# Source kinds in analysis order
+SOURCE_KINDS = ('vhdl', 'sv', 'xml', 'yaml', 'json', 'toml')
+
+
+def source_kind(filename: str) -> Optional[str]:
+    """
+    Determine the source kind of a file name.
+
+    Follows the extension rules of the individual parsers: VHDL, SystemVerilog
+    and TOML extensions are case-sensitive, XML/YAML/JSON are not.
+
+    Args:
+        filename: File name (or path)
+
+    Returns:
+        One of SOURCE_KINDS, or None for unsupported files
+    """
+    if filename.endswith(('.vhd', '.vhdl')):
+        return 'vhdl'
+    if filename.endswith(('.sv', '.svh')):
+        return 'sv'
+    lower = filename.lower()
+    if lower.endswith('.xml'):
+        return 'xml'
+    if lower.endswith(('.yaml', '.yml')):
+        return 'yaml'
+    if lower.endswith('.json'):
+        return 'json'
+    if filename.endswith('.toml'):
+        return 'toml'
+    return None
+
+
+# Annotations are matched case-insensitively by the HDL parsers
+_ANNOTATION_MARKER = re.compile(rb'@axion', re.IGNORECASE)
+
+
+def has_axion_annotation(filepath: str) -> bool:
+    """
+    Check whether a file contains an @axion annotation, without decoding it.
+
+    The file is memory-mapped and searched as raw bytes, so files without
+    annotations (testbenches, vendor IP, packages) are rejected before any
+    UTF-8 decoding or line splitting.
+
+    Args:
+        filepath: File to check
+
+    Returns:
+        False if the file certainly has no annotation. True otherwise,
+        including when the file cannot be read (the parser reports that).
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return _ANNOTATION_MARKER.search(mapped) is not None
+    except (OSError, ValueError):
+        return True
+
+
+def walk_source_files(root: str, prune_dir: Optional[Callable[[str], bool]] = None) -> Dict[str, List[str]]:
+    """
+    Walk a directory tree once and bucket supported files by kind.
+
+    Files are listed in os.walk() top-down order. Symlinked directories are
+    not followed, and unreadable directories are skipped, as with os.walk().
+
+    Args:
+        root: Directory to walk
+        prune_dir: Optional predicate; directories (below root) for which it
+                   returns True are not descended into
+
+    Returns:
+        Dictionary mapping source kind to file paths
+    """
+    buckets = {kind: [] for kind in SOURCE_KINDS}
+    stack = [root]
+    while stack:
+        top = stack.pop()
+        try:
+            with os.scandir(top) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if is_dir:
+                try:
+                    is_link = entry.is_symlink()
+                except OSError:
+                    is_link = False
+                if not is_link and not (prune_dir and prune_dir(entry.path)):
+                    subdirs.append(entry.path)
+            else:
+                kind = source_kind(entry.name)
+                if kind:
+                    buckets[kind].append(entry.path)
+
+        # Depth-first, in listing order (same as os.walk top-down)
+        stack.extend(reversed(subdirs))
+    return buckets
+
+
+class SourceInventory:
+    """
+    Supported source files below a set of root directories.
+
+    Each root is walked at most once (see walk_source_files()) until the
+    inventory is cleared; parsers then receive their file lists from here.
+    """
+
+    def __init__(self):
+        self._trees = {}  # root -> {kind: [paths]}
+
+    def scan(self, root: str) -> Dict[str, List[str]]:
+        """
+        Walk a root directory unless it has already been scanned.
+
+        Args:
+            root: Directory to scan
+
+        Returns:
+            Dictionary mapping source kind to file paths
+        """
+        if root not in self._trees:
+            self._trees[root] = walk_source_files(root)
+        return self._trees[root]
+
+    def files(self, root: str, kinds: Union[str, Iterable[str]],
+              prune_dir: Optional[Callable[[str], bool]] = None) -> List[str]:
+        """
+        Get the files of one or more kinds below a root directory.
+
+        Args:
+            root: Root directory (scanned on demand)
+            kinds: Source kind or iterable of kinds
+            prune_dir: Optional predicate; files inside directories (below
+                       root) for which it returns True are left out. Each
+                       directory is tested only once.
+
+        Returns:
+            File paths in walk order (grouped by kind if several are given)
+        """
+        tree = self.scan(root)
+        if isinstance(kinds, str):
+            kinds = (kinds,)
+        paths = [path for kind in kinds for path in tree.get(kind, ())]
+        if prune_dir is None:
+            return paths
+
+        # The root itself is never pruned (as with os.walk() pruning)
+        pruned = {root: False, root.rstrip(os.sep) or root: False}
+
+        def is_pruned(directory):
+            if directory not in pruned:
+                parent = os.path.dirname(directory)
+                pruned[directory] = (parent != directory and is_pruned(parent)) or prune_dir(directory)
+            return pruned[directory]
+
+        return [path for path in paths if not is_pruned(os.path.dirname(path))]
+
+    def kinds(self, root: str) -> List[str]:
+        """Source kinds present below a root directory, in analysis order."""
+        tree = self.scan(root)
+        return [kind for kind in SOURCE_KINDS if tree.get(kind)]
+
+    def roots(self) -> List[str]:
+        """Scanned root directories."""
+        return list(self._trees)
+
+    def clear(self) -> None:
+        """Forget all scans so that the next lookup walks the disk again."""
+        self._trees.clear()
@@ -19,8 +19,11 @@ from datetime import datetime
 from typing import Dict, List, Optional
 
 # Import from axion_hdl (unified package)
+from axion_hdl.address_decoder import DecodeMap, build_decode_map
+from axion_hdl.read_pipeline import plan_read_tree
 from axion_hdl.code_formatter import CodeFormatter
 from axion_hdl.systemverilog_utils import SystemVerilogUtils
+from axion_hdl.signal_types import RANGE, resolve_signal_type
 
 
 class SystemVerilogGenerator:
@@ -89,7 +92,9 @@ class SystemVerilogGenerator:
         sections.append(self._generate_internals(module_data))
 
         # CDC synchronizers (if enabled)
-        if module_data.get('cdc_enabled', False):
+        if module_data.get('cdc_enabled', False) and module_data.get('cdc_mode') == 'handshake':
+            sections.append(self._generate_cdc_handshake(module_data))
+        elif module_data.get('cdc_enabled', False):
             sections.append(self._generate_cdc_logic(module_data))
 
         # AXI4-Lite state machine
@@ -348,6 +353,7 @@ class SystemVerilogGenerator:
     def _generate_internals(self, module_data: Dict) -> str:
         """Generate internal signals and parameters."""
         registers = module_data.get('registers', [])
+        decode = self._decode_map(module_data)
 
         lines = [
             "    // AXI4-Lite response codes",
@@ -356,14 +362,15 @@ class SystemVerilogGenerator:
             ""
         ]
 
-        # Register addresses
-        lines.append("    // Register addresses")
-        for reg in registers:
-            signal_name = reg['signal_name'].upper()
-            address = reg['address_int']
-            lines.append(f"    localparam [ADDR_WIDTH-1:0] ADDR_{signal_name} = 32'h{address:08X};")
+        # Register addresses (DECODE=case decodes offsets instead)
+        if not decode:
+            lines.append("    // Register addresses")
+            for reg in registers:
+                signal_name = reg['signal_name'].upper()
+                address = reg['address_int']
+                lines.append(f"    localparam [ADDR_WIDTH-1:0] ADDR_{signal_name} = 32'h{address:08X};")
 
-        lines.append("")
+            lines.append("")
         
         # Generate struct definitions
         has_structs = any(reg.get('fields') for reg in registers)
@@ -371,21 +378,64 @@ class SystemVerilogGenerator:
             lines.append(self._generate_struct_definitions(registers))
             lines.append("")
 
-        # State machine enum
-        lines.extend([
-            "    // AXI4-Lite state machine",
-            "    typedef enum logic [2:0] {",
-            "        IDLE,",
-            "        WRITE_ADDR,",
-            "        WRITE_DATA,",
-            "        WRITE_RESP,",
-            "        READ_ADDR,",
-            "        READ_DATA",
-            "    } axi_state_t;",
-            "",
-            "    axi_state_t state, next_state;",
-            ""
-        ])
+        # State machine enum (RD_PIPE waits in READ_WAIT for the read mux stages)
+        pipeline = self._read_pipeline(module_data)
+        split = module_data.get('fsm') == 'split'
+        fast = module_data.get('fsm') == 'fast'
+        if fast:
+            lines.extend([
+                "    // AXI4-Lite channels (FSM=fast: no state machine, one transaction per channel and cycle)",
+                "    logic                  aw_ready, w_ready, ar_ready;",
+                "    logic                  bvalid_reg, rvalid_reg;",
+                "    logic                  wr_commit;  // Address and data available, B free: write",
+                "    logic                  rd_load;    // Address available, R free: load RDATA",
+                "    logic [DATA_WIDTH-1:0] rdata_out;",
+                "    logic [1:0]            rresp_out;",
+                "",
+                "    // Holding registers for a beat accepted before it can be served",
+                "    logic                  aw_held, w_held, ar_held;",
+                "    logic [DATA_WIDTH-1:0] w_hold_data;",
+                "    logic [DATA_WIDTH-1:0] write_data;",
+                ""
+            ])
+        elif split:
+            lines.extend([
+                "    // AXI4-Lite state machines (FSM=split: independent write and read channels)",
+                "    typedef enum logic [1:0] {",
+                "        WR_IDLE,",
+                "        WRITE_ADDR,",
+                "        WRITE_DATA,",
+                "        WRITE_RESP",
+                "    } wr_state_t;",
+                "",
+                "    typedef enum logic [1:0] {",
+                "        RD_IDLE,",
+                "        READ_ADDR,",
+                *(["        READ_WAIT,"] if pipeline else []),
+                "        READ_DATA",
+                "    } rd_state_t;",
+                "",
+                "    wr_state_t wr_state, wr_next_state;",
+                "    rd_state_t rd_state, rd_next_state;",
+                "    logic      wr_hold;  // Read of the write address pending: delay the write",
+                ""
+            ])
+        else:
+            lines.extend([
+                "    // AXI4-Lite state machine",
+                "    typedef enum logic [2:0] {",
+                "        IDLE,",
+                "        WRITE_ADDR,",
+                "        WRITE_DATA,",
+                "        WRITE_RESP,",
+                "        READ_ADDR,",
+                *(["        READ_WAIT,"] if pipeline else []),
+                "        READ_DATA",
+                "    } axi_state_t;",
+                "",
+                "    axi_state_t state, next_state;",
+                ""
+            ])
 
         # Internal registers
         lines.append("    // Internal registers")
@@ -409,10 +459,55 @@ class SystemVerilogGenerator:
             "    logic [DATA_WIDTH-1:0] rdata_reg;",
             "    logic [1:0]            rresp_reg;",
             "    logic [1:0]            bresp_reg;",
-            "    logic [ADDR_WIDTH-1:0] write_addr;",
-            "    logic [ADDR_WIDTH-1:0] read_addr;",
-            ""
         ])
+        # FSM=split compares the captured addresses for same-address ordering
+        if not decode or split:
+            lines.extend([
+                "    logic [ADDR_WIDTH-1:0] write_addr;",
+                "    logic [ADDR_WIDTH-1:0] read_addr;",
+            ])
+            if fast:
+                lines.extend([
+                    "    logic [ADDR_WIDTH-1:0] aw_hold_addr;",
+                    "    logic [ADDR_WIDTH-1:0] ar_hold_addr;",
+                ])
+        lines.append("")
+
+        if decode:
+            wr_bits = max(len(decode.write), 1)
+            rd_bits = max(len(decode.read), 1)
+            lines.extend([
+                "    // Case-based address decode (DECODE=case): one-hot register selects",
+                f"    localparam [ADDR_WIDTH-1:0] BASE_ADDR = 32'h{module_data.get('base_address', 0):08X};",
+                f"    localparam int ADDR_DEC_BITS = {decode.bits};",
+                "    logic [ADDR_WIDTH-1:0] aw_offset;",
+                "    logic [ADDR_WIDTH-1:0] ar_offset;",
+                f"    logic [{wr_bits - 1}:0] aw_sel;  // Decoded axi_awaddr",
+                f"    logic [{wr_bits - 1}:0] wr_sel;  // {'Held or decoded write select' if fast else 'Captured with write_addr'}",
+                f"    logic [{rd_bits - 1}:0] ar_sel;  // Decoded axi_araddr",
+                f"    logic [{rd_bits - 1}:0] rd_sel;  // {'Held or decoded read select' if fast else 'Captured with read_addr'}",
+            ])
+            if fast:
+                lines.extend([
+                    f"    logic [{wr_bits - 1}:0] aw_hold_sel;",
+                    f"    logic [{rd_bits - 1}:0] ar_hold_sel;",
+                ])
+            lines.append("")
+
+        if pipeline:
+            stages = plan_read_tree(len(self._read_chunks(module_data)), pipeline)
+            lines.extend([
+                f"    // Registered read mux (RD_PIPE={pipeline}): stage 1 sub-muxes and stage registers",
+                f"    logic [{len(stages[0]) - 1}:0][DATA_WIDTH-1:0] rd_mux1;",
+                f"    logic [{len(stages[0]) - 1}:0]                 rd_hit1;",
+            ])
+            for stage, groups in enumerate(stages[:-1], start=1):
+                lines.append(f"    logic [{len(groups) - 1}:0][DATA_WIDTH-1:0] rd_pipe{stage};")
+                lines.append(f"    logic [{len(groups) - 1}:0]                 rd_pipe{stage}_hit;")
+            lines.extend([
+                "    logic [1:0]            rd_pipe_cnt;",
+                ""
+            ])
 
         if use_axion_types:
             lines.extend([
@@ -547,9 +642,391 @@ class SystemVerilogGenerator:
 
         return '\n'.join(lines)
 
+    def _generate_cdc_handshake(self, module_data: Dict) -> str:
+        """
+        Generate the CDC_MODE=handshake crossings.
+
+        Each direction moves one register per toggle handshake: the source
+        domain loads cdc_<ch>_data and cdc_<ch>_ptr, toggles cdc_<ch>_req and
+        keeps both stable until the synchronized ack equals req again; the
+        destination domain loads the register selected by cdc_<ch>_ptr when
+        the synchronized req differs from its ack, and echoes req as ack.
+        """
+        cdc_stages = module_data.get('cdc_stages', 2)
+        last = cdc_stages - 1
+        registers = module_data.get('registers', [])
+        rd_regs = [reg for reg in registers if reg['access_mode'] == 'RO']
+        wr_regs = [reg for reg in registers if reg['access_mode'] in ['RW', 'WO']]
+        decode = self._decode_map(module_data)
+
+        def sync_chain(channel, signal, indent):
+            pad = " " * indent
+            chain = [f"{pad}cdc_{channel}_{signal}_sync[0] <= cdc_{channel}_{signal};"]
+            chain.extend(f"{pad}cdc_{channel}_{signal}_sync[{stage}] <= cdc_{channel}_{signal}_sync[{stage - 1}];"
+                         for stage in range(1, cdc_stages))
+            return chain
+
+        def declarations(channel, regs):
+            hold_width = max(reg.get('signal_width', 32) for reg in regs)
+            ptr_bits = max(1, (len(regs) - 1).bit_length())
+            decl = [f"    logic [{len(regs) - 1}:0] cdc_wr_pending;"] if channel == 'wr' else []
+            decl.extend([
+                f"    logic [{ptr_bits - 1}:0] cdc_{channel}_ptr;",
+                f"    logic [{hold_width - 1}:0] cdc_{channel}_data;",
+                f"    logic        cdc_{channel}_req, cdc_{channel}_ack;",
+                f"    logic [{last}:0] cdc_{channel}_req_sync, cdc_{channel}_ack_sync;",
+            ])
+            for reg in regs:
+                decl.append(f"    {self._signal_type_to_sv(reg['signal_type']):30} {reg['signal_name']}_cdc;")
+            return decl, hold_width, ptr_bits
+
+        def cases(regs, ptr_bits, indent, body):
+            # Last register is the default so the case is complete for any pointer width
+            pad = " " * indent
+            case = []
+            for k, reg in enumerate(regs):
+                label = "default" if k == len(regs) - 1 else f"{ptr_bits}'d{k}"
+                case.append(f"{pad}    {label}: begin")
+                case.extend(f"{pad}        {stmt}" for stmt in body(k, reg))
+                case.append(f"{pad}    end")
+            return case
+
+        def source(reg, hold_width):
+            width = reg.get('signal_width', 32)
+            value = reg['signal_name'] if reg['access_mode'] == 'RO' else f"{reg['signal_name']}_reg"
+            if width == hold_width:
+                return value
+            return f"{{{{{hold_width - width}{{1'b0}}}}, {value}}}"
+
+        def dest_slice(channel, reg, hold_width):
+            width = reg.get('signal_width', 32)
+            if width == hold_width:
+                return f"cdc_{channel}_data"
+            if width == 1:
+                return f"cdc_{channel}_data[0]"
+            return f"cdc_{channel}_data[{width - 1}:0]"
+
+        def capture(channel, regs, ptr_bits, hold_width, indent):
+            pad = " " * indent
+            return [
+                f"{pad}if (cdc_{channel}_req_sync[{last}] != cdc_{channel}_ack) begin",
+                f"{pad}    cdc_{channel}_ack <= cdc_{channel}_req_sync[{last}];",
+                f"{pad}    case (cdc_{channel}_ptr)",
+                *cases(regs, ptr_bits, indent + 4, lambda k, reg: [
+                    f"{reg['signal_name']}_cdc <= {dest_slice(channel, reg, hold_width)};"]),
+                f"{pad}    endcase",
+                f"{pad}end",
+            ]
+
+        lines = [
+            "    //-------------------------------------------------------------------------",
+            f"    // Clock Domain Crossing (CDC) Handshake ({cdc_stages}-stage req/ack synchronizers)",
+            "    //-------------------------------------------------------------------------",
+            "    // One register crosses per req toggle; cdc_*_ptr and cdc_*_data stay",
+            "    // stable in the source domain until the synchronized ack matches req",
+            ""
+        ]
+
+        # 1. Module -> AXI (RO registers, round robin)
+        # ---------------------------------------------------------------------
+        lines.append("    // Input Handshake (Module -> AXI, RO registers round robin)")
+        lines.append("    // ----------------------------------------------------------")
+        if rd_regs:
+            decl, hold_width, ptr_bits = declarations('rd', rd_regs)
+            count = len(rd_regs)
+
+            def load_next(k, reg):
+                sel = (k + 1) % count
+                return [f"cdc_rd_ptr <= {ptr_bits}'d{sel};",
+                        f"cdc_rd_data <= {source(rd_regs[sel], hold_width)};"]
+
+            lines.extend(decl)
+            lines.extend([
+                "",
+                "    always_ff @(posedge module_clk or negedge axi_aresetn) begin",
+                "        if (!axi_aresetn) begin",
+                "            cdc_rd_ptr <= '0;",
+                "            cdc_rd_data <= '0;",
+                "            cdc_rd_req <= 1'b0;",
+                "            cdc_rd_ack_sync <= '0;",
+                "        end else begin",
+                *sync_chain('rd', 'ack', 12),
+                f"            if (cdc_rd_req == cdc_rd_ack_sync[{last}]) begin",
+                "                case (cdc_rd_ptr)",
+                *cases(rd_regs, ptr_bits, 16, load_next),
+                "                endcase",
+                "                cdc_rd_req <= !cdc_rd_req;",
+                "            end",
+                "        end",
+                "    end",
+                "",
+                "    always_ff @(posedge axi_aclk or negedge axi_aresetn) begin",
+                "        if (!axi_aresetn) begin",
+                "            cdc_rd_req_sync <= '0;",
+                "            cdc_rd_ack <= 1'b0;",
+                *[f"            {reg['signal_name']}_cdc <= '0;" for reg in rd_regs],
+                "        end else begin",
+                *sync_chain('rd', 'req', 12),
+                *capture('rd', rd_regs, ptr_bits, hold_width, 12),
+                "        end",
+                "    end",
+            ])
+        else:
+            lines.append("    // No RO registers found")
+
+        lines.append("")
+
+        # 2. AXI -> Module (RW/WO registers, sent when written)
+        # ----------------------------------------------------------------------
+        lines.append("    // Output Handshake (AXI -> Module, RW/WO registers when written)")
+        lines.append("    // ---------------------------------------------------------------")
+        if wr_regs:
+            decl, hold_width, ptr_bits = declarations('wr', wr_regs)
+            advance = []
+            if len(wr_regs) > 1:
+                advance = [
+                    "                end else begin",
+                    f"                    cdc_wr_ptr <= (cdc_wr_ptr == {ptr_bits}'d{len(wr_regs) - 1}) ? '0 : cdc_wr_ptr + 1'b1;",
+                ]
+            written = []
+            write_cond = self._write_fire(module_data)
+            for k, reg in enumerate(wr_regs):
+                num_words = (reg.get('signal_width', 32) + 31) // 32
+                if decode:
+                    indices = [decode.write_index(reg['signal_name'], i) for i in range(num_words)]
+                    selects = [f"wr_sel[{index}]" for index in indices if index is not None]
+                else:
+                    selects = [f"write_addr == ADDR_{reg['signal_name'].upper()}" + (f" + 32'h{i*4:X}" if i > 0 else "")
+                               for i in range(num_words)]
+                if not selects:
+                    continue
+                written.extend([
+                    f"            if ({write_cond} && ({' || '.join(selects)})) begin",
+                    f"                cdc_wr_pending[{k}] <= 1'b1;",
+                    "            end",
+                ])
+
+            lines.extend(decl)
+            lines.extend([
+                "",
+                "    always_ff @(posedge axi_aclk or negedge axi_aresetn) begin",
+                "        if (!axi_aresetn) begin",
+                "            cdc_wr_pending <= '1;",
+                "            cdc_wr_ptr <= '0;",
+                "            cdc_wr_data <= '0;",
+                "            cdc_wr_req <= 1'b0;",
+                "            cdc_wr_ack_sync <= '0;",
+                "        end else begin",
+                *sync_chain('wr', 'ack', 12),
+                f"            if (cdc_wr_req == cdc_wr_ack_sync[{last}]) begin",
+                "                if (cdc_wr_pending[cdc_wr_ptr]) begin",
+                "                    case (cdc_wr_ptr)",
+                *cases(wr_regs, ptr_bits, 20, lambda k, reg: [f"cdc_wr_data <= {source(reg, hold_width)};"]),
+                "                    endcase",
+                "                    cdc_wr_pending[cdc_wr_ptr] <= 1'b0;",
+                "                    cdc_wr_req <= !cdc_wr_req;",
+                *advance,
+                "                end",
+                "            end",
+                "            // A write marks its register pending again",
+                *written,
+                "        end",
+                "    end",
+                "",
+                "    always_ff @(posedge module_clk or negedge axi_aresetn) begin",
+                "        if (!axi_aresetn) begin",
+                "            cdc_wr_req_sync <= '0;",
+                "            cdc_wr_ack <= 1'b0;",
+                *[f"            {reg['signal_name']}_cdc <= '0;" for reg in wr_regs],
+                "        end else begin",
+                *sync_chain('wr', 'req', 12),
+                *capture('wr', wr_regs, ptr_bits, hold_width, 12),
+                "        end",
+                "    end",
+            ])
+        else:
+            lines.append("    // No RW/WO registers found")
+
+        return '\n'.join(lines)
+
     def _generate_axi_state_machine(self, module_data: Dict) -> str:
         """Generate AXI4-Lite protocol state machine."""
-        lines = [
+        if module_data.get('fsm') == 'fast':
+            return '\n'.join(self._generate_fast_channels(self._decode_map(module_data)))
+        pipeline = self._read_pipeline(module_data)
+        split = module_data.get('fsm') == 'split'
+        rd_next = "rd_next_state" if split else "next_state"
+        if pipeline:
+            # RD_PIPE: the read mux stages load after read_addr is captured
+            read_addr_state = [
+                "            READ_ADDR: begin",
+                f"                {rd_next} = READ_WAIT;",
+                "            end",
+                "",
+                "            READ_WAIT: begin",
+                f"                if (rd_pipe_cnt == 2'd{pipeline - 1}) begin",
+                f"                    {rd_next} = READ_DATA;",
+                "                end",
+                "            end",
+            ]
+        else:
+            read_addr_state = [
+                "            READ_ADDR: begin",
+                f"                {rd_next} = READ_DATA;",
+                "            end",
+            ]
+        if split:
+            lines = self._generate_split_state_machines(read_addr_state, pipeline)
+        else:
+            lines = self._generate_shared_state_machine(read_addr_state)
+
+        if pipeline:
+            lines.extend([
+                f"    // Read pipeline wait counter (RD_PIPE={pipeline})",
+                "    always_ff @(posedge axi_aclk or negedge axi_aresetn) begin",
+                "        if (!axi_aresetn) begin",
+                "            rd_pipe_cnt <= '0;",
+                f"        end else if ({'rd_state' if split else 'state'} == READ_WAIT) begin",
+                "            rd_pipe_cnt <= rd_pipe_cnt + 2'd1;",
+                "        end else begin",
+                "            rd_pipe_cnt <= '0;",
+                "        end",
+                "    end",
+                ""
+            ])
+
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _read_pipeline(module_data: Dict) -> int:
+        """RD_PIPE depth; FSM=fast registers RDATA itself and keeps the mux combinational."""
+        if module_data.get('fsm') == 'fast':
+            return 0
+        return module_data.get('read_pipeline') or 0
+
+    @staticmethod
+    def _generate_fast_channels(decode: Optional[DecodeMap]) -> List[str]:
+        """
+        Generate the FSM=fast write and read channels.
+
+        AWREADY, WREADY and ARREADY stay high while the channel is empty, so
+        a new address is accepted in the cycle the previous response is. A
+        write commits and a read loads RDATA as soon as both beats are
+        available and the response register is free or being emptied; a
+        beat that has to wait is parked in its holding register and drops
+        READY of its channel until it is served.
+        """
+        if decode:
+            hold = [('wr_sel', 'aw_hold_sel', 'aw_sel'), ('rd_sel', 'ar_hold_sel', 'ar_sel')]
+        else:
+            hold = [('write_addr', 'aw_hold_addr', 'axi_awaddr'), ('read_addr', 'ar_hold_addr', 'axi_araddr')]
+        (wr_addr, aw_hold, aw_next), (rd_addr, ar_hold, ar_next) = hold
+        return [
+            "    //-------------------------------------------------------------------------",
+            "    // AXI4-Lite Channels (FSM=fast)",
+            "    // No state machine: each channel takes one transaction per cycle",
+            "    //-------------------------------------------------------------------------",
+            "",
+            "    // A write commits when address and data are available and B is free;",
+            "    // a read loads RDATA when its address is available and R is free",
+            "    assign wr_commit = (aw_held || (axi_awvalid && aw_ready)) &&",
+            "                       (w_held || (axi_wvalid && w_ready)) &&",
+            "                       (!bvalid_reg || axi_bready);",
+            "    assign rd_load   = (ar_held || (axi_arvalid && ar_ready)) && (!rvalid_reg || axi_rready);",
+            "",
+            "    // The held beat if there is one, else the beat on the bus",
+            f"    assign {wr_addr} = aw_held ? {aw_hold} : {aw_next};",
+            "    assign write_data = w_held ? w_hold_data : axi_wdata;",
+            f"    assign {rd_addr} = ar_held ? {ar_hold} : {ar_next};",
+            "",
+            "    // READY and holding registers: a beat that cannot be served waits and drops READY",
+            "    always_ff @(posedge axi_aclk or negedge axi_aresetn) begin",
+            "        if (!axi_aresetn) begin",
+            "            aw_ready <= 1'b0;",
+            "            w_ready <= 1'b0;",
+            "            ar_ready <= 1'b0;",
+            "            aw_held <= 1'b0;",
+            "            w_held <= 1'b0;",
+            "            ar_held <= 1'b0;",
+            f"            {aw_hold} <= '0;",
+            "            w_hold_data <= '0;",
+            f"            {ar_hold} <= '0;",
+            "        end else begin",
+            "            if (wr_commit) begin",
+            "                aw_held <= 1'b0;",
+            "                aw_ready <= 1'b1;",
+            "            end else if (axi_awvalid && aw_ready) begin",
+            "                aw_held <= 1'b1;",
+            "                aw_ready <= 1'b0;",
+            f"                {aw_hold} <= {aw_next};",
+            "            end else if (!aw_held) begin",
+            "                aw_ready <= 1'b1;",
+            "            end",
+            "",
+            "            if (wr_commit) begin",
+            "                w_held <= 1'b0;",
+            "                w_ready <= 1'b1;",
+            "            end else if (axi_wvalid && w_ready) begin",
+            "                w_held <= 1'b1;",
+            "                w_ready <= 1'b0;",
+            "                w_hold_data <= axi_wdata;",
+            "            end else if (!w_held) begin",
+            "                w_ready <= 1'b1;",
+            "            end",
+            "",
+            "            if (rd_load) begin",
+            "                ar_held <= 1'b0;",
+            "                ar_ready <= 1'b1;",
+            "            end else if (axi_arvalid && ar_ready) begin",
+            "                ar_held <= 1'b1;",
+            "                ar_ready <= 1'b0;",
+            f"                {ar_hold} <= {ar_next};",
+            "            end else if (!ar_held) begin",
+            "                ar_ready <= 1'b1;",
+            "            end",
+            "        end",
+            "    end",
+            "",
+            "    // Response registers: RDATA is loaded once and held until RREADY",
+            "    always_ff @(posedge axi_aclk or negedge axi_aresetn) begin",
+            "        if (!axi_aresetn) begin",
+            "            bvalid_reg <= 1'b0;",
+            "            rvalid_reg <= 1'b0;",
+            "            rdata_out <= '0;",
+            "            rresp_out <= OKAY;",
+            "        end else begin",
+            "            if (wr_commit) begin",
+            "                bvalid_reg <= 1'b1;",
+            "            end else if (axi_bready) begin",
+            "                bvalid_reg <= 1'b0;",
+            "            end",
+            "",
+            "            if (rd_load) begin",
+            "                rvalid_reg <= 1'b1;",
+            "                rdata_out <= rdata_reg;",
+            "                rresp_out <= rresp_reg;",
+            "            end else if (axi_rready) begin",
+            "                rvalid_reg <= 1'b0;",
+            "            end",
+            "        end",
+            "    end",
+            "",
+            "    // Output logic",
+            "    assign axi_awready = aw_ready;",
+            "    assign axi_wready  = w_ready;",
+            "    assign axi_bvalid  = bvalid_reg;",
+            "    assign axi_bresp   = bresp_reg;",
+            "    assign axi_arready = ar_ready;",
+            "    assign axi_rvalid  = rvalid_reg;",
+            "    assign axi_rdata   = rdata_out;",
+            "    assign axi_rresp   = rresp_out;",
+            ""
+        ]
+
+    @staticmethod
+    def _generate_shared_state_machine(read_addr_state: List[str]) -> List[str]:
+        """Generate the single state machine serving both channels (FSM=shared)."""
+        return [
             "    //-------------------------------------------------------------------------",
             "    // AXI4-Lite State Machine",
             "    //-------------------------------------------------------------------------",
@@ -592,9 +1069,7 @@ class SystemVerilogGenerator:
             "                end",
             "            end",
             "",
-            "            READ_ADDR: begin",
-            "                next_state = READ_DATA;",
-            "            end",
+            *read_addr_state,
             "",
             "            READ_DATA: begin",
             "                if (axi_rready) begin",
@@ -620,35 +1095,155 @@ class SystemVerilogGenerator:
             ""
         ]
 
-        return '\n'.join(lines)
+    @staticmethod
+    def _generate_split_state_machines(read_addr_state: List[str], pipeline: int) -> List[str]:
+        """
+        Generate independent write and read state machines (FSM=split).
+
+        A write holds WREADY low while a read of the same address waits
+        for its response (or for the RD_PIPE stages), so the read is
+        ordered first and RDATA cannot change under RVALID. A write that
+        lands in the cycle read_addr is captured is seen by that read.
+        """
+        read_pending = "(rd_state == READ_WAIT || rd_state == READ_DATA)" if pipeline else "rd_state == READ_DATA"
+        return [
+            "    //-------------------------------------------------------------------------",
+            "    // AXI4-Lite State Machines (FSM=split)",
+            "    // Write and read channels advance independently in the same cycle",
+            "    //-------------------------------------------------------------------------",
+            "",
+            "    // State registers",
+            "    always_ff @(posedge axi_aclk or negedge axi_aresetn) begin",
+            "        if (!axi_aresetn) begin",
+            "            wr_state <= WR_IDLE;",
+            "            rd_state <= RD_IDLE;",
+            "        end else begin",
+            "            wr_state <= wr_next_state;",
+            "            rd_state <= rd_next_state;",
+            "        end",
+            "    end",
+            "",
+            "    // Same-address ordering: a pending read of the write address goes first",
+            f"    assign wr_hold = {read_pending} && read_addr == write_addr;",
+            "",
+            "    // Write channel next state logic",
+            "    always_comb begin",
+            "        wr_next_state = wr_state;",
+            "",
+            "        case (wr_state)",
+            "            WR_IDLE: begin",
+            "                if (axi_awvalid) begin",
+            "                    wr_next_state = WRITE_ADDR;",
+            "                end",
+            "            end",
+            "",
+            "            WRITE_ADDR: begin",
+            "                if (axi_wvalid) begin",
+            "                    wr_next_state = WRITE_DATA;",
+            "                end",
+            "            end",
+            "",
+            "            WRITE_DATA: begin",
+            "                if (!wr_hold) begin",
+            "                    wr_next_state = WRITE_RESP;",
+            "                end",
+            "            end",
+            "",
+            "            WRITE_RESP: begin",
+            "                if (axi_bready) begin",
+            "                    wr_next_state = WR_IDLE;",
+            "                end",
+            "            end",
+            "",
+            "            default: begin",
+            "                wr_next_state = WR_IDLE;",
+            "            end",
+            "        endcase",
+            "    end",
+            "",
+            "    // Read channel next state logic",
+            "    always_comb begin",
+            "        rd_next_state = rd_state;",
+            "",
+            "        case (rd_state)",
+            "            RD_IDLE: begin",
+            "                if (axi_arvalid) begin",
+            "                    rd_next_state = READ_ADDR;",
+            "                end",
+            "            end",
+            "",
+            *read_addr_state,
+            "",
+            "            READ_DATA: begin",
+            "                if (axi_rready) begin",
+            "                    rd_next_state = RD_IDLE;",
+            "                end",
+            "            end",
+            "",
+            "            default: begin",
+            "                rd_next_state = RD_IDLE;",
+            "            end",
+            "        endcase",
+            "    end",
+            "",
+            "    // Output logic",
+            "    assign axi_awready = (wr_state == WRITE_ADDR);",
+            "    assign axi_wready  = (wr_state == WRITE_DATA) && !wr_hold;",
+            "    assign axi_bvalid  = (wr_state == WRITE_RESP);",
+            "    assign axi_bresp   = bresp_reg;",
+            "    assign axi_arready = (rd_state == READ_ADDR);",
+            "    assign axi_rvalid  = (rd_state == READ_DATA);",
+            "    assign axi_rdata   = rdata_reg;",
+            "    assign axi_rresp   = rresp_reg;",
+            ""
+        ]
 
     def _generate_register_logic(self, module_data: Dict) -> str:
         """Generate register read/write logic."""
         registers = module_data.get('registers', [])
         cdc_enabled = module_data.get('cdc_enabled', False)
         cdc_stages = module_data.get('cdc_stages', 2)
+        decode = self._decode_map(module_data)
 
         lines = [
             "    //-------------------------------------------------------------------------",
             "    // Register Logic",
             "    //-------------------------------------------------------------------------",
-            "",
+            ""
+        ]
+
+        if decode:
+            lines.extend(self._generate_decode_logic('axi_awaddr', 'aw_offset', 'aw_sel', decode.write, decode.bits))
+            lines.extend(self._generate_decode_logic('axi_araddr', 'ar_offset', 'ar_sel', decode.read, decode.bits))
+
+        # DECODE=case captures the decoded select vectors instead of the addresses
+        # (FSM=split captures both for the same-address ordering)
+        # (FSM=fast drives them from the channel holding registers instead)
+        split = module_data.get('fsm') == 'split'
+        fast = module_data.get('fsm') == 'fast'
+        wr_fsm, rd_fsm = ('wr_state', 'rd_state') if split else ('state', 'state')
+        captures = []
+        if decode:
+            captures.append(('wr_sel', 'rd_sel', 'aw_sel', 'ar_sel'))
+        if not decode or split:
+            captures.append(('write_addr', 'read_addr', 'axi_awaddr', 'axi_araddr'))
+        lines.extend([] if fast else [
             "    // Address capture",
             "    always_ff @(posedge axi_aclk or negedge axi_aresetn) begin",
             "        if (!axi_aresetn) begin",
-            "            write_addr <= '0;",
-            "            read_addr <= '0;",
+            *[f"            {write_addr} <= '0;" for write_addr, _, _, _ in captures],
+            *[f"            {read_addr} <= '0;" for _, read_addr, _, _ in captures],
             "        end else begin",
-            "            if (state == WRITE_ADDR && axi_awvalid) begin",
-            "                write_addr <= axi_awaddr;",
+            f"            if ({wr_fsm} == WRITE_ADDR && axi_awvalid) begin",
+            *[f"                {write_addr} <= {write_next};" for write_addr, _, write_next, _ in captures],
             "            end",
-            "            if (state == READ_ADDR && axi_arvalid) begin",
-            "                read_addr <= axi_araddr;",
+            f"            if ({rd_fsm} == READ_ADDR && axi_arvalid) begin",
+            *[f"                {read_addr} <= {read_next};" for _, read_addr, _, read_next in captures],
             "            end",
             "        end",
             "    end",
             ""
-        ]
+        ])
 
         # Write logic
         lines.extend([
@@ -689,11 +1284,17 @@ class SystemVerilogGenerator:
             if reg.get('write_strobe'):
                 lines.append(f"            {reg['signal_name']}_wr_strobe_int <= 1'b0;")
 
+        write_cond = self._write_fire(module_data)
+        wdata = 'write_data' if fast else 'axi_wdata'
         lines.extend([
             "",
-            "            if (state == WRITE_DATA && axi_wvalid) begin",
-            "                case (write_addr)"
+            f"            if ({write_cond}) begin",
         ])
+        if decode:
+            # Selected writable register answers OKAY; no selection is SLVERR
+            lines.append("                bresp_reg <= SLVERR;")
+        else:
+            lines.append("                case (write_addr)")
 
         # Write cases for each register
         for reg in registers:
@@ -704,13 +1305,10 @@ class SystemVerilogGenerator:
             num_words = (width + 31) // 32
 
             for i in range(num_words):
-                # Calculate address offset for this word
-                addr_suffix = f" + 32'h{i*4:X}" if i > 0 else ""
-                lines.append(f"                    ADDR_{signal_name_upper}{addr_suffix}: begin")
-
+                body = []
                 if access_mode == 'RO':
                     # Read-only: return error
-                    lines.append("                        bresp_reg <= SLVERR;")
+                    body.append("bresp_reg <= SLVERR;")
                 elif access_mode in ['RW', 'WO']:
                     # Writable: update register
                     low = i * 32
@@ -719,97 +1317,290 @@ class SystemVerilogGenerator:
 
                     if width <= 32:
                         if width == 32:
-                            lines.append(f"                        {signal_name}_reg <= axi_wdata;")
+                            body.append(f"{signal_name}_reg <= {wdata};")
                         else:
-                            lines.append(f"                        {signal_name}_reg <= axi_wdata[{width-1}:0];")
+                            body.append(f"{signal_name}_reg <= {wdata}[{width-1}:0];")
                     else:
                         # Wide register logic
                         if slice_width == 32:
-                            lines.append(f"                        {signal_name}_reg[{high}:{low}] <= axi_wdata;")
+                            body.append(f"{signal_name}_reg[{high}:{low}] <= {wdata};")
                         else:
-                            lines.append(f"                        {signal_name}_reg[{high}:{low}] <= axi_wdata[{slice_width-1}:0];")
+                            body.append(f"{signal_name}_reg[{high}:{low}] <= {wdata}[{slice_width-1}:0];")
 
                     if reg.get('write_strobe'):
-                        lines.append(f"                        {signal_name}_wr_strobe_int <= 1'b1;")
+                        body.append(f"{signal_name}_wr_strobe_int <= 1'b1;")
 
-                    lines.append("                        bresp_reg <= OKAY;")
+                    body.append("bresp_reg <= OKAY;")
 
-                lines.append("                    end")
+                if decode:
+                    index = decode.write_index(signal_name, i)
+                    if index is None:
+                        continue
+                    lines.append(f"                if (wr_sel[{index}]) begin")
+                    lines.extend(f"                    {stmt}" for stmt in body)
+                    lines.append("                end")
+                else:
+                    # Calculate address offset for this word
+                    addr_suffix = f" + 32'h{i*4:X}" if i > 0 else ""
+                    lines.append(f"                    ADDR_{signal_name_upper}{addr_suffix}: begin")
+                    lines.extend(f"                        {stmt}" for stmt in body)
+                    lines.append("                    end")
 
+        if not decode:
+            lines.extend([
+                "                    default: begin",
+                "                        bresp_reg <= SLVERR;",
+                "                    end",
+                "                endcase",
+            ])
         lines.extend([
-            "                    default: begin",
-            "                        bresp_reg <= SLVERR;",
-            "                    end",
-            "                endcase",
             "            end",
             "        end",
             "    end",
             ""
         ])
 
+        pipeline = self._read_pipeline(module_data)
+        if pipeline:
+            lines.extend(self._generate_read_pipeline(module_data, decode, pipeline))
+            return '\n'.join(lines)
+
         # Read logic
         lines.extend([
             "    // Register read logic",
             "    always_comb begin",
             "        rdata_reg = '0;",
-            "        rresp_reg = OKAY;",
-            "",
-            "        case (read_addr)"
         ])
+        if decode:
+            # One-hot select: AND-OR mux, no selection is SLVERR
+            lines.extend([
+                "        rresp_reg = SLVERR;",
+                "",
+            ])
+        else:
+            lines.extend([
+                "        rresp_reg = OKAY;",
+                "",
+                "        case (read_addr)"
+            ])
 
         # Read cases for each register
         for reg in registers:
             signal_name = reg['signal_name']
             signal_name_upper = signal_name.upper()
-            access_mode = reg['access_mode']
             width = reg.get('signal_width', 32)
             num_words = (width + 31) // 32
 
             for i in range(num_words):
+                value = self._read_value(reg, i, cdc_enabled, cdc_stages, module_data.get('cdc_mode'))
+
+                if decode:
+                    index = decode.read_index(signal_name, i)
+                    if index is None:
+                        continue
+                    lines.append(f"        if (rd_sel[{index}]) begin")
+                    lines.append(f"            rdata_reg |= {value};")
+                    lines.append("            rresp_reg = OKAY;")
+                    lines.append("        end")
+                    continue
+
                 addr_suffix = f" + 32'h{i*4:X}" if i > 0 else ""
                 lines.append(f"            ADDR_{signal_name_upper}{addr_suffix}: begin")
-
-                if access_mode == 'WO':
+                if value is None:
                     # Write-only: return error
                     lines.append("                rresp_reg = SLVERR;")
                 else:
-                    # Determine source signal
-                    if cdc_enabled and access_mode == 'RO':
-                        source = f"{signal_name}_sync[{cdc_stages-1}]"
-                    elif access_mode == 'RO':
-                        source = signal_name
-                    else:
-                        source = f"{signal_name}_reg"
+                    lines.append(f"                rdata_reg = {value};")
+                lines.append("            end")
 
-                    low = i * 32
-                    high = min((i + 1) * 32 - 1, width - 1)
-                    slice_width = high - low + 1
+        if not decode:
+            lines.extend([
+                "            default: begin",
+                "                rresp_reg = SLVERR;",
+                "            end",
+                "        endcase",
+            ])
+        lines.extend([
+            "    end",
+            ""
+        ])
 
-                    if width <= 32:
-                        if width == 32:
-                            lines.append(f"                rdata_reg = {source};")
-                        else:
-                            lines.append(f"                rdata_reg = {{{{{32 - width}'{{1'b0}}}}, {source}}};")
-                    else:
-                        # Wide register logic
-                        if slice_width == 32:
-                             lines.append(f"                rdata_reg = {source}[{high}:{low}];")
-                        else:
-                             padding = 32 - slice_width
-                             lines.append(f"                rdata_reg = {{{{{padding}'{{1'b0}}}}, {source}[{high}:{low}]}};")
+        return '\n'.join(lines)
 
-                lines.append("            end")
+    @staticmethod
+    def _write_fire(module_data: Dict) -> str:
+        """Condition of the cycle a register write is committed."""
+        fsm = module_data.get('fsm')
+        if fsm == 'fast':
+            return "wr_commit"
+        if fsm == 'split':
+            return "wr_state == WRITE_DATA && axi_wvalid && !wr_hold"
+        return "state == WRITE_DATA && axi_wvalid"
+
+    @staticmethod
+    def _read_value(reg: Dict, chunk: int, cdc_enabled: bool, cdc_stages: int,
+                    cdc_mode: Optional[str] = None) -> Optional[str]:
+        """32-bit read value of one register chunk, or None if write-only."""
+        signal_name = reg['signal_name']
+        access_mode = reg['access_mode']
+        width = reg.get('signal_width', 32)
+        if access_mode == 'WO':
+            return None
+
+        # Determine source signal
+        if cdc_enabled and access_mode == 'RO' and cdc_mode == 'handshake':
+            source = f"{signal_name}_cdc"
+        elif cdc_enabled and access_mode == 'RO':
+            source = f"{signal_name}_sync[{cdc_stages-1}]"
+        elif access_mode == 'RO':
+            source = signal_name
+        else:
+            source = f"{signal_name}_reg"
+
+        low = chunk * 32
+        high = min((chunk + 1) * 32 - 1, width - 1)
+        slice_width = high - low + 1
+
+        if width <= 32:
+            if width == 32:
+                return source
+            return f"{{{{{32 - width}'{{1'b0}}}}, {source}}}"
+        # Wide register logic
+        if slice_width == 32:
+            return f"{source}[{high}:{low}]"
+        padding = 32 - slice_width
+        return f"{{{{{padding}'{{1'b0}}}}, {source}[{high}:{low}]}}"
+
+    def _read_chunks(self, module_data: Dict) -> List[tuple]:
+        """Readable register chunks as (signal name, chunk, read value)."""
+        chunks = []
+        for reg in module_data.get('registers', []):
+            for i in range((reg.get('signal_width', 32) + 31) // 32):
+                value = self._read_value(reg, i, module_data.get('cdc_enabled', False),
+                                         module_data.get('cdc_stages', 2), module_data.get('cdc_mode'))
+                if value is not None:
+                    chunks.append((reg['signal_name'], i, value))
+        return chunks
+
+    def _generate_read_pipeline(self, module_data: Dict, decode: Optional[DecodeMap],
+                                pipeline: int) -> List[str]:
+        """
+        Generate the RD_PIPE read mux as a tree of registered sub-muxes.
 
+        Stage 1 decodes read_addr (or rd_sel with DECODE=case) into one
+        sub-mux value and hit flag per group of registers; each registered
+        stage ORs the values and hit flags of a group of the stage before.
+        RRESP is SLVERR when no register was hit.
+        """
+        chunks = self._read_chunks(module_data)
+        stages = plan_read_tree(len(chunks), pipeline)
+        group_of = {index: g for g, group in enumerate(stages[0]) for index in group}
+        lines = [
+            f"    // Register read logic (RD_PIPE={pipeline}: {pipeline}-stage registered mux tree)",
+            "    // Stage 1 sub-muxes",
+            "    always_comb begin",
+            "        rd_mux1 = '0;",
+            "        rd_hit1 = '0;",
+        ]
+        if decode:
+            for index, (signal_name, i, value) in enumerate(chunks):
+                g = group_of[index]
+                lines.extend([
+                    f"        if (rd_sel[{decode.read_index(signal_name, i)}]) begin",
+                    f"            rd_mux1[{g}] |= {value};",
+                    f"            rd_hit1[{g}] = 1'b1;",
+                    "        end",
+                ])
+        else:
+            lines.append("        case (read_addr)")
+            for index, (signal_name, i, value) in enumerate(chunks):
+                g = group_of[index]
+                addr_suffix = f" + 32'h{i*4:X}" if i > 0 else ""
+                lines.extend([
+                    f"            ADDR_{signal_name.upper()}{addr_suffix}: begin",
+                    f"                rd_mux1[{g}] = {value};",
+                    f"                rd_hit1[{g}] = 1'b1;",
+                    "            end",
+                ])
+            lines.extend([
+                "            default: ;",
+                "        endcase",
+            ])
         lines.extend([
-            "            default: begin",
-            "                rresp_reg = SLVERR;",
-            "            end",
-            "        endcase",
+            "    end",
+            "",
+            "    // Registered stages",
+            "    always_ff @(posedge axi_aclk or negedge axi_aresetn) begin",
+            "        if (!axi_aresetn) begin",
+        ])
+        for stage in range(1, pipeline):
+            lines.append(f"            rd_pipe{stage} <= '0;")
+            lines.append(f"            rd_pipe{stage}_hit <= '0;")
+        lines.extend([
+            "            rdata_reg <= '0;",
+            "            rresp_reg <= OKAY;",
+            "        end else begin",
+        ])
+        for stage, groups in enumerate(stages, start=1):
+            source = "rd_mux1" if stage == 1 else f"rd_pipe{stage - 1}"
+            hits = "rd_hit1" if stage == 1 else f"rd_pipe{stage - 1}_hit"
+            for g, group in enumerate(groups):
+                if stage == 1:
+                    value, hit = f"{source}[{g}]", f"{hits}[{g}]"
+                else:
+                    value = ' | '.join(f"{source}[{i}]" for i in group)
+                    hit = f"|{hits}[{group.stop - 1}:{group.start}]"
+                if stage == len(stages):
+                    lines.append(f"            rdata_reg <= {value};")
+                    lines.append(f"            rresp_reg <= {hit} ? OKAY : SLVERR;")
+                else:
+                    lines.append(f"            rd_pipe{stage}[{g}] <= {value};")
+                    lines.append(f"            rd_pipe{stage}_hit[{g}] <= {hit};")
+        lines.extend([
+            "        end",
             "    end",
             ""
         ])
+        return lines
 
-        return '\n'.join(lines)
+    def _decode_map(self, module_data: Dict) -> Optional[DecodeMap]:
+        """Select vectors for DECODE=case (see axion_hdl.address_decoder), or None."""
+        if module_data.get('decode') != 'case':
+            return None
+        return build_decode_map(module_data.get('registers', []), module_data.get('base_address', 0))
+
+    @staticmethod
+    def _generate_decode_logic(addr: str, offset: str, sel: str, slots: List, bits: int) -> List[str]:
+        """
+        Generate the case-based decoder of one AXI address channel.
+
+        The base address is subtracted once; the offset must be zero above
+        the ADDR_DEC_BITS window, and the window bits select one case item.
+        """
+        lines = [
+            f"    // {addr} decode (DECODE=case)",
+            "    always_comb begin",
+            f"        {offset} = {addr} - BASE_ADDR;",
+            f"        {sel} = '0;",
+            f"        if ({offset}[ADDR_WIDTH-1:ADDR_DEC_BITS] == '0) begin",
+            f"            unique case ({offset}[ADDR_DEC_BITS-1:0])",
+        ]
+        for choice, indices in DecodeMap.choices(slots):
+            labels = ', '.join(
+                f"{slots[i].name}[{slots[i].chunk}]" if slots[i].chunk else slots[i].name for i in indices
+            )
+            assigns = ' '.join(f"{sel}[{i}] = 1'b1;" for i in indices)
+            if len(indices) > 1:
+                assigns = f"begin {assigns} end"
+            lines.append(f"                {bits}'h{choice:X}: {assigns}  // {labels}")
+        lines.extend([
+            "                default: ;",
+            "            endcase",
+            "        end",
+            "    end",
+            ""
+        ])
+        return lines
 
     def _generate_output_assignments(self, module_data: Dict) -> str:
         """Generate output port assignments."""
@@ -817,6 +1608,9 @@ class SystemVerilogGenerator:
         cdc_enabled = module_data.get('cdc_enabled', False)
         cdc_stages = module_data.get('cdc_stages', 2)
         use_axion_types = module_data.get('use_axion_types', False)
+        decode = self._decode_map(module_data)
+        # FSM=fast pulses read strobes when RDATA is loaded
+        rd_fire = {'split': "rd_state == READ_DATA", 'fast': "rd_load"}.get(module_data.get('fsm'), "state == READ_DATA")
 
         lines = [
             "    //-------------------------------------------------------------------------",
@@ -857,7 +1651,9 @@ class SystemVerilogGenerator:
             access_mode = reg['access_mode']
 
             if access_mode in ['RW', 'WO']:
-                if cdc_enabled:
+                if cdc_enabled and module_data.get('cdc_mode') == 'handshake':
+                     lines.append(f"    assign {signal_name} = {signal_name}_cdc;")
+                elif cdc_enabled:
                      # Use the last stage of the synchronizer
                      lines.append(f"    assign {signal_name} = {signal_name}_sync[{cdc_stages-1}];")
                 else:
@@ -870,7 +1666,12 @@ class SystemVerilogGenerator:
             if reg.get('read_strobe'):
                 # Read strobe is asserted when reading this register
                 signal_name_upper = signal_name.upper()
-                lines.append(f"    assign {signal_name}_rd_strobe = (state == READ_DATA && read_addr == ADDR_{signal_name_upper});")
+                if decode:
+                    index = decode.read_index(signal_name)
+                    selected = f"rd_sel[{index}]" if index is not None else "1'b0"
+                    lines.append(f"    assign {signal_name}_rd_strobe = ({rd_fire} && {selected});")
+                else:
+                    lines.append(f"    assign {signal_name}_rd_strobe = ({rd_fire} && read_addr == ADDR_{signal_name_upper});")
 
         return '\n'.join(lines)
 
@@ -889,14 +1690,11 @@ class SystemVerilogGenerator:
             "[5:0]"  -> "logic [5:0]"
             "[0:0]"  -> "logic"
         """
-        import re
-        match = re.match(r'\[(\d+):(\d+)\]', signal_type)
-        if match:
-            high = int(match.group(1))
-            low = int(match.group(2))
-            if high == 0 and low == 0:
+        sig = resolve_signal_type(signal_type)
+        if sig.notation == RANGE:
+            if sig.high == 0 and sig.low == 0:
                 return "logic"
             else:
-                return f"logic [{high}:{low}]"
+                return f"logic [{sig.high}:{sig.low}]"
         # Default fallback
         return "logic [31:0]"
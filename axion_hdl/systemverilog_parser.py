@@ -7,7 +7,6 @@ Equivalent to parser.py but for SystemVerilog syntax.
 
 import os
 import re
-import fnmatch
 from typing import Dict, List, Optional, Tuple, Any, Set
 
 # Import from axion_hdl (unified package)
@@ -15,6 +14,15 @@ from .address_manager import AddressManager, AddressConflictError
 from .systemverilog_utils import SystemVerilogUtils
 from .annotation_parser import AnnotationParser
 from .bit_field_manager import BitFieldManager, BitOverlapError
+from .exclusion import get_exclude_matcher
+from .source_discovery import has_axion_annotation
+from .ir import ModuleIR
+from .signal_types import BIT, RANGE, resolve_signal_type
+from .layout_planner import LayoutEntry, parse_layout_mode, plan_layout
+from .address_decoder import parse_decode_mode
+from .read_pipeline import parse_read_pipeline
+from .axi_fsm import parse_fsm_mode
+from .cdc_mode import parse_cdc_mode
 
 
 class SystemVerilogParser:
@@ -34,6 +42,7 @@ class SystemVerilogParser:
         # Exclusion patterns (files, directories, or glob patterns)
         self.exclude_patterns: Set[str] = set()
         self.errors = []  # Track parsing errors
+        self.skipped_files = 0  # Files without any @axion annotation
 
     def parse_file(self, filepath: str) -> Optional[Dict]:
         """
@@ -91,15 +100,11 @@ class SystemVerilogParser:
 
     def _extract_width(self, signal_type: str) -> int:
         """Extract bit width from signal type string."""
-        if not signal_type or signal_type in ['logic', 'reg', 'wire', '[0:0]']:
+        if not signal_type:
             return 1
-        # Match [high:low] format
-        match = re.search(r'\[(\d+):(\d+)\]', signal_type)
-        if match:
-            high = int(match.group(1))
-            low = int(match.group(2))
-            return abs(high - low) + 1
-        return 1
+        sig = resolve_signal_type(signal_type)
+        # [high:low] or a 1-bit type; anything else counts as 1 bit
+        return sig.width if sig.notation in (RANGE, BIT) else 1
 
     def _parse_sv_file(self, filepath: str) -> Optional[Dict]:
         """
@@ -115,6 +120,11 @@ class SystemVerilogParser:
             self.errors.append(f"File not found: {filepath}")
             return None
 
+        # Most HDL files carry no annotations; reject them before decoding
+        if not has_axion_annotation(filepath):
+            self.skipped_files += 1
+            return None
+
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 content = f.read()
@@ -138,7 +148,13 @@ class SystemVerilogParser:
             # No annotated signals found
             return None
 
-        return {
+        layout_report = None
+        if module_config['layout']:
+            layout_report = self._apply_layout(
+                module_config['layout'], registers, module_config['base_address'], module_name
+            )
+
+        module = {
             'name': module_name,
             'file': filepath,
             'source_type': 'systemverilog',
@@ -148,6 +164,45 @@ class SystemVerilogParser:
             'registers': registers,
             'packed_registers': module_config.get('packed_registers', [])
         }
+        if layout_report:
+            module['layout'] = layout_report
+        if module_config['decode']:
+            module['decode'] = module_config['decode']
+        if module_config['read_pipeline']:
+            module['read_pipeline'] = module_config['read_pipeline']
+        if module_config['fsm']:
+            module['fsm'] = module_config['fsm']
+        if module_config['cdc_mode']:
+            module['cdc_mode'] = module_config['cdc_mode']
+        return ModuleIR.from_dict(module)
+
+    def _apply_layout(self, layout: str, registers: List[Dict], base_address: int, module_name: str) -> Dict:
+        """
+        Re-place the auto-assigned registers with the layout planner.
+
+        Args:
+            layout: Layout mode ('compact' or 'decode')
+            registers: Registers of the module, updated in place
+            base_address: Module base address
+            module_name: Name of the module (for the report line)
+
+        Returns:
+            Layout report dictionary (see layout_planner.LayoutPlan.report)
+        """
+        entries = [
+            LayoutEntry(
+                reg['signal_name'], reg['relative_address_int'], reg['signal_width'],
+                reg['access_mode'], reg['manual_address']
+            )
+            for reg in registers
+        ]
+        plan = plan_layout(entries, layout)
+        for reg, relative_addr in zip(registers, plan.addresses):
+            reg['relative_address_int'] = relative_addr
+            reg['address_int'] = base_address + relative_addr
+            reg['address'] = f"0x{base_address + relative_addr:08X}"
+        print(f"INFO: {plan.summary(module_name)}")
+        return plan.report()
 
     def _parse_module_config(self, content: str) -> Dict:
         """
@@ -164,12 +219,22 @@ class SystemVerilogParser:
                 - base_address: Base address (int)
                 - cdc_enabled: CDC enable flag (bool)
                 - cdc_stages: CDC stages (int)
+                - layout: Layout mode ('compact', 'decode' or None)
+                - decode: Address decode mode ('compare', 'case' or None)
+                - read_pipeline: Read mux pipeline depth (0-3 or None)
+                - fsm: AXI state machine mode ('shared', 'split', 'fast' or None)
+                - cdc_mode: CDC mode ('sync', 'handshake' or None)
                 - packed_registers: List of packed register definitions
         """
         config = {
             'base_address': 0,
             'cdc_enabled': False,
             'cdc_stages': 2,
+            'layout': None,
+            'decode': None,
+            'read_pipeline': None,
+            'fsm': None,
+            'cdc_mode': None,
             'packed_registers': []
         }
 
@@ -195,6 +260,36 @@ class SystemVerilogParser:
                 if 'cdc_stages' in attrs:
                     config['cdc_stages'] = attrs['cdc_stages']
 
+                if 'layout' in attrs:
+                    try:
+                        config['layout'] = parse_layout_mode(attrs['layout'])
+                    except ValueError as e:
+                        self.errors.append(str(e))
+
+                if 'decode' in attrs:
+                    try:
+                        config['decode'] = parse_decode_mode(attrs['decode'])
+                    except ValueError as e:
+                        self.errors.append(str(e))
+
+                if 'rd_pipe' in attrs:
+                    try:
+                        config['read_pipeline'] = parse_read_pipeline(attrs['rd_pipe'])
+                    except ValueError as e:
+                        self.errors.append(str(e))
+
+                if 'fsm' in attrs:
+                    try:
+                        config['fsm'] = parse_fsm_mode(attrs['fsm'])
+                    except ValueError as e:
+                        self.errors.append(str(e))
+
+                if 'cdc_mode' in attrs:
+                    try:
+                        config['cdc_mode'] = parse_cdc_mode(attrs['cdc_mode'])
+                    except ValueError as e:
+                        self.errors.append(str(e))
+
                 # Check for packed register definitions (AnnotationParser normalizes to lowercase)
                 if 'pack' in attrs or 'PACK' in attrs:
                     config['packed_registers'].append(attrs)
@@ -329,10 +424,11 @@ class SystemVerilogParser:
                 'address_int': address_int,
                 'relative_address_int': address_int - module_config['base_address'],
                 'is_packed': is_packed,
+                'manual_address': 'address' in attrs,
                 'bit_range': bit_range,
                 'parent_register': parent_register,
                 'width': signal_width,
-                'enum_values': attrs.get('enum_values')
+                'enum_values': self.annotation_parser.enum_values(attrs)
             }
 
             registers.append(register)
@@ -358,12 +454,7 @@ class SystemVerilogParser:
         Returns:
             True if excluded, False otherwise
         """
-        for pattern in self.exclude_patterns:
-            if fnmatch.fnmatch(filepath, pattern):
-                return True
-            if os.path.isdir(pattern) and filepath.startswith(pattern):
-                return True
-        return False
+        return get_exclude_matcher(self.exclude_patterns).is_excluded(filepath)
 
     def get_errors(self) -> List[str]:
         """
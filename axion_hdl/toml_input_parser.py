@@ -2,8 +2,9 @@
 TOML Input Parser for Axion HDL
 
 This module provides parsing functionality for TOML (Tom's Obvious, Minimal Language)
-format register definition files. TOML files are converted to YAML-compatible dictionary
-structures and processed by the YAMLInputParser for consistency.
+format register definition files. Registers are lowered directly into the module
+dictionary with ModuleBuilder, and module-level fields are normalized by YAMLInputParser,
+so TOML modules match those from the other formats.
 
 The TOML format follows the same structure as YAML/JSON:
     [module]
@@ -39,19 +40,22 @@ except ImportError:
     except ImportError:
         tomllib = None
 
+from axion_hdl.module_builder import ModuleBuilder
 from axion_hdl.yaml_input_parser import YAMLInputParser
+from axion_hdl.source_discovery import walk_source_files
+from axion_hdl.exclusion import get_exclude_matcher
 
 
 class TOMLInputParser:
     """
     Parser for TOML format register definition files.
 
-    This parser converts TOML data to YAML-compatible dictionary structures
-    and delegates to YAMLInputParser for actual parsing. This ensures format
-    equivalence across TOML, YAML, JSON, and XML inputs.
+    This parser lowers TOML register tables through the same ModuleBuilder
+    and YAMLInputParser module-level handling as the other formats. This
+    ensures format equivalence across TOML, YAML, JSON, and XML inputs.
 
     Attributes:
-        yaml_parser (YAMLInputParser): Internal YAML parser for processing converted data
+        yaml_parser (YAMLInputParser): Internal YAML parser for module-level fields
         errors (list): Collection of parsing errors encountered
         _exclude_patterns (set): File patterns to exclude from parsing
     """
@@ -72,8 +76,7 @@ class TOMLInputParser:
         Returns:
             dict: Module dictionary with register definitions, or None on error
 
-        The TOML data is loaded and converted to a YAML-compatible dictionary,
-        then passed to YAMLInputParser for standard processing.
+        The TOML data is loaded and lowered directly into the module dictionary.
         """
         if tomllib is None:
             error_msg = (
@@ -107,14 +110,8 @@ class TOMLInputParser:
                 self.errors.append({'file': filepath, 'msg': error_msg})
                 return None
 
-            # Convert TOML to YAML-compatible dict structure
-            yaml_dict = self._toml_to_yaml(data, filepath)
-
-            if yaml_dict is None:
-                return None
-
-            # Delegate to YAML parser for standard processing
-            result = self.yaml_parser.parse_data(yaml_dict, filepath)
+            # Lower TOML data straight into the module dictionary
+            result = self._toml_to_module(data, filepath)
 
             # Collect errors from YAML parser
             if self.yaml_parser.errors:
@@ -128,25 +125,23 @@ class TOMLInputParser:
             print(f"[ERROR] {error_msg}", file=sys.stderr)
             return None
 
-    def _toml_to_yaml(self, data, filepath):
+    def _toml_to_module(self, data, filepath):
         """
-        Convert TOML data structure to YAML-compatible dictionary.
+        Convert TOML data to a module dictionary.
 
         Args:
             data (dict): Parsed TOML data
             filepath (str): Source file path (for error reporting)
 
         Returns:
-            dict: YAML-compatible dictionary structure
+            dict: Module dictionary, or None on error
 
-        The TOML format closely mirrors the YAML structure, so minimal
-        conversion is needed. This method primarily validates structure
-        and ensures consistency with YAML expectations.
+        TOML register tables have the same keys as YAML registers, so they
+        are lowered into a ModuleBuilder as they are, without copying; the
+        module-level fields are normalized by YAMLInputParser.
         """
         try:
-            # TOML structure already closely matches YAML
-            # Main conversion is ensuring all expected fields exist
-            yaml_dict = {}
+            header = {}
 
             # Extract module name (required)
             if 'module' in data:
@@ -169,67 +164,37 @@ class TOMLInputParser:
                 print(f"[ERROR] {error_msg}", file=sys.stderr)
                 return None
 
-            yaml_dict['module'] = module_name
-            yaml_dict['base_addr'] = base_addr
+            header['module'] = module_name
+            header['base_addr'] = base_addr
 
             # Extract config (optional)
             if 'config' in data:
                 config = data['config']
-                yaml_dict['config'] = {
+                header['config'] = {
                     'cdc_en': config.get('cdc_en', False),
                     'cdc_stage': config.get('cdc_stage', 2),
                     'use_axion_types': config.get('use_axion_types', False),
                 }
 
             # Extract registers (required)
-            if 'registers' in data:
-                registers = []
-                for reg in data['registers']:
-                    reg_dict = {
-                        'name': reg.get('name'),
-                        'addr': reg.get('addr'),
-                        'access': reg.get('access', 'RW'),
-                    }
-
-                    # Optional fields
-                    if 'width' in reg:
-                        reg_dict['width'] = reg['width']
-                    if 'description' in reg:
-                        reg_dict['description'] = reg['description']
-                    if 'default' in reg:
-                        reg_dict['default'] = reg['default']
-                    if 'r_strobe' in reg:
-                        reg_dict['r_strobe'] = reg['r_strobe']
-                    if 'w_strobe' in reg:
-                        reg_dict['w_strobe'] = reg['w_strobe']
-                    if 'reg_name' in reg:
-                        reg_dict['reg_name'] = reg['reg_name']
-                    if 'bit_offset' in reg:
-                        reg_dict['bit_offset'] = reg['bit_offset']
-                    
-                    # Fix for Issue #88: Nested fields support
-                    if 'fields' in reg:
-                        reg_dict['fields'] = reg['fields']
-                    if 'enum_values' in reg:
-                        reg_dict['enum_values'] = reg['enum_values']
-
-                    registers.append(reg_dict)
-
-                yaml_dict['registers'] = registers
-            else:
+            if 'registers' not in data:
                 error_msg = "TOML file must contain 'registers' array"
                 self.errors.append({'file': filepath, 'msg': error_msg})
                 print(f"[ERROR] {error_msg}", file=sys.stderr)
                 return None
 
-            return yaml_dict
+            builder = ModuleBuilder(filepath)
+            for reg in data['registers']:
+                builder.add_register_data(reg)
 
         except Exception as e:
-            error_msg = f"Error converting TOML to YAML format: {str(e)}"
+            error_msg = f"Error converting TOML data: {str(e)}"
             self.errors.append({'file': filepath, 'msg': error_msg})
             print(f"[ERROR] {error_msg}", file=sys.stderr)
             return None
 
+        return self.yaml_parser.build_module(header, filepath, builder)
+
     def parse_toml_files(self, source_dirs):
         """
         Parse all TOML files in specified directories.
@@ -243,8 +208,6 @@ class TOMLInputParser:
         Scans directories recursively for .toml files and parses each one.
         Respects exclude patterns configured via add_exclude().
         """
-        import fnmatch
-
         modules = []
 
         for src_dir in source_dirs:
@@ -254,26 +217,40 @@ class TOMLInputParser:
                 print(f"[ERROR] {error_msg}", file=sys.stderr)
                 continue
 
-            for root, dirs, files in os.walk(src_dir):
-                for filename in files:
-                    if filename.endswith('.toml'):
-                        filepath = os.path.join(root, filename)
+            for filepath in self._find_toml_files(src_dir):
+                # Check exclusion patterns
+                if self._is_excluded(filepath):
+                    continue
 
-                        # Check exclusion patterns
-                        excluded = False
-                        for pattern in self._exclude_patterns:
-                            if fnmatch.fnmatch(filepath, pattern) or fnmatch.fnmatch(filename, pattern):
-                                excluded = True
-                                break
+                module = self.parse_file(filepath)
+                if module:
+                    modules.append(module)
 
-                        if excluded:
-                            continue
+        return modules
 
-                        module = self.parse_file(filepath)
-                        if module:
-                            modules.append(module)
+    def _find_toml_files(self, directory):
+        """
+        Find all TOML files in directory (recursive).
 
-        return modules
+        Args:
+            directory (str): Directory to scan
+
+        Returns:
+            list: TOML file paths in directory walk order
+        """
+        return walk_source_files(directory)['toml']
+
+    def _is_excluded(self, filepath):
+        """
+        Check if a file path matches any exclusion pattern.
+
+        Args:
+            filepath (str): Path to check
+
+        Returns:
+            bool: True if the file should be skipped
+        """
+        return get_exclude_matcher(self._exclude_patterns).is_excluded(filepath)
 
     def add_exclude(self, pattern):
         """
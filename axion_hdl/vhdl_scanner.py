@@ -0,0 +1,141 @@
+"""
+VHDL Annotation Scanner for Axion HDL
+
+Finds everything the VHDL parser needs in one forward sweep over the file
+content: the entity name, @axion_def annotations and annotated signal
+declarations, as events in source order.
+
+The sweep jumps from one "-- @axion" comment to the next. The declaration an
+annotation belongs to is matched in the text between the previous annotation
+and this one, so every character is examined a bounded number of times and
+large files scan in linear time. Annotations inside comments (commented-out
+code) are ignored.
+
+Signal declarations may span several lines and may declare a comma-separated
+list of signals; the @axion annotation must follow the terminating semicolon
+on the same line:
+
+    signal ctrl_a, ctrl_b : std_logic_vector(
+        15 downto 0);  -- @axion RW
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+
+# Patterns start with a literal so that the regex engine can skip ahead
+# quickly; word boundaries are checked with a lookbehind after the keyword.
+_ANNOTATION_PATTERN = re.compile(
+    r'--[ \t]*@axion(?:_def[ \t]+(?P<def_attrs>[^\n]+)|(?!\w):?(?:[ \t]+(?P<attrs>[^\n]*))?)',
+    re.IGNORECASE
+)
+
+_ENTITY_PATTERN = re.compile(r'entity(?<!\wentity)\s+(\w+)\s+is\b', re.IGNORECASE)
+
+# Declaration ending right before the annotated semicolon. The type may
+# contain ":=" (initial value) and single dashes, but no ';', ':' or comment.
+_DECLARATION_PATTERN = re.compile(
+    r'signal(?<!\wsignal)\s+(?P<names>\w+(?:\s*,\s*\w+)*)\s*:\s*'
+    r'(?P<type>[^;:\-]*(?:(?::=|-(?!-))[^;:\-]*)*)\Z',
+    re.IGNORECASE
+)
+
+_NAME_SEPARATOR = re.compile(r'\s*,\s*')
+
+
+@dataclass(frozen=True)
+class ScanEvent:
+    """
+    One item found by scan_vhdl().
+
+    Attributes:
+        kind: 'entity', 'def' or 'signal'
+        line: 1-based line number where the item starts
+        text: Entity name ('entity') or attribute string ('def', 'signal')
+        names: Declared signal names ('signal' only)
+        signal_type: Declared type, without the trailing semicolon ('signal' only)
+    """
+    kind: str
+    line: int
+    text: str
+    names: Tuple[str, ...] = ()
+    signal_type: str = ''
+
+
+def _in_comment(content: str, pos: int) -> bool:
+    """True if pos lies inside a comment that starts earlier on its line."""
+    line_start = content.rfind('\n', 0, pos) + 1
+    return content.find('--', line_start, pos) != -1
+
+
+def _find_entity(content: str):
+    """First entity declaration outside comments (match object or None)."""
+    for match in _ENTITY_PATTERN.finditer(content):
+        if not _in_comment(content, match.start()):
+            return match
+    return None
+
+
+def scan_vhdl(content: str) -> Iterator[ScanEvent]:
+    """
+    Scan VHDL content once and yield entity, @axion_def and signal events.
+
+    Args:
+        content: VHDL source code
+
+    Yields:
+        ScanEvent objects in source order
+    """
+    entity = _find_entity(content)
+
+    line = 1
+    counted = 0  # Offset up to which newlines have been counted into line
+    floor = 0    # Declarations are searched after this offset
+
+    def line_of(pos):
+        nonlocal line, counted
+        line += content.count('\n', counted, pos)
+        counted = pos
+        return line
+
+    for match in _ANNOTATION_PATTERN.finditer(content):
+        start = match.start()
+        if _in_comment(content, start):
+            continue
+
+        if entity is not None and entity.start() < start:
+            yield ScanEvent('entity', line_of(entity.start()), entity.group(1))
+            entity = None
+
+        region_start, floor = floor, match.end()
+
+        def_attrs = match.group('def_attrs')
+        if def_attrs is not None:
+            yield ScanEvent('def', line_of(start), def_attrs.strip())
+            continue
+
+        # The annotation must directly follow the declaration's semicolon
+        semicolon = content.rfind(';', region_start, start)
+        if semicolon == -1 or content[semicolon + 1:start].strip(' \t\r'):
+            continue
+
+        # A declaration contains no ';', so it starts after the previous one
+        statement_start = content.rfind(';', region_start, semicolon) + 1
+        declaration = _DECLARATION_PATTERN.search(content, max(statement_start, region_start), semicolon)
+        if declaration is None or _in_comment(content, declaration.start()):
+            continue
+
+        yield ScanEvent(
+            'signal', line_of(declaration.start()), (match.group('attrs') or '').strip(),
+            names=tuple(_NAME_SEPARATOR.split(declaration.group('names'))),
+            signal_type=declaration.group('type').strip(),
+        )
+
+    if entity is not None:
+        yield ScanEvent('entity', line_of(entity.start()), entity.group(1))
+
+
+def first_entity(events: List[ScanEvent]) -> Optional[str]:
+    """Name of the first entity among scan events, or None."""
+    return next((e.text for e in events if e.kind == 'entity'), None)
@@ -6,6 +6,7 @@ Provides functions for type parsing, entity extraction, and code formatting.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional, Tuple, Dict, List
 
 
@@ -33,10 +34,13 @@ class VHDLUtils:
     )
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def parse_signal_type(type_str: str) -> Tuple[str, int, int]:
         """
         Parse VHDL signal type and extract width information.
         
+        Results are memoized: declarations repeat the same few types.
+        
         Args:
             type_str: Type string (e.g., "std_logic_vector(31 downto 0)")
             
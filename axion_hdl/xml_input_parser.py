@@ -1,8 +1,9 @@
 """
 XML Input Parser Module for Axion HDL
 
-This module parses XML register definition files by first converting them to YAML format,
-then using YAMLInputParser for processing. This provides a unified parsing pipeline.
+This module parses XML register definition files. Registers are lowered directly into
+the module dictionary with ModuleBuilder, and module-level fields are normalized by
+YAMLInputParser, so XML modules match those from YAML, JSON and TOML.
 
 Supports both:
 1. Simple custom format: <register_map> with <register> elements
@@ -17,7 +18,30 @@ from pathlib import Path
 
 # Import from axion_hdl
 from axion_hdl.address_manager import AddressManager
+from axion_hdl.module_builder import ModuleBuilder
 from axion_hdl.yaml_input_parser import YAMLInputParser
+from axion_hdl.source_discovery import walk_source_files
+from axion_hdl.exclusion import get_exclude_matcher
+
+
+# Qualified tag prefix of SPIRIT elements; find() with a qualified tag takes
+# ElementTree's fast path, unlike a prefixed path with a namespace map
+SPIRIT_TAG = '{http://www.spiritconsortium.org/XMLSchema/SPIRIT/1.5}'
+
+SPIRIT_ACCESS = {'read-only': 'RO', 'write-only': 'WO', 'read-write': 'RW'}
+
+
+def _spirit_find(elem: ET.Element, name: str) -> Optional[ET.Element]:
+    """First child named spirit:<name>, else first child named <name>."""
+    child = elem.find(SPIRIT_TAG + name)
+    if child is None:
+        child = elem.find(name)
+    return child
+
+
+def _spirit_findall(elem: ET.Element, name: str) -> List[ET.Element]:
+    """Children named spirit:<name>, or those named <name> if there are none."""
+    return elem.findall(SPIRIT_TAG + name) or elem.findall(name)
 
 
 class XMLInputParser:
@@ -65,21 +89,11 @@ class XMLInputParser:
     
     def _is_excluded(self, filepath: str) -> bool:
         """Check if a file path matches any exclusion pattern."""
-        import fnmatch
-        filename = os.path.basename(filepath)
-        
-        for pattern in self._exclude_patterns:
-            if fnmatch.fnmatch(filename, pattern):
-                return True
-            if fnmatch.fnmatch(filepath, f"*/{pattern}/*"):
-                return True
-            if fnmatch.fnmatch(filepath, f"*/{pattern}"):
-                return True
-        return False
-    
+        return get_exclude_matcher(self._exclude_patterns).is_excluded(filepath)
+
     def parse_file(self, filepath: str) -> Optional[Dict]:
         """
-        Parse a single XML file by converting to YAML then using YAMLInputParser.
+        Parse a single XML file into a module dictionary.
         
         Args:
             filepath: Path to the XML file
@@ -95,16 +109,17 @@ class XMLInputParser:
             return None
         
         try:
-            tree = ET.parse(filepath)
-            root = tree.getroot()
+            events = ET.iterparse(filepath, events=('start', 'end'))
+            _, root = next(events)
             
-            # Convert XML to YAML structure
-            yaml_data = self._xml_to_yaml(root, filepath)
-            if not yaml_data:
-                return None
-            
-            # Use YAML parser for processing via public API
-            result = self.yaml_parser.parse_data(yaml_data, filepath)
+            # SPIRIT documents are lowered while they are parsed; other
+            # formats are small and loaded whole.
+            if self._is_spirit_tag(root.tag):
+                result = self._spirit_stream_to_module(events, root, filepath)
+            else:
+                for _ in events:
+                    pass
+                result = self._xml_to_module(root, filepath)
             
             # Merge errors from YAML parser
             if self.yaml_parser.errors:
@@ -124,21 +139,24 @@ class XMLInputParser:
             self.errors.append({'file': filepath, 'msg': msg})
             return None
     
-    def _xml_to_yaml(self, root: ET.Element, filepath: str) -> Optional[Dict]:
-        """Convert XML structure to YAML dictionary."""
+    def _xml_to_module(self, root: ET.Element, filepath: str) -> Optional[Dict]:
+        """Convert a loaded XML document to a module dictionary."""
         # Detect format and convert accordingly
-        if root.tag.startswith('{http://www.spiritconsortium.org'):
-            return self._spirit_to_yaml(root, filepath)
-        elif root.tag == 'spirit:component' or 'spirit' in root.tag:
-            return self._spirit_to_yaml(root, filepath)
+        if self._is_spirit_tag(root.tag):
+            return self._spirit_to_module(root, filepath)
         elif root.tag == 'register_map':
-            return self._simple_xml_to_yaml(root, filepath)
+            return self._simple_xml_to_module(root, filepath)
         else:
             print(f"  Warning: Unknown XML format in {filepath}: {root.tag}")
             return None
     
-    def _simple_xml_to_yaml(self, root: ET.Element, filepath: str) -> Optional[Dict]:
-        """Convert simple custom XML format to YAML dictionary."""
+    @staticmethod
+    def _is_spirit_tag(tag: str) -> bool:
+        """True if a root element tag denotes a SPIRIT/IP-XACT document."""
+        return tag.startswith('{http://www.spiritconsortium.org') or 'spirit' in tag
+    
+    def _simple_xml_to_module(self, root: ET.Element, filepath: str) -> Optional[Dict]:
+        """Convert simple custom XML format to a module dictionary."""
         module_name = root.get('module')
         if not module_name:
             msg = f"Missing 'module' attribute in {filepath}"
@@ -161,99 +179,84 @@ class XMLInputParser:
                 config['cdc_stage'] = cdc_stage_str
             config['use_axion_types'] = config_elem.get('use_axion_types', '').lower() == 'true'
         
-        # Parse registers
-        registers = []
-        
+        # Lower registers
+        builder = ModuleBuilder(filepath)
         for reg_elem in root.findall('register'):
-            reg_name = reg_elem.get('name')
-            if not reg_name:
+            self._lower_simple_register(builder, reg_elem, filepath)
+        
+        header = {'module': module_name, 'base_addr': base_addr_str, 'config': config}
+        return self.yaml_parser.build_module(header, filepath, builder)
+    
+    def _lower_simple_register(self, builder: ModuleBuilder, reg_elem: ET.Element, filepath: str):
+        """Add one <register> element of the simple format to builder."""
+        reg_name = reg_elem.get('name')
+        if not reg_name:
+            return
+        
+        # Parse nested fields (Issue #88 fix)
+        fields = []
+        for field_elem in reg_elem.findall('field'):
+            f_name = field_elem.get('name')
+            if not f_name:
                 continue
-            
-            reg_dict = {
-                'name': reg_name,
-                'access': reg_elem.get('access', reg_elem.get('mode', 'RW')),
-                'description': reg_elem.get('description', '')
-            }
-            
-            # Optional attributes
-            if reg_elem.get('addr'):
-                reg_dict['addr'] = reg_elem.get('addr')
-            if reg_elem.get('width'):
-                reg_dict['width'] = reg_elem.get('width')
-            if reg_elem.get('reg_name'):
-                reg_dict['reg_name'] = reg_elem.get('reg_name')
-            if reg_elem.get('bit_offset'):
-                reg_dict['bit_offset'] = reg_elem.get('bit_offset')
-            if reg_elem.get('default'):
-                reg_dict['default'] = reg_elem.get('default')
-            if reg_elem.get('r_strobe', '').lower() == 'true':
-                reg_dict['r_strobe'] = True
-            if reg_elem.get('w_strobe', '').lower() == 'true':
-                reg_dict['w_strobe'] = True
-            
-            if reg_elem.get('w_strobe', '').lower() == 'true':
-                reg_dict['w_strobe'] = True
-            
-            # Parse nested fields (Issue #88 fix)
-            fields = []
-            for field_elem in reg_elem.findall('field'):
-                f_name = field_elem.get('name')
-                if not f_name:
-                    continue
-
-                f_dict = {
-                    'name': f_name,
-                    'bit_offset': field_elem.get('bit_offset'),
-                    'width': field_elem.get('width', 1),
-                    'access': field_elem.get('access', 'RW'),
-                    'description': field_elem.get('description', '')
-                }
-
-                # Parse <enum_value value="..." name="..."/> children
-                enum_vals = {}
-                for ev_elem in field_elem.findall('enum_value'):
-                    ev_val_str = ev_elem.get('value')
-                    ev_name = ev_elem.get('name')
-                    if ev_val_str is not None and ev_name:
-                        try:
-                            enum_vals[int(ev_val_str, 0)] = ev_name
-                        except (ValueError, TypeError):
-                            self.errors.append({
-                                'file': filepath,
-                                'msg': (f"Invalid enum_value '{ev_val_str}' for name '{ev_name}' "
-                                        f"in field of register; expected an integer value")
-                            })
-                if enum_vals:
-                    f_dict['enum_values'] = enum_vals
 
-                fields.append(f_dict)
+            f_dict = {
+                'name': f_name,
+                'bit_offset': field_elem.get('bit_offset'),
+                'bit_align': field_elem.get('bit_align') or 1,
+                'width': field_elem.get('width', 1),
+                'access': field_elem.get('access', 'RW'),
+                'description': field_elem.get('description', '')
+            }
 
-            # Handle flat register-level enum attribute
-            flat_enum_attr = reg_elem.get('enum')
-            if flat_enum_attr and not fields:
-                from axion_hdl.annotation_parser import AnnotationParser
-                _ap = AnnotationParser()
-                reg_dict['enum_values'] = _ap.parse_enum_values(flat_enum_attr)
+            # Parse <enum_value value="..." name="..."/> children
+            enum_vals = {}
+            for ev_elem in field_elem.findall('enum_value'):
+                ev_val_str = ev_elem.get('value')
+                ev_name = ev_elem.get('name')
+                if ev_val_str is not None and ev_name:
+                    try:
+                        enum_vals[int(ev_val_str, 0)] = ev_name
+                    except (ValueError, TypeError):
+                        self.errors.append({
+                            'file': filepath,
+                            'msg': (f"Invalid enum_value '{ev_val_str}' for name '{ev_name}' "
+                                    f"in field of register; expected an integer value")
+                        })
+            if enum_vals:
+                f_dict['enum_values'] = enum_vals
 
-            if fields:
-                reg_dict['fields'] = fields
+            fields.append(f_dict)
 
-            registers.append(reg_dict)
+        # Handle flat register-level enum attribute
+        enum_values = None
+        flat_enum_attr = reg_elem.get('enum')
+        if flat_enum_attr and not fields:
+            from axion_hdl.annotation_parser import AnnotationParser
+            _ap = AnnotationParser()
+            enum_values = _ap.parse_enum_values(flat_enum_attr)
         
-        return {
-            'module': module_name,
-            'base_addr': base_addr_str,
-            'config': config,
-            'registers': registers
-        }
+        # Empty attributes count as absent
+        builder.add_register(
+            reg_name,
+            access=reg_elem.get('access', reg_elem.get('mode', 'RW')),
+            width=reg_elem.get('width') or 32,
+            addr=reg_elem.get('addr') or None,
+            description=reg_elem.get('description', ''),
+            default=reg_elem.get('default') or None,
+            r_strobe=reg_elem.get('r_strobe', '').lower() == 'true',
+            w_strobe=reg_elem.get('w_strobe', '').lower() == 'true',
+            reg_name=reg_elem.get('reg_name') or None,
+            bit_offset=reg_elem.get('bit_offset') or None,
+            enum_values=enum_values,
+            fields=fields,
+            bit_align=reg_elem.get('bit_align') or 1,
+        )
     
-    def _spirit_to_yaml(self, root: ET.Element, filepath: str) -> Optional[Dict]:
-        """Convert SPIRIT/IP-XACT XML format to YAML dictionary."""
-        # Handle namespace
-        ns = self.SPIRIT_NS
-        
+    def _spirit_to_module(self, root: ET.Element, filepath: str) -> Optional[Dict]:
+        """Convert a loaded SPIRIT/IP-XACT document to a module dictionary."""
         # Try to find module name
-        name_elem = root.find('.//spirit:name', ns)
+        name_elem = root.find('.//' + SPIRIT_TAG + 'name')
         if name_elem is None:
             name_elem = root.find('.//name')
         
@@ -263,7 +266,7 @@ class XMLInputParser:
             return None
         
         # Find base address
-        base_addr_elem = root.find('.//spirit:baseAddress', ns)
+        base_addr_elem = root.find('.//' + SPIRIT_TAG + 'baseAddress')
         if base_addr_elem is None:
             base_addr_elem = root.find('.//baseAddress')
         
@@ -271,165 +274,173 @@ class XMLInputParser:
         if base_addr_elem is not None and base_addr_elem.text:
             base_addr_str = base_addr_elem.text
         
-        # Parse registers
-        registers = []
-        reg_elems = root.findall('.//spirit:register', ns)
+        # Lower registers
+        reg_elems = root.findall('.//' + SPIRIT_TAG + 'register')
         if not reg_elems:
             reg_elems = root.findall('.//register')
         
+        builder = ModuleBuilder(filepath)
         for reg_elem in reg_elems:
-            reg_name_elem = reg_elem.find('spirit:name', ns)
-            if reg_name_elem is None:
-                reg_name_elem = reg_elem.find('name')
-            
-            if reg_name_elem is None or not reg_name_elem.text:
+            self._lower_spirit_register(builder, reg_elem, filepath, self.errors)
+        
+        header = {'module': module_name, 'base_addr': base_addr_str, 'config': {}}
+        return self.yaml_parser.build_module(header, filepath, builder)
+    
+    def _spirit_stream_to_module(self, events, root: ET.Element, filepath: str) -> Optional[Dict]:
+        """
+        Convert a SPIRIT/IP-XACT document to a module dictionary while it is parsed.
+        
+        Consumes the remaining ('start', 'end') events of an iterparse() whose
+        root element has already been seen. Each register is lowered as soon
+        as its element ends, after which the register is detached from the
+        tree. Every other element is detached as soon as it ends as well, so
+        memory holds the open ancestors, the register being converted and
+        whatever the parser has read ahead, whatever the size of the document.
+        The result is identical to _spirit_to_module() on the fully loaded tree.
+        """
+        name_tags = (SPIRIT_TAG + 'name', 'name')
+        base_tags = (SPIRIT_TAG + 'baseAddress', 'baseAddress')
+        reg_tags = (SPIRIT_TAG + 'register', 'register')
+        
+        # Per tag flavour (SPIRIT namespace first, plain as fallback), like
+        # the find()/findall() lookups of _spirit_to_module()
+        names = [None, None]
+        base_addrs = [None, None]
+        builders = (ModuleBuilder(filepath), ModuleBuilder(filepath))
+        errors = ([], [])
+        seen = [0, 0]
+        
+        stack = [root]
+        in_register = 0
+        for event, elem in events:
+            if event == 'start':
+                stack.append(elem)
+                if elem.tag in reg_tags:
+                    in_register += 1
                 continue
             
-            reg_name = reg_name_elem.text
-            
-            # Get address offset
-            offset_elem = reg_elem.find('spirit:addressOffset', ns)
-            if offset_elem is None:
-                offset_elem = reg_elem.find('addressOffset')
-            
-            reg_dict = {'name': reg_name}
-            
-            if offset_elem is not None and offset_elem.text:
-                reg_dict['addr'] = offset_elem.text
-            
-            # Get access mode
-            access_elem = reg_elem.find('spirit:access', ns)
-            if access_elem is None:
-                access_elem = reg_elem.find('access')
-            
-            if access_elem is not None and access_elem.text:
-                access_map = {
-                    'read-only': 'RO',
-                    'write-only': 'WO',
-                    'read-write': 'RW'
-                }
-                reg_dict['access'] = access_map.get(access_elem.text.lower(), 'RW')
-            
-            # Get size/width
-            size_elem = reg_elem.find('spirit:size', ns)
-            if size_elem is None:
-                size_elem = reg_elem.find('size')
+            stack.pop()
+            tag = elem.tag
+            if tag in name_tags:
+                kind = name_tags.index(tag)
+                if names[kind] is None:
+                    names[kind] = (elem.text,)
+            elif tag in base_tags:
+                kind = base_tags.index(tag)
+                if base_addrs[kind] is None:
+                    base_addrs[kind] = (elem.text,)
+            elif tag in reg_tags:
+                in_register -= 1
+                kind = reg_tags.index(tag)
+                seen[kind] += 1
+                self._lower_spirit_register(builders[kind], elem, filepath, errors[kind])
             
-            if size_elem is not None and size_elem.text:
-                reg_dict['width'] = size_elem.text
-            
-            # Get description
-            desc_elem = reg_elem.find('spirit:description', ns)
-            if desc_elem is None:
-                desc_elem = reg_elem.find('description')
-            
-            if desc_elem is not None and desc_elem.text:
-                reg_dict['description'] = desc_elem.text
-            
-            # Get strobe attributes (custom extension)
-            if reg_elem.get('r_strobe', '').lower() == 'true':
-                reg_dict['r_strobe'] = True
-            if reg_elem.get('w_strobe', '').lower() == 'true':
-                reg_dict['w_strobe'] = True
-            
-            if reg_elem.get('w_strobe', '').lower() == 'true':
-                reg_dict['w_strobe'] = True
+            # Children of a register are kept until the register is lowered
+            if stack and not in_register:
+                elem.clear()
+                stack[-1].remove(elem)
+        
+        name = names[0] if names[0] is not None else names[1]
+        module_name = name[0] if name is not None else None
+        if not module_name:
+            print(f"  Error: Cannot find module name in SPIRIT format: {filepath}")
+            return None
+        
+        base_addr = base_addrs[0] if base_addrs[0] is not None else base_addrs[1]
+        base_addr_str = '0x0000'
+        if base_addr is not None and base_addr[0]:
+            base_addr_str = base_addr[0]
+        
+        kind = 0 if seen[0] else 1
+        self.errors.extend(errors[kind])
+        
+        header = {'module': module_name, 'base_addr': base_addr_str, 'config': {}}
+        return self.yaml_parser.build_module(header, filepath, builders[kind])
+    
+    def _lower_spirit_register(self, builder: ModuleBuilder, reg_elem: ET.Element,
+                               filepath: str, errors: List[Dict]):
+        """Add one SPIRIT register element to builder (unnamed registers are skipped)."""
+        reg_name_elem = _spirit_find(reg_elem, 'name')
+        if reg_name_elem is None or not reg_name_elem.text:
+            return
+        
+        offset_elem = _spirit_find(reg_elem, 'addressOffset')
+        access_elem = _spirit_find(reg_elem, 'access')
+        size_elem = _spirit_find(reg_elem, 'size')
+        desc_elem = _spirit_find(reg_elem, 'description')
+        
+        access = 'RW'
+        if access_elem is not None and access_elem.text:
+            access = SPIRIT_ACCESS.get(access_elem.text.lower(), 'RW')
+        
+        # Parse nested fields (spirit:field) - Issue #88 fix
+        fields = []
+        for field_elem in _spirit_findall(reg_elem, 'field'):
+            f_name_elem = _spirit_find(field_elem, 'name')
+            if f_name_elem is None or not f_name_elem.text:
+                continue
             
-            # Parse nested fields (spirit:field) - Issue #88 fix
-            fields = []
-            field_elems = reg_elem.findall('spirit:field', ns)
-            if not field_elems:
-                field_elems = reg_elem.findall('field')
+            f_dict = {'name': f_name_elem.text}
             
-            for field_elem in field_elems:
-                # Name
-                f_name_elem = field_elem.find('spirit:name', ns)
-                if f_name_elem is None:
-                    f_name_elem = field_elem.find('name')
-                
-                if f_name_elem is None or not f_name_elem.text:
-                    continue
+            # Bit Offset
+            f_offset_elem = _spirit_find(field_elem, 'bitOffset')
+            if f_offset_elem is not None and f_offset_elem.text:
+                f_dict['bit_offset'] = f_offset_elem.text
                 
-                f_dict = {'name': f_name_elem.text}
+            # Width (bitWidth)
+            f_width_elem = _spirit_find(field_elem, 'bitWidth')
+            if f_width_elem is not None and f_width_elem.text:
+                f_dict['width'] = f_width_elem.text
+            else:
+                f_dict['width'] = 1
                 
-                # Bit Offset
-                f_offset_elem = field_elem.find('spirit:bitOffset', ns)
-                if f_offset_elem is None:
-                    f_offset_elem = field_elem.find('bitOffset')
-                if f_offset_elem is not None and f_offset_elem.text:
-                    f_dict['bit_offset'] = f_offset_elem.text
-                    
-                # Width (bitWidth)
-                f_width_elem = field_elem.find('spirit:bitWidth', ns)
-                if f_width_elem is None:
-                    f_width_elem = field_elem.find('bitWidth')
-                if f_width_elem is not None and f_width_elem.text:
-                    f_dict['width'] = f_width_elem.text
-                else:
-                    f_dict['width'] = 1
-                    
-                # Access
-                f_access_elem = field_elem.find('spirit:access', ns)
-                if f_access_elem is None:
-                    f_access_elem = field_elem.find('access')
-                if f_access_elem is not None and f_access_elem.text:
-                   # Map spirit access to simplified access
-                   amap = {'read-only': 'RO', 'write-only': 'WO', 'read-write': 'RW'}
-                   f_dict['access'] = amap.get(f_access_elem.text.lower(), 'RW')
-                else:
-                    f_dict['access'] = 'RW'
-
-                # Description
-                f_desc_elem = field_elem.find('spirit:description', ns)
-                if f_desc_elem is None:
-                    f_desc_elem = field_elem.find('description')
-                if f_desc_elem is not None and f_desc_elem.text:
-                    f_dict['description'] = f_desc_elem.text
+            # Access
+            f_access_elem = _spirit_find(field_elem, 'access')
+            if f_access_elem is not None and f_access_elem.text:
+                f_dict['access'] = SPIRIT_ACCESS.get(f_access_elem.text.lower(), 'RW')
+            else:
+                f_dict['access'] = 'RW'
 
-                # Parse spirit:enumeratedValues/spirit:enumeratedValue
-                enum_vals = {}
-                enum_vals_elem = field_elem.find('spirit:enumeratedValues', ns)
-                if enum_vals_elem is None:
-                    enum_vals_elem = field_elem.find('enumeratedValues')
-                if enum_vals_elem is not None:
-                    ev_elems = enum_vals_elem.findall('spirit:enumeratedValue', ns)
-                    if not ev_elems:
-                        ev_elems = enum_vals_elem.findall('enumeratedValue')
-                    for ev_elem in ev_elems:
-                        ev_name_elem = ev_elem.find('spirit:name', ns)
-                        if ev_name_elem is None:
-                            ev_name_elem = ev_elem.find('name')
-                        ev_val_elem = ev_elem.find('spirit:value', ns)
-                        if ev_val_elem is None:
-                            ev_val_elem = ev_elem.find('value')
-                        if ev_name_elem is not None and ev_val_elem is not None:
-                            ev_name_text = (ev_name_elem.text or '').strip()
-                            ev_val_text = (ev_val_elem.text or '').strip()
-                            if ev_name_text and ev_val_text:
-                                try:
-                                    enum_vals[int(ev_val_text, 0)] = ev_name_text
-                                except (ValueError, TypeError):
-                                    self.errors.append({
-                                        'file': filepath,
-                                        'msg': (f"Invalid SPIRIT enum value '{ev_val_text}' "
-                                                f"for name '{ev_name_text}'; expected an integer value")
-                                    })
-                if enum_vals:
-                    f_dict['enum_values'] = enum_vals
+            # Description
+            f_desc_elem = _spirit_find(field_elem, 'description')
+            if f_desc_elem is not None and f_desc_elem.text:
+                f_dict['description'] = f_desc_elem.text
 
-                fields.append(f_dict)
+            # Parse spirit:enumeratedValues/spirit:enumeratedValue
+            enum_vals = {}
+            enum_vals_elem = _spirit_find(field_elem, 'enumeratedValues')
+            if enum_vals_elem is not None:
+                for ev_elem in _spirit_findall(enum_vals_elem, 'enumeratedValue'):
+                    ev_name_elem = _spirit_find(ev_elem, 'name')
+                    ev_val_elem = _spirit_find(ev_elem, 'value')
+                    if ev_name_elem is not None and ev_val_elem is not None:
+                        ev_name_text = (ev_name_elem.text or '').strip()
+                        ev_val_text = (ev_val_elem.text or '').strip()
+                        if ev_name_text and ev_val_text:
+                            try:
+                                enum_vals[int(ev_val_text, 0)] = ev_name_text
+                            except (ValueError, TypeError):
+                                errors.append({
+                                    'file': filepath,
+                                    'msg': (f"Invalid SPIRIT enum value '{ev_val_text}' "
+                                            f"for name '{ev_name_text}'; expected an integer value")
+                                })
+            if enum_vals:
+                f_dict['enum_values'] = enum_vals
 
-            if fields:
-                reg_dict['fields'] = fields
-            
-            registers.append(reg_dict)
+            fields.append(f_dict)
         
-        return {
-            'module': module_name,
-            'base_addr': base_addr_str,
-            'config': {},
-            'registers': registers
-        }
+        # Strobe attributes are a custom extension
+        builder.add_register(
+            reg_name_elem.text,
+            access=access,
+            width=size_elem.text if size_elem is not None and size_elem.text else 32,
+            addr=offset_elem.text if offset_elem is not None and offset_elem.text else None,
+            description=desc_elem.text if desc_elem is not None and desc_elem.text else '',
+            r_strobe=reg_elem.get('r_strobe', '').lower() == 'true',
+            w_strobe=reg_elem.get('w_strobe', '').lower() == 'true',
+            fields=fields,
+        )
     
     def parse_xml_files(self, source_dirs: List[str]) -> List[Dict]:
         """
@@ -463,11 +474,4 @@ class XMLInputParser:
     
     def _find_xml_files(self, directory: str) -> List[str]:
         """Find all XML files in directory (recursive)."""
-        xml_files = []
-        
-        for root, dirs, files in os.walk(directory):
-            for filename in files:
-                if filename.lower().endswith('.xml'):
-                    xml_files.append(os.path.join(root, filename))
-        
-        return sorted(xml_files)
+        return sorted(walk_source_files(directory)['xml'])
@@ -0,0 +1,60 @@
+"""
+YAML Loader Module for Axion HDL
+
+Safe YAML loading shared by the YAML input parser, the hierarchy parser and
+the rule checker. When PyYAML is built with libyaml, the C-accelerated
+CSafeLoader is used; otherwise the pure-Python SafeLoader. Both construct
+the same plain Python objects from a document.
+"""
+
+from typing import Any, Iterator
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+if yaml is not None:
+    SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+else:
+    SafeLoader = None
+
+# True if documents are loaded by libyaml
+HAS_LIBYAML = yaml is not None and SafeLoader is not yaml.SafeLoader
+
+
+def _require_yaml() -> None:
+    if yaml is None:
+        raise ImportError("PyYAML is required for YAML support. Install with: pip install PyYAML")
+
+
+def safe_load(stream) -> Any:
+    """
+    Load a single YAML document with the fastest available safe loader.
+
+    Args:
+        stream: String or open text file
+
+    Returns:
+        Loaded document (None for an empty stream)
+    """
+    _require_yaml()
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_load_all(stream) -> Iterator[Any]:
+    """
+    Load the documents of a multi-document YAML stream one at a time.
+
+    Each document is parsed only when the iterator reaches it, so a file
+    with many documents is never held in memory as a whole.
+
+    Args:
+        stream: String or open text file (must stay open while iterating)
+
+    Returns:
+        Iterator over the loaded documents, in stream order
+    """
+    _require_yaml()
+    return yaml.load_all(stream, Loader=SafeLoader)
@@ -13,6 +13,15 @@ DUT ?= sensor_controller
 TOPLEVEL ?= $(DUT)_axion_reg
 MODULE ?= test_sv_basic
 
+# Read mux pipeline depth of the generated DUT (RD_PIPE / --read-pipeline)
+RD_PIPE ?= 0
+
+# AXI state machine of the generated DUT (FSM / --fsm: shared, split or fast)
+FSM ?= shared
+
+# CDC of the generated DUT (CDC_MODE / --cdc-mode: sync or handshake)
+CDC_MODE ?= sync
+
 # Verilator specific flags
 # --trace-structs ensures packed structs are visible in waves
 EXTRA_ARGS += --trace --trace-structs --Wno-fatal
@@ -34,4 +43,36 @@ axion = AxionHDL(output_dir='$(OUTPUT_DIR)'); \
 axion.add_src('$(TESTS_DIR)/vhdl/$(DUT).vhd'); \
 axion.exclude('error_cases'); \
 axion.analyze(); \
+[module.__setitem__('read_pipeline', $(RD_PIPE)) for module in axion.analyzed_modules]; \
+[module.__setitem__('fsm', '$(FSM)') for module in axion.analyzed_modules]; \
+[module.__setitem__('cdc_mode', '$(CDC_MODE)') for module in axion.analyzed_modules]; \
 axion.generate_systemverilog()"
+
+# Run read pipeline tests at every RD_PIPE depth
+.PHONY: test_read_pipeline test_split_fsm test_stress_fsm test_cdc_modes
+test_read_pipeline:
+	@for n in 0 1 2 3; do \
+		$(MAKE) -f Makefile.sv generate RD_PIPE=$$n && \
+		$(MAKE) -f Makefile.sv MODULE=test_read_pipeline RD_PIPE=$$n || exit 1; \
+	done
+
+# Run mixed-traffic tests with every state machine
+test_split_fsm:
+	@for fsm in shared split fast; do \
+		$(MAKE) -f Makefile.sv generate FSM=$$fsm && \
+		$(MAKE) -f Makefile.sv MODULE=test_split_fsm FSM=$$fsm || exit 1; \
+	done
+
+# Measure back-to-back throughput with every state machine
+test_stress_fsm:
+	@for fsm in shared split fast; do \
+		$(MAKE) -f Makefile.sv generate FSM=$$fsm && \
+		$(MAKE) -f Makefile.sv MODULE=test_stress_extended FSM=$$fsm || exit 1; \
+	done
+
+# Run CDC tests with every CDC mode
+test_cdc_modes:
+	@for mode in sync handshake; do \
+		$(MAKE) -f Makefile.sv generate CDC_MODE=$$mode && \
+		$(MAKE) -f Makefile.sv MODULE=test_cdc CDC_MODE=$$mode || exit 1; \
+	done
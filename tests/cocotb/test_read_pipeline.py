@@ -0,0 +1,184 @@
+"""
+Cocotb Read Pipeline Tests for Axion-HDL
+
+Verifies the registered read mux (RD_PIPE / --read-pipeline) of the
+generated sensor_controller_axion_reg at the depth it was generated with:
+- Read data and responses match the combinational mux
+- ARVALID to RVALID latency grows with the pipeline depth
+- A read right after a write returns the new value
+
+Run every depth with:
+    make test_read_pipeline                      (VHDL, GHDL)
+    make -f Makefile.sv test_read_pipeline       (SystemVerilog, Verilator)
+
+RD_PIPE (0-3) tells the tests which depth the DUT was generated with.
+"""
+
+import os
+import random
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge, ClockCycles, ReadOnly
+
+RD_PIPE = int(os.environ.get('RD_PIPE', '0'))
+IS_VHDL = os.environ.get('TOPLEVEL_LANG', 'vhdl') == 'vhdl'
+
+# Cycles from ARVALID to RVALID with the combinational mux. The VHDL FSM
+# spends RD_ADDR after capturing the address, which hides one mux stage;
+# the SystemVerilog FSM waits one READ_WAIT cycle per stage.
+BASE_LATENCY = 2
+EXTRA_LATENCY = max(RD_PIPE - 1, 0) if IS_VHDL else RD_PIPE
+
+# sensor_controller register map
+RO_REGS = {0x00: 'status_reg', 0x04: 'temperature_reg', 0x08: 'pressure_reg',
+           0x0C: 'humidity_reg', 0x10: 'error_count_reg', 0x30: 'timestamp_reg'}
+RW_REGS = [0x20, 0x24, 0x28, 0x2C, 0x34]
+WO_REGS = [0x14, 0x18, 0x1C]
+
+OKAY = 0
+SLVERR = 2
+
+
+async def setup_dut(dut):
+    """Start the clocks and reset the DUT."""
+    cocotb.start_soon(Clock(dut.axi_aclk, 10, units="ns").start())
+    if hasattr(dut, 'module_clk'):
+        cocotb.start_soon(Clock(dut.module_clk, 10, units="ns").start())
+
+    dut.axi_aresetn.value = 0
+    dut.axi_awaddr.value = 0
+    dut.axi_awvalid.value = 0
+    dut.axi_wdata.value = 0
+    dut.axi_wstrb.value = 0
+    dut.axi_wvalid.value = 0
+    dut.axi_bready.value = 0
+    dut.axi_araddr.value = 0
+    dut.axi_arvalid.value = 0
+    dut.axi_rready.value = 0
+    await ClockCycles(dut.axi_aclk, 10)
+    dut.axi_aresetn.value = 1
+    await ClockCycles(dut.axi_aclk, 5)
+
+
+async def write(dut, addr, data):
+    """AXI-Lite write; returns BRESP."""
+    await RisingEdge(dut.axi_aclk)
+    dut.axi_awaddr.value = addr
+    dut.axi_awvalid.value = 1
+    dut.axi_wdata.value = data
+    dut.axi_wstrb.value = 0xF
+    dut.axi_wvalid.value = 1
+    dut.axi_bready.value = 1
+    for _ in range(100):
+        await RisingEdge(dut.axi_aclk)
+        if dut.axi_awready.value == 1:
+            dut.axi_awvalid.value = 0
+        if dut.axi_wready.value == 1:
+            dut.axi_wvalid.value = 0
+        if dut.axi_bvalid.value == 1:
+            break
+    else:
+        raise TimeoutError("Write timeout")
+    resp = int(dut.axi_bresp.value)
+    await RisingEdge(dut.axi_aclk)
+    dut.axi_bready.value = 0
+    return resp
+
+
+async def read(dut, addr):
+    """AXI-Lite read; returns (data, RRESP, ARVALID to RVALID cycles)."""
+    await RisingEdge(dut.axi_aclk)
+    dut.axi_araddr.value = addr
+    dut.axi_arvalid.value = 1
+    dut.axi_rready.value = 1
+    cycles = 0
+    while True:
+        await RisingEdge(dut.axi_aclk)
+        cycles += 1
+        await ReadOnly()
+        if dut.axi_arready.value == 1:
+            await RisingEdge(dut.axi_aclk)
+            cycles += 1
+            dut.axi_arvalid.value = 0
+            break
+        if cycles > 100:
+            raise TimeoutError("Read address timeout")
+    await ReadOnly()
+    while dut.axi_rvalid.value != 1:
+        await RisingEdge(dut.axi_aclk)
+        cycles += 1
+        await ReadOnly()
+        if cycles > 100:
+            raise TimeoutError("Read data timeout")
+    data = int(dut.axi_rdata.value)
+    resp = int(dut.axi_rresp.value)
+    await RisingEdge(dut.axi_aclk)
+    dut.axi_rready.value = 0
+    return data, resp, cycles
+
+
+@cocotb.test()
+async def test_read_pipeline_rw_data(dut):
+    """RW registers read back through every mux stage"""
+    await setup_dut(dut)
+    rnd = random.Random(RD_PIPE)
+    expected = {}
+    for addr in RW_REGS:
+        expected[addr] = rnd.getrandbits(32)
+        assert await write(dut, addr, expected[addr]) == OKAY
+    for _ in range(3):
+        for addr in rnd.sample(RW_REGS, len(RW_REGS)):
+            data, resp, _ = await read(dut, addr)
+            assert resp == OKAY, f"RD_PIPE={RD_PIPE}: RRESP {resp} at 0x{addr:02X}"
+            assert data == expected[addr], \
+                f"RD_PIPE={RD_PIPE}: 0x{addr:02X} read 0x{data:08X}, expected 0x{expected[addr]:08X}"
+
+
+@cocotb.test()
+async def test_read_pipeline_ro_data(dut):
+    """RO registers follow their inputs"""
+    await setup_dut(dut)
+    rnd = random.Random(100 + RD_PIPE)
+    for addr, name in RO_REGS.items():
+        value = rnd.getrandbits(32)
+        getattr(dut, name).value = value
+        # Let the CDC synchronizer (if any) settle
+        await ClockCycles(dut.axi_aclk, 8)
+        data, resp, _ = await read(dut, addr)
+        assert resp == OKAY
+        assert data == value, f"RD_PIPE={RD_PIPE}: {name} read 0x{data:08X}, expected 0x{value:08X}"
+
+
+@cocotb.test()
+async def test_read_pipeline_errors(dut):
+    """Write-only and unmapped addresses answer SLVERR"""
+    await setup_dut(dut)
+    for addr in WO_REGS + [0x38, 0x100, 0x22]:
+        _, resp, _ = await read(dut, addr)
+        assert resp == SLVERR, f"RD_PIPE={RD_PIPE}: expected SLVERR at 0x{addr:02X}, got {resp}"
+
+
+@cocotb.test()
+async def test_read_pipeline_latency(dut):
+    """RVALID waits for the last mux stage"""
+    await setup_dut(dut)
+    expected = BASE_LATENCY + EXTRA_LATENCY
+    for addr in (0x00, 0x20, 0x34, 0x14):
+        _, _, cycles = await read(dut, addr)
+        assert cycles == expected, \
+            f"RD_PIPE={RD_PIPE}: ARVALID to RVALID took {cycles} cycles, expected {expected}"
+
+
+@cocotb.test()
+async def test_read_pipeline_write_then_read(dut):
+    """A read right after a write returns the new value"""
+    await setup_dut(dut)
+    rnd = random.Random(200 + RD_PIPE)
+    for _ in range(20):
+        addr = rnd.choice(RW_REGS)
+        value = rnd.getrandbits(32)
+        assert await write(dut, addr, value) == OKAY
+        data, resp, _ = await read(dut, addr)
+        assert resp == OKAY
+        assert data == value, f"RD_PIPE={RD_PIPE}: stale read 0x{data:08X} at 0x{addr:02X}"
@@ -0,0 +1,284 @@
+"""
+Cocotb Split State Machine Tests for Axion-HDL
+
+Verifies the independent write and read state machines (FSM=split / --fsm
+split) of the generated sensor_controller_axion_reg under mixed traffic:
+- Mixed write/read throughput against the same transactions issued serially
+- Same-address ordering when a read and a write arrive in the same cycle
+- RDATA stays stable while a write to the same register waits
+- Every read returns a value allowed by the write/read handshake order
+
+Run both state machines with:
+    make test_split_fsm                      (VHDL, GHDL)
+    make -f Makefile.sv test_split_fsm       (SystemVerilog, Verilator)
+
+FSM (shared, split or fast) tells the tests which state machine the DUT
+was generated with; FSM=fast has independent channels as well and is run
+with the same expectations as FSM=split.
+"""
+
+import os
+import random
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge, ClockCycles, ReadOnly, Combine
+from cocotb.utils import get_sim_time
+
+FSM = os.environ.get('FSM', 'shared')
+CLK_PERIOD_NS = 10
+# With FSM=shared a read waits for a whole burst of writes (and vice versa)
+TIMEOUT_CYCLES = 1000
+
+# sensor_controller register map
+RO_REGS = [0x00, 0x04, 0x08, 0x0C, 0x10, 0x30]
+RW_REGS = [0x20, 0x24, 0x28, 0x2C, 0x34]
+
+OKAY = 0
+
+
+def now():
+    """Current time in AXI clock cycles."""
+    return int(get_sim_time(units='ns')) // CLK_PERIOD_NS
+
+
+async def setup_dut(dut):
+    """Start the clocks and reset the DUT."""
+    cocotb.start_soon(Clock(dut.axi_aclk, CLK_PERIOD_NS, units="ns").start())
+    if hasattr(dut, 'module_clk'):
+        cocotb.start_soon(Clock(dut.module_clk, 17, units="ns").start())
+
+    dut.axi_aresetn.value = 0
+    dut.axi_awaddr.value = 0
+    dut.axi_awvalid.value = 0
+    dut.axi_wdata.value = 0
+    dut.axi_wstrb.value = 0
+    dut.axi_wvalid.value = 0
+    dut.axi_bready.value = 0
+    dut.axi_araddr.value = 0
+    dut.axi_arvalid.value = 0
+    dut.axi_rready.value = 0
+    await ClockCycles(dut.axi_aclk, 10)
+    dut.axi_aresetn.value = 1
+    await ClockCycles(dut.axi_aclk, 5)
+
+
+async def write(dut, addr, data, log=None):
+    """
+    AXI-Lite write driving only the write channels; returns BRESP.
+
+    Call right after a rising edge. Appends (addr, data, W handshake
+    cycle, B handshake cycle) to log.
+    """
+    dut.axi_awaddr.value = addr
+    dut.axi_awvalid.value = 1
+    dut.axi_wdata.value = data
+    dut.axi_wstrb.value = 0xF
+    dut.axi_wvalid.value = 1
+    dut.axi_bready.value = 1
+    aw_pending = w_pending = True
+    w_cycle = None
+    for _ in range(TIMEOUT_CYCLES):
+        await ReadOnly()
+        aw_hs = aw_pending and dut.axi_awready.value == 1
+        w_hs = w_pending and dut.axi_wready.value == 1
+        await RisingEdge(dut.axi_aclk)
+        if aw_hs:
+            aw_pending = False
+            dut.axi_awvalid.value = 0
+        if w_hs:
+            w_pending = False
+            w_cycle = now()
+            dut.axi_wvalid.value = 0
+        if not (aw_pending or w_pending):
+            break
+    else:
+        raise TimeoutError("Write handshake timeout")
+    for _ in range(TIMEOUT_CYCLES):
+        await ReadOnly()
+        if dut.axi_bvalid.value == 1:
+            break
+        await RisingEdge(dut.axi_aclk)
+    else:
+        raise TimeoutError("Write response timeout")
+    resp = int(dut.axi_bresp.value)
+    await RisingEdge(dut.axi_aclk)
+    dut.axi_bready.value = 0
+    if log is not None:
+        log.append((addr, data, w_cycle, now()))
+    return resp
+
+
+async def read(dut, addr, rready_delay=0, log=None):
+    """
+    AXI-Lite read driving only the read channels; returns (data, RRESP).
+
+    Call right after a rising edge. RREADY is held low for rready_delay
+    cycles after RVALID, during which RDATA must not change. Appends
+    (addr, AR handshake cycle, R handshake cycle, data) to log.
+    """
+    dut.axi_araddr.value = addr
+    dut.axi_arvalid.value = 1
+    dut.axi_rready.value = 0 if rready_delay else 1
+    for _ in range(TIMEOUT_CYCLES):
+        await ReadOnly()
+        ar_hs = dut.axi_arready.value == 1
+        await RisingEdge(dut.axi_aclk)
+        if ar_hs:
+            dut.axi_arvalid.value = 0
+            break
+    else:
+        raise TimeoutError("Read address timeout")
+    ar_cycle = now()
+    for _ in range(TIMEOUT_CYCLES):
+        await ReadOnly()
+        if dut.axi_rvalid.value == 1:
+            break
+        await RisingEdge(dut.axi_aclk)
+    else:
+        raise TimeoutError("Read data timeout")
+    data = int(dut.axi_rdata.value)
+    resp = int(dut.axi_rresp.value)
+    for _ in range(rready_delay):
+        await RisingEdge(dut.axi_aclk)
+        await ReadOnly()
+        assert dut.axi_rvalid.value == 1, "RVALID dropped before RREADY"
+        assert int(dut.axi_rdata.value) == data, \
+            f"FSM={FSM}: RDATA changed from 0x{data:08X} while RVALID was high"
+    if rready_delay:
+        await RisingEdge(dut.axi_aclk)
+        dut.axi_rready.value = 1
+    await RisingEdge(dut.axi_aclk)
+    dut.axi_rready.value = 0
+    if log is not None:
+        log.append((addr, ar_cycle, now(), data))
+    return data, resp
+
+
+async def write_burst(dut, ops, log=None):
+    """Issue writes back to back."""
+    for addr, data in ops:
+        assert await write(dut, addr, data, log) == OKAY
+
+
+async def read_burst(dut, addrs, log=None):
+    """Issue reads back to back."""
+    for addr in addrs:
+        _, resp = await read(dut, addr, log=log)
+        assert resp == OKAY
+
+
+@cocotb.test()
+async def test_split_fsm_mixed_throughput(dut):
+    """Mixed write/read traffic against the same transactions issued serially"""
+    await setup_dut(dut)
+    rnd = random.Random(1)
+    count = 64
+    writes = [(rnd.choice(RW_REGS), rnd.getrandbits(32)) for _ in range(count)]
+    reads = [rnd.choice(RO_REGS + RW_REGS) for _ in range(count)]
+
+    await RisingEdge(dut.axi_aclk)
+    start = now()
+    await write_burst(dut, writes)
+    await read_burst(dut, reads)
+    serial = now() - start
+
+    await ClockCycles(dut.axi_aclk, 4)
+    start = now()
+    await Combine(cocotb.start_soon(write_burst(dut, writes)),
+                  cocotb.start_soon(read_burst(dut, reads)))
+    mixed = now() - start
+
+    dut._log.info(f"FSM={FSM}: {2 * count} transactions take {serial} cycles serially, "
+                  f"{mixed} cycles mixed ({mixed / (2 * count):.2f} cycles per transaction)")
+    if FSM in ('split', 'fast'):
+        assert mixed <= 0.75 * serial, \
+            f"Independent channels should overlap: {mixed} mixed vs {serial} serial cycles"
+
+
+@cocotb.test()
+async def test_split_fsm_same_cycle_order(dut):
+    """A read and a write of one register arriving together are ordered"""
+    await setup_dut(dut)
+    for addr in RW_REGS:
+        await RisingEdge(dut.axi_aclk)
+        assert await write(dut, addr, 0x11111111) == OKAY
+        await ClockCycles(dut.axi_aclk, 2)
+        result = {}
+
+        async def reader():
+            result['data'], _ = await read(dut, addr)
+
+        await Combine(cocotb.start_soon(write(dut, addr, 0x22222222)),
+                      cocotb.start_soon(reader()))
+        # split/fast: the read is ordered first; shared: IDLE serves the write first
+        expected = 0x11111111 if FSM in ('split', 'fast') else 0x22222222
+        assert result['data'] == expected, \
+            f"FSM={FSM}: 0x{addr:02X} read 0x{result['data']:08X}, expected 0x{expected:08X}"
+
+        await RisingEdge(dut.axi_aclk)
+        data, _ = await read(dut, addr)
+        assert data == 0x22222222, f"FSM={FSM}: write to 0x{addr:02X} lost"
+
+
+@cocotb.test()
+async def test_split_fsm_rdata_stable(dut):
+    """A write to a register does not change RDATA of a pending read of it"""
+    await setup_dut(dut)
+    addr = RW_REGS[0]
+    await RisingEdge(dut.axi_aclk)
+    assert await write(dut, addr, 0xAAAA5555) == OKAY
+    await RisingEdge(dut.axi_aclk)
+    write_log, read_log = [], []
+
+    async def late_write():
+        await ClockCycles(dut.axi_aclk, 3)
+        assert await write(dut, addr, 0x0F0F0F0F, write_log) == OKAY
+
+    await Combine(cocotb.start_soon(read(dut, addr, rready_delay=8, log=read_log)),
+                  cocotb.start_soon(late_write()))
+    _, _, r_cycle, data = read_log[0]
+    if FSM == 'split':
+        # The write waits for the read response
+        assert data == 0xAAAA5555
+        assert write_log[0][3] > r_cycle
+    elif FSM == 'fast':
+        # RDATA was loaded with the read address, before the write
+        assert data == 0xAAAA5555
+    await RisingEdge(dut.axi_aclk)
+    data, _ = await read(dut, addr)
+    assert data == 0x0F0F0F0F
+
+
+@cocotb.test()
+async def test_split_fsm_mixed_ordering(dut):
+    """Random mixed traffic on two registers: reads never see stale or future data"""
+    await setup_dut(dut)
+    rnd = random.Random(7)
+    targets = RW_REGS[:2]
+    write_log, read_log = [], []
+    # Start from known values instead of the reset defaults
+    await RisingEdge(dut.axi_aclk)
+    await write_burst(dut, [(addr, 0) for addr in targets])
+
+    async def writer():
+        for _ in range(100):
+            await ClockCycles(dut.axi_aclk, rnd.randint(1, 3))
+            await write(dut, rnd.choice(targets), rnd.getrandbits(32), write_log)
+
+    async def reader():
+        for _ in range(100):
+            await ClockCycles(dut.axi_aclk, rnd.randint(1, 3))
+            await read(dut, rnd.choice(targets), rready_delay=rnd.choice([0, 0, 2]), log=read_log)
+
+    await Combine(cocotb.start_soon(writer()), cocotb.start_soon(reader()))
+
+    for addr, ar_cycle, r_cycle, data in read_log:
+        history = [w for w in write_log if w[0] == addr]
+        # The last write answered before the read address, or any write
+        # answered later whose data was accepted before the read response
+        done = [w[1] for w in history if w[3] < ar_cycle]
+        allowed = {done[-1] if done else 0}
+        allowed.update(w[1] for w in history if w[3] >= ar_cycle and w[2] <= r_cycle)
+        assert data in allowed, \
+            f"FSM={FSM}: read of 0x{addr:02X} at cycle {ar_cycle} returned 0x{data:08X}"
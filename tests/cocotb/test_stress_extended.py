@@ -7,13 +7,24 @@ Verifies robustness under:
 - Random resets under load
 - Invalid address access storms
 - Address map walking speed
+- Back-to-back write, read and mixed throughput
+
+FSM (shared, split or fast) tells the throughput tests which state machine
+the DUT was generated with; run all three with:
+    make test_stress_fsm                     (VHDL, GHDL)
+    make -f Makefile.sv test_stress_fsm      (SystemVerilog, Verilator)
 """
 
+import os
+
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import RisingEdge, Timer, ClockCycles, Combine, Join
+from cocotb.triggers import RisingEdge, Timer, ClockCycles, Combine, Join, ReadOnly
+from cocotb.utils import get_sim_time
 import random
 
+FSM = os.environ.get('FSM', 'shared')
+
 # Reuse constants
 REG_STATUS = 0x00
 REG_CONFIG = 0x20
@@ -38,12 +49,16 @@ class AxiLiteTestHelper:
         w_done = False
         
         # Timeout loop for write address/data handshake
+        # (READY is sampled before the edge: FSM=fast raises it before VALID)
         for _ in range(500):
+            await ReadOnly()
+            aw_hs = not aw_done and dut.axi_awready.value == 1
+            w_hs = not w_done and dut.axi_wready.value == 1
             await RisingEdge(self.clk)
-            if dut.axi_awready.value == 1:
+            if aw_hs:
                 aw_done = True
                 dut.axi_awvalid.value = 0
-            if dut.axi_wready.value == 1:
+            if w_hs:
                 w_done = True
                 dut.axi_wvalid.value = 0
             
@@ -56,6 +71,7 @@ class AxiLiteTestHelper:
         # Timeout loop for write response
         resp_done = False
         for _ in range(500):
+            await ReadOnly()
             if dut.axi_bvalid.value == 1:
                 resp_done = True
                 break
@@ -78,10 +94,11 @@ class AxiLiteTestHelper:
         
         ar_done = False
         for _ in range(500):
-            if dut.axi_arready.value == 1:
-                ar_done = True
-                break
+            await ReadOnly()
+            ar_done = dut.axi_arready.value == 1
             await RisingEdge(self.clk)
+            if ar_done:
+                break
         
         if not ar_done:
              raise TimeoutError("Read address handshake timeout")
@@ -90,6 +107,7 @@ class AxiLiteTestHelper:
         
         r_done = False
         for _ in range(500):
+            await ReadOnly()
             if dut.axi_rvalid.value == 1:
                 r_done = True
                 break
@@ -247,3 +265,116 @@ async def test_stress_004_invalid_access_storm(dut):
         assert resp != 0, f"Expected error for invalid addr {addr:X}, got OKAY"
         
     dut._log.info("STRESS-004 PASSED: Invalid access storm handled correctly")
+
+def now():
+    """Current time in AXI clock cycles."""
+    return int(get_sim_time(units='ns')) // 10
+
+async def stream_writes(dut, ops):
+    """
+    Issue writes back to back: AWVALID/WVALID stay high and the next
+    address/data is presented in the cycle the previous one is accepted.
+    Returns once every write has been answered.
+    """
+    clk = dut.axi_aclk
+    aw = w = b = 0
+    dut.axi_awaddr.value, dut.axi_wdata.value = ops[0]
+    dut.axi_wstrb.value = 0xF
+    dut.axi_awvalid.value = 1
+    dut.axi_wvalid.value = 1
+    dut.axi_bready.value = 1
+    for _ in range(20 * len(ops)):
+        await ReadOnly()
+        aw_hs = aw < len(ops) and dut.axi_awready.value == 1
+        w_hs = w < len(ops) and dut.axi_wready.value == 1
+        if dut.axi_bvalid.value == 1:
+            assert int(dut.axi_bresp.value) == 0, f"Write {b} failed"
+            b += 1
+        await RisingEdge(clk)
+        if aw_hs:
+            aw += 1
+            if aw < len(ops):
+                dut.axi_awaddr.value = ops[aw][0]
+            else:
+                dut.axi_awvalid.value = 0
+        if w_hs:
+            w += 1
+            if w < len(ops):
+                dut.axi_wdata.value = ops[w][1]
+            else:
+                dut.axi_wvalid.value = 0
+        if b == len(ops):
+            break
+    else:
+        raise TimeoutError(f"Back-to-back writes stalled after {b} responses")
+    dut.axi_bready.value = 0
+
+async def stream_reads(dut, addrs):
+    """Issue reads back to back (ARVALID stays high); returns the read data."""
+    clk = dut.axi_aclk
+    ar = 0
+    data = []
+    dut.axi_araddr.value = addrs[0]
+    dut.axi_arvalid.value = 1
+    dut.axi_rready.value = 1
+    for _ in range(20 * len(addrs)):
+        await ReadOnly()
+        ar_hs = ar < len(addrs) and dut.axi_arready.value == 1
+        if dut.axi_rvalid.value == 1:
+            assert int(dut.axi_rresp.value) == 0, f"Read {len(data)} failed"
+            data.append(int(dut.axi_rdata.value))
+        await RisingEdge(clk)
+        if ar_hs:
+            ar += 1
+            if ar < len(addrs):
+                dut.axi_araddr.value = addrs[ar]
+            else:
+                dut.axi_arvalid.value = 0
+        if len(data) == len(addrs):
+            break
+    else:
+        raise TimeoutError(f"Back-to-back reads stalled after {len(data)} responses")
+    dut.axi_rready.value = 0
+    return data
+
+@cocotb.test()
+async def test_stress_005_back_to_back_throughput(dut):
+    """STRESS-005: Cycles per transaction of back-to-back writes, reads and mixed traffic"""
+    clk = await setup_dut(dut)
+    helper = AxiLiteTestHelper(dut)
+    count = 64
+    writes = [(REG_MODE, 0x1000 + i) for i in range(count)]
+    assert await helper.write(REG_CONFIG, 0xC0FFEE00) == 0
+
+    cycles = {}
+    await RisingEdge(clk)
+    start = now()
+    await stream_writes(dut, writes)
+    cycles['write'] = now() - start
+
+    await RisingEdge(clk)
+    start = now()
+    data = await stream_reads(dut, [REG_CONFIG, REG_MODE] * (count // 2))
+    cycles['read'] = now() - start
+    assert data == [0xC0FFEE00, writes[-1][1]] * (count // 2), "Back-to-back reads returned wrong data"
+
+    await RisingEdge(clk)
+    start = now()
+    reader = cocotb.start_soon(stream_reads(dut, [REG_CONFIG] * count))
+    await Combine(cocotb.start_soon(stream_writes(dut, writes)), reader)
+    cycles['mixed'] = now() - start
+    data = await reader
+    assert all(value == 0xC0FFEE00 for value in data), "Reads disturbed by concurrent writes"
+
+    for kind, total in cycles.items():
+        transactions = 2 * count if kind == 'mixed' else count
+        dut._log.info(f"FSM={FSM}: {transactions} back-to-back {kind} transactions in {total} cycles "
+                      f"({total / transactions:.2f} cycles per transaction)")
+    if FSM == 'fast':
+        # One write and one read per cycle, plus the response latency
+        for kind, total in cycles.items():
+            assert total <= count + 4, f"FSM=fast {kind} traffic took {total} cycles for {count} per channel"
+
+    data, _ = await helper.read(REG_MODE)
+    assert data == writes[-1][1], "Last back-to-back write lost"
+    dut._log.info("STRESS-005 PASSED: Back-to-back throughput measured")
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+test_address_decode.py - Case-Based Address Decode Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-043  DECODE attribute and one-hot select vectors per channel
+         → TestDecodeMap
+
+PERF-044  Single case decoder shared by valid flags, enables, read mux and strobes
+         → TestCaseDecodeOutput
+"""
+
+import io
+import os
+import re
+import sys
+import shutil
+import tempfile
+import subprocess
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl import AxionHDL
+from axion_hdl.address_decoder import DecodeSlot, build_decode_map, parse_decode_mode
+from axion_hdl.parser import VHDLParser
+from axion_hdl.systemverilog_parser import SystemVerilogParser
+
+
+VHDL_DECODE = """library ieee;
+use ieee.std_logic_1164.all;
+-- @axion_def BASE_ADDR=0x1000 {decode}
+entity dec is
+end entity;
+architecture rtl of dec is
+    signal ctrl   : std_logic_vector(31 downto 0); -- @axion RW W_STROBE
+    signal status : std_logic_vector(31 downto 0); -- @axion RO R_STROBE
+    signal key    : std_logic_vector(63 downto 0); -- @axion WO
+    signal cnt    : std_logic_vector(31 downto 0); -- @axion RO ADDR=0x40
+begin
+end architecture;
+"""
+
+SV_DECODE = """// @axion_def BASE_ADDR=0x2000 DECODE=case
+module dec_sv (input logic clk);
+    logic [31:0] a; // @axion RW W_STROBE
+    logic [31:0] b; // @axion RO R_STROBE
+    logic [63:0] k; // @axion WO
+endmodule
+"""
+
+
+def _regs(*specs):
+    return [{'signal_name': name, 'reg_name': name, 'address_int': addr,
+             'relative_address_int': addr, 'signal_type': sig, 'access_mode': access}
+            for name, addr, sig, access in specs]
+
+
+class TestDecodeMap(unittest.TestCase):
+    """Test cases for PERF-043"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _parse_vhdl(self, decode):
+        path = os.path.join(self.temp_dir, 'dec.vhd')
+        with open(path, 'w') as f:
+            f.write(VHDL_DECODE.format(decode=decode))
+        with redirect_stdout(io.StringIO()):
+            return VHDLParser()._parse_vhdl_file(path)
+
+    def test_perf_043_decode_modes(self):
+        self.assertEqual(parse_decode_mode('Case'), 'case')
+        self.assertEqual(parse_decode_mode('compare'), 'compare')
+        self.assertIsNone(parse_decode_mode(None))
+        with self.assertRaises(ValueError):
+            parse_decode_mode('tree')
+
+    def test_perf_043_select_vectors(self):
+        decode = build_decode_map(_regs(
+            ('wide', 0x10, '[63:0]', 'RW'),
+            ('ctrl', 0x00, '[31:0]', 'WO'),
+            ('stat', 0x04, '[7:0]', 'RO'),
+        ))
+        self.assertEqual(decode.write, [DecodeSlot(0x00, 'ctrl', 0), DecodeSlot(0x10, 'wide', 0),
+                                        DecodeSlot(0x14, 'wide', 1)])
+        self.assertEqual(decode.read, [DecodeSlot(0x04, 'stat', 0), DecodeSlot(0x10, 'wide', 0),
+                                       DecodeSlot(0x14, 'wide', 1)])
+        self.assertEqual(decode.write_index('wide', 1), 2)
+        self.assertEqual(decode.read_index('wide', 1), 2)
+        self.assertIsNone(decode.read_index('ctrl'))
+        # 0x14 needs five offset bits
+        self.assertEqual(decode.bits, 5)
+
+    def test_perf_043_decode_window(self):
+        self.assertEqual(build_decode_map(_regs(('r', 0, '[31:0]', 'RW'))).bits, 2)
+        # Registers without a relative address are placed from the base
+        regs = [{'reg_name': 'p', 'address_int': 0x1108, 'access_mode': 'RW', 'is_packed': True}]
+        self.assertEqual(build_decode_map(regs, 0x1000).write, [DecodeSlot(0x108, 'p', 0)])
+        with self.assertRaises(ValueError):
+            build_decode_map(_regs(('far', 0x80000000, '[31:0]', 'RW')))
+
+    def test_perf_043_shared_offsets(self):
+        decode = build_decode_map(_regs(('a', 0x8, '[31:0]', 'RO'), ('b', 0x8, '[31:0]', 'RO'),
+                                        ('c', 0xC, '[31:0]', 'RO')))
+        self.assertEqual(decode.choices(decode.read), [(0x8, [0, 1]), (0xC, [2])])
+
+    def test_perf_043_vhdl_attribute(self):
+        self.assertEqual(self._parse_vhdl('DECODE=case')['decode'], 'case')
+        self.assertNotIn('decode', self._parse_vhdl(''))
+        module = self._parse_vhdl('DECODE=tree')
+        self.assertNotIn('decode', module)
+        self.assertIn("Unknown DECODE 'tree'", module['parsing_errors'][0]['msg'])
+
+    def test_perf_043_systemverilog_attribute(self):
+        path = os.path.join(self.temp_dir, 'dec.sv')
+        with open(path, 'w') as f:
+            f.write(SV_DECODE)
+        with redirect_stdout(io.StringIO()):
+            module = SystemVerilogParser()._parse_sv_file(path)
+        self.assertEqual(module['decode'], 'case')
+
+
+class TestCaseDecodeOutput(unittest.TestCase):
+    """Test cases for PERF-044"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.out_dir = os.path.join(self.temp_dir, 'out')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _generate(self, name, content):
+        with open(os.path.join(self.temp_dir, name), 'w') as f:
+            f.write(content)
+        axion = AxionHDL(output_dir=self.out_dir)
+        with redirect_stdout(io.StringIO()):
+            axion.add_source(self.temp_dir)
+            axion.analyze()
+            self.assertTrue(axion.generate_vhdl())
+            self.assertTrue(axion.generate_systemverilog())
+
+    def _read(self, name):
+        with open(os.path.join(self.out_dir, name)) as f:
+            return f.read()
+
+    def test_perf_044_vhdl_single_case_per_channel(self):
+        self._generate('dec.vhd', VHDL_DECODE.format(decode='DECODE=case'))
+        vhdl = self._read('dec_axion_reg.vhd')
+        # The base is subtracted once per channel, never compared per register
+        self.assertEqual(vhdl.count('unsigned(BASE_ADDR)'), 2)
+        self.assertEqual(len(re.findall(r'case to_integer\(addr_offset', vhdl)), 2)
+        self.assertIn('constant ADDR_DEC_BITS : natural := 7;', vhdl)
+        self.assertIn("when 16#40# =>\n                    ar_sel(2) <= '1';  -- cnt", vhdl)
+        # Valid flags, write enables, read mux and strobes use the select vectors
+        self.assertIn("wr_addr_valid_n <= '1' when aw_sel = WR_SEL_NONE else '0';", vhdl)
+        self.assertIn("rd_addr_valid_n <= '1' when ar_sel = RD_SEL_NONE else '0';", vhdl)
+        self.assertIn("if wr_sel(2) = '1' then", vhdl)
+        self.assertIn("if rd_sel(1) = '1' then", vhdl)
+        self.assertIn("rd_sel(1) = '1') else '0';", vhdl)
+        self.assertIn("wr_sel(0) = '1') else '0';", vhdl)
+        self.assertEqual(vhdl.count('wr_sel <= aw_sel;'), 3)
+        self.assertEqual(vhdl.count('rd_sel <= ar_sel;'), 1)
+
+    def test_perf_044_systemverilog_unique_case(self):
+        self._generate('dec.sv', SV_DECODE)
+        sv = self._read('dec_sv_axion_reg.sv')
+        self.assertEqual(sv.count('unique case'), 2)
+        self.assertNotIn('localparam [ADDR_WIDTH-1:0] ADDR_', sv)
+        self.assertIn("aw_offset = axi_awaddr - BASE_ADDR;", sv)
+        self.assertIn("if (wr_sel[2]) begin", sv)
+        self.assertIn("if (rd_sel[0]) begin", sv)
+        self.assertIn("b_rd_strobe", sv)
+
+    def test_perf_044_default_compare_unchanged(self):
+        self._generate('dec.vhd', VHDL_DECODE.format(decode=''))
+        vhdl = self._read('dec_axion_reg.vhd')
+        self.assertNotIn('aw_sel', vhdl)
+        self.assertIn('unsigned(axi_awaddr) = unsigned(BASE_ADDR) + 0', vhdl)
+        sv = self._read('dec_axion_reg.sv')
+        self.assertNotIn('unique case', sv)
+        self.assertIn('ADDR_CTRL', sv)
+
+    def test_perf_044_cli_decode_override(self):
+        with open(os.path.join(self.temp_dir, 'dec.vhd'), 'w') as f:
+            f.write(VHDL_DECODE.format(decode=''))
+        cmd = [sys.executable, '-m', 'axion_hdl.cli', '-s', self.temp_dir, '-o', self.out_dir,
+               '--vhdl', '--decode', 'case']
+        result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(project_root))
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        self.assertIn('rd_sel <= ar_sel;', self._read('dec_axion_reg.vhd'))
+
+        cmd[-1] = 'tree'
+        result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(project_root))
+        self.assertNotEqual(result.returncode, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+test_address_manager.py - Interval-Based Address Allocation Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-031  Interval allocator with owner-reporting conflict checks
+         → TestIntervalAllocation
+
+PERF-032  Allocation cost independent of register width (50,000-register benchmark)
+         → TestAllocationBenchmark
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+import unittest
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl.address_manager import AddressManager, AddressConflictError
+
+
+NUM_REGS = 50000
+WIDTHS = [1, 8, 32, 32, 32, 64, 100, 256, 1024, 8192]
+
+
+def _allocate_mixed(mgr, num_regs, seed=0):
+    """Allocate a mix of auto and manual registers; manual ones go past the counter."""
+    rnd = random.Random(seed)
+    for i in range(num_regs):
+        width = rnd.choice(WIDTHS)
+        if i % 10 == 9:
+            # Manual register a little ahead of the auto counter leaves holes behind
+            manual = mgr.get_next_available_address() + 4 * rnd.randrange(1, 64)
+            try:
+                mgr.allocate_address(manual, width, f'manual_{i}')
+            except AddressConflictError:
+                pass
+        else:
+            mgr.allocate_address(signal_width=width, signal_name=f'reg_{i}')
+
+
+class TestIntervalAllocation(unittest.TestCase):
+    """Test cases for PERF-031"""
+
+    def test_perf_031_conflict_reports_owner(self):
+        mgr = AddressManager(module_name='top')
+        mgr.allocate_address(0x10, 128, 'key')   # 0x10..0x1F
+        with self.assertRaises(AddressConflictError) as ctx:
+            mgr.allocate_address(0x18, 32, 'late')
+        self.assertEqual(ctx.exception.address, 0x18)
+        self.assertEqual(ctx.exception.existing_signal, 'key')
+        self.assertEqual(ctx.exception.new_signal, 'late')
+        # A wide register starting below an owner conflicts at the owner's start
+        with self.assertRaises(AddressConflictError) as ctx:
+            mgr.allocate_address(0x08, 96, 'wide')
+        self.assertEqual((ctx.exception.address, ctx.exception.existing_signal), (0x10, 'key'))
+        self.assertEqual(mgr.get_owner(0x1C), 'key')
+        self.assertIsNone(mgr.get_owner(0x20))
+
+    def test_perf_031_first_fit_auto_placement(self):
+        mgr = AddressManager()
+        mgr.allocate_address(0x08, 32, 'fixed_a')
+        mgr.allocate_address(0x14, 32, 'fixed_b')
+        mgr.auto_counter = 0
+        self.assertEqual(mgr.allocate_address(signal_width=64, signal_name='pair'), 0x00)
+        # 0x0C..0x13 is the first 8-byte hole after the counter
+        self.assertEqual(mgr.allocate_address(signal_width=64, signal_name='pair2'), 0x0C)
+        self.assertEqual(mgr.allocate_address(signal_width=96, signal_name='triple'), 0x18)
+        self.assertEqual(mgr.get_next_available_address(), 0x24)
+
+    def test_perf_031_slot_views_unchanged(self):
+        mgr = AddressManager()
+        mgr.allocate_address(signal_width=64, signal_name='wide')
+        mgr.allocate_address(0x10, 1, 'flag')
+        self.assertEqual(mgr.get_address_map(), [0x00, 0x04, 0x10])
+        self.assertEqual(mgr.assigned_addresses, {0x00, 0x04, 0x10})
+        self.assertEqual(mgr.address_to_signal, {0x00: 'wide', 0x04: 'wide', 0x10: 'flag'})
+        mgr.reset()
+        self.assertEqual(mgr.get_address_map(), [])
+        self.assertEqual(mgr.allocate_address(signal_name='again'), 0x00)
+
+
+class TestAllocationBenchmark(unittest.TestCase):
+    """Test cases for PERF-032"""
+
+    def _measure(self, num_regs):
+        mgr = AddressManager(module_name='bench')
+        start = time.perf_counter()
+        _allocate_mixed(mgr, num_regs)
+        return time.perf_counter() - start, mgr
+
+    def test_perf_032_fifty_thousand_mixed_width_registers(self):
+        small, _ = min((self._measure(NUM_REGS // 10) for _ in range(3)), key=lambda r: r[0])
+        large, mgr = self._measure(NUM_REGS)
+        slots = len(mgr.get_address_map())
+        print(f"\n  {NUM_REGS} registers / {slots} slots: {large * 1000:.1f} ms "
+              f"({NUM_REGS // 10} registers: {small * 1000:.1f} ms)")
+        # 10x the registers: per-slot probing of wide registers would be far slower
+        self.assertLess(large, small * 25)
+        self.assertLess(large, 10.0)
+
+    def test_perf_032_memory_per_register_not_per_slot(self):
+        mgr = AddressManager()
+        tracemalloc.start()
+        try:
+            for i in range(1000):
+                mgr.allocate_address(signal_width=8192, signal_name=f'table_{i}')
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        # 256,000 slots: a per-slot set and dict would need well over 20 MB
+        self.assertLess(peak, 1000 * 1000)
+        self.assertEqual(mgr.get_owner(999 * 1024 + 1020), 'table_999')
+
+
+if __name__ == '__main__':
+    unittest.main()
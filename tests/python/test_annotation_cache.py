@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+test_annotation_cache.py - Memoized Annotation Attribute Parsing Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-027  Bounded LRU cache of parsed attribute strings with hit counters
+         → TestAttributeCache
+
+PERF-028  Single-regex attribute tokenizer
+         → TestAttributeTokenizer
+"""
+
+import io
+import os
+import pickle
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl.annotation_parser import (
+    AnnotationParser, FrozenDict, ATTRIBUTE_CACHE_SIZE, _parse_attributes_cached
+)
+from axion_hdl.parser import VHDLParser
+
+
+ATTRS = 'RW W_STROBE DESC="Mode select" ENUM="0:IDLE,1:RUN"'
+
+
+class TestAttributeCache(unittest.TestCase):
+    """Test cases for PERF-027"""
+
+    def setUp(self):
+        AnnotationParser.cache_clear()
+        self.parser = AnnotationParser()
+
+    def tearDown(self):
+        AnnotationParser.cache_clear()
+
+    def test_perf_027_repeated_strings_hit_cache(self):
+        first = self.parser.parse_attributes(ATTRS)
+        for _ in range(9):
+            self.assertIs(AnnotationParser().parse_attributes(ATTRS), first)
+        info = AnnotationParser.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (9, 1, 1))
+        self.assertAlmostEqual(info.hit_rate, 0.9)
+        self.assertEqual(info.maxsize, ATTRIBUTE_CACHE_SIZE)
+
+    def test_perf_027_results_immutable(self):
+        attrs = self.parser.parse_attributes(ATTRS)
+        self.assertIsInstance(attrs, dict)
+        with self.assertRaises(TypeError):
+            attrs['access_mode'] = 'RO'
+        with self.assertRaises(TypeError):
+            attrs['enum_values'][2] = 'STOP'
+        with self.assertRaises(TypeError):
+            attrs.update(width=8)
+        # Copies are ordinary dictionaries
+        copy = dict(attrs)
+        copy['access_mode'] = 'RO'
+        self.assertEqual(self.parser.parse_attributes(ATTRS)['access_mode'], 'RW')
+        self.assertEqual(pickle.loads(pickle.dumps(attrs)), attrs)
+        self.assertIsInstance(pickle.loads(pickle.dumps(attrs)), FrozenDict)
+
+    def test_perf_027_cache_bounded(self):
+        for i in range(ATTRIBUTE_CACHE_SIZE + 100):
+            self.parser.parse_attributes(f'RW ADDR={i}')
+        self.assertEqual(AnnotationParser.cache_info().currsize, ATTRIBUTE_CACHE_SIZE)
+
+    def test_perf_027_registers_get_own_enum_dicts(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, 'enum_mod.vhd')
+            lines = '\n'.join(
+                f'    signal state_{i} : std_logic_vector(1 downto 0); -- @axion {ATTRS}'
+                for i in range(3)
+            )
+            with open(path, 'w') as f:
+                f.write(f"entity enum_mod is\nend entity;\narchitecture rtl of enum_mod is\n{lines}\n"
+                        "begin\nend architecture;\n")
+            with redirect_stdout(io.StringIO()):
+                module = VHDLParser()._parse_vhdl_file(path)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        enums = [reg['enum_values'] for reg in module['registers']]
+        self.assertEqual(enums, [{0: 'IDLE', 1: 'RUN'}] * 3)
+        self.assertTrue(all(type(e) is dict for e in enums))
+        self.assertIsNot(enums[0], enums[1])
+        self.assertEqual(AnnotationParser.cache_info().hits, 2)
+
+    def test_perf_027_repetitive_source_cost(self):
+        strings = [f'RW W_STROBE ADDR=0x{i * 4:X} DESC="Register {i}"' for i in range(50)]
+        uncached = _parse_attributes_cached.__wrapped__
+
+        start = time.perf_counter()
+        for _ in range(40):
+            for s in strings:
+                uncached(s)
+        parse_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(40):
+            for s in strings:
+                self.parser.parse_attributes(s)
+        cached_time = time.perf_counter() - start
+
+        self.assertGreater(AnnotationParser.cache_info().hit_rate, 0.95)
+        self.assertLess(cached_time, parse_time / 5)
+
+
+class TestAttributeTokenizer(unittest.TestCase):
+    """Test cases for PERF-028"""
+
+    CASES = [
+        ('RW ADDR=0x10 W_STROBE', {'access_mode': 'RW', 'address': 16, 'write_strobe': True}),
+        ('ro r_strobe cdc_en', {'access_mode': 'RO', 'read_strobe': True, 'cdc_enabled': True}),
+        ('DESC="Two words" RW', {'description': 'Two words', 'access_mode': 'RW'}),
+        ("DESC='single' DESC=other", {'description': 'single'}),
+        ('ENUM="0:A, 0x2:B, bad"', {'enum_values': {0: 'A', 2: 'B'}}),
+        ('ENUM="bad"', {'enum_values': None}),
+        ('DEFAULT=true BIT_OFFSET=3 REG_NAME=ctl',
+         {'default_value': True, 'bit_offset': 3, 'reg_name': 'ctl'}),
+        # Text around a quoted pair joins into one token
+        ('W_STRO DESC="x"BE', {'description': 'x', 'w_stro': True, 'be': True}),
+        ('W_DESC="x"STROBE', {'w_desc': 'x', 'strobe': True}),
+        ('W-DESC="x"STROBE', {'description': 'x', 'w-strobe': True}),
+        ('a=b=c x=', {'a': 'b=c', 'x': ''}),
+        ('', {}),
+    ]
+
+    def test_perf_028_tokenizer_cases(self):
+        parser = AnnotationParser()
+        for attrs_str, expected in self.CASES:
+            with self.subTest(attrs=attrs_str):
+                result = _parse_attributes_cached.__wrapped__(attrs_str)
+                self.assertEqual(result, expected)
+                self.assertEqual(parser.parse_attributes(attrs_str), expected)
+
+    def test_perf_028_single_precompiled_pattern(self):
+        import re
+        import axion_hdl.annotation_parser as module
+        patterns = [v for v in vars(module).values() if isinstance(v, type(re.compile('')))]
+        self.assertEqual(len(patterns), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
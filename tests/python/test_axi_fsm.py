@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+test_axi_fsm.py - AXI4-Lite State Machine Mode Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-047  FSM attribute selecting the shared or split AXI state machine
+         → TestFsmMode
+
+PERF-048  Independent write and read state machines with same-address ordering
+         → TestSplitFsmOutput
+
+PERF-049  FSM=fast channels without a state machine
+         → TestFastFsmOutput
+
+PERF-050  One transaction per channel and cycle with registered outputs
+         → TestFastFsmOutput
+"""
+
+import io
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl import AxionHDL
+from axion_hdl.axi_fsm import parse_fsm_mode
+from axion_hdl.parser import VHDLParser
+from axion_hdl.systemverilog_parser import SystemVerilogParser
+
+
+VHDL_FSM = """library ieee;
+use ieee.std_logic_1164.all;
+-- @axion_def BASE_ADDR=0x1000 {attrs}
+entity chan is
+end entity;
+architecture rtl of chan is
+    signal ctrl   : std_logic_vector(31 downto 0); -- @axion RW W_STROBE R_STROBE
+    signal status : std_logic_vector(31 downto 0); -- @axion RO
+begin
+end architecture;
+"""
+
+SV_FSM = """// @axion_def BASE_ADDR=0x2000 FSM=split {attrs}
+module chan_sv (input logic clk);
+    logic [31:0] a; // @axion RW R_STROBE
+    logic [31:0] b; // @axion RO
+endmodule
+"""
+
+
+class TestFsmMode(unittest.TestCase):
+    """Test cases for PERF-047"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_perf_047_modes(self):
+        self.assertEqual(parse_fsm_mode('Split'), 'split')
+        self.assertEqual(parse_fsm_mode('shared'), 'shared')
+        self.assertEqual(parse_fsm_mode('FAST'), 'fast')
+        self.assertIsNone(parse_fsm_mode(None))
+        with self.assertRaises(ValueError):
+            parse_fsm_mode('dual')
+
+    def test_perf_047_attribute(self):
+        path = os.path.join(self.temp_dir, 'chan.vhd')
+        for attrs, expected in (('FSM=split', 'split'), ('FSM=SHARED', 'shared'), ('', None)):
+            with open(path, 'w') as f:
+                f.write(VHDL_FSM.format(attrs=attrs))
+            with redirect_stdout(io.StringIO()):
+                module = VHDLParser()._parse_vhdl_file(path)
+            self.assertEqual(module.get('fsm'), expected)
+
+        with open(path, 'w') as f:
+            f.write(VHDL_FSM.format(attrs='FSM=dual'))
+        with redirect_stdout(io.StringIO()):
+            module = VHDLParser()._parse_vhdl_file(path)
+        self.assertIn("Unknown FSM 'dual'", module['parsing_errors'][0]['msg'])
+
+        sv_path = os.path.join(self.temp_dir, 'chan.sv')
+        with open(sv_path, 'w') as f:
+            f.write(SV_FSM.format(attrs=''))
+        with redirect_stdout(io.StringIO()):
+            module = SystemVerilogParser()._parse_sv_file(sv_path)
+        self.assertEqual(module['fsm'], 'split')
+
+
+class TestSplitFsmOutput(unittest.TestCase):
+    """Test cases for PERF-048"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.out_dir = os.path.join(self.temp_dir, 'out')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _generate(self, name, content):
+        with open(os.path.join(self.temp_dir, name), 'w') as f:
+            f.write(content)
+        axion = AxionHDL(output_dir=self.out_dir)
+        with redirect_stdout(io.StringIO()):
+            axion.add_source(self.temp_dir)
+            axion.analyze()
+            self.assertTrue(axion.generate_vhdl())
+            self.assertTrue(axion.generate_systemverilog())
+
+    def _read(self, name):
+        with open(os.path.join(self.out_dir, name)) as f:
+            return f.read()
+
+    def test_perf_048_vhdl_split(self):
+        self._generate('chan.vhd', VHDL_FSM.format(attrs='FSM=split RD_PIPE=2'))
+        vhdl = self._read('chan_axion_reg.vhd')
+        self.assertNotIn('axi_state', vhdl)
+        self.assertIn("type wr_state_type is (WR_IDLE, WR_WAIT_ADDR, WR_WAIT_DATA, WR_DO_WRITE, WR_RESP);", vhdl)
+        self.assertIn("type rd_state_type is (RD_IDLE, RD_ADDR, RD_DATA);", vhdl)
+        self.assertEqual(vhdl.count("process(axi_aclk)"), 4)  # write, read, registers, read mux
+        # Same-address ordering
+        self.assertIn("wr_hold <= '1' when rd_state /= RD_IDLE and rd_addr_reg = wr_addr_reg else '0';", vhdl)
+        self.assertIn("rd_hold <= '1' when wr_state = WR_DO_WRITE and axi_araddr = wr_addr_reg else '0';", vhdl)
+        self.assertIn("if axi_arvalid = '1' and rd_hold = '0' then", vhdl)
+        self.assertIn("                        if wr_hold = '0' then\n"
+                      "                            do_reg_write <= '1';", vhdl)
+        # Strobes follow the channel that owns them; RD_PIPE waits in RD_ADDR
+        self.assertIn("ctrl_wr_strobe <= '1' when (wr_state = WR_DO_WRITE and wr_hold = '0' and", vhdl)
+        self.assertIn("ctrl_rd_strobe <= '1' when (rd_state = RD_DATA and axi_rready = '1' and", vhdl)
+        self.assertIn("rd_state <= RD_DATA;", vhdl)
+        self.assertIn("rd_pipe_cnt <= rd_pipe_cnt + 1;", vhdl)
+
+    def test_perf_048_systemverilog_split(self):
+        self._generate('chan.sv', SV_FSM.format(attrs='DECODE=case'))
+        sv = self._read('chan_sv_axion_reg.sv')
+        self.assertNotIn('axi_state_t', sv)
+        self.assertIn("} wr_state_t;", sv)
+        self.assertIn("} rd_state_t;", sv)
+        self.assertIn("assign wr_hold = rd_state == READ_DATA && read_addr == write_addr;", sv)
+        self.assertIn("assign axi_wready  = (wr_state == WRITE_DATA) && !wr_hold;", sv)
+        self.assertIn("if (wr_state == WRITE_DATA && axi_wvalid && !wr_hold) begin", sv)
+        # DECODE=case keeps the addresses for the ordering check
+        self.assertIn("                wr_sel <= aw_sel;\n                write_addr <= axi_awaddr;", sv)
+        self.assertIn("assign a_rd_strobe = (rd_state == READ_DATA && rd_sel[0]);", sv)
+
+    def test_perf_048_default_shared(self):
+        self._generate('chan.vhd', VHDL_FSM.format(attrs=''))
+        vhdl = self._read('chan_axion_reg.vhd')
+        self.assertIn("signal axi_state : axi_state_type;", vhdl)
+        self.assertNotIn('wr_hold', vhdl)
+        sv = self._read('chan_axion_reg.sv')
+        self.assertIn("axi_state_t state, next_state;", sv)
+        self.assertNotIn('wr_hold', sv)
+
+    def test_perf_048_cli_fsm(self):
+        with open(os.path.join(self.temp_dir, 'chan.vhd'), 'w') as f:
+            f.write(VHDL_FSM.format(attrs=''))
+        cmd = [sys.executable, '-m', 'axion_hdl.cli', '-s', self.temp_dir, '-o', self.out_dir,
+               '--vhdl', '--fsm', 'split']
+        result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(project_root))
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        self.assertIn('signal rd_state : rd_state_type;', self._read('chan_axion_reg.vhd'))
+
+        cmd[-1] = 'dual'
+        result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(project_root))
+        self.assertNotEqual(result.returncode, 0)
+
+
+class TestFastFsmOutput(unittest.TestCase):
+    """Test cases for PERF-049 and PERF-050"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.out_dir = os.path.join(self.temp_dir, 'out')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _generate(self, name, content):
+        with open(os.path.join(self.temp_dir, name), 'w') as f:
+            f.write(content)
+        axion = AxionHDL(output_dir=self.out_dir)
+        with redirect_stdout(io.StringIO()):
+            axion.add_source(self.temp_dir)
+            axion.analyze()
+            self.assertTrue(axion.generate_vhdl())
+            self.assertTrue(axion.generate_systemverilog())
+
+    def _read(self, name):
+        with open(os.path.join(self.out_dir, name)) as f:
+            return f.read()
+
+    def test_perf_049_vhdl_fast(self):
+        self._generate('chan.vhd', VHDL_FSM.format(attrs='FSM=fast RD_PIPE=2'))
+        vhdl = self._read('chan_axion_reg.vhd')
+        for state in ('axi_state', 'wr_state', 'rd_state', 'rd_pipe'):
+            self.assertNotIn(state, vhdl)
+        # Registered READY, held beats feed the register write logic
+        self.assertIn("axi_awready <= aw_ready;", vhdl)
+        self.assertIn("do_reg_write <= (aw_held or (axi_awvalid and aw_ready)) and", vhdl)
+        self.assertIn("wr_addr_reg <= aw_hold_addr when aw_held = '1' else axi_awaddr;", vhdl)
+        self.assertIn("rd_load <= (ar_held or (axi_arvalid and ar_ready)) and (not r_valid or axi_rready);", vhdl)
+        self.assertIn("                    aw_hold_addr <= axi_awaddr;", vhdl)
+        # RDATA is loaded once per read, not driven from the mux
+        self.assertIn("                    axi_rdata <= rd_data_reg;", vhdl)
+        self.assertNotIn("    axi_rdata <= rd_data_reg;\n", vhdl.replace("                    axi_rdata", ""))
+        self.assertIn("ctrl_wr_strobe <= '1' when (do_reg_write = '1' and", vhdl)
+        self.assertIn("ctrl_rd_strobe <= '1' when (rd_load = '1' and", vhdl)
+
+    def test_perf_050_systemverilog_fast(self):
+        self._generate('chan.sv', SV_FSM.replace('FSM=split', 'FSM=fast').format(attrs='DECODE=case'))
+        sv = self._read('chan_sv_axion_reg.sv')
+        self.assertNotIn('state_t', sv)
+        self.assertIn("assign wr_commit = (aw_held || (axi_awvalid && aw_ready)) &&", sv)
+        self.assertIn("assign rd_sel = ar_held ? ar_hold_sel : ar_sel;", sv)
+        self.assertIn("assign axi_arready = ar_ready;", sv)
+        self.assertIn("assign axi_rdata   = rdata_out;", sv)
+        self.assertIn("                rdata_out <= rdata_reg;", sv)
+        self.assertIn("if (wr_commit) begin", sv)
+        self.assertIn("a_reg <= write_data;", sv)
+        self.assertIn("assign a_rd_strobe = (rd_load && rd_sel[0]);", sv)
+
+    def test_perf_050_cli_fast(self):
+        with open(os.path.join(self.temp_dir, 'chan.vhd'), 'w') as f:
+            f.write(VHDL_FSM.format(attrs=''))
+        cmd = [sys.executable, '-m', 'axion_hdl.cli', '-s', self.temp_dir, '-o', self.out_dir,
+               '--vhdl', '--fsm', 'fast']
+        result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(project_root))
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        self.assertIn("signal rd_load  : std_logic;", self._read('chan_axion_reg.vhd'))
+
+    def test_perf_049_read_pipeline_warning(self):
+        with open(os.path.join(self.temp_dir, 'chan.vhd'), 'w') as f:
+            f.write(VHDL_FSM.format(attrs='FSM=fast RD_PIPE=2'))
+        axion = AxionHDL(output_dir=self.out_dir)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            axion.add_source(self.temp_dir)
+            axion.analyze()
+            self.assertTrue(axion.generate_vhdl())
+            self.assertTrue(axion.generate_systemverilog())
+        warning = ("Warning: Module 'chan': RD_PIPE=2 (--read-pipeline) has no effect with "
+                   "FSM=fast (--fsm fast); the read data mux stays combinational")
+        self.assertEqual(out.getvalue().count(warning), 1)
+
+        # The combination may come from the command line as well
+        with open(os.path.join(self.temp_dir, 'chan.vhd'), 'w') as f:
+            f.write(VHDL_FSM.format(attrs='RD_PIPE=3'))
+        cmd = [sys.executable, '-m', 'axion_hdl.cli', '-s', self.temp_dir, '-o', self.out_dir,
+               '--vhdl', '--fsm', 'fast']
+        result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(project_root))
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        self.assertIn("RD_PIPE=3 (--read-pipeline) has no effect with FSM=fast", result.stdout)
+
+        cmd[-1] = 'split'
+        result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(project_root))
+        self.assertNotIn("has no effect", result.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+test_bit_field_masks.py - Bitmask Field Occupancy Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-035  Occupancy bitmask per packed register with first-fit auto-packing
+         → TestOccupancyMask
+
+PERF-036  Subregister overlap rule without pairwise comparison of clean registers
+         → TestOverlapRuleMasks
+"""
+
+import io
+import os
+import sys
+import time
+import random
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl.bit_field_manager import (
+    BitFieldManager, BitOverlapError, bit_mask, occupancy_masks, first_fit
+)
+from axion_hdl.rule_checker import RuleChecker
+from axion_hdl.parser import VHDLParser
+from axion_hdl.yaml_input_parser import YAMLInputParser
+
+
+class TestOccupancyMask(unittest.TestCase):
+    """Test cases for PERF-035"""
+
+    def setUp(self):
+        self.mgr = BitFieldManager()
+
+    def _add(self, name, width, **kwargs):
+        return self.mgr.add_field('ctrl', 0x10, name, width, 'RW', f'[{width - 1}:0]', **kwargs)
+
+    def test_perf_035_mask_tracks_fields(self):
+        self._add('a', 4, bit_offset=0)
+        self._add('b', 8, bit_offset=24)
+        self.assertEqual(self.mgr.get_register('ctrl').occupancy, 0xFF00000F)
+        with self.assertRaises(BitOverlapError) as ctx:
+            self._add('c', 4, bit_offset=26)
+        self.assertEqual(ctx.exception.field1.name, 'b')
+        self.assertEqual(ctx.exception.overlap_bits, (26, 29))
+        # Overlaps accepted on request still mark their bits
+        self._add('d', 2, bit_offset=3, allow_overlap=True)
+        self.assertEqual(self.mgr.get_register('ctrl').occupancy, 0xFF00001F)
+
+    def test_perf_035_auto_offsets(self):
+        # Appended after the highest field while there is room
+        self.assertEqual(self._add('a', 3).bit_low, 0)
+        self.assertEqual(self._add('b', 4, align=8).bit_low, 8)
+        self.assertEqual(self._add('c', 8, bit_offset=24).bit_low, 24)
+        # No room above the highest field: first free gap below
+        self.assertEqual(self._add('d', 5).bit_low, 3)
+        self.assertEqual(self._add('e', 4, align=4).bit_low, 12)
+        self.assertEqual(self._add('f', 1).bit_low, 16)
+        with self.assertRaises(ValueError):
+            self._add('g', 8)
+        with self.assertRaises(ValueError):
+            self._add('h', 1, bit_offset=-1)
+
+    def test_perf_035_helpers(self):
+        self.assertEqual(bit_mask(4, 7), 0xF0)
+        self.assertEqual(occupancy_masks([0x0F, 0xF0, 0x18]), (0xFF, 0x18))
+        self.assertEqual(first_fit(0x0F, 4), 4)
+        self.assertEqual(first_fit(0x0F, 4, align=8), 8)
+        self.assertIsNone(first_fit(0xFFFFFFFF, 1))
+
+    def test_perf_035_annotations_and_data_files(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            vhd = os.path.join(temp_dir, 'align.vhd')
+            with open(vhd, 'w') as f:
+                f.write("entity align is\nend entity;\narchitecture rtl of align is\n"
+                        "    signal flag  : std_logic; -- @axion RW REG_NAME=ctrl\n"
+                        "    signal count : std_logic_vector(3 downto 0); -- @axion RW REG_NAME=ctrl BIT_ALIGN=8\n"
+                        "begin\nend architecture;\n")
+            yml = os.path.join(temp_dir, 'align.yaml')
+            with open(yml, 'w') as f:
+                f.write("module: align_yaml\nregisters:\n  - name: ctrl\n    fields:\n"
+                        "      - {name: flag, width: 1}\n"
+                        "      - {name: count, width: 4, bit_align: 8}\n")
+            with redirect_stdout(io.StringIO()):
+                vhdl_module = VHDLParser()._parse_vhdl_file(vhd)
+                yaml_module = YAMLInputParser().parse_file(yml)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        for module in (vhdl_module, yaml_module):
+            fields = {f['name']: f['bit_low'] for f in module['packed_registers'][0]['fields']}
+            self.assertEqual(fields, {'flag': 0, 'count': 8})
+
+
+def _packed_modules(num_regs, fields_per_reg, overlap_every=0):
+    registers = []
+    for r in range(num_regs):
+        fields = []
+        for i in range(fields_per_reg):
+            width = 32 // fields_per_reg
+            low = i * width
+            if overlap_every and r % overlap_every == 0 and i == fields_per_reg - 1:
+                low -= 1
+            fields.append({'name': f'f{i}', 'bit_low': low, 'bit_high': low + width - 1})
+        random.Random(r).shuffle(fields)
+        registers.append({'reg_name': f'reg{r}', 'fields': fields})
+    return [{'name': 'top', 'registers': registers}]
+
+
+def _pairwise_messages(modules):
+    """Reference: the former pairwise comparison of every field pair."""
+    messages = []
+    for module in modules:
+        for reg in module['registers']:
+            fields = sorted(reg['fields'], key=lambda f: f.get('bit_low', 0))
+            for i, f1 in enumerate(fields):
+                for f2 in fields[i + 1:]:
+                    s1, e1, s2, e2 = f1['bit_low'], f1['bit_high'], f2['bit_low'], f2['bit_high']
+                    if max(s1, s2) <= min(e1, e2):
+                        messages.append(f"In register '{reg['reg_name']}': Field '{f1['name']}' "
+                                        f"[{e1}:{s1}] overlaps with '{f2['name']}' [{e2}:{s2}]")
+    return messages
+
+
+class TestOverlapRuleMasks(unittest.TestCase):
+    """Test cases for PERF-036"""
+
+    def _messages(self, modules):
+        checker = RuleChecker()
+        checker.check_subregister_overlaps(modules)
+        return [e['msg'] for e in checker.errors]
+
+    def test_perf_036_same_messages_as_pairwise(self):
+        for modules in (_packed_modules(50, 8, overlap_every=3),
+                        _packed_modules(20, 32, overlap_every=2),
+                        [{'name': 'm', 'registers': [{'reg_name': 'odd', 'fields': [
+                            {'name': 'neg', 'bit_low': -2, 'bit_high': 1},
+                            {'name': 'a', 'bit_low': 0, 'bit_high': 3},
+                            {'name': 'inv', 'bit_low': 5, 'bit_high': 4},
+                            {'name': 'b', 'bit_low': 2, 'bit_high': 2}]}]}]):
+            self.assertEqual(self._messages(modules), _pairwise_messages(modules))
+
+    def test_perf_036_clean_registers_skip_pairwise(self):
+        modules = _packed_modules(2000, 32)
+        checker = RuleChecker()
+        start = time.perf_counter()
+        checker.check_subregister_overlaps(modules)
+        masked = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _pairwise_messages(modules)
+        pairwise = time.perf_counter() - start
+
+        self.assertEqual(checker.errors, [])
+        # 32 single-bit fields: 496 pairs per register against one pass of masks
+        self.assertLess(masked, pairwise / 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
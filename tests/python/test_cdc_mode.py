@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+test_cdc_mode.py - Clock Domain Crossing Mode Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-051  CDC_MODE attribute selecting per-bit synchronizers or a handshake
+         → TestCdcMode
+
+PERF-052  One req/ack handshake per direction with coherent register transfers
+         → TestCdcHandshakeOutput
+"""
+
+import io
+import os
+import re
+import sys
+import shutil
+import tempfile
+import subprocess
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl import AxionHDL
+from axion_hdl.cdc_mode import parse_cdc_mode
+from axion_hdl.parser import VHDLParser
+from axion_hdl.systemverilog_parser import SystemVerilogParser
+
+
+VHDL_CDC = """library ieee;
+use ieee.std_logic_1164.all;
+-- @axion_def BASE_ADDR=0x1000 CDC_EN CDC_STAGE=3 {attrs}
+entity xing is
+end entity;
+architecture rtl of xing is
+    signal status : std_logic_vector(31 downto 0); -- @axion RO
+    signal count  : std_logic_vector(63 downto 0); -- @axion RO
+    signal ctrl   : std_logic_vector(31 downto 0); -- @axion RW W_STROBE
+    signal level  : std_logic_vector(7 downto 0);  -- @axion WO
+begin
+end architecture;
+"""
+
+VHDL_CDC_ONE_RW = """library ieee;
+use ieee.std_logic_1164.all;
+-- @axion_def BASE_ADDR=0x1000 CDC_EN CDC_MODE=handshake {attrs}
+entity one_rw is
+end entity;
+architecture rtl of one_rw is
+    signal ctrl : std_logic_vector(31 downto 0); -- @axion RW
+begin
+end architecture;
+"""
+
+SV_CDC = """// @axion_def BASE_ADDR=0x2000 CDC_EN CDC_STAGE=3 CDC_MODE=handshake {attrs}
+module xing_sv (input logic clk);
+    logic [31:0] a; // @axion RO
+    logic [31:0] b; // @axion RO
+    logic [47:0] c; // @axion RW
+endmodule
+"""
+
+
+class TestCdcMode(unittest.TestCase):
+    """Test cases for PERF-051"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_perf_051_modes(self):
+        self.assertEqual(parse_cdc_mode('Handshake'), 'handshake')
+        self.assertEqual(parse_cdc_mode('SYNC'), 'sync')
+        self.assertIsNone(parse_cdc_mode(None))
+        with self.assertRaises(ValueError):
+            parse_cdc_mode('gray')
+
+    def test_perf_051_attribute(self):
+        path = os.path.join(self.temp_dir, 'xing.vhd')
+        for attrs, expected in (('CDC_MODE=handshake', 'handshake'), ('CDC_MODE=SYNC', 'sync'), ('', None)):
+            with open(path, 'w') as f:
+                f.write(VHDL_CDC.format(attrs=attrs))
+            with redirect_stdout(io.StringIO()):
+                module = VHDLParser()._parse_vhdl_file(path)
+            self.assertEqual(module.get('cdc_mode'), expected)
+
+        with open(path, 'w') as f:
+            f.write(VHDL_CDC.format(attrs='CDC_MODE=gray'))
+        with redirect_stdout(io.StringIO()):
+            module = VHDLParser()._parse_vhdl_file(path)
+        self.assertIn("Unknown CDC_MODE 'gray'", module['parsing_errors'][0]['msg'])
+
+        sv_path = os.path.join(self.temp_dir, 'xing.sv')
+        with open(sv_path, 'w') as f:
+            f.write(SV_CDC.format(attrs=''))
+        with redirect_stdout(io.StringIO()):
+            module = SystemVerilogParser()._parse_sv_file(sv_path)
+        self.assertEqual(module['cdc_mode'], 'handshake')
+
+
+class TestCdcHandshakeOutput(unittest.TestCase):
+    """Test cases for PERF-052"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.out_dir = os.path.join(self.temp_dir, 'out')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _generate(self, name, content):
+        with open(os.path.join(self.temp_dir, name), 'w') as f:
+            f.write(content)
+        axion = AxionHDL(output_dir=self.out_dir)
+        with redirect_stdout(io.StringIO()):
+            axion.add_source(self.temp_dir)
+            axion.analyze()
+            self.assertTrue(axion.generate_vhdl())
+            self.assertTrue(axion.generate_systemverilog())
+
+    def _read(self, name):
+        with open(os.path.join(self.out_dir, name)) as f:
+            return f.read()
+
+    def test_perf_052_vhdl_handshake(self):
+        self._generate('xing.vhd', VHDL_CDC.format(attrs='CDC_MODE=handshake'))
+        vhdl = self._read('xing_axion_reg.vhd')
+        # No per-register flop chains; one destination register per chunk
+        self.assertNotIn('_sync0', vhdl)
+        for dest in ('status_cdc', 'count0_cdc', 'count1_cdc', 'ctrl_cdc', 'level_cdc'):
+            self.assertIn(f"signal {dest} : std_logic_vector(31 downto 0)", vhdl)
+        self.assertIn("signal cdc_rd_data     : std_logic_vector(63 downto 0)", vhdl)
+        self.assertIn("signal cdc_wr_req_sync : std_logic_vector(2 downto 0)", vhdl)
+        # Source holds the whole register; destination loads it in one cycle
+        self.assertIn("cdc_rd_data(63 downto 32) <= count(63 downto 32);", vhdl)
+        self.assertIn("                        when 1 =>\n"
+                      "                            count0_cdc <= cdc_rd_data(31 downto 0);\n"
+                      "                            count1_cdc <= cdc_rd_data(63 downto 32);", vhdl)
+        self.assertIn("if cdc_wr_req = cdc_wr_ack_sync(2) then", vhdl)
+        self.assertIn("if cdc_wr_req_sync(2) /= cdc_wr_ack then", vhdl)
+        # Writes mark their register pending
+        self.assertIn("if do_reg_write = '1' and wr_access_error = '0' and "
+                      "(unsigned(wr_addr_reg) = unsigned(BASE_ADDR) + 12) then\n"
+                      "                    cdc_wr_pending(0) <= '1';", vhdl)
+        self.assertIn("    ctrl <= ctrl_cdc;", vhdl)
+        self.assertIn("    count_reg1 <= count1_cdc;", vhdl)
+
+    def test_perf_052_vhdl_write_marked_with_register_update(self):
+        # The pending mark must not precede the <reg>_reg update, or the
+        # idle loader sends the old value and clears the mark
+        for fsm in ('shared', 'split', 'fast'):
+            with self.subTest(fsm=fsm):
+                self._generate('one_rw.vhd', VHDL_CDC_ONE_RW.format(attrs=f'FSM={fsm}'))
+                vhdl = self._read('one_rw_axion_reg.vhd')
+                self.assertIn("                if do_reg_write = '1' and wr_access_error = '0' then", vhdl)
+                self.assertIn("if do_reg_write = '1' and wr_access_error = '0' and "
+                              "(unsigned(wr_addr_reg) = unsigned(BASE_ADDR) + 0) then\n"
+                              "                    cdc_wr_pending(0) <= '1';", vhdl)
+                self.assertIn("cdc_wr_data(31 downto 0) <= ctrl_reg;", vhdl)
+                self.assertNotIn("WR_DO_WRITE and (unsigned", vhdl)
+
+    def test_perf_052_systemverilog_handshake(self):
+        self._generate('xing.sv', SV_CDC.format(attrs='FSM=fast DECODE=case'))
+        sv = self._read('xing_sv_axion_reg.sv')
+        self.assertNotIn('_sync [', sv)
+        self.assertEqual(len(re.findall(r"\blogic \[2:0\] cdc_\w+_req_sync", sv)), 2)
+        self.assertIn("logic [47:0]                   c_cdc;", sv)
+        self.assertIn("cdc_rd_data <= b;", sv)
+        self.assertIn("cdc_wr_data <= c_reg;", sv)
+        self.assertIn("if (wr_commit && (wr_sel[0] || wr_sel[1])) begin\n"
+                      "                cdc_wr_pending[0] <= 1'b1;", sv)
+        self.assertIn("rdata_reg |= a_cdc;", sv)
+        self.assertIn("assign c = c_cdc;", sv)
+
+    def test_perf_052_default_sync(self):
+        self._generate('xing.vhd', VHDL_CDC.format(attrs=''))
+        vhdl = self._read('xing_axion_reg.vhd')
+        self.assertIn("signal status_sync2 : std_logic_vector(31 downto 0);", vhdl)
+        self.assertNotIn('cdc_wr_req', vhdl)
+
+    def test_perf_052_cli_cdc_mode(self):
+        with open(os.path.join(self.temp_dir, 'xing.vhd'), 'w') as f:
+            f.write(VHDL_CDC.format(attrs=''))
+        cmd = [sys.executable, '-m', 'axion_hdl.cli', '-s', self.temp_dir, '-o', self.out_dir,
+               '--vhdl', '--cdc-mode', 'handshake']
+        result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(project_root))
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        self.assertIn('signal cdc_rd_req      : std_logic', self._read('xing_axion_reg.vhd'))
+
+        cmd[-1] = 'gray'
+        result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(project_root))
+        self.assertNotEqual(result.returncode, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+test_exclusion.py - Shared Exclusion Matcher Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-012  Compiled exclusion matcher
+         → TestExcludeMatcher
+
+PERF-013  Exclusion matcher shared by all parsers and the rule checker
+         → TestSharedExclusion
+"""
+
+import os
+import sys
+import fnmatch
+import shutil
+import tempfile
+import subprocess
+import unittest
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl.exclusion import ExcludeMatcher, directory_pattern, get_exclude_matcher
+from axion_hdl.parser import VHDLParser
+from axion_hdl.systemverilog_parser import SystemVerilogParser
+from axion_hdl.yaml_input_parser import YAMLInputParser
+from axion_hdl.json_input_parser import JSONInputParser
+from axion_hdl.xml_input_parser import XMLInputParser
+from axion_hdl.toml_input_parser import TOMLInputParser
+from axion_hdl.rule_checker import RuleChecker
+
+
+def _reference_is_excluded(filepath, patterns):
+    """Pattern-by-pattern rules the matcher replaces (former VHDLParser._is_excluded)."""
+    filename = os.path.basename(filepath)
+    dir_basename = os.path.basename(os.path.dirname(filepath))
+    abs_filepath = os.path.abspath(filepath)
+    for pattern in patterns:
+        if fnmatch.fnmatch(filename, pattern) or fnmatch.fnmatch(dir_basename, pattern):
+            return True
+        if pattern in filepath or pattern in abs_filepath:
+            return True
+        if any(fnmatch.fnmatch(part, pattern) for part in abs_filepath.split(os.sep)):
+            return True
+        if '*' in pattern or '?' in pattern:
+            if fnmatch.fnmatch(filepath, pattern) or fnmatch.fnmatch(abs_filepath, pattern):
+                return True
+    return False
+
+
+PATHS = [
+    'rtl/top.vhd',
+    'rtl/top_tb.vhd',
+    'tb/bench.vhd',
+    'src/deprecated/old.vhd',
+    'src/a/b/generated/regs.sv',
+    'src/a/b/keep/regs.sv',
+    '/abs/project/error_cases/bad.yaml',
+    '/abs/project/good/ok.yaml',
+    'maps/test_map.json',
+    'maps/map[1].xml',
+    'x.toml',
+]
+
+PATTERN_SETS = [
+    [],
+    ['*_tb.vhd'],
+    ['tb'],
+    ['deprecated'],
+    ['*/generated/*'],
+    ['error_cases', 'test_*'],
+    ['map[1].xml'],
+    ['rtl/', '?.toml'],
+    ['*.sv', 'good', 'b'],
+]
+
+
+class TestExcludeMatcher(unittest.TestCase):
+    """Test cases for PERF-012"""
+
+    def test_perf_012_matches_reference_rules(self):
+        for patterns in PATTERN_SETS:
+            matcher = ExcludeMatcher(patterns)
+            for path in PATHS:
+                with self.subTest(patterns=patterns, path=path):
+                    self.assertEqual(matcher.is_excluded(path),
+                                     _reference_is_excluded(path, patterns))
+
+    def test_perf_012_pattern_kinds(self):
+        matcher = ExcludeMatcher(['deprecated', '*_tb.vhd', 'error_cases', '*/generated/*'])
+        self.assertTrue(matcher.is_excluded('src/deprecated_ip/a.vhd'))      # literal substring
+        self.assertTrue(matcher.is_excluded('rtl/top_tb.vhd'))              # file name glob
+        self.assertTrue(matcher.is_excluded('/x/error_cases/sub/a.vhd'))    # directory name
+        self.assertTrue(matcher.is_excluded('src/generated/regs.vhd'))      # full path glob
+        self.assertFalse(matcher.is_excluded('rtl/top.vhd'))
+
+    def test_perf_012_empty_matcher(self):
+        matcher = ExcludeMatcher([])
+        self.assertFalse(matcher)
+        self.assertFalse(matcher.is_excluded('anything/at/all.vhd'))
+
+    def test_perf_012_directory_results_are_memoized(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            # The pattern must not occur in the random temp directory name
+            matcher = ExcludeMatcher(['testbench'])
+            tb_dir = os.path.join(temp_dir, 'testbench')
+            self.assertTrue(matcher.is_dir_excluded(tb_dir))
+            self.assertFalse(matcher.is_dir_excluded(os.path.join(temp_dir, 'rtl')))
+            self.assertIn(tb_dir, matcher._dirs)
+
+            calls = []
+            real = matcher.is_excluded
+            matcher.is_excluded = lambda path: calls.append(path) or real(path)
+            self.assertTrue(matcher.is_dir_excluded(tb_dir))
+            self.assertEqual(calls, [])
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_perf_012_many_patterns(self):
+        patterns = [f'block_{i}_*' for i in range(500)] + ['*_tb.vhd']
+        matcher = ExcludeMatcher(patterns)
+        self.assertTrue(matcher.is_excluded('rtl/block_42_regs.vhd'))
+        self.assertTrue(matcher.is_excluded('rtl/top_tb.vhd'))
+        self.assertFalse(matcher.is_excluded('rtl/block_x_regs.vhd'))
+
+
+class TestSharedExclusion(unittest.TestCase):
+    """Test cases for PERF-013"""
+
+    def test_perf_013_same_matcher_for_same_patterns(self):
+        self.assertIs(get_exclude_matcher(['a', 'b']), get_exclude_matcher(('b', 'a')))
+        self.assertIsNot(get_exclude_matcher(['a']), get_exclude_matcher(['b']))
+
+    def test_perf_013_parsers_agree(self):
+        patterns = {'error_cases', '*_tb.*', '*/generated/*'}
+        parsers = []
+        for cls in (VHDLParser, SystemVerilogParser, YAMLInputParser,
+                    JSONInputParser, XMLInputParser, TOMLInputParser):
+            parser = cls()
+            add = getattr(parser, 'add_exclude', None) or parser.add_exclude_pattern
+            for pattern in patterns:
+                add(pattern)
+            parsers.append(parser)
+
+        paths = ['src/error_cases/a.yaml', 'src/top_tb.json', 'src/generated/m.xml',
+                 'src/ok/m.toml', 'src/ok/regs.sv']
+        for path in paths:
+            results = {type(p).__name__: p._is_excluded(path) for p in parsers}
+            with self.subTest(path=path):
+                self.assertEqual(len(set(results.values())), 1, results)
+
+    def test_perf_013_rule_checker_uses_matcher(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            bad_dir = os.path.join(temp_dir, 'error_cases')
+            os.makedirs(bad_dir)
+            bad = os.path.join(bad_dir, 'bad.json')
+            with open(bad, 'w') as f:
+                f.write('{not json')
+
+            checker = RuleChecker()
+            checker._check_single_file(bad, ['error_cases'])
+            self.assertEqual(checker.errors, [])
+
+            checker._check_single_file(bad, [])
+            self.assertTrue(checker.errors)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_perf_013_output_dir_is_excluded_by_path(self):
+        """The output directory does not exclude sources that contain its name"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            src_dir = os.path.join(temp_dir, 'src')
+            os.makedirs(src_dir)
+            for source, name in (('json/addr_test_basic.json', 'layout_a.json'),
+                                 ('xml/addr_test_chain.xml', 'layout_b.xml'),
+                                 ('toml/sensor_controller.toml', 'layout_c.toml'),
+                                 ('sv/enum_test.sv', 'layout_e.sv'),
+                                 ('yaml/subregister_test.yaml', 'layout_f.yaml')):
+                shutil.copy(project_root / 'tests' / source, os.path.join(src_dir, name))
+
+            matcher = ExcludeMatcher([directory_pattern(os.path.join(temp_dir, 'layout'))])
+            self.assertTrue(matcher.is_excluded(os.path.join(temp_dir, 'layout', 'a_regs.json')))
+            self.assertFalse(matcher.is_excluded(os.path.join(src_dir, 'layout_a.json')))
+            self.assertFalse(matcher.is_excluded(os.path.join(temp_dir, 'layout2', 'a_regs.json')))
+
+            # Relative -o whose name occurs in every source file name
+            env = dict(os.environ, PYTHONPATH=str(project_root))
+            cmd = [sys.executable, '-m', 'axion_hdl.cli', '-s', 'src', '-o', 'layout', '--vhdl']
+            result = subprocess.run(cmd, capture_output=True, text=True, cwd=temp_dir, env=env)
+            self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+            self.assertIn("Found 5 total modules", result.stdout)
+            self.assertNotIn("Skipping excluded", result.stdout)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
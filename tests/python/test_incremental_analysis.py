@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+test_incremental_analysis.py - Incremental Re-analysis Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-008  Incremental analysis re-parses only changed files
+         → TestIncrementalAnalysis
+
+PERF-009  Invalidated modules are reported
+         → TestIncrementalAnalysis
+"""
+
+import io
+import os
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl.axion import AxionHDL
+
+
+YAML_TEMPLATE = """module: {name}
+base_addr: "{base}"
+registers:
+  - name: {reg}
+    addr: "0x00"
+    access: RW
+"""
+
+VHDL_TEMPLATE = """library ieee;
+use ieee.std_logic_1164.all;
+-- @axion_def BASE_ADDR=0x8000
+entity {name} is
+    port (clk : in std_logic);
+end entity;
+architecture rtl of {name} is
+    signal {reg} : std_logic_vector(31 downto 0); -- @axion RW
+begin
+end architecture;
+"""
+
+
+class TestIncrementalAnalysis(unittest.TestCase):
+    """Test cases for PERF-008 and PERF-009"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.src_dir = os.path.join(self.temp_dir, 'src')
+        os.makedirs(self.src_dir)
+        self._write('alpha.yaml', YAML_TEMPLATE.format(name='alpha', base='0x0000', reg='ctrl'))
+        self._write('beta.yaml', YAML_TEMPLATE.format(name='beta', base='0x1000', reg='ctrl'))
+        self._write('gamma.vhd', VHDL_TEMPLATE.format(name='gamma', reg='ctrl'))
+
+        self.axion = AxionHDL(output_dir=os.path.join(self.temp_dir, 'out'))
+        self.axion.add_source(self.src_dir)
+        self.log = self._analyze()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, name, content):
+        path = os.path.join(self.src_dir, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        # Ensure the mtime moves even on coarse-grained filesystems
+        stamp = time.time() + len(content) % 7 + 1
+        os.utime(path, (stamp, stamp))
+        return path
+
+    def _analyze(self, **kwargs):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.axion.analyze(incremental=True, **kwargs)
+        return out.getvalue()
+
+    def _module(self, name):
+        return next(m for m in self.axion.analyzed_modules if m['name'] == name)
+
+    def test_perf_008_first_run_parses_everything(self):
+        self.assertEqual(sorted(self.axion.invalidated_modules), ['alpha', 'beta', 'gamma'])
+        self.assertIn("3 added", self.log)
+
+    def test_perf_008_no_change_reuses_modules(self):
+        before = {m['name']: m for m in self.axion.analyzed_modules}
+        log = self._analyze()
+        self.assertEqual(self.axion.invalidated_modules, [])
+        self.assertIn("0 changed, 0 added, 0 removed", log)
+        for module in self.axion.analyzed_modules:
+            self.assertIs(module, before[module['name']])
+
+    def test_perf_008_matches_full_analysis(self):
+        self._write('beta.yaml', YAML_TEMPLATE.format(name='beta', base='0x2000', reg='status'))
+        self._analyze()
+
+        full = AxionHDL(output_dir=os.path.join(self.temp_dir, 'out'))
+        full.add_source(self.src_dir)
+        with redirect_stdout(io.StringIO()):
+            full.analyze()
+        self.assertEqual(self.axion.analyzed_modules, full.analyzed_modules)
+        self.assertEqual(self.axion.parse_errors, full.parse_errors)
+
+    def test_perf_008_lists_patched_in_place(self):
+        modules = self.axion.analyzed_modules
+        errors = self.axion.parse_errors
+        self._analyze()
+        self.assertIs(self.axion.analyzed_modules, modules)
+        self.assertIs(self.axion.parse_errors, errors)
+
+    def test_perf_009_changed_file_invalidates_its_module(self):
+        alpha = self._module('alpha')
+        self._write('beta.yaml', YAML_TEMPLATE.format(name='beta', base='0x1000', reg='status'))
+        log = self._analyze()
+        self.assertEqual(self.axion.invalidated_modules, ['beta'])
+        self.assertIn("1 changed", log)
+        self.assertIs(self._module('alpha'), alpha)
+        self.assertEqual(self._module('beta')['registers'][0]['signal_name'], 'status')
+
+    def test_perf_009_touch_without_content_change(self):
+        path = os.path.join(self.src_dir, 'alpha.yaml')
+        stamp = time.time() + 100
+        os.utime(path, (stamp, stamp))
+        self._analyze()
+        self.assertEqual(self.axion.invalidated_modules, [])
+
+    def test_perf_009_added_and_deleted_files(self):
+        self._write('delta.yaml', YAML_TEMPLATE.format(name='delta', base='0x3000', reg='ctrl'))
+        os.remove(os.path.join(self.src_dir, 'gamma.vhd'))
+        log = self._analyze()
+        self.assertEqual(sorted(self.axion.invalidated_modules), ['delta', 'gamma'])
+        self.assertIn("1 added, 1 removed", log)
+        names = [m['name'] for m in self.axion.analyzed_modules]
+        self.assertIn('delta', names)
+        self.assertNotIn('gamma', names)
+
+    def test_perf_009_renamed_module(self):
+        self._write('alpha.yaml', YAML_TEMPLATE.format(name='alpha2', base='0x0000', reg='ctrl'))
+        self._analyze()
+        self.assertEqual(self.axion.invalidated_modules, ['alpha', 'alpha2'])
+
+    def test_perf_009_reanalyze_forces_changed_paths(self):
+        path = os.path.join(self.src_dir, 'gamma.vhd')
+        st = os.stat(path)
+        with open(path, 'w') as f:
+            f.write(VHDL_TEMPLATE.format(name='gamma', reg='data'))
+        # Same mtime and size: only an explicit changed path reveals the edit
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        with redirect_stdout(io.StringIO()):
+            invalidated = self.axion.reanalyze([path])
+        self.assertEqual(invalidated, ['gamma'])
+        self.assertEqual(self._module('gamma')['registers'][0]['signal_name'], 'data')
+
+
+if __name__ == '__main__':
+    unittest.main()
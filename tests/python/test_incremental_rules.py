@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+test_incremental_rules.py - Incremental Rule Checking Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-041  Per-module rule results reused by content hash
+         → TestIncrementalResults
+
+PERF-042  Re-check after a one-register edit in a large design
+         → TestIncrementalScaling
+"""
+
+import io
+import sys
+import time
+import copy
+import random
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl import AxionHDL
+from axion_hdl.ir import ModuleIR, RegisterIR
+from axion_hdl.rule_checker import RuleChecker, module_digest, module_key
+
+
+def _design(num_modules, num_regs=20, ir=False):
+    modules = []
+    for m in range(num_modules):
+        base = m * 0x100
+        registers = [{'reg_name': f'r{i}', 'address_int': base + i * 4, 'width': 32,
+                      'default_value': 0, 'description': f'register {i}'}
+                     for i in range(num_regs)]
+        module = {'name': f'm{m}', 'base_address': base, 'registers': registers,
+                  'parsing_errors': []}
+        modules.append(ModuleIR.from_dict(module) if ir else module)
+    return modules
+
+
+def _edit(modules, rnd):
+    """Apply one random edit, the kind a GUI session makes."""
+    module = rnd.choice(modules)
+    reg = rnd.choice(module['registers']) if module['registers'] else None
+    action = rnd.randrange(7)
+    if reg is None or action == 0:
+        new_reg = {'reg_name': 'signal', 'address_int': module['base_address'] + 2,
+                   'width': 8, 'default_value': '0x1FF', 'description': ''}
+        if isinstance(module, ModuleIR):
+            new_reg = RegisterIR.from_dict(new_reg)
+        module['registers'].append(new_reg)
+    elif action == 1:
+        reg['width'] = rnd.choice([32, 64, 4096])
+    elif action == 2:
+        reg['description'] = ''
+    elif action == 3:
+        module['name'] = rnd.choice(modules)['name']
+    elif action == 4:
+        module['registers'].remove(reg)
+    elif action == 5:
+        modules.append(copy.deepcopy(module))
+    elif len(modules) > 1:
+        modules.remove(module)
+
+
+HIERARCHY = [{'module': 'm0', 'instance': 'a', 'base_addr': 0x0},
+             {'module': 'm1', 'instance': 'b', 'base_addr': 0x40},
+             {'module': 'gone', 'instance': 'b', 'base_addr': 0x1000}]
+
+
+class TestIncrementalResults(unittest.TestCase):
+    """Test cases for PERF-041"""
+
+    def test_perf_041_matches_full_run(self):
+        for ir in (False, True):
+            rnd = random.Random(3)
+            modules = _design(30, 6, ir=ir)
+            checker = RuleChecker()
+            for step in range(60):
+                _edit(modules, rnd)
+                with self.subTest(ir=ir, step=step):
+                    expected = RuleChecker().run_all_checks(modules, hierarchy=HIERARCHY)
+                    actual = checker.run_all_checks(modules, hierarchy=HIERARCHY, incremental=True)
+                    self.assertEqual(actual, expected)
+
+    def test_perf_041_only_changed_modules_rechecked(self):
+        modules = _design(50, 4)
+        checker = RuleChecker()
+        checker.run_all_checks(modules, incremental=True)
+        self.assertTrue(all(t['cached'] == 0 for t in checker.timings))
+
+        modules[7]['registers'][0]['description'] = ''
+        checker.run_all_checks(modules, incremental=True)
+        cached = {t['rule']: t['cached'] for t in checker.timings}
+        self.assertEqual(cached['documentation'], 49)
+        self.assertEqual(cached['naming-conventions'], 49)
+        # Names and address ranges did not change
+        self.assertEqual(cached['address-overlaps'], 50)
+        self.assertEqual(cached['unique-module-names'], 50)
+        self.assertEqual([w['module'] for w in checker.warnings], ['m7'])
+
+        modules[9]['registers'][-1]['width'] = 4096
+        checker.run_all_checks(modules, incremental=True)
+        cached = {t['rule']: t['cached'] for t in checker.timings}
+        self.assertEqual(cached['address-overlaps'], 0)
+        self.assertEqual(cached['unique-module-names'], 50)
+        self.assertEqual({e['type'] for e in checker.errors}, {'Address Overlap'})
+
+    def test_perf_041_module_digest(self):
+        a, b = _design(2, 3)
+        self.assertEqual(module_digest(a), module_digest(copy.deepcopy(a)))
+        self.assertNotEqual(module_digest(a), module_digest(b))
+
+    def test_perf_041_module_key(self):
+        module = ModuleIR.from_dict({'name': 'm', 'base_address': 0, 'registers': [
+            {'reg_name': 'packed', 'address_int': 0, 'width': 32, 'is_packed': True,
+             'fields': [{'name': 'f', 'bit_low': 0, 'bit_high': 3, 'width': 4}]}]})
+        reg, field = module['registers'][0], module['registers'][0]['fields'][0]
+        key = module_key(module)
+        self.assertIsInstance(key, tuple)
+
+        # Setting a key to its current value is no change
+        reg['width'] = 32
+        field['width'] = 4
+        self.assertEqual(module_key(module), key)
+
+        edits = [
+            lambda: field.__setitem__('bit_high', 7),
+            lambda: reg.__setitem__('description', 'x'),
+            lambda: module.__setitem__('base_address', 0x100),
+            lambda: reg['fields'].append(copy.copy(field)),
+            lambda: module['registers'].append(copy.copy(reg)),
+            lambda: module['registers'].reverse(),
+            lambda: module['registers'].pop(),
+        ]
+        for edit in edits:
+            edit()
+            new_key = module_key(module)
+            self.assertNotEqual(new_key, key)
+            key = new_key
+
+        # Plain dictionaries anywhere in the registers fall back to the content hash
+        module['registers'].append({'reg_name': 'plain', 'address_int': 8})
+        self.assertEqual(module_key(module), module_digest(module))
+
+    def test_perf_041_run_rules_reuses_checker(self):
+        axion = AxionHDL()
+        axion.analyzed_modules = _design(5, 3)
+        axion.is_analyzed = True
+        with redirect_stdout(io.StringIO()):
+            self.assertTrue(axion.run_rules())
+            axion.analyzed_modules[2]['registers'][0]['reg_name'] = 'signal'
+            self.assertFalse(axion.run_rules())
+        cached = {t['rule']: t['cached'] for t in axion._rule_checker.timings}
+        self.assertEqual(cached['naming-conventions'], 4)
+
+
+class TestIncrementalScaling(unittest.TestCase):
+    """Test cases for PERF-042"""
+
+    def test_perf_042_one_register_edit(self):
+        modules = _design(2000, ir=True)
+        start = time.perf_counter()
+        RuleChecker().run_all_checks(modules)
+        full = time.perf_counter() - start
+
+        checker = RuleChecker()
+        checker.run_all_checks(modules, incremental=True)
+        modules[1234]['registers'][-1]['width'] = 64
+        start = time.perf_counter()
+        checker.run_all_checks(modules, incremental=True)
+        incremental = time.perf_counter() - start
+
+        self.assertEqual(checker.errors, [])
+        self.assertLess(incremental, full / 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
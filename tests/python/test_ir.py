@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+test_ir.py - Typed Intermediate Representation Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-023  Typed register IR with a dictionary-compatible view
+         → TestIRView
+
+PERF-024  Compact register storage (10,000-register benchmark)
+         → TestIRMemory
+"""
+
+import copy
+import io
+import os
+import pickle
+import sys
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl.axion import AxionHDL
+from axion_hdl.ir import ModuleIR, RegisterIR, FieldIR
+from axion_hdl.module_builder import ModuleBuilder
+from axion_hdl.parser import VHDLParser
+from axion_hdl.systemverilog_parser import SystemVerilogParser
+from axion_hdl.yaml_input_parser import YAMLInputParser
+
+
+NUM_REGS = 10000
+
+REGISTER = {
+    'signal_name': 'ctrl',
+    'name': 'ctrl',
+    'access_mode': 'RW',
+    'access': 'RW',
+    'address': '0x1004',
+    'address_int': 0x1004,
+    'relative_address': '0x04',
+    'relative_address_int': 4,
+    'width': 32,
+    'signal_type': 'std_logic_vector(31 downto 0)',
+    'r_strobe': False,
+    'w_strobe': True,
+    'read_strobe': False,
+    'write_strobe': True,
+    'description': 'Control',
+    'default_value': 5,
+    'default_value_hex': '0x5',
+    'enum_values': None,
+}
+
+YAML_MAP = """module: ir_test
+base_addr: "0x1000"
+registers:
+  - name: ctrl
+    access: RW
+    default: "0x5"
+  - name: mode
+    width: 2
+    reg_name: packed
+    bit_offset: 0
+"""
+
+
+def _plain(value):
+    """Deep copy of a module with every mapping turned into a dictionary."""
+    if isinstance(value, (dict, ModuleIR, RegisterIR, FieldIR)):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+class TestIRView(unittest.TestCase):
+    """Test cases for PERF-023"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_perf_023_view_matches_dict(self):
+        reg = RegisterIR.from_dict(REGISTER)
+        self.assertEqual(list(reg), list(REGISTER))
+        self.assertEqual(dict(reg), REGISTER)
+        self.assertEqual(reg, REGISTER)
+        self.assertEqual(repr(reg), repr(REGISTER))
+        # Aliases and address strings are derived, not stored
+        self.assertIsNone(reg._extra)
+        self.assertEqual((reg.name, reg.address_int, reg.width), ('ctrl', 0x1004, 32))
+
+    def test_perf_023_disagreeing_aliases_kept(self):
+        data = dict(REGISTER, name='other', address='0x1008', r_strobe=1, extra_key=[1])
+        reg = RegisterIR.from_dict(data)
+        self.assertEqual(list(reg), list(data))
+        self.assertEqual(dict(reg), data)
+        self.assertIs(reg['r_strobe'], 1)
+        # The first key of an alias group holds the value (here r_strobe)
+        self.assertEqual(sorted(reg._extra), ['address', 'extra_key', 'name', 'read_strobe'])
+
+    def test_perf_023_writes_behave_like_dict(self):
+        reg, expected = RegisterIR.from_dict(REGISTER), dict(REGISTER)
+        for key, value in [('address_int', 0x2000), ('signal_name', 'renamed'),
+                           ('address', '0x3000'), ('new_key', 7), ('width', 8)]:
+            reg[key] = value
+            expected[key] = value
+            self.assertEqual(dict(reg), expected)
+            self.assertEqual(list(reg), list(expected))
+        del reg['access_mode']
+        del expected['access_mode']
+        self.assertEqual(dict(reg), expected)
+        self.assertEqual(reg.get('access_mode', 'missing'), 'missing')
+        self.assertNotIn('access_mode', reg)
+
+    def test_perf_023_copy_and_pickle(self):
+        reg = RegisterIR.from_dict(dict(REGISTER, extra_key=1))
+        for clone in (reg.copy(), copy.copy(reg), copy.deepcopy(reg),
+                      pickle.loads(pickle.dumps(reg))):
+            self.assertIsInstance(clone, RegisterIR)
+            self.assertEqual(list(clone), list(reg))
+            self.assertEqual(clone, reg)
+            clone['extra_key'] = 2
+            self.assertEqual(reg['extra_key'], 1)
+
+    def test_perf_023_parsers_return_ir(self):
+        yaml_path = os.path.join(self.temp_dir, 'ir_test.yaml')
+        with open(yaml_path, 'w') as f:
+            f.write(YAML_MAP)
+        with redirect_stdout(io.StringIO()):
+            modules = [
+                YAMLInputParser().parse_file(yaml_path),
+                VHDLParser()._parse_vhdl_file(str(project_root / 'tests' / 'vhdl' / 'sensor_controller.vhd')),
+                SystemVerilogParser()._parse_sv_file(str(project_root / 'tests' / 'sv' / 'enum_test.sv')),
+            ]
+        for module in modules:
+            with self.subTest(file=module['file']):
+                self.assertIsInstance(module, ModuleIR)
+                self.assertTrue(all(isinstance(r, RegisterIR) for r in module['registers']))
+                self.assertEqual(ModuleIR.from_dict(_plain(module)), module)
+
+        packed = modules[0]['packed_registers'][0]
+        self.assertIs(packed, modules[0]['registers'][1])
+        self.assertIsInstance(packed['fields'][0], FieldIR)
+        self.assertEqual(packed['fields'][0].bit_high, 1)
+
+    def test_perf_023_to_dict(self):
+        with redirect_stdout(io.StringIO()):
+            module = VHDLParser()._parse_vhdl_file(str(project_root / 'tests' / 'vhdl' / 'sensor_controller.vhd'))
+        plain = module.to_dict()
+        self.assertIs(type(plain), dict)
+        self.assertTrue(all(type(r) is dict for r in plain['registers']))
+        self.assertEqual(plain, _plain(module))
+        plain['registers'][0]['name'] = 'changed'
+        self.assertNotEqual(module['registers'][0]['name'], 'changed')
+
+    def test_perf_023_get_modules_serializable(self):
+        import json
+        import yaml
+        shutil.copy(str(project_root / 'tests' / 'vhdl' / 'sensor_controller.vhd'), self.temp_dir)
+        with open(os.path.join(self.temp_dir, 'ir_test.yaml'), 'w') as f:
+            f.write(YAML_MAP)
+        axion = AxionHDL(output_dir=os.path.join(self.temp_dir, 'out'))
+        with redirect_stdout(io.StringIO()):
+            axion.add_source(self.temp_dir)
+            axion.analyze()
+
+        modules = axion.get_modules()
+        self.assertEqual(len(modules), 2)
+        for module in modules:
+            self.assertIs(type(module), dict)
+            self.assertTrue(all(type(r) is dict for r in module['registers']))
+        packed = next(m for m in modules if m['name'] == 'ir_test')['packed_registers'][0]
+        self.assertIs(type(packed['fields'][0]), dict)
+
+        self.assertEqual(json.loads(json.dumps(modules))[0]['name'], modules[0]['name'])
+        self.assertEqual(yaml.safe_load(yaml.safe_dump(modules))[0]['name'], modules[0]['name'])
+
+
+class TestIRMemory(unittest.TestCase):
+    """Test cases for PERF-024"""
+
+    def test_perf_024_registers_smaller_than_dicts(self):
+        builder = ModuleBuilder('large.yaml')
+        for i in range(NUM_REGS):
+            builder.add_register(f'reg_{i}', description=f'Register {i}', w_strobe=True)
+        with redirect_stdout(io.StringIO()):
+            module = builder.build('large', 0x10000, False, 2, False, [])
+        dicts = [dict(reg) for reg in module['registers']]
+
+        def size(make):
+            tracemalloc.start()
+            try:
+                objects = make()
+                return tracemalloc.get_traced_memory()[0], objects
+            finally:
+                tracemalloc.stop()
+
+        dict_size, copies = size(lambda: [dict(reg) for reg in dicts])
+        ir_size, irs = size(lambda: [RegisterIR.from_dict(reg) for reg in dicts])
+        print(f"\n  {NUM_REGS} registers: dicts {dict_size / 1e6:.2f} MB, IR {ir_size / 1e6:.2f} MB")
+
+        self.assertEqual(irs, copies)
+        self.assertLess(ir_size, dict_size * 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
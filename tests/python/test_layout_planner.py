@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+test_layout_planner.py - Address Layout Planner Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-033  Compact and decode layouts that never move manual addresses
+         → TestLayoutPlanner
+
+PERF-034  LAYOUT attribute in @axion_def with span report
+         → TestLayoutAnnotation
+"""
+
+import io
+import os
+import sys
+import random
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl import AxionHDL
+from axion_hdl.layout_planner import LayoutEntry, plan_layout, parse_layout_mode
+from axion_hdl.parser import VHDLParser
+from axion_hdl.systemverilog_parser import SystemVerilogParser
+
+
+def _size(entry):
+    return ((entry.width + 31) // 32) * 4
+
+
+def _random_entries(seed, count=60):
+    rnd = random.Random(seed)
+    entries, addr = [], 0
+    for i in range(count):
+        width = rnd.choice([1, 8, 32, 32, 64, 96, 128])
+        manual = rnd.random() < 0.2
+        if manual:
+            addr += 4 * rnd.randrange(0, 16)
+        entries.append(LayoutEntry(f'r{i}', addr, width, rnd.choice(['RO', 'RW', 'WO']), manual))
+        addr += _size(entries[-1])
+    return entries
+
+
+class TestLayoutPlanner(unittest.TestCase):
+    """Test cases for PERF-033"""
+
+    def _check_valid(self, entries, plan):
+        slots = {}
+        for entry, addr in zip(entries, plan.addresses):
+            if entry.manual:
+                self.assertEqual(addr, entry.address, f"manual register {entry.name} moved")
+            else:
+                size = _size(entry)
+                # Naturally aligned to the power-of-two block holding it
+                self.assertEqual(addr % (1 << (size - 1).bit_length()), 0)
+            for slot in range(addr, addr + _size(entry), 4):
+                self.assertNotIn(slot, slots, f"{entry.name} overlaps {slots.get(slot)}")
+                slots[slot] = entry.name
+        end = max(addr + _size(e) for e, addr in zip(entries, plan.addresses))
+        self.assertGreaterEqual(plan.window, end)
+        self.assertLess(plan.window // 2, end)
+
+    def test_perf_033_manual_registers_never_move(self):
+        for seed in range(20):
+            entries = _random_entries(seed)
+            for mode in ('compact', 'decode'):
+                with self.subTest(seed=seed, mode=mode):
+                    self._check_valid(entries, plan_layout(entries, mode))
+
+    def test_perf_033_compact_fills_holes(self):
+        entries = [
+            LayoutEntry('a', 0x00, 32, 'RW', False),
+            LayoutEntry('fixed', 0x40, 32, 'RW', True),
+            LayoutEntry('b', 0x44, 64, 'RO', False),
+            LayoutEntry('c', 0x4C, 32, 'WO', False),
+        ]
+        plan = plan_layout(entries, 'compact')
+        self.assertEqual(plan.addresses, [0x08, 0x40, 0x00, 0x0C])
+        self.assertEqual((plan.span_before, plan.span_after), (0x50, 0x44))
+        self.assertEqual((plan.window, plan.moved), (0x80, 3))
+
+    def test_perf_033_decode_groups_by_access(self):
+        entries = _random_entries(7)
+        auto = [e for e in entries if not e.manual]
+        entries = [e._replace(manual=False) for e in auto]
+        plan = plan_layout(entries, 'decode')
+        self._check_valid(entries, plan)
+
+        def extent(modes):
+            ranges = [(addr, addr + _size(e)) for e, addr in zip(entries, plan.addresses)
+                      if e.access_mode in modes]
+            return min(r[0] for r in ranges), max(r[1] for r in ranges), sum(r[1] - r[0] for r in ranges)
+
+        # Readable and writable registers each fill one contiguous range,
+        # up to alignment padding of the wide registers
+        for modes in (('RO', 'RW'), ('RW', 'WO')):
+            low, high, used = extent(modes)
+            self.assertLessEqual(high - low - used, 3 * 12, modes)
+        ro_high = extent(('RO',))[1]
+        wo_low = extent(('WO',))[0]
+        self.assertLessEqual(ro_high, wo_low)
+
+    def test_perf_033_layout_modes(self):
+        self.assertEqual(parse_layout_mode('Decode'), 'decode')
+        self.assertIsNone(parse_layout_mode(None))
+        with self.assertRaises(ValueError):
+            parse_layout_mode('sparse')
+
+
+VHDL_LAYOUT = """library ieee;
+use ieee.std_logic_1164.all;
+-- @axion_def BASE_ADDR=0x1000 {layout}
+entity lay is
+end entity;
+architecture rtl of lay is
+    signal ctrl   : std_logic_vector(31 downto 0); -- @axion RW
+    signal status : std_logic_vector(31 downto 0); -- @axion RO
+    signal key    : std_logic_vector(127 downto 0); -- @axion WO
+    signal fixed  : std_logic_vector(31 downto 0); -- @axion RW ADDR=0x40
+    signal cnt    : std_logic_vector(63 downto 0); -- @axion RO
+    signal en     : std_logic; -- @axion RW REG_NAME=cfg
+    signal mode   : std_logic_vector(1 downto 0); -- @axion RW REG_NAME=cfg
+begin
+end architecture;
+"""
+
+SV_LAYOUT = """// @axion_def BASE_ADDR=0x2000 LAYOUT=compact
+module lay_sv (input logic clk);
+    logic [31:0] a; // @axion RW
+    logic [7:0] f; // @axion RO ADDR=0x2010
+    logic [127:0] k; // @axion WO
+endmodule
+"""
+
+
+class TestLayoutAnnotation(unittest.TestCase):
+    """Test cases for PERF-034"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, name, content):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def _parse_vhdl(self, layout):
+        path = self._write('lay.vhd', VHDL_LAYOUT.format(layout=layout))
+        output = io.StringIO()
+        with redirect_stdout(output):
+            module = VHDLParser()._parse_vhdl_file(path)
+        return module, output.getvalue()
+
+    def test_perf_034_vhdl_decode_layout(self):
+        module, output = self._parse_vhdl('LAYOUT=decode')
+        addresses = {r['name']: r['relative_address_int'] for r in module['registers']}
+        self.assertEqual(addresses, {'cnt': 0x00, 'status': 0x08, 'ctrl': 0x0C,
+                                     'cfg': 0x10, 'key': 0x20, 'fixed': 0x40})
+        self.assertEqual(module['packed_registers'][0]['address'], '0x1010')
+        self.assertEqual([r['name'] for r in module['registers']],
+                         sorted(addresses, key=addresses.get))
+        self.assertEqual(module['layout'], {'mode': 'decode', 'span_before': 0x50,
+                                            'span_after': 0x44, 'window': 0x80, 'moved': 5})
+        self.assertIn("Layout 'decode' for 'lay': span 0x50 -> 0x44 bytes", output)
+
+    def test_perf_034_default_layout_unchanged(self):
+        module, output = self._parse_vhdl('')
+        self.assertNotIn('layout', module)
+        self.assertEqual([r['name'] for r in module['registers']],
+                         ['ctrl', 'status', 'key', 'fixed', 'cnt', 'cfg'])
+        self.assertNotIn('Layout', output)
+
+    def test_perf_034_invalid_layout_reported(self):
+        module, _ = self._parse_vhdl('LAYOUT=sparse')
+        self.assertNotIn('layout', module)
+        self.assertIn("Unknown LAYOUT 'sparse'", module['parsing_errors'][0]['msg'])
+
+    def test_perf_034_systemverilog_layout(self):
+        path = self._write('lay.sv', SV_LAYOUT)
+        with redirect_stdout(io.StringIO()):
+            module = SystemVerilogParser()._parse_sv_file(path)
+        addresses = {r['signal_name']: r['address'] for r in module['registers']}
+        self.assertEqual(addresses, {'a': '0x00002014', 'f': '0x00002010', 'k': '0x00002000'})
+        self.assertEqual(module['layout']['span_after'], 0x18)
+
+    def test_perf_034_generated_outputs_follow_layout(self):
+        self._write('lay.vhd', VHDL_LAYOUT.format(layout='LAYOUT=compact'))
+        out_dir = os.path.join(self.temp_dir, 'out')
+        axion = AxionHDL(output_dir=out_dir)
+        axion.add_src(self.temp_dir)
+        with redirect_stdout(io.StringIO()):
+            axion.analyze()
+            self.assertTrue(axion.generate_c_header())
+        with open(os.path.join(out_dir, 'lay_regs.h')) as f:
+            header = f.read()
+        self.assertRegex(header, r'LAY_KEY\w*OFFSET\s+\(?0x0+\)?')
+
+
+if __name__ == '__main__':
+    unittest.main()
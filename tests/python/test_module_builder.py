@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+test_module_builder.py - Direct Register Lowering Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-021  XML and TOML registers lowered directly into the module
+         → TestDirectLowering
+
+PERF-022  No intermediate register dictionaries (5,000-register benchmark)
+         → TestLoweringBenchmark
+"""
+
+import io
+import os
+import sys
+import time
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+import xml.etree.ElementTree as ET
+from contextlib import redirect_stdout, redirect_stderr
+from pathlib import Path
+from unittest import mock
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl.module_builder import ModuleBuilder
+from axion_hdl.xml_input_parser import XMLInputParser
+from axion_hdl.yaml_input_parser import YAMLInputParser
+from axion_hdl.toml_input_parser import TOMLInputParser, tomllib
+
+
+NUM_REGS = 5000
+
+MIXED_YAML = """module: mixed
+base_addr: "0x2000"
+config:
+  cdc_en: true
+  cdc_stage: 3
+registers:
+  - name: ctrl
+    addr: "0x00"
+    access: RW
+    default: "0x5"
+    w_strobe: true
+  - name: wide
+    access: RO
+    width: 64
+  - name: mode
+    access: RW
+    width: 2
+    reg_name: packed
+    bit_offset: 0
+  - name: flag
+    access: RW
+    width: 1
+    reg_name: packed
+    bit_offset: 4
+  - name: irq
+    addr: "0x20"
+    fields:
+      - name: en
+        bit_offset: 0
+        width: 1
+        access: RW
+      - name: state
+        bit_offset: 1
+        width: 2
+        access: RO
+        enum_values: {0: IDLE, 1: BUSY}
+"""
+
+MIXED_XML = """<register_map module="mixed" base_addr="0x2000">
+    <config cdc_en="true" cdc_stage="3"/>
+    <register name="ctrl" addr="0x00" access="RW" default="0x5" w_strobe="true"/>
+    <register name="wide" access="RO" width="64"/>
+    <register name="mode" access="RW" width="2" reg_name="packed" bit_offset="0"/>
+    <register name="flag" access="RW" width="1" reg_name="packed" bit_offset="4"/>
+    <register name="irq" addr="0x20">
+        <field name="en" bit_offset="0" width="1" access="RW"/>
+        <field name="state" bit_offset="1" width="2" access="RO">
+            <enum_value value="0" name="IDLE"/>
+            <enum_value value="1" name="BUSY"/>
+        </field>
+    </register>
+</register_map>
+"""
+
+MIXED_TOML = """module = "mixed"
+base_addr = "0x2000"
+
+[config]
+cdc_en = true
+cdc_stage = 3
+
+[[registers]]
+name = "ctrl"
+addr = "0x00"
+access = "RW"
+default = "0x5"
+w_strobe = true
+
+[[registers]]
+name = "wide"
+access = "RO"
+width = 64
+
+[[registers]]
+name = "mode"
+access = "RW"
+width = 2
+reg_name = "packed"
+bit_offset = 0
+
+[[registers]]
+name = "flag"
+access = "RW"
+width = 1
+reg_name = "packed"
+bit_offset = 4
+
+[[registers]]
+name = "irq"
+addr = "0x20"
+
+[[registers.fields]]
+name = "en"
+bit_offset = 0
+width = 1
+access = "RW"
+
+[[registers.fields]]
+name = "state"
+bit_offset = 1
+width = 2
+access = "RO"
+enum_values = { "0" = "IDLE", "1" = "BUSY" }
+"""
+
+
+def _large_xml(num_regs):
+    regs = ''.join(
+        f'    <register name="reg_{i}" addr="0x{i * 4:X}" access="RW" width="32" '
+        f'description="Register {i}" w_strobe="true"/>\n'
+        for i in range(num_regs)
+    )
+    return f'<register_map module="large" base_addr="0x10000">\n{regs}</register_map>\n'
+
+
+def _yaml_shaped(root):
+    """YAML-shaped register dictionaries of a simple XML map (the former detour)."""
+    registers = []
+    for reg_elem in root.findall('register'):
+        reg_dict = {
+            'name': reg_elem.get('name'),
+            'access': reg_elem.get('access', 'RW'),
+            'description': reg_elem.get('description', ''),
+        }
+        for key in ('addr', 'width'):
+            if reg_elem.get(key):
+                reg_dict[key] = reg_elem.get(key)
+        if reg_elem.get('w_strobe', '').lower() == 'true':
+            reg_dict['w_strobe'] = True
+        registers.append(reg_dict)
+    return {'module': root.get('module'), 'base_addr': root.get('base_addr'),
+            'config': {}, 'registers': registers}
+
+
+class _TempDirTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write(self, name, content):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def parse(self, parser, path):
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            return parser.parse_file(path)
+
+
+class TestDirectLowering(_TempDirTest):
+    """Test cases for PERF-021"""
+
+    def test_perf_021_formats_lower_to_same_registers(self):
+        yaml_mod = self.parse(YAMLInputParser(), self.write('mixed.yaml', MIXED_YAML))
+        xml_mod = self.parse(XMLInputParser(), self.write('mixed.xml', MIXED_XML))
+        modules = [xml_mod]
+        if tomllib is not None:
+            modules.append(self.parse(TOMLInputParser(), self.write('mixed.toml', MIXED_TOML)))
+
+        self.assertEqual([r['name'] for r in yaml_mod['registers']], ['ctrl', 'wide', 'packed', 'irq'])
+        for module in modules:
+            with self.subTest(file=module['file']):
+                self.assertEqual(module['registers'], yaml_mod['registers'])
+                self.assertEqual(module['base_address'], 0x2000)
+                self.assertEqual((module['cdc_enabled'], module['cdc_stages']), (True, 3))
+                self.assertEqual(module['parsing_errors'], [])
+
+    def test_perf_021_no_yaml_dict_detour(self):
+        xml_path = self.write('mixed.xml', MIXED_XML)
+        toml_path = self.write('mixed.toml', MIXED_TOML)
+        with mock.patch.object(YAMLInputParser, 'parse_data', side_effect=AssertionError('detour')):
+            self.assertIsNotNone(self.parse(XMLInputParser(), xml_path))
+            if tomllib is not None:
+                self.assertIsNotNone(self.parse(TOMLInputParser(), toml_path))
+
+    def test_perf_021_builder_reports_invalid_values(self):
+        builder = ModuleBuilder('m.yaml')
+        builder.add_register('bad_width', width='wide')
+        builder.add_register('bad_addr', addr='0xZZ')
+        builder.add_register('', addr='0x40')  # Unnamed registers are ignored
+        module = builder.build('m', 0x100, False, 2, False, builder.errors)
+
+        self.assertEqual([r['name'] for r in module['registers']], ['bad_width', 'bad_addr'])
+        self.assertEqual([r['address_int'] for r in module['registers']], [0x100, 0x100])
+        messages = [e['msg'] for e in builder.errors]
+        self.assertIn("Invalid width value 'wide' for register 'bad_width', using default 32", messages)
+        self.assertIn("Invalid numeric value '0xZZ' in register 'bad_addr' addr", messages)
+
+
+class TestLoweringBenchmark(_TempDirTest):
+    """Test cases for PERF-022"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.root = ET.fromstring(_large_xml(NUM_REGS))
+
+    def _measure(self, convert):
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            convert()
+            elapsed = time.perf_counter() - start
+            tracemalloc.start()
+            try:
+                module = convert()
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        self.assertEqual(len(module['registers']), NUM_REGS)
+        return elapsed, peak
+
+    def test_perf_022_lowering_saves_a_dict_per_register(self):
+        parser = XMLInputParser()
+        direct = lambda: parser._simple_xml_to_module(self.root, 'large.xml')
+        detour = lambda: parser.yaml_parser.parse_data(_yaml_shaped(self.root), 'large.xml')
+
+        direct_time, direct_peak = self._measure(direct)
+        detour_time, detour_peak = self._measure(detour)
+        print(f"\n  {NUM_REGS} registers: direct {direct_time * 1000:.1f} ms / "
+              f"{direct_peak / 1e6:.2f} MB, via YAML dicts {detour_time * 1000:.1f} ms / "
+              f"{detour_peak / 1e6:.2f} MB")
+
+        # Each intermediate register dict costs well over 100 bytes
+        self.assertGreater(detour_peak - direct_peak, NUM_REGS * 100)
+
+    def test_perf_022_same_module_as_detour(self):
+        parser = XMLInputParser()
+        with redirect_stdout(io.StringIO()):
+            direct = parser._simple_xml_to_module(self.root, 'large.xml')
+            detour = parser.yaml_parser.parse_data(_yaml_shaped(self.root), 'large.xml')
+        self.assertEqual(direct, detour)
+
+
+if __name__ == '__main__':
+    unittest.main()
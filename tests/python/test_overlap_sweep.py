@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+test_overlap_sweep.py - Sweep-Line Address Overlap Check Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-037  Sweep-line overlap checks with unchanged messages
+         → TestSweepLineOverlaps
+
+PERF-038  Near-linear overlap check scaling
+         → TestOverlapScaling
+"""
+
+import sys
+import random
+import unittest
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl import AxionHDL
+from axion_hdl.address_manager import AddressConflictError, overlapping_pairs
+from axion_hdl.rule_checker import RuleChecker
+
+
+def _module(name, base, num_regs, rnd=None, wide_every=0):
+    registers = []
+    for i in range(num_regs):
+        offset = i * 4 if rnd is None else 4 * rnd.randrange(0, num_regs * 2)
+        width = 64 if wide_every and i % wide_every == 0 else 32
+        registers.append({'reg_name': f'r{i}', 'address_int': base + offset,
+                          'offset': offset, 'width': width})
+    return {'name': name, 'base_address': base, 'registers': registers}
+
+
+def _soc(num_modules, num_regs, seed=None):
+    """Modules on a 4 KB grid; with a seed, some bases collide or straddle."""
+    rnd = random.Random(seed) if seed is not None else None
+    modules = []
+    for m in range(num_modules):
+        base = m * 0x1000
+        if rnd is not None and rnd.random() < 0.2:
+            base = rnd.randrange(0, num_modules) * 0x1000 + rnd.choice([0, 0x800])
+        modules.append(_module(f'm{m}', base, num_regs, rnd, wide_every=7))
+    return modules
+
+
+def _reference_module_overlaps(modules):
+    """Former nested-loop Address Overlap check."""
+    ranges = []
+    for module in modules:
+        if module['registers']:
+            end = max([module['base_address']] + [r['address_int'] + max(4, (r['width'] + 7) // 8)
+                                                  for r in module['registers']])
+            ranges.append((module['name'], module['base_address'], end - 1))
+    overlaps = {}
+    for i, (n1, s1, e1) in enumerate(ranges):
+        for n2, s2, e2 in ranges[i + 1:]:
+            if max(s1, s2) <= min(e1, e2):
+                overlaps.setdefault(n1, []).append(
+                    f"Address region 0x{s1:X}-0x{e1:X} overlaps with {n2} (0x{s2:X}-0x{e2:X})")
+                overlaps.setdefault(n2, []).append(
+                    f"Address region 0x{s2:X}-0x{e2:X} overlaps with {n1} (0x{s1:X}-0x{e1:X})")
+    return [(name, msg) for name, msgs in overlaps.items() for msg in msgs]
+
+
+def _reference_register_conflicts(modules):
+    """Former nested-loop intra-module conflict check."""
+    issues = []
+    for module in modules:
+        ranges = [(r['address_int'], r['address_int'] + ((max(4, (r['width'] + 7) // 8) + 3) // 4) * 4,
+                   r['reg_name'], r['width']) for r in module['registers']]
+        for i, (s1, e1, n1, w1) in enumerate(ranges):
+            for s2, e2, n2, w2 in ranges[i + 1:]:
+                if s1 < e2 and s2 < e1:
+                    if s1 == s2:
+                        issues.append((module['name'], f"Address 0x{s1:04X} is assigned to both '{n1}' and '{n2}'"))
+                        continue
+                    wide, other = ((s2, e2, n2), (s1, n1)) if w1 <= 32 < w2 else ((s1, e1, n1), (s2, n2))
+                    issues.append((module['name'], f"Register '{other[1]}' at 0x{other[0]:04X} conflicts with "
+                                                   f"'{wide[2]}' which occupies 0x{wide[0]:04X}-0x{wide[1] - 1:04X}"))
+    return issues
+
+
+def _hierarchy(num_instances, seed=None):
+    """Instances of one 16-byte module on a 256-byte grid; with a seed, some collide."""
+    rnd = random.Random(seed) if seed is not None else None
+    entries = []
+    for k in range(num_instances):
+        base = k * 0x100
+        if rnd is not None and rnd.random() < 0.2:
+            base = rnd.randrange(0, num_instances) * 0x100 + rnd.choice([0, 0x8])
+        entries.append({'module': 'blk', 'instance': f'blk_{k}', 'base_addr': base})
+    return entries
+
+
+def _reference_hierarchy_overlaps(entries, size):
+    """Former nested-loop hierarchy instance overlap check."""
+    ranges = [(e['instance'], e['base_addr'], e['base_addr'] + size - 1) for e in entries]
+    issues = []
+    for i, (inst_a, base_a, end_a) in enumerate(ranges):
+        for inst_b, base_b, end_b in ranges[i + 1:]:
+            if base_a <= end_b and base_b <= end_a:
+                issues.append((inst_a, f"Address ranges of instances '{inst_a}' "
+                                       f"(0x{base_a:08X}–0x{end_a:08X}) and '{inst_b}' "
+                                       f"(0x{base_b:08X}–0x{end_b:08X}) overlap."))
+    return issues
+
+
+def _unique(issues):
+    seen, result = set(), []
+    for issue in issues:
+        if issue not in seen:
+            seen.add(issue)
+            result.append(issue)
+    return result
+
+
+class TestSweepLineOverlaps(unittest.TestCase):
+    """Test cases for PERF-037"""
+
+    def test_perf_037_pairs_match_nested_loop(self):
+        rnd = random.Random(1)
+        for _ in range(50):
+            ranges = []
+            for _ in range(rnd.randrange(1, 60)):
+                start = rnd.randrange(0, 200)
+                ranges.append((start, start + rnd.randrange(-2, 30)))
+            expected = [(i, j) for i in range(len(ranges)) for j in range(i + 1, len(ranges))
+                        if max(ranges[i][0], ranges[j][0]) < min(ranges[i][1], ranges[j][1])]
+            self.assertEqual(overlapping_pairs(ranges), expected)
+
+    def test_perf_037_rule_checker_messages_unchanged(self):
+        for seed in range(5):
+            modules = _soc(60, 20, seed)
+            checker = RuleChecker()
+            checker.check_address_overlaps(modules)
+            checker.check_intra_module_address_conflicts(modules)
+            actual = [(e['module'], e['msg']) for e in checker.errors]
+            expected = _unique(_reference_module_overlaps(modules) + _reference_register_conflicts(modules))
+            self.assertTrue(expected)
+            self.assertEqual(actual, expected)
+
+    def test_perf_037_hierarchy_messages_unchanged(self):
+        for seed in range(5):
+            entries = _hierarchy(200, seed)
+            checker = RuleChecker()
+            checker._report_hierarchy(entries, {'blk': 16})
+            actual = [(e['module'], e['msg']) for e in checker.errors]
+            expected = _reference_hierarchy_overlaps(entries, 16)
+            self.assertTrue(expected)
+            self.assertEqual(actual, expected)
+
+    def test_perf_037_axion_reports_first_pair(self):
+        axion = AxionHDL()
+        axion.analyzed_modules = [_module('a', 0x0000, 4), _module('b', 0x2000, 4),
+                                  _module('c', 0x2008, 4), _module('d', 0x0004, 1)]
+        with self.assertRaises(AddressConflictError) as ctx:
+            axion.check_address_overlaps()
+        self.assertEqual(ctx.exception.existing_signal, 'Module a')
+        self.assertEqual(ctx.exception.new_signal, 'Module d')
+        self.assertEqual(axion.parse_errors[-1]['msg'],
+                         "Address overlap detected between modules 'a' (0x0-0x10) and 'd' (0x4-0x8)")
+
+        axion.analyzed_modules = _soc(100, 4)
+        self.assertEqual(axion.check_address_overlaps(), [])
+
+
+class TestOverlapScaling(unittest.TestCase):
+    """Test cases for PERF-038"""
+
+    @staticmethod
+    def _lines(check, modules):
+        """Python lines executed by check(modules); unlike wall time, not affected by load."""
+        count = 0
+
+        def tracer(frame, event, arg):
+            nonlocal count
+            if event == 'line':
+                count += 1
+            return tracer
+
+        previous = sys.gettrace()
+        sys.settrace(tracer)
+        try:
+            check(modules)
+        finally:
+            sys.settrace(previous)
+        return count
+
+    def _assert_near_linear(self, check, small, large, factor):
+        work_small = self._lines(check, small)
+        work_large = self._lines(check, large)
+        # factor x the input: a quadratic scan would execute factor² as many lines
+        self.assertLess(work_large, work_small * factor * 2.5)
+
+    def test_perf_038_module_overlaps_scale(self):
+        self._assert_near_linear(lambda m: RuleChecker().check_address_overlaps(m),
+                                 _soc(375, 4), _soc(3000, 4), 8)
+
+    def test_perf_038_register_conflicts_scale(self):
+        check = lambda m: RuleChecker().check_intra_module_address_conflicts(m)
+        self._assert_near_linear(check, [_module('big', 0, 2500)], [_module('big', 0, 20000)], 8)
+
+    def test_perf_038_axion_overlaps_scale(self):
+        def check(modules):
+            axion = AxionHDL()
+            axion.analyzed_modules = modules
+            self.assertEqual(axion.check_address_overlaps(), [])
+        self._assert_near_linear(check, _soc(375, 4), _soc(3000, 4), 8)
+
+    def test_perf_038_hierarchy_overlaps_scale(self):
+        def check(entries):
+            checker = RuleChecker()
+            checker._report_hierarchy(entries, {'blk': 16})
+            self.assertEqual(checker.errors, [])
+        self._assert_near_linear(check, _hierarchy(375), _hierarchy(3000), 8)
+
+if __name__ == '__main__':
+    unittest.main()
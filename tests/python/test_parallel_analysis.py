@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+test_parallel_analysis.py - Parallel Analysis Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-001  analyze(jobs=N) matches serial analysis
+         → TestParallelAnalysis
+
+PERF-002  Parallel outputs are byte-identical
+         → TestParallelAnalysis
+
+PERF-003  CLI --jobs option
+         → TestParallelCLI
+"""
+
+import io
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl.axion import AxionHDL
+from axion_hdl.parse_pool import resolve_jobs, run_parse_tasks
+
+
+TESTS_DIR = project_root / "tests"
+SOURCE_DIRS = ['vhdl', 'sv', 'xml', 'yaml', 'json', 'toml']
+
+
+def _analyze(output_dir, jobs=None, excludes=()):
+    """Analyze all test sources, returning (axion, stdout, stderr)."""
+    axion = AxionHDL(output_dir=output_dir)
+    for name in SOURCE_DIRS:
+        axion.add_source(str(TESTS_DIR / name))
+    if excludes:
+        axion.exclude(*excludes)
+    out, err = io.StringIO(), io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err):
+        axion.analyze(jobs=jobs)
+    return axion, out.getvalue(), err.getvalue()
+
+
+def _read_tree(directory):
+    """Return {relative_path: bytes} for every file under directory."""
+    contents = {}
+    for root, _, files in os.walk(directory):
+        for filename in files:
+            path = os.path.join(root, filename)
+            with open(path, 'rb') as f:
+                contents[os.path.relpath(path, directory)] = f.read()
+    return contents
+
+
+class TestParallelAnalysis(unittest.TestCase):
+    """Test cases for PERF-001 and PERF-002"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        # Same basename for both, as it is auto-excluded and echoed in the log
+        cls.serial_out = os.path.join(cls.temp_dir, 'serial', 'out')
+        cls.parallel_out = os.path.join(cls.temp_dir, 'parallel', 'out')
+        cls.serial, cls.serial_stdout, cls.serial_stderr = _analyze(cls.serial_out)
+        cls.parallel, cls.parallel_stdout, cls.parallel_stderr = _analyze(cls.parallel_out, jobs=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def test_perf_001_resolve_jobs(self):
+        """None and 1 mean serial; 0 means one worker per CPU"""
+        self.assertEqual(resolve_jobs(None), 1)
+        self.assertEqual(resolve_jobs(1), 1)
+        self.assertEqual(resolve_jobs(3), 3)
+        self.assertEqual(resolve_jobs(0), os.cpu_count() or 1)
+
+    def test_perf_001_same_modules_in_same_order(self):
+        """Parallel analysis yields the same module dicts in the same order"""
+        self.assertTrue(self.serial.analyzed_modules)
+        self.assertEqual(
+            [m['name'] for m in self.parallel.analyzed_modules],
+            [m['name'] for m in self.serial.analyzed_modules],
+        )
+        self.assertEqual(self.parallel.analyzed_modules, self.serial.analyzed_modules)
+
+    def test_perf_001_same_parse_errors(self):
+        """Parse errors are merged in serial order"""
+        self.assertEqual(self.parallel.parse_errors, self.serial.parse_errors)
+
+    def test_perf_001_same_console_output(self):
+        """Console output of workers is replayed in serial order"""
+        self.assertEqual(
+            self.parallel_stdout.replace(self.parallel_out, '<out>'),
+            self.serial_stdout.replace(self.serial_out, '<out>'),
+        )
+        self.assertEqual(self.parallel_stderr, self.serial_stderr)
+
+    def test_perf_001_task_order_preserved(self):
+        """run_parse_tasks returns results in task order"""
+        files = sorted(str(p) for p in (TESTS_DIR / 'yaml').glob('*.yaml'))
+        tasks = [('yaml', f, ()) for f in files]
+        results = run_parse_tasks(tasks, 2)
+        self.assertEqual(len(results), len(files))
+        for filepath, result in zip(files, results):
+            self.assertIn(filepath, result['stdout'])
+
+    def test_perf_002_generated_outputs_identical(self):
+        """Generated files are byte-identical between serial and parallel runs"""
+        # Error cases block generation, so leave them out here
+        serial, _, _ = _analyze(self.serial_out, excludes=['error_cases'])
+        parallel, _, _ = _analyze(self.parallel_out, jobs=2, excludes=['error_cases'])
+        with redirect_stdout(io.StringIO()):
+            for axion in (serial, parallel):
+                self.assertTrue(axion.generate_vhdl())
+                self.assertTrue(axion.generate_c_header())
+                self.assertTrue(axion.generate_yaml())
+        serial_files = _read_tree(self.serial_out)
+        parallel_files = _read_tree(self.parallel_out)
+        self.assertTrue(serial_files)
+        self.assertEqual(sorted(parallel_files), sorted(serial_files))
+        for name, content in serial_files.items():
+            self.assertEqual(parallel_files[name], content, f"{name} differs")
+
+
+class TestParallelCLI(unittest.TestCase):
+    """Test cases for PERF-003"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _run_cli(self, args):
+        cmd = [sys.executable, '-m', 'axion_hdl.cli'] + args
+        return subprocess.run(cmd, capture_output=True, text=True, cwd=str(project_root))
+
+    def test_perf_003_jobs_option(self):
+        """--jobs N produces the same outputs as a serial run"""
+        serial_out = os.path.join(self.temp_dir, 'serial')
+        parallel_out = os.path.join(self.temp_dir, 'parallel')
+        source = str(TESTS_DIR / 'yaml')
+
+        result = self._run_cli(['-s', source, '-o', serial_out, '--vhdl', '--c-header'])
+        self.assertEqual(result.returncode, 0, result.stderr)
+        result = self._run_cli(['-s', source, '-o', parallel_out, '--vhdl', '--c-header', '-j', '2'])
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        self.assertEqual(_read_tree(parallel_out), _read_tree(serial_out))
+
+    def test_perf_003_jobs_in_help(self):
+        """--jobs is listed in the CLI help"""
+        result = self._run_cli(['--help'])
+        self.assertIn('--jobs', result.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()
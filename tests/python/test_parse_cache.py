@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+test_parse_cache.py - Persistent Parse Cache Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-004  Cached analysis matches a fresh parse
+         → TestParseCacheAnalysis
+
+PERF-005  Cache key covers content, parser, excludes and version
+         → TestParseCacheKey
+
+PERF-006  Size-bounded LRU eviction
+         → TestParseCacheEviction
+
+PERF-007  CLI --no-cache / --clear-cache
+         → TestParseCacheCLI
+"""
+
+import io
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+from pathlib import Path
+from unittest import mock
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl.axion import AxionHDL
+from axion_hdl.parse_cache import ParseCache, CACHE_DIR_NAME
+
+
+TESTS_DIR = project_root / "tests"
+
+YAML_MODULE = """module: cache_test
+base_addr: "0x0000"
+registers:
+  - name: control
+    addr: "0x00"
+    access: RW
+"""
+
+
+def _write(directory, name, content):
+    path = os.path.join(directory, name)
+    with open(path, 'w') as f:
+        f.write(content)
+    return path
+
+
+def _cache_files(cache_dir):
+    return [os.path.join(root, f) for root, _, files in os.walk(cache_dir) for f in files]
+
+
+class TestParseCacheAnalysis(unittest.TestCase):
+    """Test cases for PERF-004"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = os.path.join(self.temp_dir, 'out')
+        self.cache_dir = os.path.join(self.temp_dir, CACHE_DIR_NAME)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _analyze(self, use_cache=True):
+        axion = AxionHDL(output_dir=self.output_dir)
+        for name in ('vhdl', 'sv', 'xml', 'yaml', 'json', 'toml'):
+            axion.add_source(str(TESTS_DIR / name))
+        out = io.StringIO()
+        with redirect_stdout(out), redirect_stderr(io.StringIO()):
+            if use_cache:
+                axion.enable_cache()
+            axion.analyze()
+        return axion, out.getvalue()
+
+    def test_perf_004_default_cache_location(self):
+        """Cache is created next to the output directory"""
+        self._analyze()
+        self.assertTrue(os.path.isdir(self.cache_dir))
+        self.assertTrue(_cache_files(self.cache_dir))
+
+    def test_perf_004_cached_run_matches_fresh_parse(self):
+        """Second run loads every file from the cache with identical results"""
+        fresh, _ = self._analyze(use_cache=False)
+        first, first_log = self._analyze()
+        second, second_log = self._analyze()
+
+        self.assertIn(" 0 hit(s)", first_log)
+        self.assertIn(" 0 file(s) parsed", second_log)
+        self.assertEqual(first.analyzed_modules, fresh.analyzed_modules)
+        self.assertEqual(second.analyzed_modules, fresh.analyzed_modules)
+        self.assertEqual(second.parse_errors, fresh.parse_errors)
+
+    def test_perf_004_changed_file_is_reparsed(self):
+        """Editing a file invalidates only that file's entry"""
+        src_dir = os.path.join(self.temp_dir, 'src')
+        os.makedirs(src_dir)
+        _write(src_dir, 'cache_test.yaml', YAML_MODULE)
+        _write(src_dir, 'other.yaml', YAML_MODULE.replace('cache_test', 'other'))
+
+        def run():
+            axion = AxionHDL(output_dir=self.output_dir)
+            axion.add_source(src_dir)
+            out = io.StringIO()
+            with redirect_stdout(out):
+                axion.enable_cache()
+                axion.analyze()
+            return axion, out.getvalue()
+
+        run()
+        _write(src_dir, 'cache_test.yaml', YAML_MODULE.replace('control', 'config'))
+        axion, log = run()
+        self.assertIn("1 hit(s), 1 file(s) parsed", log)
+        module = next(m for m in axion.analyzed_modules if m['name'] == 'cache_test')
+        self.assertEqual(module['registers'][0]['signal_name'], 'config')
+
+
+class TestParseCacheKey(unittest.TestCase):
+    """Test cases for PERF-005"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = _write(self.temp_dir, 'regs.yaml', YAML_MODULE)
+        self.cache = ParseCache(os.path.join(self.temp_dir, CACHE_DIR_NAME))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_perf_005_key_is_stable(self):
+        self.assertEqual(self.cache.make_key('yaml', self.path, ['a']),
+                         self.cache.make_key('yaml', self.path, ['a']))
+
+    def test_perf_005_key_depends_on_content(self):
+        before = self.cache.make_key('yaml', self.path, [])
+        _write(self.temp_dir, 'regs.yaml', YAML_MODULE + "\n# comment\n")
+        self.assertNotEqual(self.cache.make_key('yaml', self.path, []), before)
+
+    def test_perf_005_key_depends_on_parser_and_excludes(self):
+        base = self.cache.make_key('yaml', self.path, [])
+        self.assertNotEqual(self.cache.make_key('json', self.path, []), base)
+        self.assertNotEqual(self.cache.make_key('yaml', self.path, ['*_tb.vhd']), base)
+
+    def test_perf_005_key_depends_on_version(self):
+        base = self.cache.make_key('yaml', self.path, [])
+        with mock.patch('axion_hdl.__version__', '0.0.0'):
+            self.assertNotEqual(self.cache.make_key('yaml', self.path, []), base)
+
+    def test_perf_005_missing_file_has_no_key(self):
+        self.assertIsNone(self.cache.make_key('yaml', os.path.join(self.temp_dir, 'nope.yaml'), []))
+
+    def test_perf_005_corrupt_entry_is_a_miss(self):
+        key = self.cache.make_key('yaml', self.path, [])
+        self.cache.put(key, {'module': None})
+        with open(self.cache._entry_path(key), 'wb') as f:
+            f.write(b'not a pickle')
+        self.assertIsNone(self.cache.get(key))
+        self.assertFalse(os.path.exists(self.cache._entry_path(key)))
+
+
+class TestParseCacheEviction(unittest.TestCase):
+    """Test cases for PERF-006"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_perf_006_prune_evicts_least_recently_used(self):
+        cache = ParseCache(os.path.join(self.temp_dir, CACHE_DIR_NAME))
+        payload = {'stdout': 'x' * 1000}
+        keys = [f"{i:02x}" + 'a' * 62 for i in range(5)]
+        for age, key in enumerate(keys):
+            cache.put(key, payload)
+            # Oldest first: entry 0 has the oldest access time
+            os.utime(cache._entry_path(key), (1000 + age, 1000 + age))
+
+        entry_size = os.path.getsize(cache._entry_path(keys[0]))
+        cache.max_bytes = entry_size * 2
+        self.assertEqual(cache.prune(), 3)
+        self.assertIsNone(cache.get(keys[0]))
+        self.assertIsNotNone(cache.get(keys[4]))
+
+    def test_perf_006_clear_removes_everything(self):
+        cache = ParseCache(os.path.join(self.temp_dir, CACHE_DIR_NAME))
+        cache.put('ab' * 32, {'module': None})
+        cache.clear()
+        self.assertFalse(os.path.exists(cache.cache_dir))
+
+
+class TestParseCacheCLI(unittest.TestCase):
+    """Test cases for PERF-007"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = os.path.join(self.temp_dir, 'out')
+        self.cache_dir = os.path.join(self.temp_dir, CACHE_DIR_NAME)
+        self.source = _write(self.temp_dir, 'regs.yaml', YAML_MODULE)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _run_cli(self, args):
+        cmd = [sys.executable, '-m', 'axion_hdl.cli', '-s', self.source, '-o', self.output_dir,
+               '--c-header'] + args
+        return subprocess.run(cmd, capture_output=True, text=True, cwd=str(project_root))
+
+    def test_perf_007_cache_enabled_by_default(self):
+        result = self._run_cli([])
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertTrue(_cache_files(self.cache_dir))
+        result = self._run_cli([])
+        self.assertIn("1 hit(s)", result.stdout)
+
+    def test_perf_007_no_cache(self):
+        result = self._run_cli(['--no-cache'])
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_perf_007_clear_cache(self):
+        self._run_cli([])
+        result = self._run_cli(['--clear-cache'])
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("Parse cache cleared", result.stdout)
+        self.assertIn("0 hit(s)", result.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+test_parse_errors.py - Per-Module Parse Error Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-025  Parse errors scoped to their module, global index by file
+         → TestScopedParseErrors
+
+PERF-026  Error aggregation linear in the number of errors
+         → TestErrorAggregationScaling
+"""
+
+import io
+import os
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl import AxionHDL
+from axion_hdl.parse_errors import ParseErrorIndex
+from axion_hdl.rule_checker import RuleChecker
+
+
+def _vhdl(entity, conflict=False):
+    second_addr = '0x00' if conflict else '0x04'
+    return f"""library ieee;
+use ieee.std_logic_1164.all;
+
+-- @axion_def BASE_ADDR=0x0000
+entity {entity} is
+end entity {entity};
+
+architecture rtl of {entity} is
+    signal reg_a : std_logic_vector(31 downto 0); -- @axion: RW ADDR=0x00
+    signal reg_b : std_logic_vector(31 downto 0); -- @axion: RW ADDR={second_addr}
+begin
+end architecture rtl;
+"""
+
+
+class TestScopedParseErrors(unittest.TestCase):
+    """Test cases for PERF-025"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.files = {}
+        for entity, conflict in [('clean_a', False), ('broken', True), ('clean_b', False)]:
+            path = os.path.join(self.temp_dir, f'{entity}.vhd')
+            with open(path, 'w') as f:
+                f.write(_vhdl(entity, conflict))
+            self.files[entity] = path
+
+        self.axion = AxionHDL(output_dir=os.path.join(self.temp_dir, 'out'))
+        self.axion.add_src(self.temp_dir)
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            self.axion.analyze()
+        self.modules = {m['name']: m for m in self.axion.analyzed_modules}
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_perf_025_errors_scoped_to_module(self):
+        self.assertEqual(self.modules['clean_a']['parsing_errors'], [])
+        self.assertEqual(self.modules['clean_b']['parsing_errors'], [])
+        errors = self.modules['broken']['parsing_errors']
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0]['file'], self.files['broken'])
+        # Lists are not shared between modules
+        self.assertIsNot(self.modules['clean_a']['parsing_errors'],
+                         self.modules['clean_b']['parsing_errors'])
+
+    def test_perf_025_global_index_by_file(self):
+        self.assertEqual(self.axion.get_parse_errors(self.files['broken']),
+                         self.modules['broken']['parsing_errors'])
+        self.assertEqual(self.axion.get_parse_errors(self.files['clean_a']), [])
+        self.assertEqual(list(self.axion.get_parse_errors()), [self.files['broken']])
+
+    def test_perf_025_rule_checker_reports_owner_only(self):
+        checker = RuleChecker()
+        checker.check_parsing_errors(self.axion.analyzed_modules)
+        self.assertEqual([e['module'] for e in checker.errors], ['broken'])
+
+    def test_perf_025_index_follows_list_changes(self):
+        index = ParseErrorIndex()
+        errors = [{'file': 'a', 'msg': '1'}]
+        self.assertEqual(len(index.for_file(errors, 'a')), 1)
+        errors.append({'file': 'a', 'msg': '2'})
+        errors.append({'msg': 'no file'})
+        self.assertEqual([e['msg'] for e in index.for_file(errors, 'a')], ['1', '2'])
+        self.assertEqual(index.for_file(errors, None), [{'msg': 'no file'}])
+        # Cleared and refilled lists are indexed again
+        errors.clear()
+        errors.extend([{'file': 'b', 'msg': '3'}] * 4)
+        self.assertEqual(index.for_file(errors, 'a'), [])
+        self.assertEqual(len(index.for_file(errors, 'b')), 4)
+
+
+class TestErrorAggregationScaling(unittest.TestCase):
+    """Test cases for PERF-026"""
+
+    @staticmethod
+    def _modules(num_errors):
+        return [
+            {'name': f'mod_{i}', 'registers': [],
+             'parsing_errors': [{'file': f'mod_{i}.vhd', 'line': j, 'msg': f'error {j}'}
+                                for j in range(10)]}
+            for i in range(num_errors // 10)
+        ]
+
+    def _check_time(self, num_errors):
+        modules = self._modules(num_errors)
+        checker = RuleChecker()
+        start = time.perf_counter()
+        checker.check_parsing_errors(modules)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(len(checker.errors), num_errors)
+        return elapsed
+
+    def test_perf_026_parsing_error_collection_linear(self):
+        small = min(self._check_time(2000) for _ in range(3))
+        large = min(self._check_time(16000) for _ in range(3))
+        # 8x the errors: quadratic de-duplication would take ~64x as long
+        self.assertLess(large, small * 20)
+
+    def test_perf_026_duplicates_still_dropped(self):
+        checker = RuleChecker()
+        for _ in range(3):
+            checker._add_error("Parsing Error", "m", "msg")
+            checker._add_warning("Documentation", "m", "msg")
+        # Issues appended directly are seen as well
+        checker.errors.append({'type': 'Parsing Error', 'module': 'm', 'msg': 'other'})
+        checker._add_error("Parsing Error", "m", "other")
+        self.assertEqual(len(checker.errors), 2)
+        self.assertEqual(len(checker.warnings), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+test_read_pipeline.py - Registered Read Path Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-045  RD_PIPE attribute and balanced registered mux tree
+         → TestReadTree
+
+PERF-046  Generated read pipeline and matching state machine latency
+         → TestReadPipelineOutput
+"""
+
+import io
+import os
+import re
+import sys
+import shutil
+import tempfile
+import subprocess
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl import AxionHDL
+from axion_hdl.read_pipeline import parse_read_pipeline, plan_read_tree
+from axion_hdl.parser import VHDLParser
+from axion_hdl.systemverilog_parser import SystemVerilogParser
+
+
+VHDL_PIPE = """library ieee;
+use ieee.std_logic_1164.all;
+-- @axion_def BASE_ADDR=0x1000 {attrs}
+entity pipe is
+end entity;
+architecture rtl of pipe is
+{signals}
+    signal ctrl : std_logic_vector(31 downto 0); -- @axion WO
+begin
+end architecture;
+"""
+
+SV_PIPE = """// @axion_def BASE_ADDR=0x2000 RD_PIPE=3
+module pipe_sv (input logic clk);
+    logic [31:0] a; // @axion RW
+    logic [31:0] b; // @axion RO
+    logic [63:0] k; // @axion RO
+endmodule
+"""
+
+
+def _signals(count):
+    return '\n'.join(f"    signal r{i} : std_logic_vector(31 downto 0); -- @axion RW" for i in range(count))
+
+
+class TestReadTree(unittest.TestCase):
+    """Test cases for PERF-045"""
+
+    def test_perf_045_depths(self):
+        self.assertEqual(parse_read_pipeline('2'), 2)
+        self.assertEqual(parse_read_pipeline(0), 0)
+        self.assertIsNone(parse_read_pipeline(None))
+        for bad in ('4', '-1', 'fast'):
+            with self.assertRaises(ValueError):
+                parse_read_pipeline(bad)
+
+    def test_perf_045_tree_shape(self):
+        for sources in (0, 1, 2, 7, 16, 17, 100, 1000):
+            for depth in (1, 2, 3):
+                with self.subTest(sources=sources, depth=depth):
+                    stages = plan_read_tree(sources, depth)
+                    self.assertEqual(len(stages), depth)
+                    self.assertEqual(len(stages[-1]), 1)
+                    # Each stage covers every output of the stage before, once
+                    inputs = sources
+                    for groups in stages:
+                        covered = [i for group in groups for i in group]
+                        self.assertEqual(covered, list(range(inputs)))
+                        inputs = len(groups)
+
+    def test_perf_045_balanced_fan_in(self):
+        stages = plan_read_tree(100, 2)
+        self.assertEqual(max(len(g) for g in stages[0]), 10)
+        self.assertEqual(len(stages[1][0]), 10)
+        self.assertEqual(max(len(g) for s in plan_read_tree(100, 3) for g in s), 5)
+        self.assertEqual([len(g) for g in plan_read_tree(11, 1)[0]], [11])
+
+    def test_perf_045_attribute(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, 'pipe.vhd')
+            for attrs, expected in (('RD_PIPE=2', 2), ('', None), ('RD_PIPE=0', None)):
+                with open(path, 'w') as f:
+                    f.write(VHDL_PIPE.format(attrs=attrs, signals=_signals(3)))
+                with redirect_stdout(io.StringIO()):
+                    module = VHDLParser()._parse_vhdl_file(path)
+                self.assertEqual(module.get('read_pipeline'), expected)
+
+            with open(path, 'w') as f:
+                f.write(VHDL_PIPE.format(attrs='RD_PIPE=5', signals=_signals(3)))
+            with redirect_stdout(io.StringIO()):
+                module = VHDLParser()._parse_vhdl_file(path)
+            self.assertIn("Invalid RD_PIPE '5'", module['parsing_errors'][0]['msg'])
+
+            sv_path = os.path.join(temp_dir, 'pipe.sv')
+            with open(sv_path, 'w') as f:
+                f.write(SV_PIPE)
+            with redirect_stdout(io.StringIO()):
+                module = SystemVerilogParser()._parse_sv_file(sv_path)
+            self.assertEqual(module['read_pipeline'], 3)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+class TestReadPipelineOutput(unittest.TestCase):
+    """Test cases for PERF-046"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.out_dir = os.path.join(self.temp_dir, 'out')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _generate(self, name, content):
+        with open(os.path.join(self.temp_dir, name), 'w') as f:
+            f.write(content)
+        axion = AxionHDL(output_dir=self.out_dir)
+        with redirect_stdout(io.StringIO()):
+            axion.add_source(self.temp_dir)
+            axion.analyze()
+            self.assertTrue(axion.generate_vhdl())
+            self.assertTrue(axion.generate_systemverilog())
+
+    def _read(self, name):
+        with open(os.path.join(self.out_dir, name)) as f:
+            return f.read()
+
+    def test_perf_046_vhdl_pipeline(self):
+        self._generate('pipe.vhd', VHDL_PIPE.format(attrs='RD_PIPE=2', signals=_signals(9)))
+        vhdl = self._read('pipe_axion_reg.vhd')
+        # 9 sources, 2 stages: three registered sub-muxes of three
+        self.assertIn("signal rd_pipe1 : rd_pipe_array(0 to 2)", vhdl)
+        self.assertIn("rd_pipe1(2) <= rd_mux;", vhdl)
+        self.assertIn("rd_mux := rd_mux or rd_pipe1(i);", vhdl)
+        self.assertIn("rd_data_reg <= rd_mux;", vhdl)
+        # The read process is clocked instead of sensitive to every register
+        self.assertNotRegex(vhdl, r"process\(rd_addr_reg")
+        # RD_ADDR waits one extra cycle before RVALID
+        self.assertIn("if rd_pipe_cnt = 1 then", vhdl)
+        self.assertEqual(vhdl.count("axi_rvalid <= '1';"), 1)
+
+    def test_perf_046_vhdl_single_stage_keeps_latency(self):
+        self._generate('pipe.vhd', VHDL_PIPE.format(attrs='RD_PIPE=1 DECODE=case', signals=_signals(4)))
+        vhdl = self._read('pipe_axion_reg.vhd')
+        self.assertNotIn('rd_pipe_cnt', vhdl)
+        self.assertNotIn('rd_pipe1', vhdl)
+        self.assertIn("rd_mux := rd_mux or r3_reg;", vhdl)
+        self.assertIn("if rd_sel(3) = '1' then", vhdl)
+
+    def test_perf_046_systemverilog_pipeline(self):
+        self._generate('pipe.sv', SV_PIPE)
+        sv = self._read('pipe_sv_axion_reg.sv')
+        self.assertIn("READ_WAIT,", sv)
+        self.assertIn("if (rd_pipe_cnt == 2'd2) begin", sv)
+        self.assertIn("rd_pipe2_hit[0] <= |rd_pipe1_hit[1:0];", sv)
+        self.assertIn("rresp_reg <= |rd_pipe2_hit[0:0] ? OKAY : SLVERR;", sv)
+        self.assertIn("ADDR_K + 32'h4: begin", sv)
+        self.assertNotIn("always_comb begin\n        rdata_reg", sv)
+
+    def test_perf_046_default_unchanged(self):
+        self._generate('pipe.vhd', VHDL_PIPE.format(attrs='', signals=_signals(3)))
+        self.assertNotIn('rd_pipe', self._read('pipe_axion_reg.vhd'))
+        sv = self._read('pipe_axion_reg.sv')
+        self.assertNotIn('READ_WAIT', sv)
+        self.assertIn("always_comb begin\n        rdata_reg = '0;", sv)
+
+    def test_perf_046_cli_read_pipeline(self):
+        with open(os.path.join(self.temp_dir, 'pipe.vhd'), 'w') as f:
+            f.write(VHDL_PIPE.format(attrs='', signals=_signals(3)))
+        cmd = [sys.executable, '-m', 'axion_hdl.cli', '-s', self.temp_dir, '-o', self.out_dir,
+               '--vhdl', '--read-pipeline', '3']
+        result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(project_root))
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        vhdl = self._read('pipe_axion_reg.vhd')
+        self.assertIn("if rd_pipe_cnt = 2 then", vhdl)
+        self.assertEqual(len(re.findall(r"-- Stage \d", vhdl)), 3)
+
+        cmd[-1] = '4'
+        result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(project_root))
+        self.assertNotEqual(result.returncode, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+test_rule_registry.py - Rule Registry and Parallel Rule Check Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-039  Registry of module-local and global rules, fanned out over workers
+         → TestRuleRegistry
+
+PERF-040  Per-rule timings in the reports and rule selection from the CLI
+         → TestRuleTimingsAndSelection
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import subprocess
+import unittest
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl.rule_checker import RuleChecker, RULES, RULE_SCOPES, select_rules
+
+
+def _modules(count):
+    """Modules that trip most rules: bad names, wide defaults, overlaps."""
+    modules = []
+    for m in range(count):
+        registers = []
+        for i in range(6):
+            registers.append({
+                'reg_name': ['ctrl', 'status', 'ctrl', 'cfg__x', 'signal', 'data_'][i],
+                'address_int': (m % 3) * 0x10 + i * 4 - (2 if i == 5 else 0),
+                'width': 8 if i == 1 else 32,
+                'default_value': '0x1FF',
+                'description': '' if i % 2 else 'documented',
+                'enum_values': {3: 'A', 300: 'B'} if i == 1 else None,
+            })
+        modules.append({'name': f'mod{m % (count - 2)}', 'base_address': (m % 3) * 0x10,
+                        'registers': registers,
+                        'parsing_errors': [{'msg': 'bad attribute', 'line': m}] if m % 5 == 0 else []})
+    return modules
+
+
+class TestRuleRegistry(unittest.TestCase):
+    """Test cases for PERF-039"""
+
+    def test_perf_039_registry(self):
+        names = [rule.name for rule in RULES]
+        self.assertEqual(len(names), len(set(names)))
+        for rule in RULES:
+            self.assertIn(rule.scope, RULE_SCOPES)
+            self.assertTrue(callable(getattr(RuleChecker, rule.method)))
+        global_rules = {rule.name for rule in RULES if rule.scope == 'global'}
+        self.assertEqual(global_rules, {'address-overlaps', 'unique-module-names', 'hierarchy'})
+
+    def test_perf_039_select_rules(self):
+        self.assertEqual(select_rules(), list(RULES))
+        self.assertEqual([r.name for r in select_rules(['duplicate-names,naming-conventions'])],
+                         ['naming-conventions', 'duplicate-names'])
+        skipped = select_rules(skip=['documentation', 'address-overlaps'])
+        self.assertEqual(len(skipped), len(RULES) - 2)
+        with self.assertRaises(ValueError):
+            select_rules(['no-such-rule'])
+
+    def test_perf_039_parallel_matches_serial(self):
+        modules = _modules(40)
+        serial = RuleChecker()
+        expected = serial.run_all_checks(modules)
+        self.assertTrue(expected['errors'] and expected['warnings'])
+        for jobs in (2, 3):
+            parallel = RuleChecker()
+            self.assertEqual(parallel.run_all_checks(modules, jobs=jobs), expected)
+            self.assertEqual([t['issues'] for t in parallel.timings],
+                             [t['issues'] for t in serial.timings])
+
+    def test_perf_039_selected_rules_only(self):
+        checker = RuleChecker()
+        result = checker.run_all_checks(_modules(10), rules=['duplicate-names'])
+        self.assertEqual({e['type'] for e in result['errors']}, {'Duplicate Name'})
+        self.assertEqual(result['warnings'], [])
+        self.assertEqual([t['rule'] for t in checker.timings], ['duplicate-names'])
+
+
+class TestRuleTimingsAndSelection(unittest.TestCase):
+    """Test cases for PERF-040"""
+
+    def test_perf_040_timings_in_reports(self):
+        checker = RuleChecker()
+        checker.run_all_checks(_modules(10), skip=['documentation'])
+        # 'hierarchy' only runs when a hierarchy is given
+        self.assertEqual(len(checker.timings), len(RULES) - 2)
+        for timing in checker.timings:
+            self.assertEqual(timing['items'], 10)
+            self.assertGreaterEqual(timing['seconds'], 0)
+
+        report = checker.generate_report()
+        self.assertIn('RULE TIMINGS', report)
+        self.assertIn('enum-overflow', report)
+        data = json.loads(checker.generate_json())
+        self.assertEqual(data['rules'], checker.timings)
+
+        clean = RuleChecker()
+        clean.run_all_checks([], rules=['logical-integrity'])
+        self.assertIn('All checks passed', clean.generate_report())
+        self.assertIn('logical-integrity', clean.generate_report())
+
+    def test_perf_040_cli_rule_selection(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(temp_dir, 'sel.vhd'), 'w') as f:
+                f.write("entity sel is\nend entity;\narchitecture rtl of sel is\n"
+                        "    signal ctrl : std_logic_vector(31 downto 0); -- @axion RW\n"
+                        "begin\nend architecture;\n")
+            report = os.path.join(temp_dir, 'report.json')
+            cmd = [sys.executable, '-m', 'axion_hdl.cli', '-s', temp_dir,
+                   '--rule-check', report, '--rules', 'naming-conventions,duplicate-names',
+                   '--skip-rules', 'duplicate-names']
+            result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(project_root))
+            self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+            with open(report) as f:
+                self.assertEqual([t['rule'] for t in json.load(f)['rules']], ['naming-conventions'])
+
+            cmd[-4:] = ['--rules', 'no-such-rule']
+            result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(project_root))
+            self.assertNotEqual(result.returncode, 0)
+            self.assertIn('Unknown rule(s): no-such-rule', result.stdout)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+test_signal_types.py - Shared Signal Type Resolution Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-029  Memoized signal type resolution to a frozen record
+         → TestSignalTypeResolution
+
+PERF-030  Parsers and generators share the resolution
+         → TestSharedResolution
+"""
+
+import io
+import sys
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl import AxionHDL
+from axion_hdl.signal_types import (
+    SignalType, RANGE, VECTOR, BIT, UNKNOWN, resolve_signal_type
+)
+from axion_hdl.generator import VHDLGenerator
+from axion_hdl.systemverilog_generator import SystemVerilogGenerator
+from axion_hdl.doc_generators import CHeaderGenerator
+from axion_hdl.parser import VHDLParser
+from axion_hdl.systemverilog_parser import SystemVerilogParser
+from axion_hdl.ir import RegisterIR
+
+
+class TestSignalTypeResolution(unittest.TestCase):
+    """Test cases for PERF-029"""
+
+    def test_perf_029_notations(self):
+        cases = {
+            '[31:0]': (32, 31, 0, 1, RANGE),
+            '[0:0]': (1, 0, 0, 1, RANGE),
+            '[99:0]': (100, 99, 0, 4, RANGE),
+            '[15:8]': (8, 15, 8, 1, RANGE),
+            'std_logic_vector(63 downto 0)': (64, 63, 0, 2, VECTOR),
+            'std_logic': (1, 0, 0, 1, BIT),
+            'logic': (1, 0, 0, 1, BIT),
+            'integer': (32, 31, 0, 1, UNKNOWN),
+        }
+        for signal_type, expected in cases.items():
+            with self.subTest(signal_type=signal_type):
+                self.assertEqual(tuple(resolve_signal_type(signal_type)), expected)
+
+    def test_perf_029_frozen_and_memoized(self):
+        resolve_signal_type.cache_clear()
+        first = resolve_signal_type('[47:0]')
+        self.assertIsInstance(first, SignalType)
+        with self.assertRaises(AttributeError):
+            first.width = 8
+        self.assertIs(resolve_signal_type('[47:0]'), first)
+        info = resolve_signal_type.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_perf_029_ir_signal_property(self):
+        reg = RegisterIR.from_dict({'signal_name': 'data', 'signal_type': '[63:0]'})
+        self.assertEqual(reg.signal.num_chunks, 2)
+        self.assertIs(reg.signal, resolve_signal_type('[63:0]'))
+
+
+class TestSharedResolution(unittest.TestCase):
+    """Test cases for PERF-030"""
+
+    def test_perf_030_helpers_keep_their_results(self):
+        self.assertEqual(VHDLGenerator._signal_type_to_vhdl('[7:0]'), 'std_logic_vector(7 downto 0)')
+        self.assertEqual(VHDLGenerator._signal_type_to_vhdl('[0:0]'), 'std_logic')
+        self.assertEqual(VHDLGenerator._signal_type_to_vhdl('std_logic'), 'std_logic')
+        self.assertEqual(VHDLGenerator._get_signal_width('std_logic_vector(11 downto 0)'), 12)
+        self.assertEqual(VHDLGenerator._get_num_regs('[63:0]'), 2)
+        self.assertEqual(VHDLGenerator._get_num_regs('std_logic_vector(63 downto 0)'), 1)
+        self.assertEqual(VHDLGenerator._expand_to_32bit('s', '[5:0]'), "(31 downto 6 => '0') & s")
+        self.assertEqual(VHDLGenerator._slice_from_32bit('s', '[5:0]'), 's(5 downto 0)')
+        self.assertEqual(VHDLGenerator._slice_from_32bit('s', '[0:0]'), 's(0)')
+
+        sv = SystemVerilogGenerator(tempfile.gettempdir())
+        self.assertEqual(sv._signal_type_to_sv('[0:0]'), 'logic')
+        self.assertEqual(sv._signal_type_to_sv('[15:0]'), 'logic [15:0]')
+        self.assertEqual(sv._signal_type_to_sv('std_logic'), 'logic [31:0]')
+
+        c_header = CHeaderGenerator(tempfile.gettempdir())
+        self.assertEqual(c_header._get_signal_width('std_logic'), 1)
+        self.assertEqual(c_header._get_signal_width('[47:0]'), 48)
+
+        self.assertEqual(VHDLParser()._extract_width('[0:0]'), 1)
+        self.assertEqual(VHDLParser()._extract_width('std_logic_vector(9 downto 0)'), 10)
+        self.assertEqual(SystemVerilogParser()._extract_width(''), 1)
+        self.assertEqual(SystemVerilogParser()._extract_width('[0:7]'), 8)
+
+    def test_perf_030_one_resolution_per_type_across_outputs(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            axion = AxionHDL(output_dir=temp_dir)
+            axion.add_src(str(project_root / 'tests' / 'vhdl'))
+            with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+                axion.analyze()
+                resolve_signal_type.cache_clear()
+                axion.generate_vhdl()
+                axion.generate_systemverilog()
+                axion.generate_c_header()
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        types = {reg['signal_type'] for m in axion.analyzed_modules for reg in m['registers']}
+        types |= {f['signal_type'] for m in axion.analyzed_modules
+                  for reg in m['registers'] for f in reg.get('fields') or ()}
+        info = resolve_signal_type.cache_info()
+        # Each distinct type string is parsed once; every other use is a hit
+        self.assertLessEqual(info.misses, len(types))
+        self.assertGreater(info.hits, info.misses * 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
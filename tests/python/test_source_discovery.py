@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+test_source_discovery.py - Shared Source Discovery Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-010  Single directory walk shared by all parsers
+         → TestSourceDiscovery, TestSingleWalk
+
+PERF-011  Source inventory API
+         → TestSourceInventory
+
+PERF-014  @axion prefilter for HDL files
+         → TestAnnotationPrefilter
+"""
+
+import io
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl.axion import AxionHDL
+from axion_hdl import source_discovery
+from axion_hdl.source_discovery import SourceInventory, source_kind, walk_source_files, has_axion_annotation
+from axion_hdl.parser import VHDLParser
+from axion_hdl.systemverilog_parser import SystemVerilogParser
+
+
+TREE = [
+    'top.vhd',
+    'top.sv',
+    'regs.YAML',
+    'a/inner.vhdl',
+    'a/map.xml',
+    'a/b/deep.json',
+    'a/b/deep.toml',
+    'tb/top_tb.vhd',
+    'notes.txt',
+]
+
+
+def _make_tree(base):
+    for rel in TREE:
+        path = os.path.join(base, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write('')
+
+
+class TestSourceDiscovery(unittest.TestCase):
+    """Test cases for PERF-010"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        _make_tree(self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_perf_010_source_kind(self):
+        self.assertEqual(source_kind('x.vhd'), 'vhdl')
+        self.assertEqual(source_kind('x.vhdl'), 'vhdl')
+        self.assertEqual(source_kind('x.svh'), 'sv')
+        self.assertEqual(source_kind('x.XML'), 'xml')
+        self.assertEqual(source_kind('x.yml'), 'yaml')
+        self.assertEqual(source_kind('x.Json'), 'json')
+        self.assertEqual(source_kind('x.toml'), 'toml')
+        self.assertIsNone(source_kind('x.txt'))
+
+    def test_perf_010_buckets_by_kind(self):
+        buckets = walk_source_files(self.temp_dir)
+        rel = {kind: sorted(os.path.relpath(p, self.temp_dir) for p in paths)
+               for kind, paths in buckets.items()}
+        self.assertEqual(rel['vhdl'], ['a/inner.vhdl', 'tb/top_tb.vhd', 'top.vhd'])
+        self.assertEqual(rel['sv'], ['top.sv'])
+        self.assertEqual(rel['xml'], ['a/map.xml'])
+        self.assertEqual(rel['yaml'], ['regs.YAML'])
+        self.assertEqual(rel['json'], ['a/b/deep.json'])
+        self.assertEqual(rel['toml'], ['a/b/deep.toml'])
+
+    def test_perf_010_matches_os_walk_order(self):
+        expected = []
+        for root, _, files in os.walk(self.temp_dir):
+            expected.extend(os.path.join(root, f) for f in files if source_kind(f) == 'vhdl')
+        self.assertEqual(walk_source_files(self.temp_dir)['vhdl'], expected)
+
+    def test_perf_010_prune_dir(self):
+        buckets = walk_source_files(self.temp_dir, prune_dir=lambda d: os.path.basename(d) == 'a')
+        self.assertEqual(buckets['xml'], [])
+        self.assertEqual(buckets['json'], [])
+        self.assertEqual(len(buckets['vhdl']), 2)
+
+    def test_perf_010_missing_directory(self):
+        buckets = walk_source_files(os.path.join(self.temp_dir, 'missing'))
+        self.assertTrue(all(paths == [] for paths in buckets.values()))
+
+
+class TestSourceInventory(unittest.TestCase):
+    """Test cases for PERF-011"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        _make_tree(self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_perf_011_files_with_prune(self):
+        inventory = SourceInventory()
+        files = inventory.files(self.temp_dir, 'vhdl', prune_dir=lambda d: d.endswith('tb'))
+        self.assertEqual(sorted(os.path.basename(f) for f in files), ['inner.vhdl', 'top.vhd'])
+
+    def test_perf_011_root_is_never_pruned(self):
+        inventory = SourceInventory()
+        files = inventory.files(self.temp_dir, 'vhdl', prune_dir=lambda d: True)
+        self.assertEqual([os.path.basename(f) for f in files], ['top.vhd'])
+
+    def test_perf_011_kinds(self):
+        inventory = SourceInventory()
+        self.assertEqual(inventory.kinds(self.temp_dir), ['vhdl', 'sv', 'xml', 'yaml', 'json', 'toml'])
+        self.assertEqual(inventory.roots(), [self.temp_dir])
+
+    def test_perf_011_axion_inventory(self):
+        axion = AxionHDL(output_dir=os.path.join(self.temp_dir, 'out'))
+        with redirect_stdout(io.StringIO()):
+            axion.add_source(self.temp_dir)
+        inventory = axion.get_source_inventory()
+        self.assertEqual(len(inventory.files(self.temp_dir, ('vhdl', 'sv'))), 4)
+
+    def test_perf_011_refresh_sees_new_files(self):
+        axion = AxionHDL(output_dir=os.path.join(self.temp_dir, 'out'))
+        with redirect_stdout(io.StringIO()):
+            axion.add_source(self.temp_dir)
+
+        new_file = os.path.join(self.temp_dir, 'added.vhd')
+        with open(new_file, 'w') as f:
+            f.write('')
+        self.assertNotIn(new_file, axion.get_source_inventory().files(self.temp_dir, ('vhdl',)))
+        self.assertIn(new_file, axion.get_source_inventory(refresh=True).files(self.temp_dir, ('vhdl',)))
+
+    def test_perf_011_gui_sees_new_files(self):
+        try:
+            from axion_hdl.gui import AnalysisCache, AxionGUI
+            import flask  # noqa: F401
+        except ImportError:
+            self.skipTest('GUI dependencies are not installed')
+
+        axion = AxionHDL(output_dir=os.path.join(self.temp_dir, 'out'))
+        with redirect_stdout(io.StringIO()):
+            axion.add_source(self.temp_dir)
+        cache = AnalysisCache()
+        cache.update_mtimes(axion)
+        self.assertFalse(cache.needs_refresh(axion))
+
+        new_file = os.path.join(self.temp_dir, 'added.vhd')
+        with open(new_file, 'w') as f:
+            f.write('')
+        self.assertTrue(cache.needs_refresh(axion))
+
+        gui = AxionGUI(axion)
+        gui.setup_app()
+        response = gui.app.test_client().get('/api/config/files')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(new_file, [f['path'] for f in response.get_json()])
+
+
+class TestSingleWalk(unittest.TestCase):
+    """Test cases for PERF-010 (one walk per analysis)"""
+
+    def test_perf_010_add_source_and_analyze_walk_once(self):
+        walked = []
+        real_walk = source_discovery.walk_source_files
+
+        def counting_walk(root, prune_dir=None):
+            walked.append(root)
+            return real_walk(root, prune_dir)
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            axion = AxionHDL(output_dir=os.path.join(temp_dir, 'out'))
+            with mock.patch.object(source_discovery, 'walk_source_files', counting_walk), \
+                    redirect_stdout(io.StringIO()):
+                for name in ('vhdl', 'yaml', 'toml'):
+                    axion.add_source(str(project_root / 'tests' / name))
+                axion.analyze()
+                self.assertEqual(len(walked), 3)
+                self.assertTrue(axion.analyzed_modules)
+
+                # Sources may change between analyses: the next one walks again
+                axion.analyze()
+                self.assertEqual(len(walked), 6)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+ANNOTATED_VHDL = """entity annotated is
+end entity;
+architecture rtl of annotated is
+    signal ctrl : std_logic_vector(31 downto 0); -- @axion RW
+begin
+end architecture;
+"""
+
+PLAIN_VHDL = """entity plain_tb is
+end entity;
+architecture sim of plain_tb is
+    signal clk : std_logic; -- @ clock, not an annotation
+begin
+end architecture;
+"""
+
+ANNOTATED_SV = """module annotated_sv (input logic clk);
+    logic [31:0] ctrl; // @axion RW
+endmodule
+"""
+
+PLAIN_SV = """module plain_sv (input logic clk);
+    logic [31:0] data;
+endmodule
+"""
+
+
+class TestAnnotationPrefilter(unittest.TestCase):
+    """Test cases for PERF-014"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, name, content):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'wb' if isinstance(content, bytes) else 'w') as f:
+            f.write(content)
+        return path
+
+    def test_perf_014_detects_annotations(self):
+        self.assertTrue(has_axion_annotation(self._write('a.vhd', ANNOTATED_VHDL)))
+        self.assertTrue(has_axion_annotation(self._write('b.vhd', '-- @AXION_DEF BASE_ADDR=0x0\n')))
+        self.assertFalse(has_axion_annotation(self._write('c.vhd', PLAIN_VHDL)))
+        self.assertFalse(has_axion_annotation(self._write('empty.vhd', '')))
+
+    def test_perf_014_unreadable_file_is_left_to_parser(self):
+        self.assertTrue(has_axion_annotation(os.path.join(self.temp_dir, 'missing.vhd')))
+
+    def test_perf_014_skips_without_decoding(self):
+        # Not valid UTF-8: decoding would fail, the prefilter never decodes
+        path = self._write('vendor.vhd', b'entity vendor is end;\n-- \xff\xfe\n')
+        parser = VHDLParser()
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.assertIsNone(parser._parse_vhdl_file(path))
+        self.assertEqual(parser.skipped_files, 1)
+        self.assertEqual(parser.errors, [])
+        self.assertEqual(out.getvalue(), '')
+
+    def test_perf_014_sv_parser_skips(self):
+        parser = SystemVerilogParser()
+        self.assertIsNone(parser._parse_sv_file(self._write('plain.sv', PLAIN_SV)))
+        self.assertEqual(parser.skipped_files, 1)
+        self.assertIsNotNone(parser._parse_sv_file(self._write('annotated.sv', ANNOTATED_SV)))
+        self.assertEqual(parser.skipped_files, 1)
+
+    def test_perf_014_summary_reports_skipped_files(self):
+        src = os.path.join(self.temp_dir, 'src')
+        os.makedirs(src)
+        for name, content in (('annotated.vhd', ANNOTATED_VHDL), ('plain_tb.vhd', PLAIN_VHDL),
+                              ('other_tb.vhd', PLAIN_VHDL), ('annotated.sv', ANNOTATED_SV),
+                              ('plain.sv', PLAIN_SV)):
+            with open(os.path.join(src, name), 'w') as f:
+                f.write(content)
+
+        axion = AxionHDL(output_dir=os.path.join(self.temp_dir, 'out'))
+        out = io.StringIO()
+        with redirect_stdout(out):
+            axion.add_source(src)
+            axion.analyze()
+        log = out.getvalue()
+
+        self.assertEqual(sorted(m['name'] for m in axion.analyzed_modules), ['annotated', 'annotated_sv'])
+        self.assertEqual(axion.skipped_files, {'vhdl': 2, 'sv': 1})
+        self.assertIn("Skipped 2 VHDL file(s) without @axion annotations.", log)
+        self.assertIn("Skipped 3 HDL file(s) without @axion annotations.", log)
+        self.assertNotIn("plain_tb.vhd", log)
+
+
+if __name__ == '__main__':
+    unittest.main()
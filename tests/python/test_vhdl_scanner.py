@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+test_vhdl_scanner.py - Single-pass VHDL Annotation Scanner Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-015  Single-pass VHDL annotation scanner
+         → TestVHDLScanner
+
+PERF-016  Multi-line and comma-separated signal declarations
+         → TestDeclarationForms
+"""
+
+import io
+import os
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl.parser import VHDLParser
+from axion_hdl.vhdl_scanner import scan_vhdl, first_entity
+
+
+SAMPLE = """library ieee;
+-- @axion_def BASE_ADDR=0x1000
+-- entity commented_out is
+entity sample is
+    port (clk : in std_logic);
+end entity;
+architecture rtl of sample is
+    -- signal dead : std_logic; -- @axion RW
+    signal ctrl : std_logic_vector(31 downto 0) := (others => '0'); -- @axion RW ADDR=0x4
+    signal plain : std_logic; -- not annotated; has a semicolon
+    signal flag : std_logic; -- @AXION RO
+    -- @axion RW (no declaration)
+begin
+end architecture;
+"""
+
+
+def _big_vhdl(num_signals):
+    lines = ['-- @axion_def BASE_ADDR=0x0', 'entity big is end entity;', 'architecture rtl of big is']
+    for i in range(num_signals):
+        if i % 5 == 0:
+            lines.append(f'    signal s{i} : std_logic_vector(31 downto 0); -- @axion RW')
+        else:
+            lines.append(f'    signal t{i} : std_logic; -- plain comment {i}')
+    lines.append('begin end architecture;')
+    return '\n'.join(lines)
+
+
+class TestVHDLScanner(unittest.TestCase):
+    """Test cases for PERF-015"""
+
+    def test_perf_015_events_in_source_order(self):
+        events = list(scan_vhdl(SAMPLE))
+        self.assertEqual([(e.kind, e.line) for e in events],
+                         [('def', 2), ('entity', 4), ('signal', 9), ('signal', 11)])
+        self.assertEqual(events[0].text, 'BASE_ADDR=0x1000')
+        self.assertEqual(first_entity(events), 'sample')
+        self.assertEqual(events[2].names, ('ctrl',))
+        self.assertEqual(events[2].signal_type, "std_logic_vector(31 downto 0) := (others => '0')")
+        self.assertEqual(events[2].text, 'RW ADDR=0x4')
+        self.assertEqual(events[3].text, 'RO')
+
+    def test_perf_015_commented_code_is_ignored(self):
+        names = [e.names for e in scan_vhdl(SAMPLE) if e.kind == 'signal']
+        self.assertNotIn(('dead',), names)
+        self.assertNotIn(('plain',), names)
+
+    def test_perf_015_no_entity(self):
+        self.assertIsNone(first_entity(list(scan_vhdl("-- @axion_def BASE_ADDR=0x0\n"))))
+
+    def test_perf_015_linear_time(self):
+        small, large = _big_vhdl(10000), _big_vhdl(50000)
+
+        start = time.perf_counter()
+        list(scan_vhdl(small))
+        small_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        events = list(scan_vhdl(large))
+        large_time = time.perf_counter() - start
+
+        self.assertEqual(sum(1 for e in events if e.kind == 'signal'), 10000)
+        # Last annotated signal is s49995 on line 3 + 49995 + 1
+        self.assertEqual(events[-1].line, 49999)
+        # 5x the input must not take anywhere near 25x the time
+        self.assertLess(large_time, max(small_time, 0.005) * 15)
+
+
+class TestDeclarationForms(unittest.TestCase):
+    """Test cases for PERF-016"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _parse(self, body):
+        path = os.path.join(self.temp_dir, 'forms.vhd')
+        with open(path, 'w') as f:
+            f.write("entity forms is\nend entity;\narchitecture rtl of forms is\n"
+                    f"{body}\nbegin\nend architecture;\n")
+        parser = VHDLParser()
+        with redirect_stdout(io.StringIO()):
+            module = parser._parse_vhdl_file(path)
+        return module, parser
+
+    def test_perf_016_multi_line_declaration(self):
+        module, parser = self._parse(
+            "    signal wide_ctrl : std_logic_vector(\n"
+            "        15 downto 0\n"
+            "    ); -- @axion RW DESC=\"Split over lines\"")
+        self.assertEqual(parser.errors, [])
+        reg = module['registers'][0]
+        self.assertEqual(reg['signal_name'], 'wide_ctrl')
+        self.assertEqual(reg['width'], 16)
+        self.assertEqual(reg['access_mode'], 'RW')
+        self.assertEqual(reg['description'], 'Split over lines')
+
+    def test_perf_016_comma_separated_list(self):
+        module, parser = self._parse(
+            "    signal status_a, status_b,\n"
+            "           status_c : std_logic_vector(7 downto 0); -- @axion RO")
+        self.assertEqual(parser.errors, [])
+        regs = module['registers']
+        self.assertEqual([r['signal_name'] for r in regs], ['status_a', 'status_b', 'status_c'])
+        self.assertEqual([r['relative_address_int'] for r in regs], [0, 4, 8])
+        self.assertTrue(all(r['access_mode'] == 'RO' and r['width'] == 8 for r in regs))
+
+    def test_perf_016_packed_list(self):
+        module, parser = self._parse(
+            "    signal en_a, en_b : std_logic; -- @axion RW REG_NAME=enables")
+        self.assertEqual(parser.errors, [])
+        packed = [r for r in module['registers'] if r.get('is_packed')]
+        self.assertEqual(len(packed), 1)
+        self.assertEqual([f['name'] for f in packed[0]['fields']], ['en_a', 'en_b'])
+
+
+if __name__ == '__main__':
+    unittest.main()
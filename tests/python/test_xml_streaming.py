@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+test_xml_streaming.py - Streaming IP-XACT (SPIRIT) XML Input Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-019  Streaming SPIRIT XML conversion
+         → TestSpiritStreaming
+
+PERF-020  Bounded memory for large SPIRIT XML files
+         → TestSpiritStreamingMemory
+"""
+
+import io
+import os
+import sys
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+import xml.etree.ElementTree as ET
+from contextlib import redirect_stdout
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl.xml_input_parser import XMLInputParser
+
+
+def _spirit_xml(num_regs, prefix='spirit:', bad_enum=False):
+    """SPIRIT document in the XMLGenerator layout with num_regs registers."""
+    s = prefix
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<spirit:component xmlns:spirit="http://www.spiritconsortium.org/XMLSchema/SPIRIT/1.5">',
+        '  <spirit:vendor>axion</spirit:vendor>',
+        '  <spirit:name>stream_mod</spirit:name>',
+        '  <spirit:vendorExtensions><axion:config cdc_en="true" '
+        'xmlns:axion="http://axion-hdl.org/extensions"/></spirit:vendorExtensions>',
+        f'  <{s}memoryMaps><{s}memoryMap><{s}name>register_map</{s}name>',
+        f'  <{s}addressBlock><{s}name>registers</{s}name>',
+        f'  <{s}baseAddress>0x4000</{s}baseAddress><{s}width>32</{s}width>',
+    ]
+    for i in range(num_regs):
+        strobe = ' w_strobe="true"' if i % 3 == 0 else ''
+        lines.append(
+            f'    <{s}register{strobe}><{s}name>reg_{i}</{s}name>'
+            f'<{s}description>Register {i}</{s}description>'
+            f'<{s}addressOffset>0x{i * 4:X}</{s}addressOffset><{s}size>32</{s}size>'
+            f'<{s}access>{"read-only" if i % 2 else "read-write"}</{s}access>'
+            f'<{s}field><{s}name>mode_{i}</{s}name><{s}bitOffset>0</{s}bitOffset>'
+            f'<{s}bitWidth>2</{s}bitWidth><{s}enumeratedValues>'
+            f'<{s}enumeratedValue><{s}name>IDLE</{s}name><{s}value>0</{s}value></{s}enumeratedValue>'
+            f'<{s}enumeratedValue><{s}name>RUN</{s}name>'
+            f'<{s}value>{"bogus" if bad_enum and i == 1 else "1"}</{s}value></{s}enumeratedValue>'
+            f'</{s}enumeratedValues></{s}field>'
+            f'<{s}field><{s}name>flag_{i}</{s}name><{s}bitOffset>2</{s}bitOffset></{s}field>'
+            f'</{s}register>'
+        )
+    lines += [f'  </{s}addressBlock></{s}memoryMap></{s}memoryMaps>', '</spirit:component>', '']
+    return '\n'.join(lines)
+
+
+class _SpiritFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_xml(self, content, name='spirit.xml'):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+
+class TestSpiritStreaming(_SpiritFileTest):
+    """Test cases for PERF-019"""
+
+    def _compare_with_tree(self, path):
+        streamed = XMLInputParser()
+        with redirect_stdout(io.StringIO()):
+            events = ET.iterparse(path, events=('start', 'end'))
+            _, root = next(events)
+            stream_data = streamed._spirit_stream_to_module(events, root, path)
+
+        loaded = XMLInputParser()
+        with redirect_stdout(io.StringIO()):
+            tree_data = loaded._spirit_to_module(ET.parse(path).getroot(), path)
+
+        self.assertEqual(stream_data, tree_data)
+        self.assertEqual(streamed.errors, loaded.errors)
+        return stream_data, streamed.errors
+
+    def test_perf_019_same_result_as_tree(self):
+        data, errors = self._compare_with_tree(self.write_xml(_spirit_xml(20)))
+        self.assertEqual(errors, [])
+        self.assertEqual(data['name'], 'stream_mod')
+        self.assertEqual(data['base_address'], 0x4000)
+        self.assertEqual(len(data['registers']), 20)
+        reg = data['registers'][3]
+        self.assertEqual(reg['name'], 'reg_3')
+        self.assertEqual(reg['address_int'], 0x400C)
+        self.assertEqual(reg['fields'][0]['enum_values'], {0: 'IDLE', 1: 'RUN'})
+        self.assertEqual(reg['fields'][0]['access_mode'], 'RW')
+        self.assertEqual([f['width'] for f in reg['fields']], [2, 1])
+
+    def test_perf_019_repo_fixture(self):
+        path = str(project_root / 'tests' / 'xml' / 'enum_test_spirit.xml')
+        data, _ = self._compare_with_tree(path)
+        self.assertEqual(data['name'], 'enum_test_mod')
+
+    def test_perf_019_unprefixed_register_fallback(self):
+        data, _ = self._compare_with_tree(self.write_xml(_spirit_xml(4, prefix='')))
+        self.assertEqual([r['name'] for r in data['registers']],
+                         ['reg_0', 'reg_1', 'reg_2', 'reg_3'])
+
+    def test_perf_019_enum_errors_reported(self):
+        _, errors = self._compare_with_tree(self.write_xml(_spirit_xml(3, bad_enum=True)))
+        self.assertEqual(len(errors), 1)
+        self.assertIn("Invalid SPIRIT enum value 'bogus'", errors[0]['msg'])
+
+    def test_perf_019_parse_file_uses_stream(self):
+        path = self.write_xml(_spirit_xml(5))
+        parser = XMLInputParser()
+        calls = []
+        real = parser._spirit_stream_to_module
+        parser._spirit_stream_to_module = lambda *args: calls.append(args) or real(*args)
+        with redirect_stdout(io.StringIO()):
+            module = parser.parse_file(path)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(module['name'], 'stream_mod')
+        self.assertEqual(module['base_address'], 0x4000)
+        self.assertEqual(len(module['registers']), 5)
+
+    def test_perf_019_malformed_document(self):
+        path = self.write_xml(_spirit_xml(5).replace('</spirit:component>', ''))
+        parser = XMLInputParser()
+        with redirect_stdout(io.StringIO()):
+            self.assertIsNone(parser.parse_file(path))
+        self.assertEqual(len(parser.errors), 1)
+        self.assertIn('Error parsing XML file', parser.errors[0]['msg'])
+
+
+class TestSpiritStreamingMemory(_SpiritFileTest):
+    """Test cases for PERF-020"""
+
+    def _live_registers(self, num_regs):
+        """Register elements in the tree each time a register is converted."""
+        path = self.write_xml(_spirit_xml(num_regs), f'spirit_{num_regs}.xml')
+        parser = XMLInputParser()
+        live = []
+        real = parser._lower_spirit_register
+
+        def convert(builder, reg_elem, filepath, errors):
+            live.append(sum(1 for e in root.iter() if e.tag.endswith('register')))
+            return real(builder, reg_elem, filepath, errors)
+
+        parser._lower_spirit_register = convert
+        events = ET.iterparse(path, events=('start', 'end'))
+        _, root = next(events)
+        data = parser._spirit_stream_to_module(events, root, path)
+
+        self.assertEqual(len(data['registers']), num_regs)
+        self.assertEqual(len(root), 0)
+        return live
+
+    def test_perf_020_registers_released(self):
+        small, large = self._live_registers(200), self._live_registers(4000)
+        # Only the parser's read-ahead is held besides the current register,
+        # independent of the document size
+        self.assertLess(max(large), 100)
+        self.assertLessEqual(max(large), max(small) + 1)
+
+    def test_perf_020_peak_memory_below_tree(self):
+        path = self.write_xml(_spirit_xml(1000))
+
+        def peak(convert):
+            tracemalloc.start()
+            try:
+                convert()
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        def stream():
+            events = ET.iterparse(path, events=('start', 'end'))
+            _, root = next(events)
+            XMLInputParser()._spirit_stream_to_module(events, root, path)
+
+        def tree():
+            XMLInputParser()._spirit_to_module(ET.parse(path).getroot(), path)
+
+        # The converted registers dominate what the stream keeps; the
+        # element tree of the whole document is never held
+        self.assertLess(peak(stream), peak(tree) * 0.6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+test_yaml_loader.py - YAML Loading Performance Tests
+
+Maps to requirements in docs/source/requirements-core.md.
+
+Requirement ↔ test-class mapping
+---------------------------------
+PERF-017  C-accelerated safe YAML loader with pure-Python fallback
+         → TestYAMLLoader
+
+PERF-018  Streaming multi-document YAML files
+         → TestMultiDocumentYAML
+"""
+
+import io
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+import yaml
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from axion_hdl import yaml_loader
+from axion_hdl.axion import AxionHDL
+from axion_hdl.yaml_input_parser import YAMLInputParser
+from axion_hdl.hierarchy_parser import HierarchyParser
+from axion_hdl.rule_checker import RuleChecker
+
+
+MODULE_TEMPLATE = """module: {name}
+base_addr: "{base}"
+registers:
+  - name: ctrl
+    access: RW
+    description: "Control register of {name}"
+  - name: status
+    access: RO
+"""
+
+
+def _multi_document(count):
+    return '---\n'.join(MODULE_TEMPLATE.format(name=f'mod_{i}', base=f'0x{i * 0x1000:04X}')
+                        for i in range(count))
+
+
+class TestYAMLLoader(unittest.TestCase):
+    """Test cases for PERF-017"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'regs.yaml')
+        with open(self.path, 'w') as f:
+            f.write(MODULE_TEMPLATE.format(name='uart', base='0x1000'))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _parse(self):
+        parser = YAMLInputParser()
+        with redirect_stdout(io.StringIO()):
+            return parser.parse_file(self.path)
+
+    def test_perf_017_uses_libyaml_when_available(self):
+        if hasattr(yaml, 'CSafeLoader'):
+            self.assertIs(yaml_loader.SafeLoader, yaml.CSafeLoader)
+            self.assertTrue(yaml_loader.HAS_LIBYAML)
+        else:
+            self.assertIs(yaml_loader.SafeLoader, yaml.SafeLoader)
+            self.assertFalse(yaml_loader.HAS_LIBYAML)
+
+    def test_perf_017_fallback_produces_same_module(self):
+        fast = self._parse()
+        with mock.patch.object(yaml_loader, 'SafeLoader', yaml.SafeLoader):
+            pure = self._parse()
+        self.assertEqual(fast, pure)
+        self.assertEqual(fast['name'], 'uart')
+
+    def test_perf_017_loader_is_safe(self):
+        with self.assertRaises(yaml.YAMLError):
+            yaml_loader.safe_load("!!python/object/apply:os.system ['true']")
+
+    def test_perf_017_hierarchy_uses_loader(self):
+        path = os.path.join(self.temp_dir, 'hier.yaml')
+        with open(path, 'w') as f:
+            f.write("instances:\n  - name: u0\n    module: uart\n    base_addr: '0x1000'\n")
+        with mock.patch.object(yaml_loader, 'safe_load', wraps=yaml_loader.safe_load) as load:
+            HierarchyParser().parse(path)
+        load.assert_called_once()
+
+
+class TestMultiDocumentYAML(unittest.TestCase):
+    """Test cases for PERF-018"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, name, content):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def test_perf_018_one_module_per_document(self):
+        path = self._write('many.yaml', _multi_document(3) + '---\n')
+        parser = YAMLInputParser()
+        with redirect_stdout(io.StringIO()):
+            modules = list(parser.iter_modules(path))
+        self.assertEqual([m['name'] for m in modules], ['mod_0', 'mod_1', 'mod_2'])
+        self.assertEqual(parser.errors, [])
+
+    def test_perf_018_documents_are_streamed(self):
+        path = self._write('many.yaml', _multi_document(50))
+        loaded = []
+        real_parse = YAMLInputParser._parse_yaml_data
+
+        def tracking_parse(parser, data, filepath):
+            loaded.append(data['module'])
+            return real_parse(parser, data, filepath)
+
+        parser = YAMLInputParser()
+        with mock.patch.object(YAMLInputParser, '_parse_yaml_data', tracking_parse), \
+                redirect_stdout(io.StringIO()):
+            modules = parser.iter_modules(path)
+            self.assertEqual(next(modules)['name'], 'mod_0')
+            # Only the first document has been loaded so far
+            self.assertEqual(loaded, ['mod_0'])
+            modules.close()
+
+    def test_perf_018_syntax_error_keeps_earlier_documents(self):
+        path = self._write('broken.yaml', _multi_document(2) + '---\nmodule: [unclosed\n')
+        parser = YAMLInputParser()
+        with redirect_stdout(io.StringIO()):
+            modules = list(parser.iter_modules(path))
+        self.assertEqual([m['name'] for m in modules], ['mod_0', 'mod_1'])
+        self.assertEqual(len(parser.errors), 1)
+        self.assertIn('YAML syntax error', parser.errors[0]['msg'])
+
+    def test_perf_018_parse_file_returns_first_module(self):
+        path = self._write('many.yaml', _multi_document(2))
+        parser = YAMLInputParser()
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(parser.parse_file(path)['name'], 'mod_0')
+
+    def test_perf_018_analysis_collects_all_documents(self):
+        src = os.path.join(self.temp_dir, 'src')
+        os.makedirs(src)
+        with open(os.path.join(src, 'many.yaml'), 'w') as f:
+            f.write(_multi_document(4))
+        axion = AxionHDL(output_dir=os.path.join(self.temp_dir, 'out'))
+        with redirect_stdout(io.StringIO()):
+            axion.add_source(src)
+            axion.analyze(jobs=2)
+        self.assertEqual([m['name'] for m in axion.analyzed_modules],
+                         ['mod_0', 'mod_1', 'mod_2', 'mod_3'])
+
+    def test_perf_018_rule_checker_checks_every_document(self):
+        path = self._write('many.yaml', _multi_document(1) + '---\nname: wrong\nregisters: []\n')
+        checker = RuleChecker()
+        checker._check_single_file(path)
+        self.assertEqual(checker.errors, [])
+        self.assertTrue(any("Did you mean 'module'" in w['msg'] for w in checker.warnings))
+
+
+if __name__ == '__main__':
+    unittest.main()
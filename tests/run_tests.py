@@ -1089,7 +1089,13 @@ def generate_markdown_report(results: List[TestResult]):
         "cocotb": ("🧪 Cocotb VHDL Tests", {
             "setup": "Setup & Configuration",
             "axi_lite": "AXI-Lite Protocol Tests",
-            "cdc": "CDC Comprehensive Tests"
+            "cdc": "CDC Comprehensive Tests",
+            "sub": "Subregister Tests",
+            "stress": "Extended Stress Tests",
+            "read_pipeline": "Read Pipeline Tests (RD_PIPE=0..3)",
+            "split_fsm": "Mixed Traffic Tests (FSM=shared/split/fast)",
+            "stress_fsm": "Throughput Tests (FSM=shared/split/fast)",
+            "cdc_modes": "CDC Tests (CDC_MODE=sync/handshake)"
         }),
         "parser": ("📜 Parser Tests (PARSER-xxx)", {
             "requirements": "PARSER Requirements",
@@ -2454,6 +2460,10 @@ def run_cocotb_tests() -> List[TestResult]:
         ("test_cdc_simultaneous_edges", "CDC: Simultaneous Clock Edges"),
         ("test_cdc_slow_to_fast", "CDC: Slow to Fast Clock Domain Transfer"),
         ("test_cdc_fast_to_slow", "CDC: Fast to Slow Clock Domain Transfer"),
+        ("test_cdc_transfer_slow_module", "CDC: Coherent Transfers, Slower Module Clock"),
+        ("test_cdc_transfer_fast_module", "CDC: Coherent Transfers, Faster Module Clock"),
+        ("test_cdc_transfer_very_slow_module", "CDC: Coherent Transfers, Much Slower Module Clock"),
+        ("test_cdc_transfer_near_equal", "CDC: Coherent Transfers, Nearly Equal Clocks"),
     ]
     
     cocotb_sub_tests = [
@@ -2468,6 +2478,31 @@ def run_cocotb_tests() -> List[TestResult]:
         ("test_stress_002_reset_under_load", "STRESS-002: Reset Under High Load"),
         ("test_stress_003_address_map_walk", "STRESS-003: Address Map Walk"),
         ("test_stress_004_invalid_access_storm", "STRESS-004: Invalid Access Storm"),
+        ("test_stress_005_back_to_back_throughput", "STRESS-005: Back-to-Back Throughput"),
+    ]
+
+    cocotb_read_pipeline_tests = [
+        ("test_read_pipeline_rw_data", "RD_PIPE: Read-Write Register Data"),
+        ("test_read_pipeline_ro_data", "RD_PIPE: Read-Only Register Data"),
+        ("test_read_pipeline_errors", "RD_PIPE: Error Responses"),
+        ("test_read_pipeline_latency", "RD_PIPE: Read Latency"),
+        ("test_read_pipeline_write_then_read", "RD_PIPE: Write Then Read"),
+    ]
+
+    cocotb_split_fsm_tests = [
+        ("test_split_fsm_mixed_throughput", "FSM: Mixed Read/Write Throughput"),
+        ("test_split_fsm_same_cycle_order", "FSM: Same-Cycle Read/Write Order"),
+        ("test_split_fsm_rdata_stable", "FSM: RDATA Stable Until Accepted"),
+        ("test_split_fsm_mixed_ordering", "FSM: Mixed Traffic Ordering"),
+    ]
+
+    # Test modules re-run with every value of a generator option:
+    # (make variable, values, test module, tests, subcategory)
+    cocotb_option_runs = [
+        ("RD_PIPE", ("0", "1", "2", "3"), "test_read_pipeline", cocotb_read_pipeline_tests, "read_pipeline"),
+        ("FSM", ("shared", "split", "fast"), "test_split_fsm", cocotb_split_fsm_tests, "split_fsm"),
+        ("FSM", ("shared", "split", "fast"), "test_stress_extended", cocotb_stress_ext_tests, "stress_fsm"),
+        ("CDC_MODE", ("sync", "handshake"), "test_cdc", cocotb_cdc_tests, "cdc_modes"),
     ]
 
     # Check if cocotb-config is available (check venv first, then system)
@@ -2507,6 +2542,14 @@ def run_cocotb_tests() -> List[TestResult]:
                                       f"{skip_reason} ({skip_msg})",
                                       category="cocotb", subcategory="stress"))
 
+        for var, values, _, tests, subcategory in cocotb_option_runs:
+            for value in values:
+                for test_id, desc in tests:
+                    results.append(TestResult(f"cocotb.{subcategory}.{value}.{test_id}",
+                                              f"{desc} ({var}={value})", "skipped", 0,
+                                              f"{skip_reason} ({skip_msg})",
+                                              category="cocotb", subcategory=subcategory))
+
         return results
 
     # Get cocotb version
@@ -2656,6 +2699,49 @@ def run_cocotb_tests() -> List[TestResult]:
         else:
             results.append(TestResult(f"cocotb.stress.{test_id}", desc, "skipped", 0, "Test not executed", category="cocotb", subcategory="stress"))
 
+    # Run the option-dependent tests against a DUT generated with each value
+    # (the test_read_pipeline, test_split_fsm, test_stress_fsm and
+    # test_cdc_modes make targets, one value at a time)
+    for var, values, module, tests, subcategory in cocotb_option_runs:
+        for value in values:
+            print(f"{BOLD}Running {module} with {var}={value}...{RESET}")
+            generated, _, output = run_command(
+                ["make", "generate", f"{var}={value}"],
+                cwd=str(cocotb_dir),
+                timeout=300,
+                env=venv_env
+            )
+            if generated:
+                _, duration, output = run_command(
+                    ["make", f"MODULE={module}", "DUT=sensor_controller", f"{var}={value}"],
+                    cwd=str(cocotb_dir),
+                    timeout=600,
+                    env=venv_env,
+                    stream_output=True
+                )
+
+            option_results = {}
+            for match in test_pattern.finditer(output if generated else ""):
+                option_results[match.group(1).split('.')[-1]] = match.group(2).lower()
+
+            for test_id, desc in tests:
+                name = f"cocotb.{subcategory}.{value}.{test_id}"
+                desc = f"{desc} ({var}={value})"
+                status = option_results.get(test_id)
+                if not generated:
+                    results.append(TestResult(name, desc, "failed", 0, "Generation failed", category="cocotb", subcategory=subcategory))
+                elif status == "pass":
+                    results.append(TestResult(name, desc, "passed", 0, "", category="cocotb", subcategory=subcategory))
+                elif status == "fail":
+                    results.append(TestResult(name, desc, "failed", 0, "Assertion failed", category="cocotb", subcategory=subcategory))
+                elif status is None:
+                    results.append(TestResult(name, desc, "skipped", 0, "Test not executed", category="cocotb", subcategory=subcategory))
+                else:
+                    results.append(TestResult(name, desc, "skipped", 0, "", category="cocotb", subcategory=subcategory))
+
+    # Leave the default DUT in the output directory
+    run_command(["make", "generate"], cwd=str(cocotb_dir), timeout=300, env=venv_env)
+
     return results
 
 